@@ -1,7 +1,17 @@
 """
 Módulo de interfaces de usuario para el generador de matrices.
-Incluye interfaces de consola y gráfica.
+Incluye interfaces de consola y gráfica, y la ejecución por lotes.
+
+La interfaz gráfica se importa solo al usarse, para que los modos de
+consola y por lotes no carguen tkinter.
 """
 
 from .consola import *
-from .grafica import *
+
+
+def __getattr__(nombre):
+    """Carga la interfaz gráfica bajo demanda."""
+    if nombre == 'InterfazGrafica':
+        from .grafica import InterfazGrafica
+        return InterfazGrafica
+    raise AttributeError(f"module {__name__!r} has no attribute {nombre!r}")
@@ -187,7 +187,12 @@ class InterfazConsola:
             matriz.mostrar(nombre)
             print(f"Dimensiones: {matriz.filas}x{matriz.columnas}")
             print(f"Es cuadrada: {'Sí' if matriz.es_cuadrada() else 'No'}")
-            
+
+            # Las grandes solo se muestran resumidas: ofrecer recorrerlas enteras
+            if matriz.filas > 20 or matriz.columnas > 20:
+                if confirmar_accion("¿Recorrer la matriz por páginas?"):
+                    matriz.paginar()
+
         except Exception as e:
             print(f"❌ Error: {e}")
         
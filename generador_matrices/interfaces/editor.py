@@ -0,0 +1,286 @@
+"""
+Editor Virtual de Matrices
+==========================
+
+Rejilla editable para llenar matrices en la interfaz gráfica. Extiende
+VisorMatriz: solo se dibujan las celdas visibles y un único Entry se
+coloca sobre la celda que se está editando, en lugar de crear un Entry
+por elemento.
+
+- Escribir sobre la celda activa empieza a editarla; Enter, Tab y las
+  flechas confirman y mueven la selección; Escape cancela.
+- Ctrl+V pega un bloque (tabuladores, punto y coma, comas o espacios;
+  fracciones como 3/4) desde la celda activa.
+- Las celdas inválidas se muestran en rojo con su texto y se informan al
+  pedir los datos.
+
+Autor: Nicolas
+"""
+
+import tkinter as tk
+import sys
+import os
+
+# Agregar el directorio raíz al path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.matriz import Matriz
+from src.validadores import validar_numero
+from src.utilidades import analizar_bloque, formatear_numero
+from interfaces.visor import VisorMatriz
+
+COLOR_ACTIVA = '#1a73e8'
+COLOR_INVALIDA = '#d93025'
+
+
+class EditorMatriz(VisorMatriz):
+    """
+    Rejilla virtual editable con pegado en bloque.
+    """
+
+    def __init__(self, padre, matriz, fuente=("Courier", 10), al_cambiar=None, **opciones):
+        """
+        Crea el editor sobre una copia de la matriz.
+
+        Args:
+            padre: Widget contenedor
+            matriz (Matriz): Matriz con las dimensiones y los valores iniciales
+            fuente (tuple): Fuente de las celdas
+            al_cambiar (callable): Se llama con el editor tras cada edición o pegado
+        """
+        super().__init__(padre, fuente=fuente, **opciones)
+        self.invalidos = {}
+        self.activa = (0, 0)
+        self._al_cambiar = al_cambiar
+        self._editando = False
+
+        self._marco = self.canvas.create_rectangle(0, 0, 0, 0, outline=COLOR_ACTIVA, width=2)
+        self._entrada = tk.Entry(self.canvas, font=self._fuente, justify=tk.RIGHT, relief=tk.FLAT,
+                                 highlightthickness=1, highlightcolor=COLOR_ACTIVA)
+        self._ventana_entrada = self.canvas.create_window(0, 0, window=self._entrada, anchor=tk.NW,
+                                                          state=tk.HIDDEN)
+
+        self.canvas.bind('<Button-1>', self._clic)
+        self.canvas.bind('<Double-Button-1>', lambda e: self.editar())
+        self.canvas.bind('<Key>', self._tecla)
+        self.canvas.bind('<Return>', lambda e: self.editar())
+        self.canvas.bind('<F2>', lambda e: self.editar())
+        self.canvas.bind('<Delete>', lambda e: self.establecer(*self.activa, '0'))
+        self.canvas.bind('<BackSpace>', lambda e: self.editar(''))
+        for tecla, (df, dc) in {'<Up>': (-1, 0), '<Down>': (1, 0), '<Left>': (0, -1), '<Right>': (0, 1),
+                                '<Tab>': (0, 1), '<Shift-Tab>': (0, -1)}.items():
+            self.canvas.bind(tecla, lambda e, df=df, dc=dc: self._mover_y_cortar(df, dc))
+        self.canvas.bind('<Prior>', lambda e: self.mover(-self._visibles[0], 0))
+        self.canvas.bind('<Next>', lambda e: self.mover(self._visibles[0], 0))
+        for secuencia in ('<Control-v>', '<Control-V>', '<<Paste>>'):
+            self.canvas.bind(secuencia, self._pegar_y_cortar)
+
+        self._entrada.bind('<Return>', lambda e: self._confirmar_y_mover(1, 0))
+        self._entrada.bind('<Tab>', lambda e: self._confirmar_y_mover(0, 1))
+        self._entrada.bind('<Shift-Tab>', lambda e: self._confirmar_y_mover(0, -1))
+        self._entrada.bind('<Up>', lambda e: self._confirmar_y_mover(-1, 0))
+        self._entrada.bind('<Down>', lambda e: self._confirmar_y_mover(1, 0))
+        self._entrada.bind('<Escape>', lambda e: self.cancelar())
+        self._entrada.bind('<FocusOut>', lambda e: self.confirmar())
+
+        copia = Matriz(matriz.filas, matriz.columnas)
+        copia.datos = [fila[:] for fila in matriz.datos]
+        self.mostrar(copia)
+
+    def editar(self, texto=None):
+        """
+        Abre la edición de la celda activa.
+
+        Args:
+            texto (str): Texto inicial (por defecto, el valor actual)
+        """
+        fila, columna = self.activa
+        self._asegurar_visible(fila, columna)
+        self._entrada.delete(0, tk.END)
+        self._entrada.insert(0, self._texto_celda(fila, columna) if texto is None else texto)
+        self._editando = True
+        self._entrada.focus_set()
+        self._entrada.icursor(tk.END)
+        self.refrescar()
+
+    def confirmar(self):
+        """Valida y guarda el texto de la celda en edición."""
+        if not self._editando:
+            return
+        self._editando = False
+        self.canvas.itemconfigure(self._ventana_entrada, state=tk.HIDDEN)
+        self.canvas.focus_set()
+        self.establecer(*self.activa, self._entrada.get())
+
+    def cancelar(self):
+        """Descarta la edición en curso."""
+        self._editando = False
+        self.canvas.itemconfigure(self._ventana_entrada, state=tk.HIDDEN)
+        self.canvas.focus_set()
+
+    def establecer(self, fila, columna, texto):
+        """
+        Guarda el texto de una celda; si no es un número, la marca como inválida.
+
+        Args:
+            fila (int): Fila de la celda
+            columna (int): Columna de la celda
+            texto (str): Texto ingresado (vacío cuenta como 0)
+
+        Returns:
+            bool: True si el texto era válido
+        """
+        texto = texto.strip()
+        try:
+            self.matriz.datos[fila][columna] = validar_numero(texto) if texto else 0
+            self.matriz.marcar_modificada(fila, columna)
+            self.invalidos.pop((fila, columna), None)
+            valido = True
+        except ValueError:
+            self.invalidos[(fila, columna)] = texto
+            valido = False
+        self._cambio()
+        return valido
+
+    def pegar(self, texto):
+        """
+        Escribe un bloque de texto a partir de la celda activa.
+
+        Lo que sobresale de la matriz se ignora.
+
+        Args:
+            texto (str): Filas en líneas, elementos separados por tabuladores,
+                punto y coma, comas o espacios
+
+        Returns:
+            tuple: (filas, columnas) pegadas
+        """
+        filas, errores = analizar_bloque(texto)
+        fila_inicio, columna_inicio = self.activa
+        filas = filas[:self.filas - fila_inicio]
+        longitudes = [min(len(valores), self.columnas - columna_inicio) for valores in filas]
+
+        for desplazamiento, (valores, longitud) in enumerate(zip(filas, longitudes)):
+            self.matriz.datos[fila_inicio + desplazamiento][columna_inicio:columna_inicio + longitud] = \
+                [0 if valor is None else valor for valor in valores[:longitud]]
+        self.matriz.marcar_modificada()
+
+        def pegada(celda):
+            desplazamiento = celda[0] - fila_inicio
+            return (0 <= desplazamiento < len(filas)
+                    and columna_inicio <= celda[1] < columna_inicio + longitudes[desplazamiento])
+
+        self.invalidos = {celda: texto for celda, texto in self.invalidos.items() if not pegada(celda)}
+        for fila, columna, elemento in errores:
+            celda = (fila_inicio + fila, columna_inicio + columna)
+            if fila < len(filas) and pegada(celda):
+                self.invalidos[celda] = elemento
+        self._cambio()
+        return len(filas), max(longitudes, default=0)
+
+    def mover(self, filas, columnas):
+        """Mueve la celda activa (confirmando la edición en curso)."""
+        self.confirmar()
+        fila = min(max(self.activa[0] + filas, 0), self.filas - 1)
+        columna = min(max(self.activa[1] + columnas, 0), self.columnas - 1)
+        self.activa = (fila, columna)
+        self._asegurar_visible(fila, columna)
+        self.refrescar()
+
+    def obtener_datos(self):
+        """
+        Devuelve los datos editados.
+
+        Returns:
+            list: Lista de listas con los elementos
+
+        Raises:
+            ValueError: Si quedan celdas inválidas
+        """
+        self.confirmar()
+        if self.invalidos:
+            fila, columna = min(self.invalidos)
+            raise ValueError(f"{len(self.invalidos)} celda(s) inválida(s); la primera en la fila {fila + 1}, "
+                             f"columna {columna + 1}: '{self.invalidos[(fila, columna)]}'")
+        return [fila[:] for fila in self.matriz.datos]
+
+    # ============ MÉTODOS PRIVADOS ============
+
+    def _textos_bloque(self, fila_inicio, fila_fin, columna_inicio, columna_fin):
+        celdas = super()._textos_bloque(fila_inicio, fila_fin, columna_inicio, columna_fin)
+        if self.invalidos:
+            for i, fila in enumerate(celdas):
+                for j in range(len(fila)):
+                    texto = self.invalidos.get((fila_inicio + i, columna_inicio + j))
+                    if texto is not None:
+                        fila[j] = texto
+        return celdas
+
+    def _color_celda(self, fila, columna):
+        return COLOR_INVALIDA if (fila, columna) in self.invalidos else 'black'
+
+    def _despues_de_dibujar(self):
+        """Coloca el marco de la celda activa y el Entry de edición."""
+        fila, columna = self.activa
+        filas_visibles, columnas_visibles = self._visibles
+        visible = (self.fila_inicio <= fila < self.fila_inicio + filas_visibles
+                   and self.columna_inicio <= columna < self.columna_inicio + columnas_visibles)
+        x0, y0, x1, y1 = self.rectangulo_celda(fila, columna)
+        self.canvas.coords(self._marco, x0, y0, x1, y1)
+        self.canvas.itemconfigure(self._marco, state=tk.NORMAL if visible else tk.HIDDEN)
+        self.canvas.tag_raise(self._marco)
+        if self._editando:
+            self.canvas.coords(self._ventana_entrada, x0, y0)
+            self.canvas.itemconfigure(self._ventana_entrada, width=x1 - x0, height=y1 - y0,
+                                      state=tk.NORMAL if visible else tk.HIDDEN)
+
+    def _texto_celda(self, fila, columna):
+        if (fila, columna) in self.invalidos:
+            return self.invalidos[(fila, columna)]
+        return formatear_numero(self.matriz.datos[fila][columna])
+
+    def _asegurar_visible(self, fila, columna):
+        filas_visibles, columnas_visibles = self._visibles
+        if fila < self.fila_inicio:
+            self.fila_inicio = fila
+        elif fila >= self.fila_inicio + filas_visibles:
+            self.fila_inicio = fila - filas_visibles + 1
+        if columna < self.columna_inicio:
+            self.columna_inicio = columna
+        elif columna >= self.columna_inicio + columnas_visibles:
+            self.columna_inicio = columna - columnas_visibles + 1
+
+    def _cambio(self):
+        self.refrescar()
+        if self._al_cambiar:
+            self._al_cambiar(self)
+
+    def _clic(self, evento):
+        self.confirmar()
+        self.canvas.focus_set()
+        celda = self.celda_en(evento.x, evento.y)
+        if celda is not None:
+            self.activa = celda
+            self.refrescar()
+
+    def _tecla(self, evento):
+        """Empieza a editar al escribir un carácter sobre la celda activa."""
+        if evento.char and evento.char.isprintable() and not evento.state & 0x4:
+            self.editar(evento.char)
+
+    def _mover_y_cortar(self, filas, columnas):
+        self.mover(filas, columnas)
+        return 'break'
+
+    def _confirmar_y_mover(self, filas, columnas):
+        self.mover(filas, columnas)
+        self.canvas.focus_set()
+        return 'break'
+
+    def _pegar_y_cortar(self, evento):
+        try:
+            texto = self.clipboard_get()
+        except tk.TclError:
+            return 'break'
+        self.pegar(texto)
+        return 'break'
@@ -18,7 +18,9 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from src.matriz import Matriz
 from src.operaciones import *
-from src.utilidades import formatear_numero
+from src.utilidades import formatear_matriz_como_texto
+from interfaces.visor import VisorMatriz
+from interfaces.editor import EditorMatriz
 
 
 class InterfazGrafica:
@@ -40,7 +42,8 @@ class InterfazGrafica:
         
         # Widgets principales
         self.lista_matrices = None
-        self.texto_matriz = None
+        self.info_matriz = None
+        self.visor_matriz = None
     
     
     def iniciar(self):
@@ -214,16 +217,12 @@ class InterfazGrafica:
         
         ttk.Label(frame_der, text="Vista de Matriz", font=("Arial", 12, "bold")).pack()
         
-        # Área de texto para mostrar la matriz
-        text_frame = ttk.Frame(frame_der)
-        text_frame.pack(fill=tk.BOTH, expand=True, pady=10)
+        self.info_matriz = ttk.Label(frame_der, text="", justify=tk.LEFT)
+        self.info_matriz.pack(anchor=tk.W)
         
-        self.texto_matriz = tk.Text(text_frame, font=("Courier", 10), state=tk.DISABLED)
-        scrollbar_text = ttk.Scrollbar(text_frame, orient=tk.VERTICAL, command=self.texto_matriz.yview)
-        self.texto_matriz.configure(yscrollcommand=scrollbar_text.set)
-        
-        self.texto_matriz.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar_text.pack(side=tk.RIGHT, fill=tk.Y)
+        # Visor virtual: solo dibuja las celdas que caben en la ventana
+        self.visor_matriz = VisorMatriz(frame_der, fuente=("Courier", 10))
+        self.visor_matriz.pack(fill=tk.BOTH, expand=True, pady=10)
     
     
     def crear_pestaña_operaciones(self):
@@ -358,7 +357,7 @@ Instrucciones:
         """Abre una ventana para llenar la matriz manualmente."""
         ventana = tk.Toplevel(self.root)
         ventana.title("Llenar Matriz Manualmente")
-        ventana.geometry("400x300")
+        ventana.geometry("600x450")
         ventana.transient(self.root)
         ventana.grab_set()
         
@@ -371,34 +370,27 @@ Instrucciones:
         ttk.Label(main_frame, text=f"Ingresa los valores para la matriz {matriz.filas}x{matriz.columnas}:", 
                  font=("Arial", 10, "bold")).pack(pady=(0, 10))
         
-        # Crear grid de entries
-        entries = []
-        grid_frame = ttk.Frame(main_frame)
-        grid_frame.pack()
+        ttk.Label(main_frame, text="Escribe sobre una celda o pega un bloque (Ctrl+V) separado por "
+                 "tabuladores, comas o espacios. Se admiten fracciones como 3/4.",
+                 wraplength=560, justify=tk.LEFT).pack(pady=(0, 5))
+        
+        estado = ttk.Label(main_frame, text="", foreground="red")
         
-        for i in range(matriz.filas):
-            fila_entries = []
-            for j in range(matriz.columnas):
-                entry = ttk.Entry(grid_frame, width=8, justify=tk.CENTER)
-                entry.grid(row=i, column=j, padx=2, pady=2)
-                entry.insert(0, "0")  # Valor por defecto
-                fila_entries.append(entry)
-            entries.append(fila_entries)
+        def al_cambiar(editor):
+            invalidas = len(editor.invalidos)
+            estado.config(text=f"{invalidas} celda(s) inválida(s)" if invalidas else "")
+        
+        # Una sola rejilla virtual en lugar de un Entry por elemento
+        editor = EditorMatriz(main_frame, matriz, al_cambiar=al_cambiar)
+        editor.pack(fill=tk.BOTH, expand=True)
+        estado.pack(pady=(5, 0))
+        editor.canvas.focus_set()
         
         resultado = {"matriz_llena": False}
         
         def aceptar():
             try:
-                for i in range(matriz.filas):
-                    for j in range(matriz.columnas):
-                        valor_str = entries[i][j].get().strip()
-                        if '/' in valor_str:
-                            from fractions import Fraction
-                            valor = Fraction(valor_str)
-                        else:
-                            valor = float(valor_str) if '.' in valor_str else int(valor_str)
-                        matriz.datos[i][j] = valor
-                
+                matriz.llenar_manual(editor.obtener_datos())
                 resultado["matriz_llena"] = True
                 ventana.destroy()
                 
@@ -455,25 +447,20 @@ Instrucciones:
     
     
     def mostrar_matriz_en_texto(self, matriz, nombre="Matriz"):
-        """Muestra una matriz en el widget de texto."""
-        if self.texto_matriz:
-            self.texto_matriz.config(state=tk.NORMAL)
-            self.texto_matriz.delete(1.0, tk.END)
-            
+        """Muestra una matriz en el visor de la pestaña de matrices."""
+        if self.visor_matriz:
             texto = f"{nombre}:\n"
             texto += f"Dimensiones: {matriz.filas}x{matriz.columnas}\n"
-            texto += f"Es cuadrada: {'Sí' if matriz.es_cuadrada() else 'No'}\n\n"
-            
-            # Formatear la matriz
-            for fila in matriz.datos:
-                elementos_formateados = []
-                for elemento in fila:
-                    elem_str = formatear_numero(elemento)
-                    elementos_formateados.append(f"{elem_str:>8}")
-                texto += "[ " + "  ".join(elementos_formateados) + " ]\n"
-            
-            self.texto_matriz.insert(tk.END, texto)
-            self.texto_matriz.config(state=tk.DISABLED)
+            texto += f"Es cuadrada: {'Sí' if matriz.es_cuadrada() else 'No'}"
+            self.info_matriz.config(text=texto)
+            self.visor_matriz.mostrar(matriz)
+    
+    
+    def limpiar_vista_matriz(self):
+        """Vacía el visor de la pestaña de matrices."""
+        if self.visor_matriz:
+            self.info_matriz.config(text="")
+            self.visor_matriz.mostrar(None)
     
     
     def seleccionar_matriz(self, titulo="Seleccionar Matriz"):
@@ -613,48 +600,10 @@ Instrucciones:
         matriz_frame = ttk.LabelFrame(main_frame, text="Matriz Resultado", padding="10")
         matriz_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 15))
         
-        # Área de texto para la matriz
-        text_frame = ttk.Frame(matriz_frame)
-        text_frame.pack(fill=tk.BOTH, expand=True)
-        
-        scrollbar_v = ttk.Scrollbar(text_frame, orient=tk.VERTICAL)
-        scrollbar_h = ttk.Scrollbar(text_frame, orient=tk.HORIZONTAL)
-        
-        texto_resultado = tk.Text(text_frame, font=("Courier", 10), 
-                                yscrollcommand=scrollbar_v.set,
-                                xscrollcommand=scrollbar_h.set,
-                                wrap=tk.NONE, state=tk.DISABLED)
-        
-        scrollbar_v.config(command=texto_resultado.yview)
-        scrollbar_h.config(command=texto_resultado.xview)
-        
-        # Empaquetar widgets
-        texto_resultado.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar_v.pack(side=tk.RIGHT, fill=tk.Y)
-        scrollbar_h.pack(side=tk.BOTTOM, fill=tk.X)
-        
-        # Llenar con el contenido de la matriz
-        texto_resultado.config(state=tk.NORMAL)
-        
-        # Formatear la matriz
-        contenido = ""
-        max_ancho = 0
-        for fila in matriz_resultado.datos:
-            for elemento in fila:
-                ancho = len(formatear_numero(elemento))
-                max_ancho = max(max_ancho, ancho)
-        
-        max_ancho = max(max_ancho, 4)
-        
-        for fila in matriz_resultado.datos:
-            elementos_formateados = []
-            for elemento in fila:
-                elem_str = formatear_numero(elemento)
-                elementos_formateados.append(f"{elem_str:>{max_ancho}}")
-            contenido += "[ " + "  ".join(elementos_formateados) + " ]\n"
-        
-        texto_resultado.insert(tk.END, contenido)
-        texto_resultado.config(state=tk.DISABLED)
+        # Visor de la matriz (solo dibuja las celdas visibles)
+        visor_resultado = VisorMatriz(matriz_frame, fuente=("Courier", 10))
+        visor_resultado.pack(fill=tk.BOTH, expand=True)
+        visor_resultado.mostrar(matriz_resultado)
         
         # Botones
         btn_frame = ttk.Frame(main_frame)
@@ -665,6 +614,9 @@ Instrucciones:
             self.notebook.select(1)  # Cambiar a la pestaña de matrices
         
         def copiar_resultado():
+            # El texto completo solo se genera al copiar (y sale de la caché de visualización)
+            contenido = formatear_matriz_como_texto(matriz_resultado) + "\n"
+            
             self.root.clipboard_clear()
             self.root.clipboard_append(contenido)
             messagebox.showinfo("Copiado", "Matriz copiada al portapapeles")
@@ -910,9 +862,7 @@ Instrucciones:
         if messagebox.askyesno("Confirmar", f"¿Seguro que deseas eliminar '{nombre}'?"):
             del self.matrices[nombre]
             self.actualizar_lista_matrices()
-            self.texto_matriz.config(state=tk.NORMAL)
-            self.texto_matriz.delete(1.0, tk.END)
-            self.texto_matriz.config(state=tk.DISABLED)
+            self.limpiar_vista_matriz()
             self.actualizar_barra_estado(f"Matriz '{nombre}' eliminada")
     
     
@@ -926,9 +876,7 @@ Instrucciones:
             self.matrices.clear()
             self.contador_matrices = 0
             self.actualizar_lista_matrices()
-            self.texto_matriz.config(state=tk.NORMAL)
-            self.texto_matriz.delete(1.0, tk.END)
-            self.texto_matriz.config(state=tk.DISABLED)
+            self.limpiar_vista_matriz()
             self.actualizar_barra_estado("Todas las matrices eliminadas")
     
     
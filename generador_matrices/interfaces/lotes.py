@@ -0,0 +1,303 @@
+"""
+Ejecución por Lotes
+===================
+
+Modo no interactivo: ejecuta un guion de órdenes (una por línea) sobre un
+espacio de trabajo de matrices con nombre, sin menús ni interfaz gráfica.
+
+Órdenes disponibles:
+
+    cargar A datos.csv              Lee una matriz de un CSV
+    guardar C resultado.csv         Escribe una matriz en un CSV
+    aleatoria A 3 4 [-10 10] [semilla]
+    identidad I 3
+    ceros Z 2 3
+    unos U 2 3
+    mostrar C                       Imprime la matriz en la salida
+    eliminar A
+    C = A + B                       También: A - B, A @ B @ ..., 2 * A,
+                                    A * 2, A.T, A ** 3, A
+
+Las líneas vacías y lo que sigue a ``#`` se ignoran. Los mensajes de
+progreso van a la salida de errores para no mezclarse con los resultados.
+
+Códigos de salida: 0 éxito, 1 error al ejecutar una orden, 2 error de
+sintaxis en el guion.
+
+Autor: Nicolas
+"""
+
+import csv
+import random
+import sys
+import os
+
+# Agregar el directorio raíz al path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from fractions import Fraction
+from src.matriz import Matriz
+from src.operaciones import *
+from src.utilidades import formatear_matriz_como_texto
+from src.validadores import validar_numero
+
+EXITO = 0
+ERROR_EJECUCION = 1
+ERROR_SINTAXIS = 2
+
+
+class ErrorSintaxis(ValueError):
+    """Error en la escritura de una orden del guion."""
+
+
+class EjecutorLotes:
+    """
+    Ejecuta guiones de órdenes sobre un espacio de trabajo de matrices.
+    """
+
+    def __init__(self, salida=None, registro=None):
+        """
+        Inicializa el ejecutor.
+
+        Args:
+            salida: Flujo para los resultados de ``mostrar`` (default: stdout)
+            registro: Flujo para mensajes de progreso y errores (default: stderr)
+        """
+        self.matrices = {}
+        self.salida = salida or sys.stdout
+        self.registro = registro or sys.stderr
+        self.ordenes = {
+            'cargar': self.orden_cargar,
+            'guardar': self.orden_guardar,
+            'aleatoria': self.orden_aleatoria,
+            'identidad': self.orden_identidad,
+            'ceros': self.orden_ceros,
+            'unos': self.orden_unos,
+            'mostrar': self.orden_mostrar,
+            'eliminar': self.orden_eliminar,
+        }
+
+    def ejecutar(self, lineas):
+        """
+        Ejecuta un guion completo, deteniéndose en el primer error.
+
+        Args:
+            lineas (iterable): Líneas del guion
+
+        Returns:
+            int: Código de salida
+        """
+        for numero, linea in enumerate(lineas, 1):
+            linea = linea.split('#', 1)[0].strip()
+            if not linea:
+                continue
+
+            try:
+                self.ejecutar_linea(linea)
+            except ErrorSintaxis as e:
+                print(f"❌ Línea {numero}: {e}", file=self.registro)
+                return ERROR_SINTAXIS
+            except (ValueError, ZeroDivisionError, OSError) as e:
+                print(f"❌ Línea {numero}: {e}", file=self.registro)
+                return ERROR_EJECUCION
+
+        return EXITO
+
+    def ejecutar_linea(self, linea):
+        """
+        Ejecuta una orden o asignación.
+
+        Args:
+            linea (str): Orden sin comentarios
+
+        Raises:
+            ErrorSintaxis: Si la orden está mal escrita
+            ValueError: Si la operación no se puede realizar
+        """
+        if '=' in linea:
+            nombre, expresion = (parte.strip() for parte in linea.split('=', 1))
+            if not nombre.isidentifier():
+                raise ErrorSintaxis(f"Nombre de matriz no válido: '{nombre}'")
+            self.matrices[nombre] = self.evaluar(expresion)
+            resultado = self.matrices[nombre]
+            print(f"✅ {nombre} = {expresion} ({resultado.filas}x{resultado.columnas})", file=self.registro)
+            return
+
+        orden, *argumentos = linea.split()
+        if orden not in self.ordenes:
+            raise ErrorSintaxis(f"Orden desconocida: '{orden}'")
+        self.ordenes[orden](*argumentos)
+
+    def evaluar(self, expresion):
+        """
+        Evalúa una expresión simple sobre el espacio de trabajo.
+
+        Args:
+            expresion (str): Expresión (ver documentación del módulo)
+
+        Returns:
+            Matriz: Resultado
+        """
+        partes = expresion.split()
+
+        if len(partes) == 1:
+            if partes[0].endswith('.T'):
+                return self._obtener(partes[0][:-2]).transponer()
+            return self._obtener(partes[0]).copiar()
+
+        if len(partes) % 2 == 0:
+            raise ErrorSintaxis(f"Expresión incompleta: '{expresion}'")
+
+        operadores = set(partes[1::2])
+        if operadores == {'@'}:
+            return multiplicar_cadena([self._operando(nombre) for nombre in partes[0::2]])
+
+        if len(partes) != 3:
+            raise ErrorSintaxis("Solo se admite una operación por línea (salvo cadenas con @)")
+
+        izquierda, operador, derecha = partes
+        if operador == '+':
+            return sumar_matrices(self._operando(izquierda), self._operando(derecha))
+        if operador == '-':
+            return restar_matrices(self._operando(izquierda), self._operando(derecha))
+        if operador == '*':
+            if izquierda in self.matrices or izquierda.endswith('.T'):
+                return multiplicar_por_escalar(self._operando(izquierda), self._escalar(derecha))
+            return multiplicar_por_escalar(self._operando(derecha), self._escalar(izquierda))
+        if operador == '**':
+            return potencia_matriz(self._operando(izquierda), self._entero(derecha))
+        raise ErrorSintaxis(f"Operador desconocido: '{operador}'")
+
+    # ============ ÓRDENES ============
+
+    def orden_cargar(self, *argumentos):
+        """cargar NOMBRE ARCHIVO.csv"""
+        nombre, ruta = self._argumentos(argumentos, 2, "cargar NOMBRE ARCHIVO")
+
+        with open(ruta, newline='', encoding='utf-8') as archivo:
+            filas = [fila for fila in csv.reader(archivo) if fila]
+        if not filas:
+            raise ValueError(f"El archivo '{ruta}' está vacío")
+
+        matriz = Matriz(len(filas), len(filas[0]))
+        matriz.llenar_manual(filas)
+        self.matrices[nombre] = matriz
+        print(f"✅ Cargada {nombre} ({matriz.filas}x{matriz.columnas}) desde {ruta}", file=self.registro)
+
+    def orden_guardar(self, *argumentos):
+        """guardar NOMBRE ARCHIVO.csv"""
+        nombre, ruta = self._argumentos(argumentos, 2, "guardar NOMBRE ARCHIVO")
+        matriz = self._obtener(nombre)
+
+        with open(ruta, 'w', newline='', encoding='utf-8') as archivo:
+            escritor = csv.writer(archivo)
+            for fila in matriz.datos:
+                escritor.writerow([_texto_exacto(valor) for valor in fila])
+        print(f"💾 Guardada {nombre} en {ruta}", file=self.registro)
+
+    def orden_aleatoria(self, *argumentos):
+        """aleatoria NOMBRE FILAS COLUMNAS [MIN MAX] [SEMILLA]"""
+        if len(argumentos) not in (3, 5, 6):
+            raise ErrorSintaxis("Uso: aleatoria NOMBRE FILAS COLUMNAS [MIN MAX] [SEMILLA]")
+        nombre = argumentos[0]
+        filas, columnas = self._entero(argumentos[1]), self._entero(argumentos[2])
+        minimo, maximo = (-10, 10) if len(argumentos) == 3 else map(self._entero, argumentos[3:5])
+        if len(argumentos) == 6:
+            random.seed(self._entero(argumentos[5]))
+
+        matriz = Matriz(filas, columnas)
+        matriz.llenar_aleatorio(minimo, maximo)
+        self.matrices[nombre] = matriz
+        print(f"✅ Creada {nombre} aleatoria ({filas}x{columnas})", file=self.registro)
+
+    def orden_identidad(self, *argumentos):
+        """identidad NOMBRE N"""
+        nombre, n = self._argumentos(argumentos, 2, "identidad NOMBRE N")
+        self.matrices[nombre] = crear_matriz_identidad(self._entero(n))
+
+    def orden_ceros(self, *argumentos):
+        """ceros NOMBRE FILAS COLUMNAS"""
+        nombre, filas, columnas = self._argumentos(argumentos, 3, "ceros NOMBRE FILAS COLUMNAS")
+        self.matrices[nombre] = crear_matriz_ceros(self._entero(filas), self._entero(columnas))
+
+    def orden_unos(self, *argumentos):
+        """unos NOMBRE FILAS COLUMNAS"""
+        nombre, filas, columnas = self._argumentos(argumentos, 3, "unos NOMBRE FILAS COLUMNAS")
+        self.matrices[nombre] = crear_matriz_unos(self._entero(filas), self._entero(columnas))
+
+    def orden_mostrar(self, *argumentos):
+        """mostrar NOMBRE"""
+        nombre, = self._argumentos(argumentos, 1, "mostrar NOMBRE")
+        print(formatear_matriz_como_texto(self._obtener(nombre)), file=self.salida)
+
+    def orden_eliminar(self, *argumentos):
+        """eliminar NOMBRE"""
+        nombre, = self._argumentos(argumentos, 1, "eliminar NOMBRE")
+        self._obtener(nombre)
+        del self.matrices[nombre]
+
+    # ============ MÉTODOS PRIVADOS ============
+
+    def _obtener(self, nombre):
+        """Obtiene una matriz del espacio de trabajo."""
+        if nombre not in self.matrices:
+            raise ValueError(f"No existe la matriz '{nombre}'")
+        return self.matrices[nombre]
+
+    def _operando(self, texto):
+        """Obtiene una matriz, admitiendo el sufijo .T para la transpuesta."""
+        if texto.endswith('.T'):
+            return self._obtener(texto[:-2]).transponer()
+        return self._obtener(texto)
+
+    @staticmethod
+    def _argumentos(argumentos, cantidad, uso):
+        """Valida el número de argumentos de una orden."""
+        if len(argumentos) != cantidad:
+            raise ErrorSintaxis(f"Uso: {uso}")
+        return argumentos
+
+    @staticmethod
+    def _entero(texto):
+        """Convierte un argumento en entero."""
+        try:
+            return int(texto)
+        except ValueError:
+            raise ErrorSintaxis(f"Se esperaba un entero: '{texto}'")
+
+    @staticmethod
+    def _escalar(texto):
+        """Convierte un argumento en escalar (entero, decimal o fracción)."""
+        try:
+            return validar_numero(texto)
+        except ValueError:
+            raise ErrorSintaxis(f"Se esperaba un número: '{texto}'")
+
+
+def _texto_exacto(valor):
+    """Representa un número sin pérdida para poder volver a leerlo."""
+    if isinstance(valor, Fraction):
+        return str(valor)
+    return repr(valor)
+
+
+def ejecutar_script(ruta):
+    """
+    Ejecuta un guion desde un archivo o desde la entrada estándar ('-').
+
+    Args:
+        ruta (str): Ruta del guion o '-'
+
+    Returns:
+        int: Código de salida
+    """
+    ejecutor = EjecutorLotes()
+    if ruta == '-':
+        return ejecutor.ejecutar(sys.stdin)
+
+    try:
+        with open(ruta, encoding='utf-8') as archivo:
+            return ejecutor.ejecutar(archivo)
+    except OSError as e:
+        print(f"❌ No se pudo leer el guion: {e}", file=sys.stderr)
+        return ERROR_SINTAXIS
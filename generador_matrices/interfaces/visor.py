@@ -0,0 +1,275 @@
+"""
+Visor Virtual de Matrices
+=========================
+
+Widget de Tkinter que dibuja solo las celdas de la matriz que caben en la
+ventana, de modo que el coste de cada repintado depende del tamaño de la
+ventana y no del de la matriz. Las barras de desplazamiento son virtuales
+(indican la primera fila/columna visible) y los elementos del Canvas se
+reutilizan entre repintados.
+
+Autor: Nicolas
+"""
+
+import tkinter as tk
+from tkinter import ttk
+import tkinter.font as tkfont
+import sys
+import os
+
+# Agregar el directorio raíz al path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.utilidades import formatear_numero
+from src.cache_visualizacion import CACHE
+
+# Ancho mínimo de columna (caracteres) y separación entre celdas (px)
+ANCHO_MINIMO = 6
+SEPARACION = 12
+
+COLOR_ENCABEZADO = '#e8e8e8'
+COLOR_TEXTO_ENCABEZADO = '#555555'
+
+
+def formatear_bloque(filas):
+    """
+    Convierte un bloque de filas en textos de celda.
+
+    Args:
+        filas (list): Lista de listas con los elementos visibles
+
+    Returns:
+        list: Lista de listas con el texto de cada celda
+    """
+    return [[formatear_numero(elemento) for elemento in fila] for fila in filas]
+
+
+def posicion_desde_scroll(argumentos, actual, total, pagina):
+    """
+    Traduce un comando de barra de desplazamiento a la primera fila/columna visible.
+
+    Args:
+        argumentos (tuple): ('moveto', fraccion) o ('scroll', n, 'units'|'pages')
+        actual (int): Primera fila/columna visible ahora
+        total (int): Filas/columnas de la matriz
+        pagina (int): Filas/columnas que caben en la ventana
+
+    Returns:
+        int: Nueva primera fila/columna visible, dentro de los límites
+    """
+    if argumentos[0] == 'moveto':
+        nueva = int(float(argumentos[1]) * total)
+    else:
+        pasos = int(argumentos[1])
+        nueva = actual + pasos * (max(pagina - 1, 1) if argumentos[2] == 'pages' else 1)
+    return limitar_inicio(nueva, total, pagina)
+
+
+def limitar_inicio(inicio, total, pagina):
+    """Ajusta la primera posición visible para no dejar huecos al final."""
+    return max(0, min(inicio, total - pagina))
+
+
+class VisorMatriz(ttk.Frame):
+    """
+    Rejilla virtual de solo lectura para mostrar matrices.
+    """
+
+    def __init__(self, padre, fuente=("Courier", 10), **opciones):
+        """
+        Crea el visor vacío.
+
+        Args:
+            padre: Widget contenedor
+            fuente (tuple): Fuente de las celdas (monoespaciada)
+        """
+        super().__init__(padre, **opciones)
+        self.matriz = None
+        self.fila_inicio = 0
+        self.columna_inicio = 0
+        self._ancho_caracteres = ANCHO_MINIMO
+        self._items = []
+        self._pendiente = False
+        self._visibles = (1, 1)
+        self._geometria = (0, 1)
+
+        self._fuente = tkfont.Font(font=fuente)
+        self._ancho_caracter = self._fuente.measure('0')
+        self._alto_fila = self._fuente.metrics('linespace') + 4
+
+        self.canvas = tk.Canvas(self, background='white', highlightthickness=0, takefocus=True)
+        self.barra_y = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self._desplazar_y)
+        self.barra_x = ttk.Scrollbar(self, orient=tk.HORIZONTAL, command=self._desplazar_x)
+        self.canvas.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        self.barra_y.grid(row=0, column=1, sticky=(tk.N, tk.S))
+        self.barra_x.grid(row=1, column=0, sticky=(tk.W, tk.E))
+        self.columnconfigure(0, weight=1)
+        self.rowconfigure(0, weight=1)
+
+        self._fondo_columnas = self.canvas.create_rectangle(0, 0, 0, 0, fill=COLOR_ENCABEZADO, width=0)
+        self._fondo_filas = self.canvas.create_rectangle(0, 0, 0, 0, fill=COLOR_ENCABEZADO, width=0)
+
+        self.canvas.bind('<Configure>', lambda e: self.refrescar())
+        self.canvas.bind('<MouseWheel>', self._rueda)
+        self.canvas.bind('<Shift-MouseWheel>', lambda e: self._rueda(e, horizontal=True))
+        self.canvas.bind('<Button-4>', lambda e: self.desplazar(-3, 0))
+        self.canvas.bind('<Button-5>', lambda e: self.desplazar(3, 0))
+        self.canvas.bind('<Shift-Button-4>', lambda e: self.desplazar(0, -3))
+        self.canvas.bind('<Shift-Button-5>', lambda e: self.desplazar(0, 3))
+        self.canvas.bind('<Button-1>', lambda e: self.canvas.focus_set())
+        for tecla, (df, dc) in {'<Up>': (-1, 0), '<Down>': (1, 0), '<Left>': (0, -1), '<Right>': (0, 1)}.items():
+            self.canvas.bind(tecla, lambda e, df=df, dc=dc: self.desplazar(df, dc))
+        self.canvas.bind('<Prior>', lambda e: self.desplazar(-self._visibles[0], 0))
+        self.canvas.bind('<Next>', lambda e: self.desplazar(self._visibles[0], 0))
+        self.canvas.bind('<Home>', lambda e: self.ir_a(0, 0))
+        self.canvas.bind('<End>', lambda e: self.ir_a(self.filas, self.columnas))
+
+
+    @property
+    def filas(self):
+        return 0 if self.matriz is None else self.matriz.filas
+
+    @property
+    def columnas(self):
+        return 0 if self.matriz is None else self.matriz.columnas
+
+    def mostrar(self, matriz):
+        """
+        Muestra una matriz desde la esquina superior izquierda.
+
+        Args:
+            matriz (Matriz): Matriz a mostrar, o None para vaciar el visor
+        """
+        self.matriz = matriz
+        self.fila_inicio = self.columna_inicio = 0
+        self._ancho_caracteres = ANCHO_MINIMO
+        self.refrescar()
+
+    def ir_a(self, fila, columna):
+        """Desplaza la vista para que (fila, columna) quede arriba a la izquierda."""
+        self.fila_inicio = limitar_inicio(fila, self.filas, self._visibles[0])
+        self.columna_inicio = limitar_inicio(columna, self.columnas, self._visibles[1])
+        self.refrescar()
+
+    def desplazar(self, filas, columnas):
+        """Desplaza la vista un número de filas y columnas."""
+        self.ir_a(self.fila_inicio + filas, self.columna_inicio + columnas)
+
+    def refrescar(self):
+        """Programa un repintado (varios seguidos se agrupan en uno)."""
+        if not self._pendiente:
+            self._pendiente = True
+            self.after_idle(self._dibujar)
+
+    def celda_en(self, x, y):
+        """Celda (fila, columna) bajo un punto del Canvas, o None si cae en los encabezados o fuera."""
+        ancho_indice, ancho_columna = self._geometria
+        if self.matriz is None or x < ancho_indice or y < self._alto_fila:
+            return None
+        fila = self.fila_inicio + y // self._alto_fila - 1
+        columna = self.columna_inicio + (x - ancho_indice) // ancho_columna
+        if fila >= self.filas or columna >= self.columnas:
+            return None
+        return fila, columna
+
+    def rectangulo_celda(self, fila, columna):
+        """Coordenadas (x0, y0, x1, y1) de una celda en el Canvas."""
+        ancho_indice, ancho_columna = self._geometria
+        x0 = ancho_indice + (columna - self.columna_inicio) * ancho_columna
+        y0 = (fila - self.fila_inicio + 1) * self._alto_fila
+        return x0, y0, x0 + ancho_columna, y0 + self._alto_fila
+
+    # ============ MÉTODOS PRIVADOS ============
+
+    def _desplazar_y(self, *argumentos):
+        self.fila_inicio = posicion_desde_scroll(argumentos, self.fila_inicio, self.filas, self._visibles[0])
+        self.refrescar()
+
+    def _desplazar_x(self, *argumentos):
+        self.columna_inicio = posicion_desde_scroll(argumentos, self.columna_inicio, self.columnas,
+                                                    self._visibles[1])
+        self.refrescar()
+
+    def _rueda(self, evento, horizontal=False):
+        pasos = -3 if evento.delta > 0 else 3
+        if horizontal:
+            self.desplazar(0, pasos)
+        else:
+            self.desplazar(pasos, 0)
+
+    def _dibujar(self):
+        self._pendiente = False
+        ancho, alto = self.canvas.winfo_width(), self.canvas.winfo_height()
+        if self.matriz is None:
+            self._ocultar_desde(0)
+            self.canvas.coords(self._fondo_columnas, 0, 0, 0, 0)
+            self.canvas.coords(self._fondo_filas, 0, 0, 0, 0)
+            self.barra_y.set(0, 1)
+            self.barra_x.set(0, 1)
+            return
+
+        ancho_indice = (len(str(self.filas - 1)) + 1) * self._ancho_caracter + SEPARACION
+        filas_visibles = max((alto - self._alto_fila) // self._alto_fila, 1)
+        self.fila_inicio = limitar_inicio(self.fila_inicio, self.filas, filas_visibles)
+        fila_fin = min(self.fila_inicio + filas_visibles + 1, self.filas)
+
+        # El ancho de columna solo crece con lo que se ha visto, para no saltar al desplazarse
+        ancho_columna = self._ancho_caracteres * self._ancho_caracter + SEPARACION
+        columnas_visibles = max((ancho - ancho_indice) // ancho_columna, 1)
+        self.columna_inicio = limitar_inicio(self.columna_inicio, self.columnas, columnas_visibles)
+        columna_fin = min(self.columna_inicio + columnas_visibles + 1, self.columnas)
+
+        celdas = self._textos_bloque(self.fila_inicio, fila_fin, self.columna_inicio, columna_fin)
+        mas_ancha = max((len(texto) for fila in celdas for texto in fila), default=0)
+        if mas_ancha > self._ancho_caracteres:
+            self._ancho_caracteres = mas_ancha
+            ancho_columna = mas_ancha * self._ancho_caracter + SEPARACION
+        self._visibles = (filas_visibles, columnas_visibles)
+        self._geometria = (ancho_indice, ancho_columna)
+
+        self.canvas.coords(self._fondo_columnas, 0, 0, ancho, self._alto_fila)
+        self.canvas.coords(self._fondo_filas, 0, 0, ancho_indice, alto)
+
+        usados = 0
+        for j in range(columna_fin - self.columna_inicio):
+            x = ancho_indice + (j + 1) * ancho_columna - SEPARACION // 2
+            usados = self._colocar(usados, x, self._alto_fila // 2, str(self.columna_inicio + j),
+                                   COLOR_TEXTO_ENCABEZADO)
+        for i, fila in enumerate(celdas):
+            y = (i + 1) * self._alto_fila + self._alto_fila // 2
+            usados = self._colocar(usados, ancho_indice - SEPARACION // 2, y, str(self.fila_inicio + i),
+                                   COLOR_TEXTO_ENCABEZADO)
+            for j, texto in enumerate(fila):
+                usados = self._colocar(usados, ancho_indice + (j + 1) * ancho_columna - SEPARACION // 2, y,
+                                       texto, self._color_celda(self.fila_inicio + i, self.columna_inicio + j))
+        self._ocultar_desde(usados)
+        self._despues_de_dibujar()
+
+        self.barra_y.set(self.fila_inicio / self.filas, (self.fila_inicio + filas_visibles) / self.filas)
+        self.barra_x.set(self.columna_inicio / self.columnas,
+                         (self.columna_inicio + columnas_visibles) / self.columnas)
+
+    def _textos_bloque(self, fila_inicio, fila_fin, columna_inicio, columna_fin):
+        """Textos de las celdas visibles (los editores lo amplían)."""
+        # Desde la caché: al volver a una matriz ya vista no se reformatea nada
+        textos, _ = CACHE.textos(self.matriz)
+        return [fila[columna_inicio:columna_fin] for fila in textos[fila_inicio:fila_fin]]
+
+    def _color_celda(self, fila, columna):
+        return 'black'
+
+    def _despues_de_dibujar(self):
+        """Punto de extensión tras cada repintado."""
+
+    def _colocar(self, indice, x, y, texto, color):
+        """Reutiliza (o crea) el elemento de texto 'indice'; devuelve el siguiente."""
+        if indice == len(self._items):
+            self._items.append(self.canvas.create_text(0, 0, anchor=tk.E, font=self._fuente))
+        item = self._items[indice]
+        self.canvas.coords(item, x, y)
+        self.canvas.itemconfigure(item, text=texto, fill=color, state=tk.NORMAL)
+        return indice + 1
+
+    def _ocultar_desde(self, indice):
+        for item in self._items[indice:]:
+            self.canvas.itemconfigure(item, state=tk.HIDDEN)
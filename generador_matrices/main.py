@@ -4,21 +4,23 @@ Generador de Matrices - Programa Principal
 ==========================================
 
 Punto de entrada principal del programa.
-Permite al usuario elegir entre interfaz de consola o gráfica.
+Permite al usuario elegir entre interfaz de consola o gráfica, o ejecutar
+un guion sin interacción:
+
+    python main.py --script trabajo.txt
+    python main.py --script - < trabajo.txt
 
 Autor: Nicolas
 Versión: 1.0.0
 """
 
+import argparse
 import sys
 import os
 
 # Agregar el directorio actual al path para importaciones
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from interfaces.consola import InterfazConsola
-from interfaces.grafica import InterfazGrafica
-
 
 def mostrar_menu_principal():
     """Muestra el menú principal de selección de interfaz."""
@@ -33,8 +35,22 @@ def mostrar_menu_principal():
     print()
 
 
-def main():
+def procesar_argumentos(argv=None):
+    """Procesa los argumentos de la línea de comandos."""
+    parser = argparse.ArgumentParser(description="Generador de Matrices")
+    parser.add_argument('--script', metavar='ARCHIVO',
+                        help="Ejecuta un guion de órdenes sin interacción ('-' para leer de stdin)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
     """Función principal del programa."""
+    argumentos = procesar_argumentos(argv)
+    if argumentos.script:
+        # Modo por lotes: sin menús y sin importar la interfaz gráfica
+        from interfaces.lotes import ejecutar_script
+        sys.exit(ejecutar_script(argumentos.script))
+    
     try:
         while True:
             mostrar_menu_principal()
@@ -44,11 +60,13 @@ def main():
                 
                 if opcion == "1":
                     print("\n🚀 Iniciando interfaz de consola...\n")
+                    from interfaces.consola import InterfazConsola
                     interfaz_consola = InterfazConsola()
                     interfaz_consola.iniciar()
                     
                 elif opcion == "2":
                     print("\n🖥️ Iniciando interfaz gráfica...\n")
+                    from interfaces.grafica import InterfazGrafica
                     interfaz_grafica = InterfazGrafica()
                     interfaz_grafica.iniciar()
                     
@@ -7,6 +7,7 @@ from .matriz import Matriz
 from .operaciones import *
 from .validadores import *
 from .utilidades import *
+from .perfilador import Perfilador, PERFILADOR, perfilado
 
 __version__ = "1.0.0"
 __author__ = "Nicolas"
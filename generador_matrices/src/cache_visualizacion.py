@@ -0,0 +1,145 @@
+"""
+Caché de Visualización
+======================
+
+Guarda el texto ya formateado de cada matriz (una cadena por elemento y
+el ancho de cada columna) para que mostrarla otra vez no vuelva a llamar
+a formatear_numero sobre todos sus elementos.
+
+- Las entradas se identifican por la matriz (su id, comprobado con una
+  referencia débil para que un id reutilizado no devuelva texto ajeno) y
+  se validan con su versión, que Matriz incrementa en cada modificación.
+- Si desde la última vez solo cambiaron elementos sueltos
+  (establecer_elemento), se reformatean solo esos elementos.
+- Las entradas menos usadas se descartan cuando el tamaño estimado supera
+  la capacidad.
+
+Quien modifique matriz.datos directamente debe llamar después a
+matriz.marcar_modificada() para que la caché lo note.
+
+Autor: Nicolas
+"""
+
+import weakref
+from collections import OrderedDict
+
+from .utilidades import formatear_numero
+
+# Capacidad por defecto (bytes estimados de las cadenas guardadas)
+CAPACIDAD_POR_DEFECTO = 16 * 1024 * 1024
+
+# Coste fijo aproximado de un str y de cada posición de una lista (CPython, 64 bits)
+_BYTES_CADENA = 49
+_BYTES_LISTA = 56
+_BYTES_PUNTERO = 8
+
+
+class _Entrada:
+    """Texto formateado de una matriz en una versión concreta."""
+
+    def __init__(self, matriz):
+        self.referencia = weakref.ref(matriz)
+        self.version = matriz.version
+        self.textos = [[formatear_numero(elemento) for elemento in fila] for fila in matriz.datos]
+        self.anchos = [max(len(fila[j]) for fila in self.textos) for j in range(matriz.columnas)]
+        self.bytes = (sum(len(texto) for fila in self.textos for texto in fila)
+                      + matriz.filas * (_BYTES_LISTA + matriz.columnas * (_BYTES_CADENA + _BYTES_PUNTERO)))
+
+    def actualizar(self, matriz, celdas):
+        """Reformatea solo las celdas indicadas."""
+        for fila, columna in set(celdas):
+            anterior = self.textos[fila][columna]
+            texto = formatear_numero(matriz.datos[fila][columna])
+            self.textos[fila][columna] = texto
+            self.bytes += len(texto) - len(anterior)
+            if len(texto) >= self.anchos[columna]:
+                self.anchos[columna] = len(texto)
+            elif len(anterior) == self.anchos[columna]:
+                self.anchos[columna] = max(len(textos[columna]) for textos in self.textos)
+        self.version = matriz.version
+
+
+class CacheVisualizacion:
+    """
+    Caché LRU del texto formateado de las matrices.
+    """
+
+    def __init__(self, capacidad_bytes=CAPACIDAD_POR_DEFECTO):
+        """
+        Crea una caché vacía.
+
+        Args:
+            capacidad_bytes (int): Tamaño estimado máximo de lo guardado
+        """
+        self.capacidad_bytes = capacidad_bytes
+        self.bytes = 0
+        self.aciertos = 0
+        self.fallos = 0
+        self.incrementales = 0
+        self._entradas = OrderedDict()
+
+    def textos(self, matriz):
+        """
+        Devuelve el texto de cada elemento y el ancho de cada columna.
+
+        Las listas devueltas pertenecen a la caché: no deben modificarse.
+
+        Args:
+            matriz (Matriz): Matriz a formatear
+
+        Returns:
+            tuple: (textos, anchos) con una lista de cadenas por fila y el
+            ancho máximo de cada columna
+        """
+        clave = id(matriz)
+        entrada = self._entradas.get(clave)
+        if entrada is not None and entrada.referencia() is not matriz:
+            self._descartar(clave)
+            entrada = None
+
+        if entrada is None:
+            self.fallos += 1
+            entrada = _Entrada(matriz)
+            self._entradas[clave] = entrada
+            self.bytes += entrada.bytes
+        elif entrada.version != matriz.version:
+            celdas = matriz.cambios_desde(entrada.version)
+            if celdas is None:
+                self.fallos += 1
+                self._descartar(clave)
+                entrada = _Entrada(matriz)
+                self._entradas[clave] = entrada
+                self.bytes += entrada.bytes
+            else:
+                self.incrementales += 1
+                self.bytes -= entrada.bytes
+                entrada.actualizar(matriz, celdas)
+                self.bytes += entrada.bytes
+        else:
+            self.aciertos += 1
+
+        self._entradas.move_to_end(clave)
+        self._liberar()
+        return entrada.textos, entrada.anchos
+
+    def limpiar(self):
+        """Descarta todas las entradas."""
+        self._entradas.clear()
+        self.bytes = 0
+
+    def __len__(self):
+        return len(self._entradas)
+
+    # ============ MÉTODOS PRIVADOS ============
+
+    def _descartar(self, clave):
+        self.bytes -= self._entradas.pop(clave).bytes
+
+    def _liberar(self):
+        """Descarta las entradas menos usadas hasta caber en la capacidad (siempre queda la última)."""
+        while self.bytes > self.capacidad_bytes and len(self._entradas) > 1:
+            self._descartar(next(iter(self._entradas)))
+
+
+# Caché compartida por Matriz.mostrar, str() y formatear_matriz_como_texto
+CACHE = CacheVisualizacion()
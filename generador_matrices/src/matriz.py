@@ -8,9 +8,15 @@ Maneja matrices de números enteros, decimales y fracciones.
 Autor: Nicolas
 """
 
+from collections import deque
 from fractions import Fraction
 from .validadores import validar_dimensiones, validar_numero, validar_matriz_datos
-from .utilidades import formatear_numero
+from .utilidades import formatear_matriz_como_texto, leer_filas
+from .cache_visualizacion import CACHE
+from .paginacion import LIMITE_COMPLETA, Paginador, resumir
+
+# Cambios de elementos sueltos que se recuerdan para actualizar la caché de visualización
+MAX_CAMBIOS_REGISTRADOS = 256
 
 
 class Matriz:
@@ -21,6 +27,7 @@ class Matriz:
         filas (int): Número de filas de la matriz
         columnas (int): Número de columnas de la matriz
         datos (list): Lista de listas que contiene los elementos de la matriz
+        version (int): Contador de modificaciones (lo usa la caché de visualización)
     """
     
     def __init__(self, filas, columnas):
@@ -39,6 +46,8 @@ class Matriz:
         self.filas = filas
         self.columnas = columnas
         self.datos = [[0 for _ in range(columnas)] for _ in range(filas)]
+        self.version = 0
+        self._cambios = deque(maxlen=MAX_CAMBIOS_REGISTRADOS)
     
     
     def llenar_manual(self, datos):
@@ -60,12 +69,28 @@ class Matriz:
                     self.datos[i][j] = Fraction(valor)
                 else:
                     self.datos[i][j] = validar_numero(valor)
+        
+        self.marcar_modificada()
     
     
-    def llenar_interactivo(self):
+    def llenar_interactivo(self, por_elementos=False):
         """
-        Llena la matriz de forma interactiva pidiendo cada elemento al usuario.
+        Llena la matriz de forma interactiva.
+        
+        Por defecto cada línea es una fila completa (ver
+        utilidades.leer_filas): se puede escribir fila a fila, pegar un
+        bloque o redirigir un archivo.
+        
+        Args:
+            por_elementos (bool): Pedir cada elemento por separado
         """
+        if not por_elementos:
+            print(f"Ingresa las {self.filas} filas de la matriz {self.filas}x{self.columnas}, "
+                  f"una por línea, con los {self.columnas} elementos separados por espacios o comas "
+                  f"(admite fracciones como 3/4). Puedes pegar un bloque y terminarlo con una línea vacía.")
+            self.llenar_manual(leer_filas(self.filas, self.columnas))
+            return
+        
         print(f"Ingresa los elementos de la matriz {self.filas}x{self.columnas}:")
         
         for i in range(self.filas):
@@ -85,6 +110,8 @@ class Matriz:
                     except ValueError as e:
                         print(f"❌ Error: {e}")
                         print("Por favor ingresa un número válido.")
+        
+        self.marcar_modificada()
     
     
     def llenar_aleatorio(self, min_valor=-10, max_valor=10):
@@ -100,6 +127,8 @@ class Matriz:
         for i in range(self.filas):
             for j in range(self.columnas):
                 self.datos[i][j] = random.randint(min_valor, max_valor)
+        
+        self.marcar_modificada()
     
     
     def obtener_elemento(self, fila, columna):
@@ -146,38 +175,74 @@ class Matriz:
             self.datos[fila][columna] = Fraction(valor)
         else:
             self.datos[fila][columna] = validar_numero(valor)
+        
+        self.marcar_modificada(fila, columna)
+    
+    
+    def marcar_modificada(self, fila=None, columna=None):
+        """
+        Registra una modificación de la matriz.
+        
+        Debe llamarse tras escribir en self.datos directamente, para que
+        la caché de visualización no muestre texto desactualizado.
+        
+        Args:
+            fila (int): Fila del elemento modificado (None si cambió más de uno)
+            columna (int): Columna del elemento modificado
+        """
+        self.version += 1
+        self._cambios.append(None if fila is None else (fila, columna))
+    
     
+    def cambios_desde(self, version):
+        """
+        Elementos modificados desde una versión anterior.
+        
+        Args:
+            version (int): Versión de referencia
+            
+        Returns:
+            list: Lista de (fila, columna), o None si no se puede saber
+            (cambió más de un elemento a la vez o hubo demasiados cambios)
+        """
+        pendientes = self.version - version
+        if pendientes < 0 or pendientes > len(self._cambios):
+            return None
+        
+        recientes = list(self._cambios)[len(self._cambios) - pendientes:]
+        if None in recientes:
+            return None
+        return recientes
     
-    def mostrar(self, titulo="Matriz"):
+    
+    def mostrar(self, titulo="Matriz", completa=False):
         """
         Muestra la matriz de forma formateada en la consola.
         
+        Las matrices de más de 20×20 se resumen con sus primeras y últimas
+        filas y columnas; paginar() las recorre enteras.
+        
         Args:
             titulo (str): Título a mostrar arriba de la matriz
+            completa (bool): Mostrarla entera aunque sea grande
         """
         print(f"\n{titulo}:")
         print("-" * len(titulo + ":"))
-        
-        # Calcular el ancho máximo para el formato
-        max_ancho = 0
-        for fila in self.datos:
-            for elemento in fila:
-                ancho = len(str(formatear_numero(elemento)))
-                max_ancho = max(max_ancho, ancho)
-        
-        max_ancho = max(max_ancho, 4)  # Ancho mínimo de 4
-        
-        # Mostrar la matriz
-        for fila in self.datos:
-            elementos_formateados = []
-            for elemento in fila:
-                elem_str = str(formatear_numero(elemento))
-                elementos_formateados.append(f"{elem_str:>{max_ancho}}")
-            
-            print("[ " + "  ".join(elementos_formateados) + " ]")
+        if completa or (self.filas <= LIMITE_COMPLETA and self.columnas <= LIMITE_COMPLETA):
+            print(formatear_matriz_como_texto(self))
+        else:
+            print(f"(resumen de {self.filas}x{self.columnas})")
+            print(resumir(self))
         print()
     
     
+    def paginar(self):
+        """
+        Recorre la matriz por páginas en la consola (ver src.paginacion).
+        """
+        Paginador(self).ejecutar()
+    
+    
     def es_cuadrada(self):
         """
         Verifica si la matriz es cuadrada.
@@ -241,12 +306,8 @@ class Matriz:
         Returns:
             str: Representación de la matriz
         """
-        resultado = []
-        for fila in self.datos:
-            elementos = [str(formatear_numero(elemento)) for elemento in fila]
-            resultado.append("[ " + "  ".join(elementos) + " ]")
-        
-        return "\n".join(resultado)
+        textos, _ = CACHE.textos(self)
+        return "\n".join("[ " + "  ".join(fila) + " ]" for fila in textos)
     
     
     def __repr__(self):
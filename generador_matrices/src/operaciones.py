@@ -3,12 +3,18 @@ Operaciones Matemáticas con Matrices
 ===================================
 
 Implementación de operaciones matemáticas básicas para matrices.
-Incluye suma, resta, multiplicación y operaciones auxiliares.
+Incluye suma, resta, multiplicación (simple, paralela y encadenada) y
+operaciones auxiliares.
 
 Autor: Nicolas
 """
 
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
 from .matriz import Matriz
+from .perfilador import perfilado, forma, flops_elementos, flops_producto
 
 
 def sumar_matrices(matriz_a, matriz_b):
@@ -100,6 +106,119 @@ def multiplicar_matrices(matriz_a, matriz_b):
     return resultado
 
 
+def multiplicar_matrices_paralelo(matriz_a, matriz_b, trabajadores=None, tam_bloque=None,
+                                  usar_hilos=None):
+    """
+    Multiplica dos matrices (A × B) repartiendo bloques de filas entre trabajadores.
+    
+    En CPython sin GIL (3.13t y posteriores) los bloques se calculan en un
+    ThreadPoolExecutor con paralelismo real; con GIL se usa un
+    ProcessPoolExecutor, que envía B a cada proceso una sola vez. Cada
+    elemento se acumula en el mismo orden que multiplicar_matrices, por lo
+    que el resultado es idéntico al del núcleo secuencial.
+    
+    Args:
+        matriz_a (Matriz): Primera matriz
+        matriz_b (Matriz): Segunda matriz
+        trabajadores (int): Número de hilos o procesos (default: núcleos disponibles)
+        tam_bloque (int): Filas por tarea (default: reparto en 4 tareas por trabajador)
+        usar_hilos (bool): Fuerza hilos (True) o procesos (False);
+            por defecto hilos solo si el intérprete no tiene GIL
+        
+    Returns:
+        Matriz: Resultado de la multiplicación
+        
+    Raises:
+        ValueError: Si las dimensiones no son compatibles o los parámetros no son positivos
+    """
+    if matriz_a.columnas != matriz_b.filas:
+        raise ValueError(f"Para multiplicar matrices, el número de columnas de la primera "
+                        f"debe ser igual al número de filas de la segunda. "
+                        f"Matriz A: {matriz_a.filas}x{matriz_a.columnas}, "
+                        f"Matriz B: {matriz_b.filas}x{matriz_b.columnas}")
+    
+    trabajadores = trabajadores or os.cpu_count() or 1
+    if tam_bloque is None:
+        tam_bloque = max(1, -(-matriz_a.filas // (4 * trabajadores)))
+    if trabajadores < 1 or tam_bloque < 1:
+        raise ValueError("El número de trabajadores y el tamaño de bloque deben ser positivos")
+    if usar_hilos is None:
+        usar_hilos = not _gil_activo()
+    
+    columnas_b = [list(columna) for columna in zip(*matriz_b.datos)]
+    bloques = [matriz_a.datos[inicio:inicio + tam_bloque]
+               for inicio in range(0, matriz_a.filas, tam_bloque)]
+    
+    if trabajadores == 1 or len(bloques) == 1:
+        filas = _multiplicar_filas(matriz_a.datos, columnas_b)
+    elif usar_hilos:
+        with ThreadPoolExecutor(trabajadores) as ejecutor:
+            partes = ejecutor.map(_multiplicar_filas, bloques, [columnas_b] * len(bloques))
+            filas = [fila for parte in partes for fila in parte]
+    else:
+        with ProcessPoolExecutor(trabajadores, initializer=_iniciar_proceso,
+                                 initargs=(columnas_b,)) as ejecutor:
+            filas = [fila for parte in ejecutor.map(_multiplicar_filas, bloques) for fila in parte]
+    
+    resultado = Matriz(matriz_a.filas, matriz_b.columnas)
+    resultado.datos = filas
+    return resultado
+
+
+def _gil_activo():
+    """
+    Indica si el intérprete ejecuta con el GIL activado.
+    
+    Returns:
+        bool: False solo en compilaciones sin GIL con el GIL desactivado
+    """
+    return getattr(sys, '_is_gil_enabled', lambda: True)()
+
+
+def multiplicar_cadena(matrices):
+    """
+    Multiplica una cadena de matrices (A₁ × A₂ × ... × Aₙ) en el orden más barato.
+    
+    El orden de evaluación no cambia el resultado matemático pero sí el costo:
+    A × B × v con A, B de n×n y v de n×1 cuesta O(n³) de izquierda a derecha
+    y O(n²) como A × (B × v). La parentización se elige por programación
+    dinámica sobre las dimensiones y la densidad de cada matriz, y los
+    productos omiten los elementos nulos de la matriz izquierda.
+    
+    Args:
+        matrices (list): Lista de matrices (Matriz) a multiplicar en orden
+        
+    Returns:
+        Matriz: Resultado de la multiplicación encadenada
+        
+    Raises:
+        ValueError: Si la lista está vacía o las dimensiones no son compatibles
+    """
+    if not matrices:
+        raise ValueError("Debe indicar al menos una matriz para multiplicar")
+    
+    for matriz_a, matriz_b in zip(matrices, matrices[1:]):
+        if matriz_a.columnas != matriz_b.filas:
+            raise ValueError(f"Para multiplicar matrices, el número de columnas de la primera "
+                            f"debe ser igual al número de filas de la segunda. "
+                            f"Matriz A: {matriz_a.filas}x{matriz_a.columnas}, "
+                            f"Matriz B: {matriz_b.filas}x{matriz_b.columnas}")
+    
+    if len(matrices) == 1:
+        return matrices[0].copiar()
+    
+    dimensiones = [matriz.filas for matriz in matrices] + [matrices[-1].columnas]
+    division = _orden_cadena(dimensiones, [_densidad(matriz) for matriz in matrices])
+    
+    def producto(i, j):
+        if i == j:
+            return matrices[i]
+        k = division[i][j]
+        return _multiplicar_omitiendo_ceros(producto(i, k), producto(k + 1, j))
+    
+    return producto(0, len(matrices) - 1)
+
+
 def multiplicar_por_escalar(matriz, escalar):
     """
     Multiplica una matriz por un escalar.
@@ -231,3 +350,167 @@ def son_matrices_iguales(matriz_a, matriz_b, tolerancia=1e-10):
                 return False
     
     return True
+
+
+def _densidad(matriz):
+    """
+    Calcula la fracción de elementos no nulos de una matriz.
+    
+    Args:
+        matriz (Matriz): Matriz a analizar
+        
+    Returns:
+        float: Valor entre 0 y 1
+    """
+    no_nulos = sum(1 for fila in matriz.datos for valor in fila if valor != 0)
+    return no_nulos / (matriz.filas * matriz.columnas)
+
+
+def _orden_cadena(dimensiones, densidades):
+    """
+    Calcula la parentización de menor costo de una cadena de productos.
+    
+    Multiplicar A (p×q, densidad d) por B (q×r) omitiendo los ceros de A
+    cuesta d·p·q·r operaciones. La densidad de cada producto intermedio se
+    estima suponiendo elementos no nulos independientes:
+    1 - (1 - dA·dB)^q.
+    
+    Args:
+        dimensiones (list): n+1 dimensiones; la matriz i es dimensiones[i]×dimensiones[i+1]
+        densidades (list): Densidad de cada una de las n matrices
+        
+    Returns:
+        list: Tabla donde division[i][j] = k indica (A_i…A_k)(A_k+1…A_j)
+    """
+    n = len(densidades)
+    costo = [[0.0] * n for _ in range(n)]
+    densidad = [[0.0] * n for _ in range(n)]
+    division = [[0] * n for _ in range(n)]
+    
+    for i in range(n):
+        densidad[i][i] = densidades[i]
+    
+    for longitud in range(2, n + 1):
+        for i in range(n - longitud + 1):
+            j = i + longitud - 1
+            costo[i][j] = float('inf')
+            for k in range(i, j):
+                q = dimensiones[k + 1]
+                candidato = (costo[i][k] + costo[k + 1][j] +
+                             densidad[i][k] * dimensiones[i] * q * dimensiones[j + 1])
+                if candidato < costo[i][j]:
+                    costo[i][j] = candidato
+                    division[i][j] = k
+                    densidad[i][j] = 1 - (1 - densidad[i][k] * densidad[k + 1][j]) ** q
+    
+    return division
+
+
+def _multiplicar_omitiendo_ceros(matriz_a, matriz_b):
+    """
+    Multiplica dos matrices recorriendo A por filas y omitiendo sus ceros.
+    
+    Cada fila del resultado se acumula como combinación de las filas de B
+    (orden i-k-j), sumando los términos en el mismo orden que
+    multiplicar_matrices.
+    
+    Args:
+        matriz_a (Matriz): Primera matriz
+        matriz_b (Matriz): Segunda matriz
+        
+    Returns:
+        Matriz: Resultado de la multiplicación
+    """
+    resultado = Matriz(matriz_a.filas, matriz_b.columnas)
+    
+    for i, fila_a in enumerate(matriz_a.datos):
+        fila_resultado = resultado.datos[i]
+        for k, valor in enumerate(fila_a):
+            if valor == 0:
+                continue
+            fila_resultado = [acumulado + valor * elemento
+                              for acumulado, elemento in zip(fila_resultado, matriz_b.datos[k])]
+        resultado.datos[i] = fila_resultado
+    
+    return resultado
+
+
+# Columnas de B en cada proceso del ProcessPoolExecutor (se envían una sola vez)
+_columnas_proceso = None
+
+
+def _iniciar_proceso(columnas_b):
+    """
+    Inicializa un proceso trabajador con las columnas de B.
+    
+    Args:
+        columnas_b (list): Columnas de la matriz derecha
+    """
+    global _columnas_proceso
+    _columnas_proceso = columnas_b
+
+
+def _multiplicar_filas(filas_a, columnas_b=None):
+    """
+    Calcula un bloque de filas del producto.
+    
+    La suma recorre k en orden y parte de 0, igual que multiplicar_matrices
+    (no se usa sum(), que en Python 3.12+ compensa el redondeo de floats).
+    
+    Args:
+        filas_a (list): Filas de A del bloque
+        columnas_b (list): Columnas de B (default: las del proceso trabajador)
+        
+    Returns:
+        list: Filas del resultado
+    """
+    if columnas_b is None:
+        columnas_b = _columnas_proceso
+    
+    bloque = []
+    for fila in filas_a:
+        fila_resultado = []
+        for columna in columnas_b:
+            suma = 0
+            for valor_a, valor_b in zip(fila, columna):
+                suma += valor_a * valor_b
+            fila_resultado.append(suma)
+        bloque.append(fila_resultado)
+    return bloque
+
+
+# ============ INSTRUMENTACIÓN ============
+
+def _flops_cadena(args, kwargs):
+    """2·(multiplicaciones escalares del orden óptimo), como si todas fueran densas."""
+    formas = [forma(matriz) for matriz in args[0]]
+    dimensiones = [f[0] for f in formas] + [formas[-1][1]]
+    division = _orden_cadena(dimensiones, [1.0] * len(formas))
+    
+    def costo(i, j):
+        if i == j:
+            return 0
+        k = division[i][j]
+        return costo(i, k) + costo(k + 1, j) + dimensiones[i] * dimensiones[k + 1] * dimensiones[j + 1]
+    
+    return 2.0 * costo(0, len(formas) - 1)
+
+
+def _flops_potencia(args, kwargs):
+    """Productos de n×n que hace potencia_matriz (exponente - 1)."""
+    n = forma(args[0])[0]
+    return 2.0 * n ** 3 * max(args[1] - 1, 0)
+
+
+sumar_matrices = perfilado('operaciones.sumar_matrices', flops_elementos)(sumar_matrices)
+restar_matrices = perfilado('operaciones.restar_matrices', flops_elementos)(restar_matrices)
+multiplicar_matrices = perfilado('operaciones.multiplicar_matrices', flops_producto)(multiplicar_matrices)
+multiplicar_matrices_paralelo = perfilado('operaciones.multiplicar_matrices_paralelo',
+                                          flops_producto)(multiplicar_matrices_paralelo)
+multiplicar_cadena = perfilado('operaciones.multiplicar_cadena', _flops_cadena)(multiplicar_cadena)
+multiplicar_por_escalar = perfilado('operaciones.multiplicar_por_escalar', flops_elementos)(multiplicar_por_escalar)
+potencia_matriz = perfilado('operaciones.potencia_matriz', _flops_potencia)(potencia_matriz)
+crear_matriz_identidad = perfilado('operaciones.crear_matriz_identidad')(crear_matriz_identidad)
+crear_matriz_ceros = perfilado('operaciones.crear_matriz_ceros')(crear_matriz_ceros)
+crear_matriz_unos = perfilado('operaciones.crear_matriz_unos')(crear_matriz_unos)
+son_matrices_iguales = perfilado('operaciones.son_matrices_iguales', flops_elementos)(son_matrices_iguales)
@@ -0,0 +1,218 @@
+"""
+Paginación y Resumen de Matrices en Consola
+===========================================
+
+Presentación de matrices grandes en la terminal sin volcarlas enteras:
+
+- resumir: primeras y últimas filas/columnas con elipsis (…, ⋮, ⋱).
+  Solo se formatean los elementos de los bordes.
+- Paginador: recorre la matriz por páginas de filas y ventanas de
+  columnas que caben en la terminal, formateando solo la página pedida.
+  Órdenes: Enter/s siguiente, a anterior, d/i columnas a la
+  derecha/izquierda, f N ir a la fila N, c N ir a la columna N, q salir.
+
+Autor: Nicolas
+"""
+
+import shutil
+
+from .utilidades import formatear_numero
+
+# Las matrices mayores que esto se resumen en Matriz.mostrar
+LIMITE_COMPLETA = 20
+FILAS_POR_PAGINA = 20
+BORDES_RESUMEN = 3
+SEPARACION = 2
+
+ELIPSIS_HORIZONTAL = '…'
+ELIPSIS_VERTICAL = '⋮'
+ELIPSIS_DIAGONAL = '⋱'
+
+AYUDA_PAGINADOR = "[Enter/s] siguiente  [a] anterior  [d/i] columnas →/←  [f N] fila  [c N] columna  [q] salir"
+
+
+def _indices_bordes(total, bordes):
+    """Índices de los bordes con None en el hueco central (si lo hay)."""
+    if total <= 2 * bordes + 1:
+        return list(range(total))
+    return list(range(bordes)) + [None] + list(range(total - bordes, total))
+
+
+def componer(textos, etiquetas_filas, etiquetas_columnas):
+    """
+    Alinea una rejilla de textos con índices de fila y columna.
+
+    Args:
+        textos (list): Lista de filas con el texto de cada celda
+        etiquetas_filas (list): Índice de cada fila
+        etiquetas_columnas (list): Índice de cada columna
+
+    Returns:
+        str: Tabla con una línea de encabezado y una por fila
+    """
+    anchos = [max([len(etiqueta)] + [len(fila[j]) for fila in textos])
+              for j, etiqueta in enumerate(etiquetas_columnas)]
+    ancho_indice = max((len(etiqueta) for etiqueta in etiquetas_filas), default=0)
+    separador = ' ' * SEPARACION
+
+    lineas = [' ' * ancho_indice + separador
+              + separador.join(etiqueta.rjust(ancho) for etiqueta, ancho in zip(etiquetas_columnas, anchos))]
+    for etiqueta, fila in zip(etiquetas_filas, textos):
+        lineas.append(etiqueta.rjust(ancho_indice) + separador
+                      + separador.join(texto.rjust(ancho) for texto, ancho in zip(fila, anchos)))
+    return "\n".join(lineas)
+
+
+def resumir(matriz, bordes=BORDES_RESUMEN):
+    """
+    Resume una matriz con sus primeras y últimas filas y columnas.
+
+    Args:
+        matriz (Matriz): Matriz a resumir
+        bordes (int): Filas/columnas que se muestran en cada extremo
+
+    Returns:
+        str: Tabla con elipsis en lugar de la parte central
+    """
+    filas = _indices_bordes(matriz.filas, bordes)
+    columnas = _indices_bordes(matriz.columnas, bordes)
+
+    textos = []
+    for i in filas:
+        if i is None:
+            textos.append([ELIPSIS_DIAGONAL if j is None else ELIPSIS_VERTICAL for j in columnas])
+        else:
+            fila = matriz.datos[i]
+            textos.append([ELIPSIS_HORIZONTAL if j is None else formatear_numero(fila[j]) for j in columnas])
+
+    return componer(textos,
+                    [ELIPSIS_VERTICAL if i is None else str(i) for i in filas],
+                    [ELIPSIS_HORIZONTAL if j is None else str(j) for j in columnas])
+
+
+def columnas_que_caben(matriz, fila, columna, filas, ancho):
+    """
+    Cuántas columnas desde columna caben en ancho caracteres.
+
+    Solo formatea los elementos de las filas de la página.
+
+    Args:
+        matriz (Matriz): Matriz a recorrer
+        fila (int): Primera fila de la página
+        columna (int): Primera columna de la ventana
+        filas (int): Filas de la página
+        ancho (int): Caracteres disponibles
+
+    Returns:
+        int: Número de columnas (al menos 1)
+    """
+    bloque = matriz.datos[fila:fila + filas]
+    usado = len(str(min(fila + filas, matriz.filas) - 1))
+    for j in range(columna, matriz.columnas):
+        ancho_columna = max([len(str(j))] + [len(formatear_numero(valores[j])) for valores in bloque])
+        usado += SEPARACION + ancho_columna
+        if usado > ancho:
+            return max(j - columna, 1)
+    return matriz.columnas - columna
+
+
+class Paginador:
+    """
+    Recorrido interactivo de una matriz por páginas en la consola.
+    """
+
+    def __init__(self, matriz, filas_por_pagina=FILAS_POR_PAGINA, ancho=None, entrada=input, salida=print):
+        """
+        Prepara el recorrido desde la esquina superior izquierda.
+
+        Args:
+            matriz (Matriz): Matriz a recorrer
+            filas_por_pagina (int): Filas de cada página
+            ancho (int): Ancho de la terminal (por defecto el detectado)
+            entrada (callable): Lee una orden (por defecto input)
+            salida (callable): Escribe una página (por defecto print)
+        """
+        self.matriz = matriz
+        self.filas_por_pagina = max(1, filas_por_pagina)
+        self.ancho = ancho or shutil.get_terminal_size().columns
+        self.fila = 0
+        self.columna = 0
+        self.columnas_visibles = 1
+        self._entrada = entrada
+        self._salida = salida
+
+
+    def pagina(self):
+        """
+        Texto de la página actual (solo formatea sus elementos).
+
+        Returns:
+            str: Tabla de la página y una línea con su posición
+        """
+        filas, columnas = self.matriz.filas, self.matriz.columnas
+        self.columnas_visibles = columnas_que_caben(self.matriz, self.fila, self.columna,
+                                                    self.filas_por_pagina, self.ancho)
+        fila_fin = min(self.fila + self.filas_por_pagina, filas)
+        columna_fin = min(self.columna + self.columnas_visibles, columnas)
+
+        textos = [[formatear_numero(valor) for valor in fila[self.columna:columna_fin]]
+                  for fila in self.matriz.datos[self.fila:fila_fin]]
+        tabla = componer(textos,
+                         [str(i) for i in range(self.fila, fila_fin)],
+                         [str(j) for j in range(self.columna, columna_fin)])
+        return (f"{tabla}\n"
+                f"Filas {self.fila}–{fila_fin - 1} de {filas} · columnas {self.columna}–{columna_fin - 1} de {columnas}")
+
+
+    def procesar(self, orden):
+        """
+        Aplica una orden del usuario.
+
+        Args:
+            orden (str): Orden (ver AYUDA_PAGINADOR)
+
+        Returns:
+            bool: False si la orden es salir
+
+        Raises:
+            ValueError: Si la orden no es válida
+        """
+        partes = orden.strip().lower().split()
+        comando = partes[0] if partes else 's'
+        filas, columnas = self.matriz.filas, self.matriz.columnas
+
+        if comando == 'q':
+            return False
+        if comando == 's':
+            if self.fila + self.filas_por_pagina < filas:
+                self.fila += self.filas_por_pagina
+        elif comando == 'a':
+            self.fila = max(self.fila - self.filas_por_pagina, 0)
+        elif comando == 'd':
+            self.columna = min(self.columna + self.columnas_visibles, columnas - 1)
+        elif comando == 'i':
+            self.columna = max(self.columna - self.columnas_visibles, 0)
+        elif comando in ('f', 'c') and len(partes) == 2 and partes[1].lstrip('-').isdigit():
+            destino = int(partes[1])
+            if comando == 'f':
+                self.fila = min(max(destino, 0), filas - 1)
+            else:
+                self.columna = min(max(destino, 0), columnas - 1)
+        else:
+            raise ValueError(f"Orden no válida: '{orden.strip()}'")
+        return True
+
+
+    def ejecutar(self):
+        """Muestra páginas y lee órdenes hasta que el usuario sale."""
+        while True:
+            self._salida(self.pagina())
+            try:
+                orden = self._entrada(AYUDA_PAGINADOR + "\n> ")
+            except EOFError:
+                return
+            try:
+                if not self.procesar(orden):
+                    return
+            except ValueError as e:
+                self._salida(f"❌ {e}")
@@ -0,0 +1,332 @@
+"""
+Perfilador de Operaciones
+=========================
+
+Registro en memoria de lo que cuestan las funciones de ``operaciones``:
+tiempo real y de CPU, FLOPs estimados, bytes reservados y formas/tipos de
+las entradas.
+
+- Las funciones se envuelven una sola vez al importar ``operaciones``
+  (``perfilado``). Con el perfilador desactivado (el estado inicial) el
+  envoltorio solo comprueba un atributo y llama a la función original.
+- Los bytes se miden con ``tracemalloc`` solo si se activa con
+  ``memoria=True``, y solo en las llamadas de primer nivel.
+- Cada operación guarda sus últimas ``MAX_MEDICIONES`` mediciones;
+  ``resumen`` calcula percentiles del tiempo real.
+
+Uso::
+
+    from src.perfilador import PERFILADOR
+
+    with PERFILADOR.perfilando(memoria=True):
+        multiplicar_matrices(a, b)
+    print(PERFILADOR.informe())
+
+Autor: Nicolas
+"""
+
+import functools
+import threading
+import time
+import tracemalloc
+from collections import deque
+from contextlib import contextmanager
+
+MAX_MEDICIONES = 10_000
+PERCENTILES = (50, 90, 99)
+
+
+class Medicion:
+    """Costo de una llamada a una operación."""
+
+    __slots__ = ('operacion', 'tiempo', 'cpu', 'flops', 'bytes', 'formas', 'tipos', 'profundidad')
+
+    def __init__(self, operacion, tiempo, cpu, flops, bytes, formas, tipos, profundidad):
+        self.operacion = operacion
+        self.tiempo = tiempo
+        self.cpu = cpu
+        self.flops = flops
+        self.bytes = bytes
+        self.formas = formas
+        self.tipos = tipos
+        self.profundidad = profundidad
+
+    def __repr__(self):
+        return (f"Medicion({self.operacion}, {self.tiempo * 1e3:.3f} ms, formas={self.formas}, "
+                f"flops={self.flops}, bytes={self.bytes})")
+
+
+def forma(valor):
+    """
+    Dimensiones de una Matriz.
+
+    Args:
+        valor: Argumento de una operación
+
+    Returns:
+        tuple: (filas, columnas), o None si no es una matriz
+    """
+    filas, columnas = getattr(valor, 'filas', None), getattr(valor, 'columnas', None)
+    if filas is None or columnas is None:
+        return None
+    return (filas, columnas)
+
+
+def tipo(valor):
+    """
+    Tipo de los elementos de una Matriz (el de su primer elemento).
+
+    Args:
+        valor: Argumento de una operación
+
+    Returns:
+        str: Nombre del tipo ('int', 'Fraction'...), o None si no es una matriz
+    """
+    datos = getattr(valor, 'datos', None)
+    if forma(valor) is None or not datos or not datos[0]:
+        return None
+    return type(datos[0][0]).__name__
+
+
+# ============ ESTIMADORES DE FLOPS ============
+
+def flops_elementos(args, kwargs):
+    """Una operación por elemento del primer operando."""
+    forma_a = forma(args[0]) if args else None
+    return float(forma_a[0] * forma_a[1]) if forma_a else None
+
+
+def flops_producto(args, kwargs):
+    """2·m·k·n para el producto de los dos primeros operandos."""
+    forma_a, forma_b = (forma(args[0]), forma(args[1])) if len(args) > 1 else (None, None)
+    if not forma_a or not forma_b:
+        return None
+    return 2.0 * forma_a[0] * forma_a[1] * forma_b[1]
+
+
+class Perfilador:
+    """Registro de mediciones por operación."""
+
+    def __init__(self, max_mediciones=MAX_MEDICIONES):
+        """
+        Crea un perfilador desactivado y vacío.
+
+        Args:
+            max_mediciones (int): Mediciones que se guardan por operación
+        """
+        self.activo = False
+        self.memoria = False
+        self.max_mediciones = max_mediciones
+        self._mediciones = {}
+        self._cerrojo = threading.Lock()
+        self._local = threading.local()
+        self._tracemalloc_propio = False
+
+    def activar(self, memoria=False):
+        """
+        Empieza a medir.
+
+        Args:
+            memoria (bool): Medir también los bytes reservados (tracemalloc,
+                que ralentiza notablemente todas las reservas de memoria)
+        """
+        self.memoria = memoria
+        if memoria and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._tracemalloc_propio = True
+        self.activo = True
+
+    def desactivar(self):
+        """Deja de medir (las mediciones se conservan)."""
+        self.activo = False
+        self.memoria = False
+        if self._tracemalloc_propio:
+            tracemalloc.stop()
+            self._tracemalloc_propio = False
+
+    @contextmanager
+    def perfilando(self, memoria=False):
+        """Activa el perfilador dentro de un bloque ``with``."""
+        self.activar(memoria)
+        try:
+            yield self
+        finally:
+            self.desactivar()
+
+    def medir(self, operacion, funcion, args, kwargs, flops=None):
+        """
+        Ejecuta una llamada y registra su medición.
+
+        Args:
+            operacion (str): Nombre con el que se registra
+            funcion (callable): Función a ejecutar
+            args (tuple): Argumentos posicionales de la llamada
+            kwargs (dict): Argumentos con nombre de la llamada
+            flops (callable): Estimador de FLOPs, recibe (args, kwargs)
+
+        Returns:
+            El resultado de la llamada
+        """
+        profundidad = getattr(self._local, 'profundidad', 0)
+        medir_memoria = self.memoria and profundidad == 0 and tracemalloc.is_tracing()
+        if medir_memoria:
+            reservado, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+
+        self._local.profundidad = profundidad + 1
+        cpu_inicio = time.process_time()
+        inicio = time.perf_counter()
+        try:
+            return funcion(*args, **kwargs)
+        finally:
+            tiempo = time.perf_counter() - inicio
+            cpu = time.process_time() - cpu_inicio
+            self._local.profundidad = profundidad
+
+            bytes_reservados = None
+            if medir_memoria:
+                bytes_reservados = max(tracemalloc.get_traced_memory()[1] - reservado, 0)
+            try:
+                estimados = flops(args, kwargs) if flops is not None else None
+            except Exception:
+                estimados = None
+            valores = tuple(args) + tuple(kwargs.values())
+            formas = tuple(f for f in map(forma, valores) if f is not None)
+            tipos = tuple(t for t in map(tipo, valores) if t is not None)
+            self.registrar(Medicion(operacion, tiempo, cpu, estimados, bytes_reservados, formas, tipos,
+                                    profundidad))
+
+    def registrar(self, medicion):
+        """Añade una medición al registro de su operación."""
+        with self._cerrojo:
+            registro = self._mediciones.get(medicion.operacion)
+            if registro is None:
+                registro = self._mediciones[medicion.operacion] = deque(maxlen=self.max_mediciones)
+            registro.append(medicion)
+
+    def mediciones(self, operacion=None):
+        """
+        Mediciones guardadas, de una operación o de todas.
+
+        Args:
+            operacion (str): Nombre de la operación (default: todas)
+
+        Returns:
+            list: Mediciones en orden de registro por operación
+        """
+        with self._cerrojo:
+            if operacion is not None:
+                return list(self._mediciones.get(operacion, ()))
+            return [m for registro in self._mediciones.values() for m in registro]
+
+    def resumen(self, percentiles=PERCENTILES):
+        """
+        Estadísticas por operación.
+
+        Args:
+            percentiles (tuple): Percentiles del tiempo real
+
+        Returns:
+            dict: Para cada operación: ``llamadas``, ``total``, ``media``,
+            ``p50``… (segundos), ``cpu`` (segundos), ``flops`` (suma de las
+            estimadas), ``gflops`` (por segundo real) y ``bytes_max`` (None
+            si no se midió)
+        """
+        with self._cerrojo:
+            registros = {operacion: list(registro) for operacion, registro in self._mediciones.items()}
+
+        resumen = {}
+        for operacion, registro in sorted(registros.items()):
+            tiempos = sorted(m.tiempo for m in registro)
+            flops = [m.flops for m in registro if m.flops is not None]
+            bytes_medidos = [m.bytes for m in registro if m.bytes is not None]
+            estadisticas = {
+                'llamadas': len(registro),
+                'total': sum(tiempos),
+                'media': sum(tiempos) / len(tiempos),
+                'cpu': sum(m.cpu for m in registro),
+                'flops': float(sum(flops)) if flops else None,
+                'gflops': None,
+                'bytes_max': max(bytes_medidos) if bytes_medidos else None,
+            }
+            for p in percentiles:
+                estadisticas[f"p{p:g}"] = _percentil(tiempos, p)
+            tiempo_con_flops = sum(m.tiempo for m in registro if m.flops is not None)
+            if flops and tiempo_con_flops > 0:
+                estadisticas['gflops'] = estadisticas['flops'] / tiempo_con_flops / 1e9
+            resumen[operacion] = estadisticas
+        return resumen
+
+    def informe(self, percentiles=PERCENTILES):
+        """
+        Tabla de texto con el resumen, de mayor a menor tiempo total.
+
+        Returns:
+            str: Una línea por operación
+        """
+        resumen = self.resumen(percentiles)
+        if not resumen:
+            return "(sin mediciones)"
+
+        columnas_p = [f"p{p:g}" for p in percentiles]
+        ancho = max(len(operacion) for operacion in resumen)
+        lineas = [f"{'Operación':<{ancho}}  {'llamadas':>8}  {'total ms':>10}  "
+                  + "  ".join(f"{c + ' ms':>9}" for c in columnas_p)
+                  + f"  {'GFLOP/s':>8}  {'pico MB':>8}"]
+        for operacion, e in sorted(resumen.items(), key=lambda par: -par[1]['total']):
+            gflops = f"{e['gflops']:.2f}" if e['gflops'] is not None else "—"
+            pico = f"{e['bytes_max'] / 2**20:.1f}" if e['bytes_max'] is not None else "—"
+            lineas.append(f"{operacion:<{ancho}}  {e['llamadas']:>8}  {e['total'] * 1e3:>10.3f}  "
+                          + "  ".join(f"{e[c] * 1e3:>9.3f}" for c in columnas_p)
+                          + f"  {gflops:>8}  {pico:>8}")
+        return "\n".join(lineas)
+
+    def limpiar(self):
+        """Descarta todas las mediciones."""
+        with self._cerrojo:
+            self._mediciones.clear()
+
+
+# Perfilador compartido por las funciones de operaciones
+PERFILADOR = Perfilador()
+
+
+def perfilado(operacion, flops=None):
+    """
+    Decorador que registra las llamadas en ``PERFILADOR`` cuando está activo.
+
+    Args:
+        operacion (str): Nombre con el que se registran las llamadas
+        flops (callable): Estimador de FLOPs de la llamada, recibe (args, kwargs)
+
+    Returns:
+        callable: Decorador
+    """
+    def decorar(funcion):
+        @functools.wraps(funcion)
+        def envoltorio(*args, **kwargs):
+            if not PERFILADOR.activo:
+                return funcion(*args, **kwargs)
+            return PERFILADOR.medir(operacion, funcion, args, kwargs, flops)
+        envoltorio.__wrapped_perfilado__ = True
+        return envoltorio
+    return decorar
+
+
+# ============ MÉTODOS PRIVADOS ============
+
+def _percentil(ordenados, p):
+    """
+    Percentil con interpolación lineal (el método por defecto de NumPy).
+
+    Args:
+        ordenados (list): Valores ordenados de menor a mayor (al menos uno)
+        p (float): Percentil entre 0 y 100
+
+    Returns:
+        float: Valor del percentil
+    """
+    posicion = (len(ordenados) - 1) * p / 100
+    inferior = int(posicion)
+    superior = min(inferior + 1, len(ordenados) - 1)
+    return ordenados[inferior] + (ordenados[superior] - ordenados[inferior]) * (posicion - inferior)
@@ -291,23 +291,129 @@ def formatear_matriz_como_texto(matriz):
     if not matriz or not matriz.datos:
         return "Matriz vacía"
     
-    # Calcular el ancho máximo necesario
-    max_ancho = 0
-    for fila in matriz.datos:
-        for elemento in fila:
-            ancho = len(formatear_numero(elemento))
-            max_ancho = max(max_ancho, ancho)
-    
-    max_ancho = max(max_ancho, 4)  # Ancho mínimo
-    
-    # Construir la representación
-    lineas = []
-    for fila in matriz.datos:
-        elementos_formateados = []
-        for elemento in fila:
-            elem_str = formatear_numero(elemento)
-            elementos_formateados.append(f"{elem_str:>{max_ancho}}")
+    # Los textos y anchos salen de la caché: cada elemento se formatea una
+    # sola vez mientras la matriz no cambie
+    from .cache_visualizacion import CACHE
+    textos, anchos = CACHE.textos(matriz)
+    max_ancho = max(max(anchos), 4)  # Ancho mínimo
+    
+    return "\n".join("[ " + "  ".join(f"{texto:>{max_ancho}}" for texto in fila) + " ]"
+                     for fila in textos)
+
+
+def dividir_linea(linea):
+    """
+    Separa una línea de números pegada o escrita por el usuario.
+    
+    Reconoce tabuladores (copiado desde una hoja de cálculo), punto y coma,
+    comas o espacios, en ese orden de preferencia.
+    
+    Args:
+        linea (str): Línea de texto
+        
+    Returns:
+        list: Lista de textos (uno por elemento)
+    """
+    for separador in ('\t', ';', ','):
+        if separador in linea:
+            return [parte.strip() for parte in linea.split(separador)]
+    return linea.split()
+
+
+def analizar_bloque(texto):
+    """
+    Convierte un bloque de texto (filas en líneas) en valores numéricos.
+    
+    Las líneas vacías se ignoran. Los elementos que no son números válidos
+    (enteros, decimales o fracciones como 3/4) quedan como None y se
+    informan en la lista de errores, sin detener el análisis.
+    
+    Args:
+        texto (str): Bloque con una fila por línea
+        
+    Returns:
+        tuple: (filas, errores) donde filas es una lista de listas de
+        valores y errores una lista de (fila, columna, texto) con índices
+        desde 0 relativos al bloque
+    """
+    from .validadores import validar_numero
+    
+    filas = []
+    errores = []
+    for linea in texto.splitlines():
+        if not linea.strip():
+            continue
+        
+        valores = []
+        for columna, parte in enumerate(dividir_linea(linea)):
+            try:
+                valores.append(validar_numero(parte))
+            except ValueError:
+                valores.append(None)
+                errores.append((len(filas), columna, parte))
+        filas.append(valores)
+    
+    return filas, errores
+
+
+def leer_filas(filas, columnas, leer=input, escribir=print, interactivo=None):
+    """
+    Lee una matriz fila a fila: cada línea es una fila completa.
+    
+    Se puede escribir una fila por línea o pegar un bloque de varias
+    líneas (una línea vacía lo termina antes de tiempo); la entrada también
+    puede venir de un archivo o tubería. Solo se vuelven a pedir las filas
+    con errores o con un número de elementos distinto de columnas.
+    
+    En modo interactivo cada línea se analiza en cuanto llega, así un error
+    en la fila 2 se avisa antes de escribir la 3. Si no, cada tanda de
+    líneas se analiza de una vez con analizar_bloque.
+    
+    Args:
+        filas (int): Número de filas a leer
+        columnas (int): Elementos de cada fila
+        leer (callable): Lee una línea dado un mensaje (por defecto input)
+        escribir (callable): Muestra los errores (por defecto print)
+        interactivo (bool): Analizar línea a línea (por defecto, si leer es
+            input y la entrada estándar es una terminal)
+        
+    Returns:
+        list: Lista de listas con los valores
+        
+    Raises:
+        ValueError: Si la entrada termina antes de completar la matriz
+    """
+    if interactivo is None:
+        interactivo = leer is input and sys.stdin is not None and sys.stdin.isatty()
+    datos = [None] * filas
+    pendientes = list(range(filas))
+    
+    while pendientes:
+        lineas = []
+        while len(lineas) < (1 if interactivo else len(pendientes)):
+            try:
+                linea = leer(f"Fila {pendientes[len(lineas)] + 1}: ")
+            except EOFError:
+                leidas = filas - len(pendientes) + len(lineas)
+                raise ValueError(f"La entrada terminó con {leidas} de {filas} filas")
+            if linea.strip():
+                lineas.append(linea)
+            elif lineas:
+                break
+        
+        valores, errores = analizar_bloque("\n".join(lineas))
+        invalidas = {}
+        for fila, columna, texto in errores:
+            invalidas.setdefault(fila, f"'{texto}' (columna {columna + 1}) no es un número")
+        for indice, fila in enumerate(valores):
+            if indice not in invalidas and len(fila) != columnas:
+                invalidas[indice] = f"tiene {len(fila)} elementos, se esperaban {columnas}"
         
-        lineas.append("[ " + "  ".join(elementos_formateados) + " ]")
+        for indice, mensaje in sorted(invalidas.items()):
+            escribir(f"❌ Fila {pendientes[indice] + 1}: {mensaje}")
+        for indice, fila in enumerate(valores):
+            if indice not in invalidas:
+                datos[pendientes[indice]] = fila
+        pendientes = [pendientes[indice] for indice in sorted(invalidas)] + pendientes[len(valores):]
     
-    return "\n".join(lineas)
+    return datos
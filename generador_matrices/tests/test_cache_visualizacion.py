@@ -0,0 +1,90 @@
+"""
+Pruebas unitarias para la caché de visualización
+================================================
+
+Tests para verificar que el texto formateado de las matrices se reutiliza
+mientras no cambian, se actualiza por elementos sueltos y se descarta por
+antigüedad al superar la capacidad.
+
+Autor: Nicolas
+"""
+
+import unittest
+import sys
+import os
+from fractions import Fraction
+
+# Agregar el directorio raíz al path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.matriz import Matriz
+from src.cache_visualizacion import CacheVisualizacion
+from src.utilidades import formatear_matriz_como_texto, formatear_numero
+
+
+class TestCacheVisualizacion(unittest.TestCase):
+    """Pruebas unitarias para src/cache_visualizacion.py."""
+
+    def setUp(self):
+        """Configuración inicial para cada test."""
+        self.cache = CacheVisualizacion()
+        self.matriz = Matriz(3, 2)
+        self.matriz.llenar_manual([[1, 2.5], ["3/4", -10], [0, 7]])
+
+    def test_acierto_y_texto(self):
+        """Testa que la segunda consulta no reformatea y que el texto es el de siempre."""
+        textos, anchos = self.cache.textos(self.matriz)
+        self.assertEqual(textos, [["1", "2.5"], ["3/4", "-10"], ["0", "7"]])
+        self.assertEqual(anchos, [3, 3])
+        self.cache.textos(self.matriz)
+        self.assertEqual((self.cache.fallos, self.cache.aciertos), (1, 1))
+
+        esperado = "\n".join("[ " + "  ".join(f"{formatear_numero(e):>4}" for e in fila) + " ]"
+                             for fila in self.matriz.datos)
+        self.assertEqual(formatear_matriz_como_texto(self.matriz), esperado)
+
+    def test_actualizacion_incremental(self):
+        """Testa que un elemento suelto se reformatea sin rehacer la matriz."""
+        self.cache.textos(self.matriz)
+        self.matriz.establecer_elemento(1, 1, Fraction(1, 3))
+        textos, anchos = self.cache.textos(self.matriz)
+        self.assertEqual(textos[1][1], "1/3")
+        self.assertEqual(anchos, [3, 3])
+        self.assertEqual(self.cache.incrementales, 1)
+
+        # El ancho baja al reemplazar el único elemento más ancho
+        self.matriz.establecer_elemento(1, 0, 5)
+        self.matriz.establecer_elemento(0, 1, 2)
+        _, anchos = self.cache.textos(self.matriz)
+        self.assertEqual(anchos, [1, 3])
+        self.assertEqual(self.cache.fallos, 1)
+
+    def test_cambios_completos(self):
+        """Testa que llenar la matriz o marcarla modificada obliga a reformatear."""
+        self.cache.textos(self.matriz)
+        self.matriz.llenar_aleatorio(100, 100)
+        self.assertEqual(self.cache.textos(self.matriz)[0][0], ["100", "100"])
+
+        self.matriz.datos[2][1] = 12345
+        self.matriz.marcar_modificada()
+        self.assertEqual(self.cache.textos(self.matriz)[1], [3, 5])
+        self.assertEqual(self.cache.fallos, 3)
+        self.assertEqual(str(self.matriz).splitlines()[2], "[ 100  12345 ]")
+
+    def test_descarte_lru(self):
+        """Testa que se descartan las entradas menos usadas al superar la capacidad."""
+        matrices = [Matriz(10, 10) for _ in range(3)]
+        self.cache.textos(matrices[0])
+        self.cache.capacidad_bytes = self.cache.bytes * 2
+        self.cache.textos(matrices[1])
+        self.cache.textos(matrices[0])
+        self.cache.textos(matrices[2])
+        self.assertEqual(len(self.cache), 2)
+
+        self.cache.textos(matrices[0])
+        self.cache.textos(matrices[1])
+        self.assertEqual(self.cache.fallos, 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
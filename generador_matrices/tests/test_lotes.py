@@ -0,0 +1,81 @@
+"""
+Pruebas unitarias para la ejecución por lotes
+=============================================
+
+Tests para verificar el modo no interactivo: órdenes, expresiones,
+archivos y códigos de salida.
+
+Autor: Nicolas
+"""
+
+import unittest
+import sys
+import os
+import io
+import subprocess
+import tempfile
+from fractions import Fraction
+
+# Agregar el directorio raíz al path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from interfaces.lotes import EjecutorLotes, EXITO, ERROR_EJECUCION, ERROR_SINTAXIS
+
+
+class TestEjecutorLotes(unittest.TestCase):
+    """Pruebas unitarias para EjecutorLotes."""
+    
+    def setUp(self):
+        """Configuración inicial para cada test."""
+        self.salida = io.StringIO()
+        self.registro = io.StringIO()
+        self.ejecutor = EjecutorLotes(self.salida, self.registro)
+        self.directorio = tempfile.TemporaryDirectory()
+    
+    def tearDown(self):
+        self.directorio.cleanup()
+    
+    def test_guion_completo(self):
+        """Testa creación, operaciones, guardado y carga."""
+        ruta = os.path.join(self.directorio.name, "c.csv")
+        codigo = self.ejecutor.ejecutar([
+            "# comentario",
+            "identidad I 2",
+            "unos U 2 2",
+            "S = U + I   # suma",
+            "C = 1/2 * S",
+            "P = S @ U @ I",
+            f"guardar C {ruta}",
+            f"cargar D {ruta}",
+            "mostrar D",
+        ])
+        
+        self.assertEqual(codigo, EXITO)
+        self.assertEqual(self.ejecutor.matrices['D'].datos, [[1, Fraction(1, 2)], [Fraction(1, 2), 1]])
+        self.assertEqual(self.ejecutor.matrices['P'].datos, [[3, 3], [3, 3]])
+        self.assertIn("1/2", self.salida.getvalue())
+    
+    def test_codigos_de_error(self):
+        """Testa los códigos de salida de errores de sintaxis y de ejecución."""
+        self.assertEqual(self.ejecutor.ejecutar(["girar A"]), ERROR_SINTAXIS)
+        self.assertEqual(self.ejecutor.ejecutar(["ceros Z 2"]), ERROR_SINTAXIS)
+        self.assertEqual(self.ejecutor.ejecutar(["C = A + B"]), ERROR_EJECUCION)
+        self.assertEqual(self.ejecutor.ejecutar(["ceros A 2 3", "B = A @ A"]), ERROR_EJECUCION)
+        self.assertIn("Línea 2", self.registro.getvalue())
+    
+    def test_main_sin_tkinter(self):
+        """Testa main.py --script leyendo de stdin sin importar tkinter."""
+        raiz = os.path.join(os.path.dirname(__file__), '..')
+        codigo = ("import sys, main\n"
+                  "try:\n"
+                  "    main.main(['--script', '-'])\n"
+                  "except SystemExit as e:\n"
+                  "    print(e.code, 'tkinter' in sys.modules)\n")
+        resultado = subprocess.run([sys.executable, "-c", codigo], cwd=raiz, input="identidad I 3\nmostrar I\n",
+                                   capture_output=True, text=True, timeout=60)
+        
+        self.assertEqual(resultado.stdout.splitlines()[-1], "0 False")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -181,5 +181,92 @@ class TestOperaciones(unittest.TestCase):
         self.assertFalse(son_matrices_iguales(self.matriz_2x2_a, matriz_float, 1e-10))
 
 
+class TestMultiplicarCadena(unittest.TestCase):
+    """Pruebas unitarias para la multiplicación encadenada."""
+    
+    def setUp(self):
+        """Configuración inicial para cada test."""
+        self.matriz_a = Matriz(30, 30)
+        self.matriz_a.llenar_aleatorio(-5, 5)
+        self.matriz_b = Matriz(30, 30)
+        self.matriz_b.llenar_aleatorio(-5, 5)
+        self.vector = Matriz(30, 1)
+        self.vector.llenar_aleatorio(-5, 5)
+    
+    def test_resultado_igual_a_izquierda_a_derecha(self):
+        """Testa que el resultado coincida con multiplicar en orden."""
+        esperado = multiplicar_matrices(multiplicar_matrices(self.matriz_a, self.matriz_b), self.vector)
+        resultado = multiplicar_cadena([self.matriz_a, self.matriz_b, self.vector])
+        
+        self.assertEqual(resultado.datos, esperado.datos)
+    
+    def test_orden_elegido(self):
+        """Testa que se elija A × (B × v) y que la densidad cambie el orden."""
+        from src.operaciones import _orden_cadena
+        
+        self.assertEqual(_orden_cadena([30, 30, 30, 1], [1.0, 1.0, 1.0])[0][2], 0)
+        # Con A casi vacía conviene (A × B) × C aunque las formas sugieran lo contrario
+        self.assertEqual(_orden_cadena([10, 100, 5, 50], [1.0, 1.0, 1.0])[0][2], 1)
+        self.assertEqual(_orden_cadena([50, 5, 100, 10], [1.0, 1.0, 1.0])[0][2], 0)
+        self.assertEqual(_orden_cadena([50, 5, 100, 10], [0.001, 1.0, 1.0])[0][2], 1)
+    
+    def test_fracciones_y_ceros(self):
+        """Testa fracciones y matrices con ceros."""
+        matriz_f = Matriz(2, 2)
+        matriz_f.llenar_manual([["1/2", 0], [0, "1/3"]])
+        resultado = multiplicar_cadena([matriz_f, matriz_f, matriz_f])
+        
+        self.assertEqual(resultado.datos, [[Fraction(1, 8), 0], [0, Fraction(1, 27)]])
+    
+    def test_cadena_invalida(self):
+        """Testa errores de la multiplicación encadenada."""
+        with self.assertRaises(ValueError):
+            multiplicar_cadena([])
+        with self.assertRaises(ValueError):
+            multiplicar_cadena([self.matriz_a, Matriz(2, 2)])
+        
+        copia = multiplicar_cadena([self.matriz_a])
+        self.assertEqual(copia.datos, self.matriz_a.datos)
+        self.assertIsNot(copia.datos, self.matriz_a.datos)
+
+
+class TestMultiplicarParalelo(unittest.TestCase):
+    """Pruebas unitarias para la multiplicación paralela por bloques de filas."""
+
+    def setUp(self):
+        """Configuración inicial para cada test."""
+        self.matriz_a = Matriz(23, 17)
+        self.matriz_a.datos = [[(i * 7 + j * 3) % 11 / 7 for j in range(17)] for i in range(23)]
+        self.matriz_b = Matriz(17, 9)
+        self.matriz_b.datos = [[(i * 5 - j) / 3 for j in range(9)] for i in range(17)]
+        self.esperado = multiplicar_matrices(self.matriz_a, self.matriz_b)
+
+    def test_identico_con_hilos(self):
+        """Testa que el resultado con hilos sea idéntico bit a bit para varios bloques."""
+        for tam_bloque in (1, 4, 23, 100):
+            resultado = multiplicar_matrices_paralelo(self.matriz_a, self.matriz_b, trabajadores=3,
+                                                      tam_bloque=tam_bloque, usar_hilos=True)
+            self.assertEqual(resultado.datos, self.esperado.datos)
+
+    def test_identico_con_procesos(self):
+        """Testa que el resultado con procesos sea idéntico, también con fracciones."""
+        resultado = multiplicar_matrices_paralelo(self.matriz_a, self.matriz_b, trabajadores=2,
+                                                  usar_hilos=False)
+        self.assertEqual(resultado.datos, self.esperado.datos)
+
+        matriz_f = Matriz(3, 3)
+        matriz_f.llenar_manual([["1/2", 1, 0], [0, "1/3", 2], [1, 1, "-1/5"]])
+        resultado = multiplicar_matrices_paralelo(matriz_f, matriz_f, trabajadores=2,
+                                                  tam_bloque=1, usar_hilos=False)
+        self.assertEqual(resultado.datos, multiplicar_matrices(matriz_f, matriz_f).datos)
+
+    def test_parametros_invalidos(self):
+        """Testa errores de dimensiones y de parámetros."""
+        with self.assertRaises(ValueError):
+            multiplicar_matrices_paralelo(self.matriz_b, self.matriz_b)
+        with self.assertRaises(ValueError):
+            multiplicar_matrices_paralelo(self.matriz_a, self.matriz_b, tam_bloque=0)
+
+
 if __name__ == '__main__':
     unittest.main()
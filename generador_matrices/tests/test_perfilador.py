@@ -0,0 +1,88 @@
+"""
+Pruebas unitarias para el perfilador de operaciones
+===================================================
+
+Tests para verificar que las funciones de operaciones se registran solo
+con el perfilador activo, con sus formas, tipos, FLOPs estimados y
+percentiles.
+
+Autor: Nicolas
+"""
+
+import unittest
+import sys
+import os
+from fractions import Fraction
+
+# Agregar el directorio raíz al path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.matriz import Matriz
+from src import operaciones
+from src.perfilador import PERFILADOR, Perfilador, Medicion
+
+
+class TestPerfilador(unittest.TestCase):
+    """Pruebas unitarias para src/perfilador.py."""
+
+    def setUp(self):
+        """Configuración inicial para cada test."""
+        PERFILADOR.desactivar()
+        PERFILADOR.limpiar()
+        self.a = Matriz(3, 4)
+        self.a.llenar_manual([[Fraction(i + j, 2) for j in range(4)] for i in range(3)])
+        self.b = operaciones.crear_matriz_unos(4, 2)
+
+    def tearDown(self):
+        """Deja el perfilador compartido desactivado y vacío."""
+        PERFILADOR.desactivar()
+        PERFILADOR.limpiar()
+
+    def test_desactivado_no_registra(self):
+        """Sin activar, las operaciones no dejan mediciones."""
+        operaciones.multiplicar_matrices(self.a, self.b)
+        self.assertEqual(PERFILADOR.mediciones(), [])
+
+    def test_registra_producto(self):
+        """El producto registra formas, tipos y 2·m·k·n FLOPs."""
+        with PERFILADOR.perfilando():
+            operaciones.multiplicar_matrices(self.a, self.b)
+
+        medicion, = PERFILADOR.mediciones('operaciones.multiplicar_matrices')
+        self.assertEqual(medicion.formas, ((3, 4), (4, 2)))
+        self.assertEqual(medicion.tipos, ('Fraction', 'int'))
+        self.assertEqual(medicion.flops, 2 * 3 * 4 * 2)
+        self.assertEqual(medicion.profundidad, 0)
+
+    def test_llamadas_anidadas(self):
+        """Cada función pública de operaciones se registra, también anidada."""
+        c = operaciones.crear_matriz_unos(2, 5)
+        cuadrada = operaciones.crear_matriz_identidad(3)
+        with PERFILADOR.perfilando(memoria=True):
+            operaciones.multiplicar_cadena([self.a, self.b, c])
+            operaciones.potencia_matriz(cuadrada, 3)
+
+        cadena, = PERFILADOR.mediciones('operaciones.multiplicar_cadena')
+        self.assertEqual(cadena.flops, 2 * (3 * 4 * 2 + 3 * 2 * 5))
+        self.assertIsNotNone(cadena.bytes)
+        potencia, = PERFILADOR.mediciones('operaciones.potencia_matriz')
+        self.assertEqual(potencia.flops, 2 * 27 * 2)
+        productos = PERFILADOR.mediciones('operaciones.multiplicar_matrices')
+        self.assertEqual([m.profundidad for m in productos], [1, 1])
+
+    def test_resumen_y_percentiles(self):
+        """resumen interpola los percentiles como NumPy e informe los lista."""
+        perfilador = Perfilador()
+        for tiempo in (0.001, 0.002, 0.003, 0.004):
+            perfilador.registrar(Medicion('op', tiempo, tiempo, 1e6, None, (), (), 0))
+        estadisticas = perfilador.resumen((50, 90))['op']
+        self.assertEqual(estadisticas['llamadas'], 4)
+        self.assertAlmostEqual(estadisticas['p50'], 0.0025)
+        self.assertAlmostEqual(estadisticas['p90'], 0.0037)
+        self.assertAlmostEqual(estadisticas['gflops'], 4e6 / 0.010 / 1e9)
+        self.assertIn('op', perfilador.informe())
+        self.assertEqual(Perfilador().informe(), "(sin mediciones)")
+
+
+if __name__ == '__main__':
+    unittest.main()
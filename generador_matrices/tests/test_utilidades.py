@@ -0,0 +1,95 @@
+"""
+Pruebas unitarias para las utilidades de entrada
+================================================
+
+Tests para verificar el análisis de bloques de texto pegados en el editor
+de matrices.
+
+Autor: Nicolas
+"""
+
+import unittest
+import sys
+import os
+import io
+from contextlib import redirect_stdout
+from fractions import Fraction
+
+# Agregar el directorio raíz al path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from unittest import mock
+
+from src.matriz import Matriz
+from src.utilidades import dividir_linea, analizar_bloque, leer_filas
+
+
+class TestAnalizarBloque(unittest.TestCase):
+    """Pruebas unitarias para dividir_linea y analizar_bloque."""
+
+    def test_dividir_linea(self):
+        """Testa los separadores reconocidos."""
+        self.assertEqual(dividir_linea("1\t2\t3"), ["1", "2", "3"])
+        self.assertEqual(dividir_linea("1;2;3"), ["1", "2", "3"])
+        self.assertEqual(dividir_linea("1, 2, 3"), ["1", "2", "3"])
+        self.assertEqual(dividir_linea("1 2   3"), ["1", "2", "3"])
+
+    def test_analizar_bloque(self):
+        """Testa tipos conservados, líneas vacías y errores con posición."""
+        filas, errores = analizar_bloque("1\t2.5\t3/4\n\nx\t5\n")
+        self.assertEqual(filas, [[1, 2.5, Fraction(3, 4)], [None, 5]])
+        self.assertIsInstance(filas[0][0], int)
+        self.assertEqual(errores, [(1, 0, "x")])
+
+
+class TestLeerFilas(unittest.TestCase):
+    """Pruebas unitarias para leer_filas y Matriz.llenar_interactivo."""
+
+    def test_leer_filas(self):
+        """Testa la lectura por filas, repidiendo solo las filas con errores."""
+        lineas = iter(["1 2 3/4", "4, x, 6", "7 8", "", "4 5 6", "7 8 9"])
+        mensajes = []
+        datos = leer_filas(3, 3, leer=lambda _: next(lineas), escribir=mensajes.append)
+
+        self.assertEqual(datos, [[1, 2, Fraction(3, 4)], [4, 5, 6], [7, 8, 9]])
+        self.assertEqual(mensajes, ["❌ Fila 2: 'x' (columna 2) no es un número",
+                                    "❌ Fila 3: tiene 2 elementos, se esperaban 3"])
+
+    def test_leer_filas_interactivo(self):
+        """Testa que en modo interactivo cada fila se revise al escribirla."""
+        lineas = iter(["1 2", "3 x", "3 4", "5 6"])
+        eventos = []
+
+        def leer(mensaje):
+            eventos.append(mensaje)
+            return next(lineas)
+
+        datos = leer_filas(3, 2, leer=leer, escribir=eventos.append, interactivo=True)
+
+        self.assertEqual(datos, [[1, 2], [3, 4], [5, 6]])
+        self.assertEqual(eventos[1:3], ["Fila 2: ", "❌ Fila 2: 'x' (columna 2) no es un número"])
+        self.assertEqual(eventos[3:], ["Fila 2: ", "Fila 3: "])
+
+    def test_fin_de_entrada(self):
+        """Testa que la entrada terminada antes de tiempo se informe."""
+        def leer(_, lineas=iter(["1 2"])):
+            try:
+                return next(lineas)
+            except StopIteration:
+                raise EOFError
+
+        with self.assertRaises(ValueError) as contexto:
+            leer_filas(2, 2, leer=leer)
+        self.assertIn("1 de 2 filas", str(contexto.exception))
+
+    def test_llenar_interactivo_por_filas(self):
+        """Testa que llenar_interactivo lea filas completas desde una entrada redirigida."""
+        matriz = Matriz(2, 3)
+        with mock.patch('sys.stdin', io.StringIO("1 2 3\n1/2 0 -1\n")), \
+                redirect_stdout(io.StringIO()):
+            matriz.llenar_interactivo()
+        self.assertEqual(matriz.datos, [[1, 2, 3], [Fraction(1, 2), 0, -1]])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,46 @@
+"""
+Pruebas unitarias para el visor virtual
+=======================================
+
+Tests para verificar el formateo del bloque visible y la traducción de
+los comandos de desplazamiento del visor de la interfaz gráfica.
+
+Autor: Nicolas
+"""
+
+import unittest
+import sys
+import os
+from fractions import Fraction
+
+# Agregar el directorio raíz al path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from interfaces.visor import formatear_bloque, posicion_desde_scroll, limitar_inicio
+
+
+class TestVisor(unittest.TestCase):
+    """Pruebas unitarias para interfaces/visor.py."""
+    
+    def test_formatear_bloque(self):
+        """Testa el formateo de enteros, decimales y fracciones."""
+        filas = [[1, 2.5, Fraction(1, 3)], [4.0, -1, Fraction(6, 3)]]
+        self.assertEqual(formatear_bloque(filas), [["1", "2.5", "1/3"], ["4", "-1", "2"]])
+    
+    def test_posicion_desde_scroll(self):
+        """Testa moveto, unidades y páginas dentro de los límites."""
+        self.assertEqual(posicion_desde_scroll(('moveto', '0.5'), 0, 100, 10), 50)
+        self.assertEqual(posicion_desde_scroll(('moveto', '1.0'), 0, 100, 10), 90)
+        self.assertEqual(posicion_desde_scroll(('scroll', '1', 'units'), 5, 100, 10), 6)
+        self.assertEqual(posicion_desde_scroll(('scroll', '2', 'pages'), 5, 100, 10), 23)
+        self.assertEqual(posicion_desde_scroll(('scroll', '-1', 'pages'), 5, 100, 10), 0)
+    
+    def test_limitar_inicio(self):
+        """Testa que una matriz más pequeña que la ventana empieza en 0."""
+        self.assertEqual(limitar_inicio(7, 5, 10), 0)
+        self.assertEqual(limitar_inicio(-3, 50, 10), 0)
+        self.assertEqual(limitar_inicio(45, 50, 10), 40)
+
+
+if __name__ == '__main__':
+    unittest.main()
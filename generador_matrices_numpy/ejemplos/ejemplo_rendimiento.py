@@ -0,0 +1,530 @@
+#!/usr/bin/env python3
+"""
+Benchmarks de Rendimiento - Matriz frente a MatrizNumPy
+=======================================================
+
+Mide las mismas operaciones con los dos motores (``Matriz`` de Python
+puro y ``MatrizNumPy``) para varios tamaños y tipos de elemento (int,
+float y Fraction), guarda los resultados en JSON y los compara con una
+línea base para detectar regresiones:
+
+    python ejemplos/ejemplo_rendimiento.py --salida base.json
+    python ejemplos/ejemplo_rendimiento.py --linea-base base.json --umbral 0.25
+
+- Cada caso se calienta (``--calentamiento``) y después se mide
+  ``--repeticiones`` veces. Las operaciones muy rápidas se repiten dentro
+  de cada medición hasta durar al menos ``TIEMPO_MINIMO`` (como
+  ``timeit.autorange``); los tiempos guardados son por llamada.
+- Los dos motores reciben los mismos datos (generados con una semilla) y
+  con la diagonal reforzada para que las matrices sean invertibles.
+- Las operaciones que un motor no tiene (el motor puro no calcula
+  determinantes ni descomposiciones) o que no admiten un tipo (LAPACK no
+  trabaja con Fraction) se anotan en ``omitidos`` con el motivo.
+- Con ``--linea-base`` el programa termina con código 1 si alguna mediana
+  empeora más que ``--umbral`` (fracción) respecto a la línea base.
+
+Los dos paquetes tienen un paquete ``src`` propio, así que el motor puro
+se importa con otro nombre (``matrices_puro``).
+
+Autor: Nicolas
+"""
+
+import argparse
+import csv
+import gc
+import importlib.util
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+from fractions import Fraction
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+RAIZ_NUMPY = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+RAIZ_PURO = os.path.join(RAIZ_NUMPY, '..', 'generador_matrices')
+
+# Agregar el directorio raíz al path
+sys.path.insert(0, RAIZ_NUMPY)
+
+from src.matriz_numpy import MatrizNumPy
+from src.algebra_lineal import factorizar_lu
+from src.paginacion import resumir
+
+
+def _importar_motor_puro():
+    """Importa ``generador_matrices/src`` como el paquete ``matrices_puro``."""
+    if 'matrices_puro' in sys.modules:
+        return sys.modules['matrices_puro']
+    carpeta = os.path.join(RAIZ_PURO, 'src')
+    spec = importlib.util.spec_from_file_location('matrices_puro', os.path.join(carpeta, '__init__.py'),
+                                                  submodule_search_locations=[carpeta])
+    modulo = importlib.util.module_from_spec(spec)
+    sys.modules['matrices_puro'] = modulo
+    spec.loader.exec_module(modulo)
+    return modulo
+
+
+try:
+    puro = _importar_motor_puro()
+    from matrices_puro.cache_visualizacion import CACHE as CACHE_PURO
+    HAS_PURO = True
+except (ImportError, FileNotFoundError):
+    HAS_PURO = False
+
+MOTORES = ('puro', 'numpy')
+TIPOS = ('int', 'float', 'fraction')
+TAMAÑOS = (10, 25, 50)
+OPERACIONES = ('crear', 'identidad', 'suma', 'resta', 'multiplicacion', 'potencia', 'transpuesta',
+               'determinante', 'inversa', 'resolver', 'lu', 'qr', 'cholesky', 'svd', 'eigen',
+               'csv_escribir', 'csv_leer', 'formato')
+EXPONENTE = 3
+# Duración mínima de cada medición (s); las operaciones rápidas se repiten dentro
+TIEMPO_MINIMO = 0.005
+# Diferencia absoluta mínima (s) para considerar una regresión
+RUIDO_ABSOLUTO = 1e-6
+VERSION_FORMATO = 1
+
+# Un caso devuelve la función a medir (sin argumentos) o lanza NoDisponible
+Caso = Callable[[], Callable[[], Any]]
+
+
+class NoDisponible(Exception):
+    """La operación no existe en un motor o no admite el tipo de elemento."""
+
+
+# ============ DATOS ============
+
+def generar_datos(tamaño: int, tipo: str, semilla: int = 0) -> List[List[Any]]:
+    """
+    Matriz cuadrada con la diagonal reforzada (invertible y bien condicionada).
+
+    Parameters:
+        tamaño (int): Filas y columnas
+        tipo (str): 'int', 'float' o 'fraction'
+        semilla (int): Semilla del generador
+
+    Returns:
+        List[List]: Datos como lista de listas
+    """
+    generador = random.Random(semilla)
+    if tipo == 'int':
+        valor = lambda: generador.randint(-9, 9)
+    elif tipo == 'float':
+        valor = lambda: generador.uniform(-9.0, 9.0)
+    elif tipo == 'fraction':
+        valor = lambda: Fraction(generador.randint(-9, 9), generador.randint(1, 9))
+    else:
+        raise ValueError(f"Tipo no soportado: {tipo}")
+    datos = [[valor() for _ in range(tamaño)] for _ in range(tamaño)]
+    for i in range(tamaño):
+        datos[i][i] += 10 * tamaño
+    return datos
+
+
+def definida_positiva(datos: List[List[Any]]) -> List[List[Any]]:
+    """A + Aᵀ, que con la diagonal reforzada es simétrica definida positiva."""
+    return [[datos[i][j] + datos[j][i] for j in range(len(datos))] for i in range(len(datos))]
+
+
+def _array(datos: List[List[Any]], tipo: str) -> np.ndarray:
+    dtype = {'int': np.int64, 'float': np.float64, 'fraction': object}[tipo]
+    return np.array(datos, dtype=dtype)
+
+
+# ============ CASOS ============
+
+def casos_puro(datos: List[List[Any]], tipo: str, carpeta: str) -> Dict[str, Caso]:
+    """Casos del motor de Python puro (``Matriz`` y ``operaciones``)."""
+    n = len(datos)
+
+    def matriz(valores):
+        resultado = puro.Matriz(n, n)
+        resultado.llenar_manual(valores)
+        return resultado
+
+    a, b = matriz(datos), matriz([fila[::-1] for fila in datos])
+    ruta = os.path.join(carpeta, f'puro_{tipo}_{n}.csv')
+
+    def escribir():
+        with open(ruta, 'w', newline='', encoding='utf-8') as archivo:
+            escritor = csv.writer(archivo)
+            for fila in a.datos:
+                escritor.writerow([str(valor) if isinstance(valor, Fraction) else repr(valor) for valor in fila])
+
+    def leer():
+        with open(ruta, newline='', encoding='utf-8') as archivo:
+            filas = [fila for fila in csv.reader(archivo) if fila]
+        return matriz(filas)
+
+    def formatear():
+        # Sin caché: se mide el formateo de todos los elementos
+        CACHE_PURO.limpiar()
+        return puro.formatear_matriz_como_texto(a)
+
+    def preparar_lectura():
+        escribir()
+        return leer
+
+    def no_disponible():
+        raise NoDisponible("El motor puro no implementa esta operación")
+
+    casos = {
+        'crear': lambda: lambda: matriz(datos),
+        'identidad': lambda: lambda: puro.crear_matriz_identidad(n),
+        'suma': lambda: lambda: puro.sumar_matrices(a, b),
+        'resta': lambda: lambda: puro.restar_matrices(a, b),
+        'multiplicacion': lambda: lambda: puro.multiplicar_matrices(a, b),
+        'potencia': lambda: lambda: puro.potencia_matriz(a, EXPONENTE),
+        'transpuesta': lambda: a.transponer,
+        'csv_escribir': lambda: escribir,
+        'csv_leer': preparar_lectura,
+        'formato': lambda: formatear,
+    }
+    return {operacion: casos.get(operacion, no_disponible) for operacion in OPERACIONES}
+
+
+def casos_numpy(datos: List[List[Any]], tipo: str, carpeta: str) -> Dict[str, Caso]:
+    """Casos de ``MatrizNumPy``."""
+    n = len(datos)
+    a = MatrizNumPy(_array(datos, tipo))
+    b = MatrizNumPy(_array([fila[::-1] for fila in datos], tipo))
+    spd = MatrizNumPy(_array(definida_positiva(datos), tipo))
+    lado_derecho = np.ones((n, 1))
+    ruta = os.path.join(carpeta, f'numpy_{tipo}_{n}.csv')
+
+    def nativo(preparar, motivo="LAPACK no trabaja con Fraction (dtype=object)"):
+        # Las rutinas compiladas solo admiten tipos nativos
+        def caso():
+            if tipo == 'fraction':
+                raise NoDisponible(motivo)
+            return preparar()
+        return caso
+
+    def escribir():
+        formato = '%d' if np.issubdtype(a.datos.dtype, np.integer) else '%.17g'
+        np.savetxt(ruta, a.datos, delimiter=',', fmt=formato)
+
+    def leer():
+        return MatrizNumPy(np.loadtxt(ruta, delimiter=',', ndmin=2))
+
+    def preparar_lectura():
+        escribir()
+        return leer
+
+    def preparar_lu():
+        # La LU trabaja en el dtype de la entrada: los enteros se convierten antes de medir
+        flotante = a.datos.astype(np.float64)
+        return lambda: factorizar_lu(flotante)
+
+    sin_csv = "savetxt/loadtxt no escriben ni leen Fraction"
+
+    return {
+        'crear': lambda: lambda: MatrizNumPy(_array(datos, tipo)),
+        'identidad': lambda: lambda: MatrizNumPy.crear_identidad(n),
+        'suma': lambda: lambda: a + b,
+        'resta': lambda: lambda: a - b,
+        'multiplicacion': lambda: lambda: a @ b,
+        'potencia': lambda: lambda: a ** EXPONENTE,
+        'transpuesta': lambda: a.transponer,
+        'determinante': nativo(lambda: a.determinante),
+        'inversa': nativo(lambda: a.inversa),
+        'resolver': nativo(lambda: lambda: a.resolver_sistema(lado_derecho)),
+        'lu': nativo(preparar_lu),
+        'qr': nativo(lambda: a.qr),
+        'cholesky': nativo(lambda: spd.cholesky),
+        'svd': nativo(lambda: a.svd),
+        'eigen': nativo(lambda: a.eigenvalores),
+        'csv_escribir': nativo(lambda: escribir, sin_csv),
+        'csv_leer': nativo(preparar_lectura, sin_csv),
+        'formato': lambda: lambda: resumir(a.datos, bordes=n),
+    }
+
+
+# ============ MEDICIÓN ============
+
+def medir(funcion: Callable[[], Any], calentamiento: int = 1, repeticiones: int = 5,
+          tiempo_minimo: float = TIEMPO_MINIMO) -> Dict[str, Any]:
+    """
+    Mide una función tras calentarla.
+
+    Parameters:
+        funcion (Callable[[], Any]): Operación a medir
+        calentamiento (int): Llamadas previas que no se miden (al menos 1)
+        repeticiones (int): Mediciones que se guardan
+        tiempo_minimo (float): Duración mínima de cada medición (s)
+
+    Returns:
+        Dict[str, Any]: Tiempos por llamada (s), llamadas por medición y
+        estadísticas (mínimo, mediana, media, desviación)
+    """
+    # La primera llamada de calentamiento también calibra las llamadas por medición
+    inicio = time.perf_counter()
+    funcion()
+    duracion = time.perf_counter() - inicio
+    for _ in range(calentamiento - 1):
+        funcion()
+    llamadas = max(1, int(tiempo_minimo / duracion)) if duracion > 0 else 1000
+
+    tiempos = []
+    gc_activo = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeticiones):
+            inicio = time.perf_counter()
+            for _ in range(llamadas):
+                funcion()
+            tiempos.append((time.perf_counter() - inicio) / llamadas)
+    finally:
+        if gc_activo:
+            gc.enable()
+
+    return {
+        'tiempos': tiempos,
+        'llamadas': llamadas,
+        'minimo': min(tiempos),
+        'mediana': statistics.median(tiempos),
+        'media': statistics.fmean(tiempos),
+        'desviacion': statistics.stdev(tiempos) if len(tiempos) > 1 else 0.0,
+    }
+
+
+def clave(resultado: Dict[str, Any]) -> str:
+    """Identificador de un caso: motor/operación/tipo/tamaño."""
+    return f"{resultado['motor']}/{resultado['operacion']}/{resultado['tipo']}/{resultado['tamaño']}"
+
+
+def ejecutar(tamaños: Sequence[int] = TAMAÑOS, tipos: Sequence[str] = TIPOS, motores: Sequence[str] = MOTORES,
+             operaciones: Sequence[str] = OPERACIONES, calentamiento: int = 1, repeticiones: int = 5,
+             tiempo_minimo: float = TIEMPO_MINIMO, semilla: int = 0,
+             progreso: Optional[Callable[[str], None]] = None) -> Dict[str, Any]:
+    """
+    Ejecuta la batería de benchmarks.
+
+    Parameters:
+        tamaños, tipos, motores, operaciones: Casos a medir
+        calentamiento, repeticiones, tiempo_minimo: Ver ``medir``
+        semilla (int): Semilla de los datos
+        progreso (Optional[Callable[[str], None]]): Recibe la clave de cada caso
+
+    Returns:
+        Dict[str, Any]: ``metadatos``, ``resultados`` y ``omitidos``
+
+    Raises:
+        ValueError: Si se pide un motor u operación desconocidos
+    """
+    for motor in motores:
+        if motor not in MOTORES:
+            raise ValueError(f"Motor desconocido: {motor}")
+        if motor == 'puro' and not HAS_PURO:
+            raise ValueError(f"No se encontró el motor puro en {os.path.abspath(RAIZ_PURO)}")
+    for operacion in operaciones:
+        if operacion not in OPERACIONES:
+            raise ValueError(f"Operación desconocida: {operacion}")
+
+    resultados, omitidos = [], []
+    with tempfile.TemporaryDirectory() as carpeta:
+        for tamaño in tamaños:
+            for tipo in tipos:
+                datos = generar_datos(tamaño, tipo, semilla)
+                for motor in motores:
+                    casos = (casos_puro if motor == 'puro' else casos_numpy)(datos, tipo, carpeta)
+                    for operacion in operaciones:
+                        caso = {'motor': motor, 'operacion': operacion, 'tipo': tipo, 'tamaño': tamaño}
+                        if progreso:
+                            progreso(clave(caso))
+                        try:
+                            caso.update(medir(casos[operacion](), calentamiento, repeticiones, tiempo_minimo))
+                        except NoDisponible as e:
+                            omitidos.append({**caso, 'motivo': str(e)})
+                            continue
+                        except (ValueError, TypeError, np.linalg.LinAlgError) as e:
+                            omitidos.append({**caso, 'motivo': f"{type(e).__name__}: {e}"})
+                            continue
+                        resultados.append(caso)
+
+    return {
+        'metadatos': metadatos(calentamiento, repeticiones, tiempo_minimo, semilla),
+        'resultados': resultados,
+        'omitidos': omitidos,
+    }
+
+
+def metadatos(calentamiento: int, repeticiones: int, tiempo_minimo: float, semilla: int) -> Dict[str, Any]:
+    """Entorno y configuración de la ejecución."""
+    return {
+        'version_formato': VERSION_FORMATO,
+        'fecha': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'plataforma': platform.platform(),
+        'procesador': platform.processor() or platform.machine(),
+        'nucleos': os.cpu_count(),
+        'calentamiento': calentamiento,
+        'repeticiones': repeticiones,
+        'tiempo_minimo': tiempo_minimo,
+        'semilla': semilla,
+    }
+
+
+# ============ COMPARACIÓN ============
+
+def comparar(actual: Dict[str, Any], base: Dict[str, Any], umbral: float = 0.25,
+             ruido: float = RUIDO_ABSOLUTO) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Compara las medianas con las de una línea base.
+
+    Parameters:
+        actual (Dict[str, Any]): Resultado de ``ejecutar``
+        base (Dict[str, Any]): Resultado guardado de otra ejecución
+        umbral (float): Empeoramiento relativo tolerado (0.25 = 25 %)
+        ruido (float): Diferencia absoluta (s) por debajo de la cual no se avisa
+
+    Returns:
+        Dict[str, List[Dict]]: ``regresiones``, ``mejoras``, ``nuevos`` (sin
+        línea base) y ``desaparecidos`` (solo en la línea base); cada
+        comparación lleva ``clave``, ``base``, ``actual`` y ``cambio``
+    """
+    anteriores = {clave(r): r for r in base.get('resultados', [])}
+    informe = {'regresiones': [], 'mejoras': [], 'nuevos': [], 'desaparecidos': []}
+    vistos = set()
+
+    for resultado in actual['resultados']:
+        identificador = clave(resultado)
+        vistos.add(identificador)
+        anterior = anteriores.get(identificador)
+        if anterior is None:
+            informe['nuevos'].append({'clave': identificador})
+            continue
+
+        antes, ahora = anterior['mediana'], resultado['mediana']
+        cambio = (ahora - antes) / antes if antes > 0 else 0.0
+        comparacion = {'clave': identificador, 'base': antes, 'actual': ahora, 'cambio': cambio}
+        if abs(ahora - antes) < ruido:
+            continue
+        if cambio > umbral:
+            informe['regresiones'].append(comparacion)
+        elif cambio < -umbral:
+            informe['mejoras'].append(comparacion)
+
+    informe['desaparecidos'] = [{'clave': identificador} for identificador in anteriores
+                                if identificador not in vistos]
+    return informe
+
+
+# ============ INFORMES ============
+
+def _tiempo(segundos: float) -> str:
+    """Tiempo con la unidad más legible."""
+    if segundos < 1e-3:
+        return f"{segundos * 1e6:.1f} µs"
+    if segundos < 1:
+        return f"{segundos * 1e3:.2f} ms"
+    return f"{segundos:.2f} s"
+
+
+def tabla(informe: Dict[str, Any]) -> str:
+    """Medianas de los dos motores lado a lado, con la aceleración de NumPy."""
+    medianas: Dict[Tuple[str, str, int], Dict[str, float]] = {}
+    for r in informe['resultados']:
+        medianas.setdefault((r['operacion'], r['tipo'], r['tamaño']), {})[r['motor']] = r['mediana']
+
+    lineas = [f"{'Operación':<16}{'Tipo':<10}{'Tamaño':>7}{'Puro':>13}{'NumPy':>13}{'Aceleración':>13}",
+              "-" * 72]
+    orden = lambda caso: (caso[2], TIPOS.index(caso[1]), OPERACIONES.index(caso[0]))
+    for (operacion, tipo, tamaño), tiempos in sorted(medianas.items(), key=lambda item: orden(item[0])):
+        puro_t, numpy_t = tiempos.get('puro'), tiempos.get('numpy')
+        aceleracion = f"{puro_t / numpy_t:.1f}×" if puro_t and numpy_t else "-"
+        lineas.append(f"{operacion:<16}{tipo:<10}{tamaño:>7}"
+                      f"{_tiempo(puro_t) if puro_t else '-':>13}{_tiempo(numpy_t) if numpy_t else '-':>13}"
+                      f"{aceleracion:>13}")
+    return "\n".join(lineas)
+
+
+def texto_comparacion(comparacion: Dict[str, List[Dict[str, Any]]], umbral: float) -> str:
+    """Resumen legible de ``comparar``."""
+    lineas = []
+    for titulo, grupo in (("❌ Regresiones", 'regresiones'), ("✅ Mejoras", 'mejoras')):
+        if comparacion[grupo]:
+            lineas.append(f"{titulo} (umbral {umbral:.0%}):")
+            for c in sorted(comparacion[grupo], key=lambda c: -abs(c['cambio'])):
+                lineas.append(f"  {c['clave']:<40} {_tiempo(c['base']):>10} → {_tiempo(c['actual']):>10} "
+                              f"({c['cambio']:+.0%})")
+    if comparacion['nuevos']:
+        lineas.append(f"🆕 {len(comparacion['nuevos'])} casos sin línea base")
+    if comparacion['desaparecidos']:
+        lineas.append(f"⚠️ {len(comparacion['desaparecidos'])} casos de la línea base no se midieron")
+    if not comparacion['regresiones']:
+        lineas.append("✅ Sin regresiones respecto a la línea base")
+    return "\n".join(lineas)
+
+
+def procesar_argumentos(argv=None):
+    """Procesa los argumentos de la línea de comandos."""
+    parser = argparse.ArgumentParser(description="Benchmarks de Matriz y MatrizNumPy")
+    parser.add_argument('--tamaños', type=int, nargs='+', default=list(TAMAÑOS), metavar='N',
+                        help="Tamaños de las matrices cuadradas (el motor puro admite hasta 100)")
+    parser.add_argument('--tipos', nargs='+', default=list(TIPOS), choices=TIPOS)
+    parser.add_argument('--motores', nargs='+', default=list(MOTORES), choices=MOTORES)
+    parser.add_argument('--operaciones', nargs='+', default=list(OPERACIONES), choices=OPERACIONES)
+    parser.add_argument('--calentamiento', type=int, default=1, help="Llamadas previas sin medir")
+    parser.add_argument('--repeticiones', type=int, default=5, help="Mediciones por caso")
+    parser.add_argument('--semilla', type=int, default=0)
+    parser.add_argument('--salida', metavar='ARCHIVO.json', default='rendimiento.json',
+                        help="Archivo JSON con los resultados")
+    parser.add_argument('--linea-base', metavar='ARCHIVO.json',
+                        help="Resultados anteriores con los que comparar")
+    parser.add_argument('--umbral', type=float, default=0.25,
+                        help="Empeoramiento relativo que se considera regresión (0.25 = 25%%)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    """Función principal del programa."""
+    argumentos = procesar_argumentos(argv)
+    if argumentos.calentamiento < 1 or argumentos.repeticiones < 1:
+        print("❌ El calentamiento y las repeticiones deben ser al menos 1", file=sys.stderr)
+        return 2
+
+    # La línea base se lee antes de medir para no perder la ejecución si no es válida
+    base = None
+    if argumentos.linea_base:
+        try:
+            with open(argumentos.linea_base, encoding='utf-8') as archivo:
+                base = json.load(archivo)
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"❌ No se pudo leer la línea base: {e}", file=sys.stderr)
+            return 2
+
+    try:
+        informe = ejecutar(argumentos.tamaños, argumentos.tipos, argumentos.motores, argumentos.operaciones,
+                           argumentos.calentamiento, argumentos.repeticiones, semilla=argumentos.semilla,
+                           progreso=lambda caso: print(f"⏱️ {caso}", file=sys.stderr))
+    except ValueError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 2
+
+    print(tabla(informe))
+    if informe['omitidos']:
+        motivos = sorted({o['motivo'] for o in informe['omitidos']})
+        print(f"\n⏭️ {len(informe['omitidos'])} casos omitidos: " + "; ".join(motivos))
+
+    with open(argumentos.salida, 'w', encoding='utf-8') as archivo:
+        json.dump(informe, archivo, ensure_ascii=False, indent=2)
+    print(f"\n💾 Resultados guardados en {argumentos.salida}")
+
+    if base is not None:
+        comparacion = comparar(informe, base, argumentos.umbral)
+        print("\n" + texto_comparacion(comparacion, argumentos.umbral))
+        if comparacion['regresiones']:
+            return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -17,6 +17,9 @@ from typing import Dict, List, Optional, Tuple
 # Importar la clase principal
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from src.matriz_numpy import MatrizNumPy
+from src.expresiones import evaluar_expresion
+from src.entrada import leer_filas
+from src.historial import Historial, nueva_semilla
 
 
 class InterfazConsolaNP:
@@ -25,7 +28,7 @@ class InterfazConsolaNP:
     def __init__(self):
         """Inicializa la interfaz de consola."""
         self.matrices: Dict[str, MatrizNumPy] = {}
-        self.historial_operaciones: List[str] = []
+        self.historial = Historial()
         self.precision_salida = 4
         
     def iniciar(self):
@@ -45,6 +48,8 @@ class InterfazConsolaNP:
                     self.menu_algebra_lineal()
                 elif opcion == "4":
                     self.menu_gestionar_matrices()
+                elif opcion == "5":
+                    self.modo_expresiones()
                 elif opcion == "0":
                     print("\n👋 ¡Gracias por usar el generador de matrices!")
                     break
@@ -79,6 +84,7 @@ class InterfazConsolaNP:
         print("2. ➕ Operaciones Básicas")
         print("3. 🧪 Álgebra Lineal")
         print("4. 📁 Gestionar Matrices")
+        print("5. ⌨️ Expresiones")
         print("0. 🚪 Salir")
     
     def menu_crear_matrices(self):
@@ -128,27 +134,18 @@ class InterfazConsolaNP:
             filas = int(input("📏 Número de filas: "))
             columnas = int(input("📐 Número de columnas: "))
             
-            print(f"\n📝 Ingresa los valores para matriz {filas}×{columnas}:")
-            datos = []
-            for i in range(filas):
-                fila = []
-                for j in range(columnas):
-                    while True:
-                        try:
-                            valor = float(input(f"  Elemento [{i+1},{j+1}]: "))
-                            fila.append(valor)
-                            break
-                        except ValueError:
-                            print("❌ Por favor, ingresa un número válido.")
-                datos.append(fila)
-            
-            matriz = MatrizNumPy(datos)
-            self.matrices[nombre] = matriz
+            print(f"\n📝 Ingresa las filas de la matriz {filas}×{columnas}, una por línea, con los "
+                  f"{columnas} valores separados por espacios o comas (admite fracciones como 3/4).")
+            print("   Puedes pegar un bloque de filas y terminarlo con una línea vacía.")
+            datos = leer_filas(filas, columnas)
+            
+            with self.historial.medir('manual', self.matrices, (), (nombre,),
+                                      f"Creada matriz manual '{nombre}' ({filas}×{columnas})", datos=datos):
+                matriz = MatrizNumPy(datos)
+                self.matrices[nombre] = matriz
             print(f"✅ Matriz '{nombre}' creada exitosamente!")
             matriz.mostrar(f"Matriz {nombre}")
             
-            self.historial_operaciones.append(f"Creada matriz manual '{nombre}' ({filas}×{columnas})")
-            
         except ValueError as e:
             print(f"❌ Error en los datos: {e}")
         except Exception as e:
@@ -168,16 +165,16 @@ class InterfazConsolaNP:
             max_val = float(input("📈 Valor máximo (default 10): ") or "10")
             
             seed_input = input("🎲 Semilla aleatoria (Enter para aleatorio): ").strip()
-            seed = int(seed_input) if seed_input else None
+            # Sin semilla se elige una, que queda en el historial para poder repetir la matriz
+            seed = int(seed_input) if seed_input else nueva_semilla()
             
-            matriz = MatrizNumPy.crear_aleatoria(filas, columnas, min_val, max_val, seed=seed)
-            self.matrices[nombre] = matriz
+            matriz = self._crear(nombre, 'crear_aleatoria',
+                                 f"Creada matriz aleatoria '{nombre}' ({filas}×{columnas}, rango [{min_val}, {max_val}])",
+                                 filas=filas, columnas=columnas, min_val=min_val, max_val=max_val, seed=seed)
             
             print(f"✅ Matriz aleatoria '{nombre}' creada exitosamente!")
             matriz.mostrar(f"Matriz {nombre}")
             
-            self.historial_operaciones.append(f"Creada matriz aleatoria '{nombre}' ({filas}×{columnas}, rango [{min_val}, {max_val}])")
-            
         except ValueError as e:
             print(f"❌ Error en los datos: {e}")
         except Exception as e:
@@ -194,14 +191,12 @@ class InterfazConsolaNP:
             filas = int(input("📏 Número de filas: "))
             columnas = int(input("📐 Número de columnas: "))
             
-            matriz = MatrizNumPy.crear_ceros(filas, columnas)
-            self.matrices[nombre] = matriz
+            matriz = self._crear(nombre, 'crear_ceros', f"Creada matriz de ceros '{nombre}' ({filas}×{columnas})",
+                                 filas=filas, columnas=columnas)
             
             print(f"✅ Matriz de ceros '{nombre}' creada exitosamente!")
             matriz.mostrar(f"Matriz {nombre}")
             
-            self.historial_operaciones.append(f"Creada matriz de ceros '{nombre}' ({filas}×{columnas})")
-            
         except ValueError as e:
             print(f"❌ Error en los datos: {e}")
         except Exception as e:
@@ -218,14 +213,12 @@ class InterfazConsolaNP:
             filas = int(input("📏 Número de filas: "))
             columnas = int(input("📐 Número de columnas: "))
             
-            matriz = MatrizNumPy.crear_unos(filas, columnas)
-            self.matrices[nombre] = matriz
+            matriz = self._crear(nombre, 'crear_unos', f"Creada matriz de unos '{nombre}' ({filas}×{columnas})",
+                                 filas=filas, columnas=columnas)
             
             print(f"✅ Matriz de unos '{nombre}' creada exitosamente!")
             matriz.mostrar(f"Matriz {nombre}")
             
-            self.historial_operaciones.append(f"Creada matriz de unos '{nombre}' ({filas}×{columnas})")
-            
         except ValueError as e:
             print(f"❌ Error en los datos: {e}")
         except Exception as e:
@@ -241,14 +234,12 @@ class InterfazConsolaNP:
                 
             tamaño = int(input("📏 Tamaño (n×n): "))
             
-            matriz = MatrizNumPy.crear_identidad(tamaño)
-            self.matrices[nombre] = matriz
+            matriz = self._crear(nombre, 'crear_identidad', f"Creada matriz identidad '{nombre}' ({tamaño}×{tamaño})",
+                                 tamaño=tamaño)
             
             print(f"✅ Matriz identidad '{nombre}' creada exitosamente!")
             matriz.mostrar(f"Matriz {nombre}")
             
-            self.historial_operaciones.append(f"Creada matriz identidad '{nombre}' ({tamaño}×{tamaño})")
-            
         except ValueError as e:
             print(f"❌ Error en los datos: {e}")
         except Exception as e:
@@ -265,14 +256,12 @@ class InterfazConsolaNP:
             diagonal_str = input("📐 Valores diagonales (separados por comas): ").strip()
             diagonal = [float(x.strip()) for x in diagonal_str.split(',')]
             
-            matriz = MatrizNumPy.crear_diagonal(diagonal)
-            self.matrices[nombre] = matriz
+            matriz = self._crear(nombre, 'crear_diagonal', f"Creada matriz diagonal '{nombre}' con valores {diagonal}",
+                                 valores=diagonal)
             
             print(f"✅ Matriz diagonal '{nombre}' creada exitosamente!")
             matriz.mostrar(f"Matriz {nombre}")
             
-            self.historial_operaciones.append(f"Creada matriz diagonal '{nombre}' con valores {diagonal}")
-            
         except ValueError as e:
             print(f"❌ Error en los datos: {e}")
         except Exception as e:
@@ -287,6 +276,11 @@ class InterfazConsolaNP:
             print("2. 🎯 Matriz de Vandermonde")
             print("3. 📈 Matriz Toeplitz")
             print("4. 🔄 Matriz Circulante")
+            print("5. 📉 Matriz Hankel")
+            print("6. 🔺 Matriz de Pascal")
+            print("7. 🎚️ Matriz Tridiagonal")
+            print("8. 💎 Simétrica Definida Positiva Aleatoria")
+            print("9. 🧭 Ortogonal Aleatoria")
             print("0. ⬅️ Volver")
             
             opcion = input("\n🎯 Opción: ").strip()
@@ -295,28 +289,60 @@ class InterfazConsolaNP:
                 self.crear_matriz_hilbert()
             elif opcion == "2":
                 self.crear_matriz_vandermonde()
+            elif opcion == "3":
+                self.crear_matriz_toeplitz()
+            elif opcion == "4":
+                self.crear_matriz_circulante()
+            elif opcion == "5":
+                self.crear_matriz_hankel()
+            elif opcion == "6":
+                self.crear_matriz_pascal()
+            elif opcion == "7":
+                self.crear_matriz_tridiagonal()
+            elif opcion == "8":
+                self.crear_matriz_spd()
+            elif opcion == "9":
+                self.crear_matriz_ortogonal()
             elif opcion == "0":
                 break
     
+    def _leer_vector(self, mensaje: str) -> List[float]:
+        """Lee un vector de valores separados por comas."""
+        vector_str = input(mensaje).strip()
+        return [float(x.strip()) for x in vector_str.split(',')]
+    
+    def _crear(self, nombre: str, metodo: str, descripcion: str, **argumentos) -> MatrizNumPy:
+        """Crea una matriz con ``MatrizNumPy.<metodo>(**argumentos)``, la guarda y la registra."""
+        with self.historial.medir('crear', self.matrices, (), (nombre,), descripcion,
+                                  metodo=metodo, argumentos=argumentos):
+            matriz = getattr(MatrizNumPy, metodo)(**argumentos)
+            self.matrices[nombre] = matriz
+        return matriz
+    
+    def _crear_matriz_especial(self, nombre: str, descripcion: str, metodo: str, **argumentos) -> MatrizNumPy:
+        """Crea una matriz especial, la guarda, la registra y la muestra."""
+        with self.historial.medir('crear', self.matrices, (), (nombre,),
+                                  metodo=metodo, argumentos=argumentos) as registro:
+            matriz = getattr(MatrizNumPy, metodo)(**argumentos)
+            self.matrices[nombre] = matriz
+        registro.descripcion = f"Creada {descripcion} '{nombre}' ({matriz.filas}×{matriz.columnas})"
+        print(f"✅ {descripcion} '{nombre}' creada exitosamente!")
+        matriz.mostrar(f"{descripcion} {nombre}")
+        return matriz
+    
     def crear_matriz_hilbert(self):
         """Crear matriz de Hilbert."""
         try:
             nombre = input("🏷️ Nombre de la matriz: ").strip()
             n = int(input("📏 Tamaño n×n: "))
             
-            # Crear matriz de Hilbert H[i,j] = 1/(i+j+1)
-            hilbert = np.array([[1/(i+j+1) for j in range(n)] for i in range(n)])
-            matriz = MatrizNumPy(hilbert)
-            
-            self.matrices[nombre] = matriz
-            print(f"✅ Matriz de Hilbert '{nombre}' creada exitosamente!")
-            matriz.mostrar(f"Matriz de Hilbert {nombre}")
+            # H[i,j] = 1/(i+j+1) construida con broadcasting
+            matriz = self._crear_matriz_especial(nombre, "Matriz de Hilbert", 'crear_hilbert', n=n)
             
-            # Información adicional
+            # Información adicional (la condición requiere una SVD completa)
             print(f"💡 Las matrices de Hilbert son mal condicionadas.")
-            print(f"   Número de condición: {matriz.condicion():.2e}")
-            
-            self.historial_operaciones.append(f"Creada matriz de Hilbert '{nombre}' ({n}×{n})")
+            if n <= 500:
+                print(f"   Número de condición: {matriz.condicion():.2e}")
             
         except ValueError as e:
             print(f"❌ Error en los datos: {e}")
@@ -327,19 +353,118 @@ class InterfazConsolaNP:
         """Crear matriz de Vandermonde."""
         try:
             nombre = input("🏷️ Nombre de la matriz: ").strip()
-            vector_str = input("📐 Vector base (separado por comas): ").strip()
-            vector = [float(x.strip()) for x in vector_str.split(',')]
+            vector = self._leer_vector("📐 Vector base (separado por comas): ")
             grado = int(input("📈 Grado máximo: "))
             
-            # Crear matriz de Vandermonde
-            vander = np.vander(vector, grado + 1)
-            matriz = MatrizNumPy(vander)
+            self._crear_matriz_especial(nombre, "Matriz de Vandermonde", 'crear_vandermonde',
+                                        x=vector, columnas=grado + 1)
             
-            self.matrices[nombre] = matriz
-            print(f"✅ Matriz de Vandermonde '{nombre}' creada exitosamente!")
-            matriz.mostrar(f"Matriz de Vandermonde {nombre}")
+        except ValueError as e:
+            print(f"❌ Error en los datos: {e}")
+        except Exception as e:
+            print(f"❌ Error: {e}")
+    
+    def crear_matriz_toeplitz(self):
+        """Crear matriz de Toeplitz."""
+        try:
+            nombre = input("🏷️ Nombre de la matriz: ").strip()
+            columna = self._leer_vector("📐 Primera columna (separada por comas): ")
+            fila_str = input("📏 Primera fila (Enter para simétrica): ").strip()
+            fila = [float(x.strip()) for x in fila_str.split(',')] if fila_str else None
             
-            self.historial_operaciones.append(f"Creada matriz de Vandermonde '{nombre}' con vector {vector}")
+            self._crear_matriz_especial(nombre, "Matriz Toeplitz", 'crear_toeplitz', c=columna, r=fila)
+            
+        except ValueError as e:
+            print(f"❌ Error en los datos: {e}")
+        except Exception as e:
+            print(f"❌ Error: {e}")
+    
+    def crear_matriz_circulante(self):
+        """Crear matriz circulante."""
+        try:
+            nombre = input("🏷️ Nombre de la matriz: ").strip()
+            columna = self._leer_vector("📐 Primera columna (separada por comas): ")
+            
+            self._crear_matriz_especial(nombre, "Matriz circulante", 'crear_circulante', c=columna)
+            
+        except ValueError as e:
+            print(f"❌ Error en los datos: {e}")
+        except Exception as e:
+            print(f"❌ Error: {e}")
+    
+    def crear_matriz_hankel(self):
+        """Crear matriz de Hankel."""
+        try:
+            nombre = input("🏷️ Nombre de la matriz: ").strip()
+            columna = self._leer_vector("📐 Primera columna (separada por comas): ")
+            fila_str = input("📏 Última fila (Enter para ceros): ").strip()
+            fila = [float(x.strip()) for x in fila_str.split(',')] if fila_str else None
+            
+            self._crear_matriz_especial(nombre, "Matriz Hankel", 'crear_hankel', c=columna, r=fila)
+            
+        except ValueError as e:
+            print(f"❌ Error en los datos: {e}")
+        except Exception as e:
+            print(f"❌ Error: {e}")
+    
+    def crear_matriz_pascal(self):
+        """Crear matriz de Pascal."""
+        try:
+            nombre = input("🏷️ Nombre de la matriz: ").strip()
+            n = int(input("📏 Tamaño n×n: "))
+            tipo = input("🔺 Tipo (simetrica/inferior/superior, default simetrica): ").strip() or "simetrica"
+            
+            self._crear_matriz_especial(nombre, "Matriz de Pascal", 'crear_pascal', n=n, tipo=tipo)
+            
+        except ValueError as e:
+            print(f"❌ Error en los datos: {e}")
+        except Exception as e:
+            print(f"❌ Error: {e}")
+    
+    def crear_matriz_tridiagonal(self):
+        """Crear matriz tridiagonal con diagonales constantes."""
+        try:
+            nombre = input("🏷️ Nombre de la matriz: ").strip()
+            n = int(input("📏 Tamaño n×n: "))
+            inferior = float(input("⬇️ Valor subdiagonal (default -1): ") or "-1")
+            diagonal = float(input("↘️ Valor diagonal (default 2): ") or "2")
+            superior = float(input("⬆️ Valor superdiagonal (default -1): ") or "-1")
+            
+            self._crear_matriz_especial(nombre, "Matriz tridiagonal", 'crear_tridiagonal',
+                                        inferior=inferior, diagonal=diagonal, superior=superior, n=n)
+            
+        except ValueError as e:
+            print(f"❌ Error en los datos: {e}")
+        except Exception as e:
+            print(f"❌ Error: {e}")
+    
+    def crear_matriz_spd(self):
+        """Crear matriz simétrica definida positiva aleatoria."""
+        try:
+            nombre = input("🏷️ Nombre de la matriz: ").strip()
+            n = int(input("📏 Tamaño n×n: "))
+            condicion = float(input("📊 Número de condición (default 10): ") or "10")
+            seed_input = input("🎲 Semilla aleatoria (Enter para aleatorio): ").strip()
+            seed = int(seed_input) if seed_input else nueva_semilla()
+            
+            self._crear_matriz_especial(nombre, "Matriz SPD aleatoria", 'crear_spd_aleatoria',
+                                        n=n, condicion=condicion, seed=seed)
+            
+        except ValueError as e:
+            print(f"❌ Error en los datos: {e}")
+        except Exception as e:
+            print(f"❌ Error: {e}")
+    
+    def crear_matriz_ortogonal(self):
+        """Crear matriz ortogonal aleatoria."""
+        try:
+            nombre = input("🏷️ Nombre de la matriz: ").strip()
+            n = int(input("📏 Tamaño n×n: "))
+            seed_input = input("🎲 Semilla aleatoria (Enter para aleatorio): ").strip()
+            seed = int(seed_input) if seed_input else nueva_semilla()
+            
+            self._crear_matriz_especial(nombre, "Matriz ortogonal aleatoria", 'crear_ortogonal_aleatoria',
+                                        n=n, seed=seed)
             
         except ValueError as e:
             print(f"❌ Error en los datos: {e}")
@@ -357,15 +482,16 @@ class InterfazConsolaNP:
                 return
             
             # Cargar datos del CSV
-            datos = np.loadtxt(archivo, delimiter=',')
-            matriz = MatrizNumPy(datos)
+            with self.historial.medir('cargar_csv', self.matrices, (), (nombre,),
+                                      f"Cargada matriz '{nombre}' desde CSV: {archivo}",
+                                      archivo=os.path.abspath(archivo)):
+                datos = np.loadtxt(archivo, delimiter=',', ndmin=2)
+                matriz = MatrizNumPy(datos)
+                self.matrices[nombre] = matriz
             
-            self.matrices[nombre] = matriz
             print(f"✅ Matriz '{nombre}' cargada exitosamente desde {archivo}!")
             matriz.mostrar(f"Matriz {nombre}")
             
-            self.historial_operaciones.append(f"Cargada matriz '{nombre}' desde CSV: {archivo}")
-            
         except Exception as e:
             print(f"❌ Error al cargar archivo: {e}")
     
@@ -442,14 +568,14 @@ class InterfazConsolaNP:
             if not nombre_resultado:
                 nombre_resultado = f"{matriz_a}+{matriz_b}"
             
-            resultado = self.matrices[matriz_a] + self.matrices[matriz_b]
-            self.matrices[nombre_resultado] = resultado
+            with self.historial.medir('suma', self.matrices, (matriz_a, matriz_b), (nombre_resultado,),
+                                      f"Suma: {nombre_resultado} = {matriz_a} + {matriz_b}"):
+                resultado = self.matrices[matriz_a] + self.matrices[matriz_b]
+                self.matrices[nombre_resultado] = resultado
             
             print(f"✅ Suma completada exitosamente!")
             resultado.mostrar(f"Resultado: {nombre_resultado} = {matriz_a} + {matriz_b}")
             
-            self.historial_operaciones.append(f"Suma: {nombre_resultado} = {matriz_a} + {matriz_b}")
-            
         except Exception as e:
             print(f"❌ Error en suma: {e}")
     
@@ -469,14 +595,14 @@ class InterfazConsolaNP:
             if not nombre_resultado:
                 nombre_resultado = f"{matriz_a}-{matriz_b}"
             
-            resultado = self.matrices[matriz_a] - self.matrices[matriz_b]
-            self.matrices[nombre_resultado] = resultado
+            with self.historial.medir('resta', self.matrices, (matriz_a, matriz_b), (nombre_resultado,),
+                                      f"Resta: {nombre_resultado} = {matriz_a} - {matriz_b}"):
+                resultado = self.matrices[matriz_a] - self.matrices[matriz_b]
+                self.matrices[nombre_resultado] = resultado
             
             print(f"✅ Resta completada exitosamente!")
             resultado.mostrar(f"Resultado: {nombre_resultado} = {matriz_a} - {matriz_b}")
             
-            self.historial_operaciones.append(f"Resta: {nombre_resultado} = {matriz_a} - {matriz_b}")
-            
         except Exception as e:
             print(f"❌ Error en resta: {e}")
     
@@ -496,14 +622,14 @@ class InterfazConsolaNP:
             if not nombre_resultado:
                 nombre_resultado = f"{matriz_a}*{matriz_b}"
             
-            resultado = self.matrices[matriz_a] @ self.matrices[matriz_b]
-            self.matrices[nombre_resultado] = resultado
+            with self.historial.medir('multiplicacion', self.matrices, (matriz_a, matriz_b), (nombre_resultado,),
+                                      f"Multiplicación: {nombre_resultado} = {matriz_a} × {matriz_b}"):
+                resultado = self.matrices[matriz_a] @ self.matrices[matriz_b]
+                self.matrices[nombre_resultado] = resultado
             
             print(f"✅ Multiplicación completada exitosamente!")
             resultado.mostrar(f"Resultado: {nombre_resultado} = {matriz_a} × {matriz_b}")
             
-            self.historial_operaciones.append(f"Multiplicación: {nombre_resultado} = {matriz_a} × {matriz_b}")
-            
         except Exception as e:
             print(f"❌ Error en multiplicación: {e}")
     
@@ -519,14 +645,14 @@ class InterfazConsolaNP:
             if not nombre_resultado:
                 nombre_resultado = f"{matriz_nombre}_T"
             
-            resultado = self.matrices[matriz_nombre].transponer()
-            self.matrices[nombre_resultado] = resultado
+            with self.historial.medir('transpuesta', self.matrices, (matriz_nombre,), (nombre_resultado,),
+                                      f"Transposición: {nombre_resultado} = {matriz_nombre}ᵀ"):
+                resultado = self.matrices[matriz_nombre].transponer()
+                self.matrices[nombre_resultado] = resultado
             
             print(f"✅ Transposición completada exitosamente!")
             resultado.mostrar(f"Resultado: {nombre_resultado} = {matriz_nombre}ᵀ")
             
-            self.historial_operaciones.append(f"Transposición: {nombre_resultado} = {matriz_nombre}ᵀ")
-            
         except Exception as e:
             print(f"❌ Error en transposición: {e}")
     
@@ -544,14 +670,14 @@ class InterfazConsolaNP:
             if not nombre_resultado:
                 nombre_resultado = f"{matriz_nombre}*{escalar}"
             
-            resultado = self.matrices[matriz_nombre] * escalar
-            self.matrices[nombre_resultado] = resultado
+            with self.historial.medir('escalado', self.matrices, (matriz_nombre,), (nombre_resultado,),
+                                      f"Escalado: {nombre_resultado} = {escalar} × {matriz_nombre}", escalar=escalar):
+                resultado = self.matrices[matriz_nombre] * escalar
+                self.matrices[nombre_resultado] = resultado
             
             print(f"✅ Escalado completado exitosamente!")
             resultado.mostrar(f"Resultado: {nombre_resultado} = {escalar} × {matriz_nombre}")
             
-            self.historial_operaciones.append(f"Escalado: {nombre_resultado} = {escalar} × {matriz_nombre}")
-            
         except ValueError as e:
             print(f"❌ Error en el valor del escalar: {e}")
         except Exception as e:
@@ -576,14 +702,14 @@ class InterfazConsolaNP:
             if not nombre_resultado:
                 nombre_resultado = f"{matriz_nombre}^{exponente}"
             
-            resultado = matriz.potencia(exponente)
-            self.matrices[nombre_resultado] = resultado
+            with self.historial.medir('potencia', self.matrices, (matriz_nombre,), (nombre_resultado,),
+                                      f"Potencia: {nombre_resultado} = {matriz_nombre}^{exponente}", exponente=exponente):
+                resultado = matriz ** exponente
+                self.matrices[nombre_resultado] = resultado
             
             print(f"✅ Potencia completada exitosamente!")
             resultado.mostrar(f"Resultado: {nombre_resultado} = {matriz_nombre}^{exponente}")
             
-            self.historial_operaciones.append(f"Potencia: {nombre_resultado} = {matriz_nombre}^{exponente}")
-            
         except ValueError as e:
             print(f"❌ Error en el exponente: {e}")
         except Exception as e:
@@ -642,7 +768,9 @@ class InterfazConsolaNP:
                 print("❌ La matriz debe ser cuadrada para calcular el determinante.")
                 return
             
-            det = matriz.determinante()
+            with self.historial.medir('determinante', self.matrices, (matriz_nombre,)) as registro:
+                det = matriz.determinante()
+            registro.descripcion = f"Calculado determinante de '{matriz_nombre}': {det:.{self.precision_salida}f}"
             print(f"✅ Determinante de '{matriz_nombre}': {det:.{self.precision_salida}f}")
             
             # Interpretación
@@ -653,8 +781,6 @@ class InterfazConsolaNP:
             else:
                 print("💡 La matriz contrae volúmenes")
             
-            self.historial_operaciones.append(f"Calculado determinante de '{matriz_nombre}': {det:.{self.precision_salida}f}")
-            
         except Exception as e:
             print(f"❌ Error al calcular determinante: {e}")
     
@@ -675,8 +801,10 @@ class InterfazConsolaNP:
             if not nombre_resultado:
                 nombre_resultado = f"{matriz_nombre}_inv"
             
-            inversa = matriz.inversa()
-            self.matrices[nombre_resultado] = inversa
+            with self.historial.medir('inversa', self.matrices, (matriz_nombre,), (nombre_resultado,),
+                                      f"Calculada inversa: {nombre_resultado} = {matriz_nombre}⁻¹"):
+                inversa = matriz.inversa()
+                self.matrices[nombre_resultado] = inversa
             
             print(f"✅ Inversa calculada exitosamente!")
             inversa.mostrar(f"Inversa: {nombre_resultado} = {matriz_nombre}⁻¹")
@@ -686,8 +814,6 @@ class InterfazConsolaNP:
             error = np.max(np.abs(producto.datos - np.eye(matriz.shape[0])))
             print(f"🔍 Error de verificación (A × A⁻¹ - I): {error:.2e}")
             
-            self.historial_operaciones.append(f"Calculada inversa: {nombre_resultado} = {matriz_nombre}⁻¹")
-            
         except Exception as e:
             print(f"❌ Error al calcular inversa: {e}")
     
@@ -705,7 +831,9 @@ class InterfazConsolaNP:
                 return
             
             print("🔍 Calculando eigenvalores y eigenvectores...")
-            eigenvals, eigenvecs = matriz.eigen()
+            with self.historial.medir('eigen', self.matrices, (matriz_nombre,),
+                                      descripcion=f"Calculados eigenvalores de '{matriz_nombre}'") as registro:
+                eigenvals, eigenvecs = matriz.eigenvectores()
             
             print(f"\n✅ Eigenvalores de '{matriz_nombre}':")
             for i, val in enumerate(eigenvals):
@@ -721,10 +849,9 @@ class InterfazConsolaNP:
                 if not nombre_eigenvecs:
                     nombre_eigenvecs = f"{matriz_nombre}_eigenvecs"
                 self.matrices[nombre_eigenvecs] = MatrizNumPy(eigenvecs)
+                registro.guardar_resultados(self.matrices, nombre_eigenvecs)
                 print(f"✅ Eigenvectores guardados como '{nombre_eigenvecs}'")
             
-            self.historial_operaciones.append(f"Calculados eigenvalores de '{matriz_nombre}'")
-            
         except Exception as e:
             print(f"❌ Error al calcular eigenvalores: {e}")
     
@@ -739,7 +866,8 @@ class InterfazConsolaNP:
             matriz = self.matrices[matriz_nombre]
             
             print("🔍 Calculando descomposición SVD...")
-            U, s, Vt = matriz.svd()
+            with self.historial.medir('svd', self.matrices, (matriz_nombre,)) as registro:
+                U, s, Vt = matriz.svd()
             
             print(f"\n✅ SVD de '{matriz_nombre}' completada:")
             print(f"  - U: {U.shape[0]}×{U.shape[1]}")
@@ -762,12 +890,14 @@ class InterfazConsolaNP:
             # Opción de guardar componentes
             guardar = input("\n💾 ¿Guardar matrices U, S, V^T? (s/n): ").strip().lower()
             if guardar == 's':
-                self.matrices[f"{matriz_nombre}_U"] = U
+                self.matrices[f"{matriz_nombre}_U"] = MatrizNumPy(U)
                 self.matrices[f"{matriz_nombre}_S"] = MatrizNumPy(np.diag(s))
-                self.matrices[f"{matriz_nombre}_Vt"] = Vt
+                self.matrices[f"{matriz_nombre}_Vt"] = MatrizNumPy(Vt)
+                registro.guardar_resultados(self.matrices, f"{matriz_nombre}_U", f"{matriz_nombre}_S",
+                                            f"{matriz_nombre}_Vt")
                 print(f"✅ Matrices SVD guardadas como '{matriz_nombre}_U', '{matriz_nombre}_S', '{matriz_nombre}_Vt'")
             
-            self.historial_operaciones.append(f"SVD de '{matriz_nombre}': rango {rango_numerico}, cond {condicion:.2e}")
+            registro.descripcion = f"SVD de '{matriz_nombre}': rango {rango_numerico}, cond {condicion:.2e}"
             
         except Exception as e:
             print(f"❌ Error en SVD: {e}")
@@ -783,25 +913,27 @@ class InterfazConsolaNP:
             matriz = self.matrices[matriz_nombre]
             
             print("🔍 Calculando descomposición QR...")
-            Q, R = matriz.qr()
+            with self.historial.medir('qr', self.matrices, (matriz_nombre,)) as registro:
+                Q, R = matriz.qr()
             
             print(f"\n✅ QR de '{matriz_nombre}' completada:")
             print(f"  - Q (ortogonal): {Q.shape[0]}×{Q.shape[1]}")
             print(f"  - R (triangular superior): {R.shape[0]}×{R.shape[1]}")
             
             # Verificar ortogonalidad de Q
-            QtQ = Q.transponer() @ Q
-            error_ortogonal = np.max(np.abs(QtQ.datos - np.eye(Q.shape[1])))
+            QtQ = Q.T @ Q
+            error_ortogonal = np.max(np.abs(QtQ - np.eye(Q.shape[1])))
             print(f"🔍 Error de ortogonalidad Q^T × Q - I: {error_ortogonal:.2e}")
             
             # Opción de guardar componentes
             guardar = input("\n💾 ¿Guardar matrices Q y R? (s/n): ").strip().lower()
             if guardar == 's':
-                self.matrices[f"{matriz_nombre}_Q"] = Q
-                self.matrices[f"{matriz_nombre}_R"] = R
+                self.matrices[f"{matriz_nombre}_Q"] = MatrizNumPy(Q)
+                self.matrices[f"{matriz_nombre}_R"] = MatrizNumPy(R)
+                registro.guardar_resultados(self.matrices, f"{matriz_nombre}_Q", f"{matriz_nombre}_R")
                 print(f"✅ Matrices QR guardadas como '{matriz_nombre}_Q' y '{matriz_nombre}_R'")
             
-            self.historial_operaciones.append(f"QR de '{matriz_nombre}': error ortogonal {error_ortogonal:.2e}")
+            registro.descripcion = f"QR de '{matriz_nombre}': error ortogonal {error_ortogonal:.2e}"
             
         except Exception as e:
             print(f"❌ Error en QR: {e}")
@@ -829,7 +961,8 @@ class InterfazConsolaNP:
                 return
             
             print("🔍 Calculando descomposición de Cholesky...")
-            L = matriz.cholesky()
+            with self.historial.medir('cholesky', self.matrices, (matriz_nombre,)) as registro:
+                L = matriz.cholesky()
             
             print(f"\n✅ Cholesky de '{matriz_nombre}' completada:")
             print(f"  - L (triangular inferior): {L.shape[0]}×{L.shape[1]}")
@@ -848,9 +981,10 @@ class InterfazConsolaNP:
                 if not nombre_L:
                     nombre_L = f"{matriz_nombre}_L"
                 self.matrices[nombre_L] = L
+                registro.guardar_resultados(self.matrices, nombre_L)
                 print(f"✅ Matriz L guardada como '{nombre_L}'")
             
-            self.historial_operaciones.append(f"Cholesky de '{matriz_nombre}': error {error:.2e}")
+            registro.descripcion = f"Cholesky de '{matriz_nombre}': error {error:.2e}"
             
         except Exception as e:
             print(f"❌ Error en Cholesky: {e}")
@@ -883,6 +1017,7 @@ class InterfazConsolaNP:
                     val = float(input(f"  b[{i+1}]: "))
                     b_valores.append(val)
                 b = np.array(b_valores).reshape(-1, 1)
+                operandos, parametros = (matriz_A_nombre,), {'b': b_valores}
                 
             elif opcion_b == "2":
                 # Usar matriz existente
@@ -891,13 +1026,18 @@ class InterfazConsolaNP:
                     return
                 matriz_b = self.matrices[matriz_b_nombre]
                 b = matriz_b.datos.reshape(-1, 1) if matriz_b.datos.ndim == 1 else matriz_b.datos
+                operandos, parametros = (matriz_A_nombre, matriz_b_nombre), {}
                 
             else:
                 print("❌ Opción no válida.")
                 return
             
+            mixta = input("⚡ ¿Usar precisión mixta (float32 + refinamiento)? (s/n): ").strip().lower() == 's'
+            
             print("🔍 Resolviendo sistema...")
-            x = matriz_A.resolver_sistema(MatrizNumPy(b))
+            with self.historial.medir('resolver', self.matrices, operandos, precision_mixta=mixta,
+                                      **parametros) as registro:
+                x = matriz_A.resolver_sistema(MatrizNumPy(b), precision_mixta=mixta)
             
             print(f"\n✅ Solución encontrada:")
             x.mostrar("Solución x")
@@ -913,9 +1053,10 @@ class InterfazConsolaNP:
                 nombre_x = input("🏷️ Nombre para la solución: ").strip()
                 if nombre_x:
                     self.matrices[nombre_x] = x
+                    registro.guardar_resultados(self.matrices, nombre_x)
                     print(f"✅ Solución guardada como '{nombre_x}'")
             
-            self.historial_operaciones.append(f"Sistema resuelto: A={matriz_A_nombre}, residuo={residuo:.2e}")
+            registro.descripcion = f"Sistema resuelto: A={matriz_A_nombre}, residuo={residuo:.2e}"
             
         except Exception as e:
             print(f"❌ Error al resolver sistema: {e}")
@@ -930,27 +1071,30 @@ class InterfazConsolaNP:
             
             matriz = self.matrices[matriz_nombre]
             
+            with self.historial.medir('normas', self.matrices, (matriz_nombre,)) as registro:
+                norma_fro = matriz.norma('fro')
+                norma_2 = matriz.norma(2)
+                norma_inf = matriz.norma(np.inf)
+                norma_1 = matriz.norma(1)
+                cond = matriz.condicion() if matriz.es_cuadrada() else None
+            registro.descripcion = f"Normas de '{matriz_nombre}': Fro={norma_fro:.3f}, 2={norma_2:.3f}"
+            
             print(f"\n✅ Normas de '{matriz_nombre}':")
             
             # Norma de Frobenius
-            norma_fro = matriz.norma('fro')
             print(f"  - Frobenius: {norma_fro:.{self.precision_salida}f}")
             
             # Norma espectral (2-norma)
-            norma_2 = matriz.norma(2)
             print(f"  - Espectral (2): {norma_2:.{self.precision_salida}f}")
             
             # Norma infinito
-            norma_inf = matriz.norma(np.inf)
             print(f"  - Infinito: {norma_inf:.{self.precision_salida}f}")
             
             # Norma 1
-            norma_1 = matriz.norma(1)
             print(f"  - 1-norma: {norma_1:.{self.precision_salida}f}")
             
             # Número de condición (si es cuadrada)
-            if matriz.es_cuadrada():
-                cond = matriz.condicion()
+            if cond is not None:
                 print(f"  - Número de condición: {cond:.2e}")
                 
                 if cond > 1e12:
@@ -960,11 +1104,38 @@ class InterfazConsolaNP:
                 else:
                     print("    ✅ Matriz bien condicionada")
             
-            self.historial_operaciones.append(f"Normas de '{matriz_nombre}': Fro={norma_fro:.3f}, 2={norma_2:.3f}")
-            
         except Exception as e:
             print(f"❌ Error al calcular normas: {e}")
     
+    def modo_expresiones(self):
+        """Evalúa expresiones de una línea sobre las matrices guardadas."""
+        print("\n⌨️ MODO EXPRESIONES")
+        print("="*25)
+        print("💡 Ejemplo: C = A @ B.T + 2*inv(D)")
+        print("   Operadores: + - * / @ **  |  X.T, inv(X), transpuesta(X)")
+        print("   Sin asignación el resultado se guarda como 'ans'. Línea vacía para volver.")
+        
+        while True:
+            linea = input("\nexpr> ").strip()
+            if not linea:
+                break
+            
+            try:
+                nombre, resultado, info = evaluar_expresion(linea, self.matrices)
+            except (ValueError, ZeroDivisionError, MemoryError) as e:
+                print(f"❌ Error en expresión: {e}")
+                continue
+            
+            nombre = nombre or "ans"
+            self.matrices[nombre] = resultado
+            self.historial.registrar('expresion', self.matrices, (), (nombre,), info['tiempo'],
+                                     f"Expresión: {linea} → '{nombre}'", linea=linea)
+            
+            print(f"✅ {nombre} = {info['plan']}")
+            print(f"⏱️ Tiempo: {info['tiempo'] * 1000:.2f} ms | "
+                  f"💾 Memoria pico: {info['memoria_pico'] / 1024**2:.2f} MB")
+            resultado.mostrar(f"Resultado: {nombre}", self.precision_salida)
+    
     def menu_gestionar_matrices(self):
         """Menú para gestionar matrices."""
         while True:
@@ -976,6 +1147,7 @@ class InterfazConsolaNP:
             print("4. 📋 Copiar Matriz")
             print("5. 🗑️ Eliminar Matriz")
             print("6. 🧹 Limpiar Todas")
+            print("7. 📜 Historial de Operaciones")
             print("0. ⬅️ Volver")
             
             opcion = input("\n🎯 Opción: ").strip()
@@ -992,6 +1164,8 @@ class InterfazConsolaNP:
                 self.eliminar_matriz()
             elif opcion == "6":
                 self.limpiar_matrices()
+            elif opcion == "7":
+                self.menu_historial()
             elif opcion == "0":
                 break
     
@@ -1024,8 +1198,14 @@ class InterfazConsolaNP:
         
         matriz = self.matrices[matriz_nombre]
         matriz.mostrar(f"Matriz {matriz_nombre}")
-        
-        self.historial_operaciones.append(f"Visualizada '{matriz_nombre}'")
+
+        # Las grandes solo se muestran resumidas: ofrecer recorrerlas enteras
+        if matriz.filas > 20 or matriz.columnas > 20:
+            paginar = input("📄 ¿Recorrer la matriz por páginas? (s/n): ").strip().lower()
+            if paginar == 's':
+                matriz.paginar(self.precision_salida)
+
+        self.historial.registrar('ver', self.matrices, (matriz_nombre,), descripcion=f"Visualizada '{matriz_nombre}'")
     
     def renombrar_matriz(self):
         """Renombrar una matriz."""
@@ -1045,10 +1225,11 @@ class InterfazConsolaNP:
                 return
             
             # Renombrar
-            self.matrices[nuevo_nombre] = self.matrices.pop(matriz_nombre)
+            with self.historial.medir('renombrar', self.matrices, (matriz_nombre,), (nuevo_nombre,),
+                                      f"Renombrada '{matriz_nombre}' → '{nuevo_nombre}'"):
+                self.matrices[nuevo_nombre] = self.matrices.pop(matriz_nombre)
             
             print(f"✅ Matriz renombrada de '{matriz_nombre}' a '{nuevo_nombre}'")
-            self.historial_operaciones.append(f"Renombrada '{matriz_nombre}' → '{nuevo_nombre}'")
             
         except Exception as e:
             print(f"❌ Error al renombrar: {e}")
@@ -1071,11 +1252,12 @@ class InterfazConsolaNP:
                 return
             
             # Copiar
-            matriz_original = self.matrices[matriz_nombre]
-            self.matrices[nuevo_nombre] = MatrizNumPy(matriz_original.datos.copy())
+            with self.historial.medir('copiar', self.matrices, (matriz_nombre,), (nuevo_nombre,),
+                                      f"Copiada '{matriz_nombre}' → '{nuevo_nombre}'"):
+                matriz_original = self.matrices[matriz_nombre]
+                self.matrices[nuevo_nombre] = MatrizNumPy(matriz_original.datos.copy())
             
             print(f"✅ Matriz copiada: '{matriz_nombre}' → '{nuevo_nombre}'")
-            self.historial_operaciones.append(f"Copiada '{matriz_nombre}' → '{nuevo_nombre}'")
             
         except Exception as e:
             print(f"❌ Error al copiar: {e}")
@@ -1093,10 +1275,11 @@ class InterfazConsolaNP:
                 print("❌ Eliminación cancelada.")
                 return
             
-            del self.matrices[matriz_nombre]
+            with self.historial.medir('eliminar', self.matrices, (matriz_nombre,),
+                                      descripcion=f"Eliminada '{matriz_nombre}'"):
+                del self.matrices[matriz_nombre]
             
             print(f"✅ Matriz '{matriz_nombre}' eliminada exitosamente.")
-            self.historial_operaciones.append(f"Eliminada '{matriz_nombre}'")
             
         except Exception as e:
             print(f"❌ Error al eliminar: {e}")
@@ -1116,11 +1299,63 @@ class InterfazConsolaNP:
                 print("❌ Limpieza cancelada.")
                 return
             
-            self.matrices.clear()
+            with self.historial.medir('limpiar', self.matrices, descripcion=f"Limpiadas {num_matrices} matrices"):
+                self.matrices.clear()
             
             print(f"✅ Todas las matrices eliminadas ({num_matrices} matrices).")
-            self.historial_operaciones.append(f"Limpiadas {num_matrices} matrices")
             
         except Exception as e:
             print(f"❌ Error al limpiar: {e}")
     
+    
+    def menu_historial(self):
+        """Consultar, exportar y reproducir el historial de operaciones."""
+        while True:
+            print("\n📜 HISTORIAL DE OPERACIONES")
+            print("="*30)
+            print(f"📊 {len(self.historial)} registros (capacidad {self.historial.capacidad}, "
+                  f"descartados {self.historial.descartados})")
+            print("1. 📋 Ver últimos registros")
+            print("2. 💾 Exportar a JSON Lines")
+            print("3. 🔁 Reproducir desde archivo")
+            print("0. ⬅️ Volver")
+            
+            opcion = input("\n🎯 Opción: ").strip()
+            
+            try:
+                if opcion == "1":
+                    cantidad = input("🔢 Cantidad (default: 20): ").strip()
+                    for registro in self.historial.ultimos(int(cantidad) if cantidad else 20):
+                        print(f"  {registro}")
+                elif opcion == "2":
+                    archivo = input("📁 Archivo (default: historial.jsonl): ").strip() or "historial.jsonl"
+                    escritos = self.historial.exportar(archivo)
+                    print(f"✅ {escritos} registros exportados a {archivo}")
+                elif opcion == "3":
+                    self.reproducir_historial()
+                elif opcion == "0":
+                    break
+            except (ValueError, OSError) as e:
+                print(f"❌ Error: {e}")
+    
+    def reproducir_historial(self):
+        """Reproduce un historial exportado sobre un espacio de trabajo nuevo."""
+        archivo = input("📁 Archivo JSON Lines: ").strip()
+        if not os.path.exists(archivo):
+            print(f"❌ El archivo {archivo} no existe.")
+            return
+        
+        historial = Historial.importar(archivo)
+        print(f"🔁 Reproduciendo {len(historial)} registros...")
+        matrices, repeticion = historial.reproducir()
+        
+        # Comparar las duraciones originales con las de esta ejecución
+        for original, nuevo in zip(historial, repeticion):
+            print(f"  {nuevo}  (original: {original.duracion * 1e3:.2f} ms)")
+        print(f"✅ Espacio de trabajo reproducido: {len(matrices)} matrices")
+        
+        reemplazar = input("⚠️ ¿Reemplazar las matrices actuales por las reproducidas? (s/n): ").strip().lower()
+        if reemplazar == 's':
+            self.matrices = matrices
+            self.historial = repeticion
+            print("✅ Matrices reemplazadas.")
@@ -0,0 +1,271 @@
+"""
+Editor Virtual de Matrices
+==========================
+
+Rejilla editable para ingresar matrices en la interfaz gráfica. Extiende
+``VisorMatriz``: solo se dibujan las celdas visibles y hay un único
+``Entry`` que se coloca sobre la celda que se está editando, así que abrir
+el editor cuesta lo mismo para 3×3 que para 1000×1000.
+
+- Escribir sobre la celda activa empieza a editarla; Enter, Tab y las
+  flechas confirman y mueven la selección; Escape cancela.
+- Ctrl+V pega un bloque (tabuladores, punto y coma, comas o espacios;
+  fracciones como ``3/4``) desde la celda activa, analizado de una vez con
+  ``src.entrada.analizar_bloque``.
+- Cada celda se valida al confirmarla; las inválidas se muestran en rojo
+  con su texto y se informan al pedir los datos.
+
+Autor: Nicolas
+"""
+
+import tkinter as tk
+import numpy as np
+from typing import Callable, Dict, List, Optional, Tuple
+
+from src.entrada import analizar_bloque, convertir_numero
+from interfaces.visor_numpy import VisorMatriz
+
+COLOR_ACTIVA = '#1a73e8'
+COLOR_INVALIDA = '#d93025'
+
+
+class EditorMatriz(VisorMatriz):
+    """Rejilla virtual editable con pegado en bloque."""
+
+    def __init__(self, padre, filas: int, columnas: int, fuente: Tuple = ('Courier', 10),
+                 al_cambiar: Optional[Callable[['EditorMatriz'], None]] = None, **opciones):
+        """
+        Crea un editor lleno de ceros.
+
+        Parameters:
+            padre: Widget contenedor
+            filas (int): Número de filas
+            columnas (int): Número de columnas
+            fuente (Tuple): Fuente de las celdas
+            al_cambiar (Optional[Callable]): Se llama tras cada edición o pegado
+        """
+        super().__init__(padre, fuente=fuente, **opciones)
+        self.invalidos: Dict[Tuple[int, int], str] = {}
+        self.activa = (0, 0)
+        self._al_cambiar = al_cambiar
+        self._editando = False
+
+        self._marco = self.canvas.create_rectangle(0, 0, 0, 0, outline=COLOR_ACTIVA, width=2)
+        self._entrada = tk.Entry(self.canvas, font=self._fuente, justify=tk.RIGHT, relief=tk.FLAT,
+                                 highlightthickness=1, highlightcolor=COLOR_ACTIVA)
+        self._ventana_entrada = self.canvas.create_window(0, 0, window=self._entrada, anchor=tk.NW,
+                                                          state=tk.HIDDEN)
+
+        self.canvas.bind('<Button-1>', self._clic)
+        self.canvas.bind('<Double-Button-1>', lambda e: self.editar())
+        self.canvas.bind('<Key>', self._tecla)
+        self.canvas.bind('<Return>', lambda e: self.editar())
+        self.canvas.bind('<F2>', lambda e: self.editar())
+        self.canvas.bind('<Delete>', lambda e: self.establecer(*self.activa, '0'))
+        self.canvas.bind('<BackSpace>', lambda e: self.editar(''))
+        for tecla, (df, dc) in {'<Up>': (-1, 0), '<Down>': (1, 0), '<Left>': (0, -1), '<Right>': (0, 1),
+                                '<Tab>': (0, 1), '<Shift-Tab>': (0, -1)}.items():
+            self.canvas.bind(tecla, lambda e, df=df, dc=dc: self._mover_y_cortar(df, dc))
+        self.canvas.bind('<Prior>', lambda e: self.mover(-self._visibles[0], 0))
+        self.canvas.bind('<Next>', lambda e: self.mover(self._visibles[0], 0))
+        for secuencia in ('<Control-v>', '<Control-V>', '<<Paste>>'):
+            self.canvas.bind(secuencia, self._pegar_y_cortar)
+
+        self._entrada.bind('<Return>', lambda e: self._confirmar_y_mover(1, 0))
+        self._entrada.bind('<Tab>', lambda e: self._confirmar_y_mover(0, 1))
+        self._entrada.bind('<Shift-Tab>', lambda e: self._confirmar_y_mover(0, -1))
+        self._entrada.bind('<Up>', lambda e: self._confirmar_y_mover(-1, 0))
+        self._entrada.bind('<Down>', lambda e: self._confirmar_y_mover(1, 0))
+        self._entrada.bind('<Escape>', lambda e: self.cancelar())
+        self._entrada.bind('<FocusOut>', lambda e: self.confirmar())
+
+        self.mostrar(np.zeros((filas, columnas)))
+
+    # ============ API PÚBLICA ============
+
+    def editar(self, texto: Optional[str] = None) -> None:
+        """
+        Abre la edición de la celda activa.
+
+        Parameters:
+            texto (Optional[str]): Texto inicial (default: el valor actual)
+        """
+        fila, columna = self.activa
+        self._asegurar_visible(fila, columna)
+        self._entrada.delete(0, tk.END)
+        self._entrada.insert(0, self._texto_celda(fila, columna) if texto is None else texto)
+        self._editando = True
+        self._entrada.focus_set()
+        self._entrada.icursor(tk.END)
+        self.refrescar()
+
+    def confirmar(self) -> None:
+        """Valida y guarda el texto de la celda en edición."""
+        if not self._editando:
+            return
+        self._editando = False
+        self.canvas.itemconfigure(self._ventana_entrada, state=tk.HIDDEN)
+        self.canvas.focus_set()
+        self.establecer(*self.activa, self._entrada.get())
+
+    def cancelar(self) -> None:
+        """Descarta la edición en curso."""
+        self._editando = False
+        self.canvas.itemconfigure(self._ventana_entrada, state=tk.HIDDEN)
+        self.canvas.focus_set()
+
+    def establecer(self, fila: int, columna: int, texto: str) -> bool:
+        """
+        Guarda el texto de una celda; si no es un número, la marca como inválida.
+
+        Returns:
+            bool: True si el texto era válido (vacío cuenta como 0)
+        """
+        texto = texto.strip()
+        try:
+            self.datos[fila, columna] = convertir_numero(texto) if texto else 0.0
+            self.invalidos.pop((fila, columna), None)
+            valido = True
+        except ValueError:
+            self.invalidos[(fila, columna)] = texto
+            valido = False
+        self._cambio()
+        return valido
+
+    def pegar(self, texto: str) -> Tuple[int, int]:
+        """
+        Escribe un bloque de texto a partir de la celda activa.
+
+        Lo que sobresale de la matriz se ignora.
+
+        Parameters:
+            texto (str): Filas en líneas, elementos separados por tabuladores,
+                punto y coma, comas o espacios
+
+        Returns:
+            Tuple[int, int]: Filas y columnas pegadas
+        """
+        filas, errores = analizar_bloque(texto)
+        fila_inicio, columna_inicio = self.activa
+        filas = filas[:self.filas - fila_inicio]
+        longitudes = [min(len(valores), self.columnas - columna_inicio) for valores in filas]
+
+        for desplazamiento, (valores, longitud) in enumerate(zip(filas, longitudes)):
+            self.datos[fila_inicio + desplazamiento, columna_inicio:columna_inicio + longitud] = valores[:longitud]
+
+        def pegada(celda):
+            desplazamiento = celda[0] - fila_inicio
+            return (0 <= desplazamiento < len(filas)
+                    and columna_inicio <= celda[1] < columna_inicio + longitudes[desplazamiento])
+
+        self.invalidos = {celda: texto for celda, texto in self.invalidos.items() if not pegada(celda)}
+        for fila, columna, elemento in errores:
+            celda = (fila_inicio + fila, columna_inicio + columna)
+            if fila < len(filas) and pegada(celda):
+                self.invalidos[celda] = elemento
+        self._cambio()
+        return len(filas), max(longitudes, default=0)
+
+    def mover(self, filas: int, columnas: int) -> None:
+        """Mueve la celda activa (confirmando la edición en curso)."""
+        self.confirmar()
+        fila = min(max(self.activa[0] + filas, 0), self.filas - 1)
+        columna = min(max(self.activa[1] + columnas, 0), self.columnas - 1)
+        self.activa = (fila, columna)
+        self._asegurar_visible(fila, columna)
+        self.refrescar()
+
+    def obtener_datos(self) -> np.ndarray:
+        """
+        Devuelve la matriz editada.
+
+        Raises:
+            ValueError: Si quedan celdas inválidas
+        """
+        self.confirmar()
+        if self.invalidos:
+            fila, columna = min(self.invalidos)
+            raise ValueError(f"{len(self.invalidos)} celda(s) inválida(s); la primera en la fila {fila + 1}, "
+                             f"columna {columna + 1}: '{self.invalidos[(fila, columna)]}'")
+        return self.datos
+
+    # ============ MÉTODOS PRIVADOS ============
+
+    def _textos_bloque(self, fila_inicio: int, fila_fin: int, columna_inicio: int, columna_fin: int) -> List[List[str]]:
+        celdas = super()._textos_bloque(fila_inicio, fila_fin, columna_inicio, columna_fin)
+        if self.invalidos:
+            for i, fila in enumerate(celdas):
+                for j in range(len(fila)):
+                    texto = self.invalidos.get((fila_inicio + i, columna_inicio + j))
+                    if texto is not None:
+                        fila[j] = texto
+        return celdas
+
+    def _color_celda(self, fila: int, columna: int) -> str:
+        return COLOR_INVALIDA if (fila, columna) in self.invalidos else 'black'
+
+    def _despues_de_dibujar(self) -> None:
+        """Coloca el marco de la celda activa y el Entry de edición."""
+        fila, columna = self.activa
+        filas_visibles, columnas_visibles = self._visibles
+        visible = (self.fila_inicio <= fila < self.fila_inicio + filas_visibles
+                   and self.columna_inicio <= columna < self.columna_inicio + columnas_visibles)
+        x0, y0, x1, y1 = self.rectangulo_celda(fila, columna)
+        self.canvas.coords(self._marco, x0, y0, x1, y1)
+        self.canvas.itemconfigure(self._marco, state=tk.NORMAL if visible else tk.HIDDEN)
+        self.canvas.tag_raise(self._marco)
+        if self._editando:
+            self.canvas.coords(self._ventana_entrada, x0, y0)
+            self.canvas.itemconfigure(self._ventana_entrada, width=x1 - x0, height=y1 - y0,
+                                      state=tk.NORMAL if visible else tk.HIDDEN)
+
+    def _texto_celda(self, fila: int, columna: int) -> str:
+        if (fila, columna) in self.invalidos:
+            return self.invalidos[(fila, columna)]
+        return self._formatear(self.datos[fila:fila + 1, columna:columna + 1])[0][0]
+
+    def _asegurar_visible(self, fila: int, columna: int) -> None:
+        filas_visibles, columnas_visibles = self._visibles
+        if fila < self.fila_inicio:
+            self.fila_inicio = fila
+        elif fila >= self.fila_inicio + filas_visibles:
+            self.fila_inicio = fila - filas_visibles + 1
+        if columna < self.columna_inicio:
+            self.columna_inicio = columna
+        elif columna >= self.columna_inicio + columnas_visibles:
+            self.columna_inicio = columna - columnas_visibles + 1
+
+    def _cambio(self) -> None:
+        self.refrescar()
+        if self._al_cambiar:
+            self._al_cambiar(self)
+
+    def _clic(self, evento) -> None:
+        self.confirmar()
+        self.canvas.focus_set()
+        celda = self.celda_en(evento.x, evento.y)
+        if celda is not None:
+            self.activa = celda
+            self.refrescar()
+
+    def _tecla(self, evento) -> None:
+        """Empieza a editar al escribir un carácter sobre la celda activa."""
+        if evento.char and evento.char.isprintable() and not evento.state & 0x4:
+            self.editar(evento.char)
+
+    def _mover_y_cortar(self, filas: int, columnas: int) -> str:
+        self.mover(filas, columnas)
+        return 'break'
+
+    def _confirmar_y_mover(self, filas: int, columnas: int) -> str:
+        self.mover(filas, columnas)
+        self.canvas.focus_set()
+        return 'break'
+
+    def _pegar_y_cortar(self, evento) -> str:
+        try:
+            texto = self.clipboard_get()
+        except tk.TclError:
+            return 'break'
+        self.pegar(texto)
+        return 'break'
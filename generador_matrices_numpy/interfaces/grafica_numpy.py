@@ -11,15 +11,27 @@ Versión: 2.0.0 (NumPy Edition)
 
 import sys
 import os
+import itertools
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
 import numpy as np
-from typing import Dict, List, Optional, Tuple
+from concurrent.futures import CancelledError
+from typing import Dict, Optional, Tuple
 
 # Importar la clase principal
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from src.matriz_numpy import MatrizNumPy
+from src.historial import Historial, nueva_semilla
+from src.teselas import TAM_TESELA, inversa_teselas
+from interfaces.tareas_fondo import EjecutorFondo, TareaFondo, INTERVALO_SONDEO
+from interfaces.visor_numpy import VisorMatriz
+from interfaces.editor_numpy import EditorMatriz
+from interfaces.mapa_calor import MapaCalor
 
+# Filas por panel en productos largos y líneas por bloque al leer CSV
+# (entre paneles/bloques se actualiza el progreso y se atiende la cancelación)
+FILAS_PANEL = 256
+LINEAS_BLOQUE = 20000
 
 
 class InterfazGraficaNP:
@@ -29,12 +41,17 @@ class InterfazGraficaNP:
         """Inicializa la interfaz gráfica."""
         self.matrices: Dict[str, MatrizNumPy] = {}
         self.ventana_principal = None
-        self.historial_operaciones: List[str] = []
+        self.historial = Historial()
+        self.ejecutor = EjecutorFondo()
+        self._sondeo_activo = False
         
     def iniciar(self):
         """Inicia la interfaz gráfica."""
         self.crear_ventana_principal()
-        self.ventana_principal.mainloop()
+        try:
+            self.ventana_principal.mainloop()
+        finally:
+            self.ejecutor.cerrar()
     
     def crear_ventana_principal(self):
         """Crea la ventana principal de la aplicación."""
@@ -63,6 +80,7 @@ class InterfazGraficaNP:
         menu_archivo.add_separator()
         menu_archivo.add_command(label="📂 Cargar CSV", command=self.cargar_csv)
         menu_archivo.add_command(label="💾 Guardar CSV", command=self.guardar_csv)
+        menu_archivo.add_command(label="📜 Exportar Historial", command=self.exportar_historial)
         menu_archivo.add_separator()
         menu_archivo.add_command(label="🚪 Salir", command=self.ventana_principal.quit)
         
@@ -135,9 +153,17 @@ class InterfazGraficaNP:
         self.info_label = ttk.Label(panel_derecho, text="Selecciona una matriz para ver información", style='Heading.TLabel')
         self.info_label.grid(row=0, column=0, sticky=(tk.W, tk.E), pady=(0, 10))
         
-        # Área de texto para mostrar matriz
-        self.texto_matriz = scrolledtext.ScrolledText(panel_derecho, height=20, width=60, font=('Courier', 10))
-        self.texto_matriz.grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        # Pestañas de valores y mapa de calor
+        self.pestanas_vista = ttk.Notebook(panel_derecho)
+        self.pestanas_vista.grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        
+        # Visor virtual: solo dibuja las celdas visibles, sirve para cualquier tamaño
+        self.visor = VisorMatriz(self.pestanas_vista, fuente=('Courier', 10))
+        self.pestanas_vista.add(self.visor, text="🔢 Valores")
+        
+        # Mapa de calor: solo se dibuja mientras su pestaña está visible
+        self.mapa_calor = MapaCalor(self.pestanas_vista, padding="5")
+        self.pestanas_vista.add(self.mapa_calor, text="🌡️ Mapa de calor")
         
         # Panel de operaciones rápidas
         ops_frame = ttk.LabelFrame(panel_derecho, text="⚡ Operaciones Rápidas", padding="5")
@@ -152,8 +178,79 @@ class InterfazGraficaNP:
         self.status_bar = ttk.Label(main_frame, text="✅ Listo - NumPy v" + np.__version__, relief=tk.SUNKEN)
         self.status_bar.grid(row=2, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(10, 0))
         
+        # Progreso de las tareas en segundo plano (oculto mientras no haya)
+        self.panel_progreso = ttk.Frame(main_frame)
+        self.panel_progreso.grid(row=3, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(5, 0))
+        self.panel_progreso.columnconfigure(1, weight=1)
+        self.etiqueta_progreso = ttk.Label(self.panel_progreso, text="")
+        self.etiqueta_progreso.grid(row=0, column=0, sticky=tk.W, padx=(0, 10))
+        self.barra_progreso = ttk.Progressbar(self.panel_progreso, maximum=1.0)
+        self.barra_progreso.grid(row=0, column=1, sticky=(tk.W, tk.E))
+        ttk.Button(self.panel_progreso, text="⛔ Cancelar", command=self.cancelar_tarea).grid(row=0, column=2, padx=(10, 0))
+        self.panel_progreso.grid_remove()
+        
         self.actualizar_lista_matrices()
     
+    def ejecutar_en_fondo(self, descripcion, funcion, al_terminar, titulo_error="Error"):
+        """
+        Ejecuta ``funcion(tarea)`` en segundo plano y llama a ``al_terminar``
+        con su resultado desde el bucle de Tk.
+        """
+        def al_fallar(error):
+            self.status_bar.config(text=f"❌ {descripcion}: {error}")
+            messagebox.showerror(titulo_error, f"{titulo_error}: {error}")
+        
+        tarea = self.ejecutor.enviar(descripcion, funcion, al_terminar, al_fallar)
+        self.status_bar.config(text=f"⏳ {descripcion}...")
+        if not self._sondeo_activo:
+            self._sondeo_activo = True
+            self.ventana_principal.after(INTERVALO_SONDEO, self._sondear_tareas)
+        self._actualizar_progreso()
+        return tarea
+    
+    def cancelar_tarea(self):
+        """Cancela la tarea en segundo plano que se muestra en la barra."""
+        en_curso = self.ejecutor.en_curso()
+        if en_curso:
+            tarea = en_curso[0]
+            tarea.cancelar()
+            self.status_bar.config(text=f"⛔ Cancelado: {tarea.descripcion}")
+    
+    def _sondear_tareas(self):
+        """Entrega los resultados terminados y refresca el progreso."""
+        self.ejecutor.sondear()
+        self._actualizar_progreso()
+        if self.ejecutor.activas:
+            self.ventana_principal.after(INTERVALO_SONDEO, self._sondear_tareas)
+        else:
+            self._sondeo_activo = False
+    
+    def _actualizar_progreso(self):
+        """Muestra la primera tarea activa con su progreso y tiempo transcurrido."""
+        activas = self.ejecutor.en_curso()
+        if not activas:
+            self.barra_progreso.stop()
+            self.panel_progreso.grid_remove()
+            return
+        
+        tarea = activas[0]
+        texto = f"⏳ {tarea.descripcion} - {tarea.transcurrido():.1f} s"
+        if len(activas) > 1:
+            texto += f" (+{len(activas) - 1} en cola)"
+        self.etiqueta_progreso.config(text=texto)
+        
+        fraccion = tarea.fraccion()
+        if fraccion is None:
+            if str(self.barra_progreso['mode']) != 'indeterminate':
+                self.barra_progreso.config(mode='indeterminate')
+                self.barra_progreso.start(INTERVALO_SONDEO // 5)
+        else:
+            if str(self.barra_progreso['mode']) != 'determinate':
+                self.barra_progreso.stop()
+                self.barra_progreso.config(mode='determinate')
+            self.barra_progreso['value'] = fraccion
+        self.panel_progreso.grid()
+    
     def actualizar_lista_matrices(self):
         """Actualiza la lista de matrices en la interfaz."""
         self.lista_matrices.delete(0, tk.END)
@@ -172,7 +269,7 @@ class InterfazGraficaNP:
                 self.mostrar_matriz_seleccionada(nombre_matriz)
     
     def mostrar_matriz_seleccionada(self, nombre):
-        """Muestra la matriz seleccionada en el área de texto."""
+        """Muestra la matriz seleccionada en el visor."""
         if nombre in self.matrices:
             matriz = self.matrices[nombre]
             
@@ -181,27 +278,8 @@ class InterfazGraficaNP:
             if matriz.es_cuadrada():
                 info += " (Cuadrada)"
             self.info_label.config(text=info)
-            
-            # Mostrar matriz en el área de texto
-            self.texto_matriz.delete('1.0', tk.END)
-            
-            # Crear representación de la matriz
-            contenido = f"Matriz: {nombre}\n"
-            contenido += f"Dimensiones: {matriz.shape[0]}×{matriz.shape[1]}\n"
-            contenido += f"Tipo: {matriz.datos.dtype}\n"
-            contenido += "="*50 + "\n\n"
-            
-            # Formatear la matriz para visualización
-            if matriz.shape[0] <= 20 and matriz.shape[1] <= 20:  # Solo mostrar si no es muy grande
-                contenido += str(matriz.datos)
-            else:
-                contenido += f"Matriz demasiado grande para visualizar completa.\n"
-                contenido += f"Primeras 5×5 elementos:\n"
-                contenido += str(matriz.datos[:5, :5])
-                if matriz.shape[0] > 5 or matriz.shape[1] > 5:
-                    contenido += "\n..."
-            
-            self.texto_matriz.insert('1.0', contenido)
+            self.visor.mostrar(matriz)
+            self.mapa_calor.mostrar(matriz)
     
     def nueva_matriz_dialogo(self):
         """Abre diálogo para crear nueva matriz."""
@@ -295,22 +373,25 @@ class InterfazGraficaNP:
                     self.crear_matriz_manual_dialogo(nombre, filas, columnas, dialogo)
                     return  # No cerrar aún para matriz manual
                 elif tipo == "aleatoria":
-                    min_val = float(min_entry.get())
-                    max_val = float(max_entry.get())
-                    matriz = MatrizNumPy.crear_aleatoria(filas, columnas, min_val, max_val)
+                    # La semilla queda en el historial para poder repetir la matriz
+                    metodo, argumentos = 'crear_aleatoria', {
+                        'filas': filas, 'columnas': columnas, 'min_val': float(min_entry.get()),
+                        'max_val': float(max_entry.get()), 'seed': nueva_semilla()}
                 elif tipo == "ceros":
-                    matriz = MatrizNumPy.crear_ceros(filas, columnas)
+                    metodo, argumentos = 'crear_ceros', {'filas': filas, 'columnas': columnas}
                 elif tipo == "unos":
-                    matriz = MatrizNumPy.crear_unos(filas, columnas)
+                    metodo, argumentos = 'crear_unos', {'filas': filas, 'columnas': columnas}
                 elif tipo == "identidad":
                     if filas != columnas:
                         messagebox.showerror("Error", "La matriz identidad debe ser cuadrada")
                         return
-                    matriz = MatrizNumPy.crear_identidad(filas)
+                    metodo, argumentos = 'crear_identidad', {'tamaño': filas}
                 
-                self.matrices[nombre] = matriz
+                with self.historial.medir('crear', self.matrices, (), (nombre,),
+                                          f"Creada matriz '{nombre}' ({filas}×{columnas})",
+                                          metodo=metodo, argumentos=argumentos):
+                    self.matrices[nombre] = getattr(MatrizNumPy, metodo)(**argumentos)
                 self.actualizar_lista_matrices()
-                self.historial_operaciones.append(f"Creada matriz '{nombre}' ({filas}×{columnas})")
                 self.status_bar.config(text=f"✅ Matriz '{nombre}' creada exitosamente")
                 dialogo.destroy()
                 
@@ -339,39 +420,33 @@ class InterfazGraficaNP:
         ttk.Label(main_frame, text=f"Ingresa valores para matriz {filas}×{columnas}:", 
                  font=('Arial', 12, 'bold')).pack(pady=(0, 10))
         
-        # Frame para entradas
-        entradas_frame = ttk.Frame(main_frame)
-        entradas_frame.pack(fill=tk.BOTH, expand=True)
-        
-        # Crear grid de entradas
-        entradas = []
-        for i in range(filas):
-            fila_entradas = []
-            for j in range(columnas):
-                entry = ttk.Entry(entradas_frame, width=8)
-                entry.grid(row=i, column=j, padx=2, pady=2)
-                entry.insert(0, "0")
-                fila_entradas.append(entry)
-            entradas.append(fila_entradas)
+        ttk.Label(main_frame, text="Escribe sobre una celda o pega un bloque (Ctrl+V) separado por "
+                 "tabuladores, comas o espacios. Se admiten fracciones como 3/4.",
+                 wraplength=560, justify=tk.LEFT).pack(pady=(0, 5))
         
-        # Botones
+        # Botones y estado abajo; la rejilla ocupa el resto
         btn_frame = ttk.Frame(main_frame)
-        btn_frame.pack(fill=tk.X, pady=(20, 0))
+        btn_frame.pack(side=tk.BOTTOM, fill=tk.X, pady=(10, 0))
+        estado = ttk.Label(main_frame, text="", foreground='red')
+        estado.pack(side=tk.BOTTOM, anchor=tk.W)
+        
+        def al_cambiar(editor):
+            invalidas = len(editor.invalidos)
+            estado.config(text=f"⚠️ {invalidas} celda(s) inválida(s)" if invalidas else "")
+        
+        # Una sola rejilla virtual en lugar de un Entry por elemento
+        editor = EditorMatriz(main_frame, filas, columnas, al_cambiar=al_cambiar)
+        editor.pack(fill=tk.BOTH, expand=True)
+        editor.canvas.focus_set()
         
         def crear_matriz_manual():
             try:
-                datos = []
-                for fila in entradas:
-                    fila_datos = []
-                    for entry in fila:
-                        valor = float(entry.get() or "0")
-                        fila_datos.append(valor)
-                    datos.append(fila_datos)
+                datos = editor.obtener_datos()
                 
-                matriz = MatrizNumPy(datos)
-                self.matrices[nombre] = matriz
+                with self.historial.medir('manual', self.matrices, (), (nombre,),
+                                          f"Creada matriz manual '{nombre}' ({filas}×{columnas})", datos=datos):
+                    self.matrices[nombre] = MatrizNumPy(datos)
                 self.actualizar_lista_matrices()
-                self.historial_operaciones.append(f"Creada matriz manual '{nombre}' ({filas}×{columnas})")
                 self.status_bar.config(text=f"✅ Matriz manual '{nombre}' creada exitosamente")
                 dialogo.destroy()
                 
@@ -397,11 +472,13 @@ class InterfazGraficaNP:
             
             respuesta = messagebox.askyesno("Confirmar", f"¿Eliminar matriz '{nombre}'?")
             if respuesta:
-                del self.matrices[nombre]
+                with self.historial.medir('eliminar', self.matrices, (nombre,),
+                                          descripcion=f"Eliminada matriz '{nombre}'"):
+                    del self.matrices[nombre]
                 self.actualizar_lista_matrices()
-                self.texto_matriz.delete('1.0', tk.END)
+                self.visor.mostrar(None)
+                self.mapa_calor.mostrar(None)
                 self.info_label.config(text="Selecciona una matriz para ver información")
-                self.historial_operaciones.append(f"Eliminada matriz '{nombre}'")
                 self.status_bar.config(text=f"✅ Matriz '{nombre}' eliminada")
     
     def ver_matriz(self):
@@ -441,13 +518,14 @@ class InterfazGraficaNP:
             messagebox.showerror("Error", "La matriz debe ser cuadrada para calcular el determinante")
             return
         
-        try:
-            det = matriz.determinante()
+        def al_terminar(det):
             messagebox.showinfo("Determinante", f"Determinante de '{nombre}': {det:.6f}")
-            self.historial_operaciones.append(f"Calculado determinante de '{nombre}': {det:.6f}")
+            self.historial.registrar('determinante', self.matrices, (nombre,), duracion=tarea.duracion,
+                                     descripcion=f"Calculado determinante de '{nombre}': {det:.6f}")
             self.status_bar.config(text=f"✅ Determinante calculado: {det:.6f}")
-        except Exception as e:
-            messagebox.showerror("Error", f"Error al calcular determinante: {e}")
+        
+        tarea = self.ejecutar_en_fondo(f"Determinante de '{nombre}'", lambda tarea: matriz.determinante(),
+                                       al_terminar, "Error al calcular determinante")
     
     def calcular_inversa(self):
         """Calcula la inversa de la matriz seleccionada."""
@@ -471,13 +549,16 @@ class InterfazGraficaNP:
                 messagebox.showerror("Error", "Ya existe una matriz con ese nombre")
                 return
             
-            inversa = matriz.inversa()
-            self.matrices[nombre_inversa] = inversa
-            self.actualizar_lista_matrices()
+            def al_terminar(inversa):
+                if not self._guardar_resultado(nombre_inversa, inversa):
+                    return
+                messagebox.showinfo("Inversa", f"Inversa calculada y guardada como '{nombre_inversa}'")
+                self.historial.registrar('inversa', self.matrices, (nombre,), (nombre_inversa,), tarea.duracion,
+                                         f"Calculada inversa de '{nombre}' → '{nombre_inversa}'")
+                self.status_bar.config(text=f"✅ Inversa calculada: '{nombre_inversa}'")
             
-            messagebox.showinfo("Inversa", f"Inversa calculada y guardada como '{nombre_inversa}'")
-            self.historial_operaciones.append(f"Calculada inversa de '{nombre}' → '{nombre_inversa}'")
-            self.status_bar.config(text=f"✅ Inversa calculada: '{nombre_inversa}'")
+            tarea = self.ejecutar_en_fondo(f"Inversa de '{nombre}'", lambda tarea: _invertir(matriz, tarea),
+                                           al_terminar, "Error al calcular inversa")
             
         except Exception as e:
             messagebox.showerror("Error", f"Error al calcular inversa: {e}")
@@ -499,13 +580,12 @@ class InterfazGraficaNP:
                 messagebox.showerror("Error", "Ya existe una matriz con ese nombre")
                 return
             
-            matriz = self.matrices[nombre]
-            transpuesta = matriz.transponer()
-            self.matrices[nombre_transpuesta] = transpuesta
+            with self.historial.medir('transpuesta', self.matrices, (nombre,), (nombre_transpuesta,),
+                                      f"Transpuesta de '{nombre}' → '{nombre_transpuesta}'"):
+                self.matrices[nombre_transpuesta] = self.matrices[nombre].transponer()
             self.actualizar_lista_matrices()
             
             messagebox.showinfo("Transposición", f"Transpuesta calculada y guardada como '{nombre_transpuesta}'")
-            self.historial_operaciones.append(f"Transpuesta de '{nombre}' → '{nombre_transpuesta}'")
             self.status_bar.config(text=f"✅ Transpuesta calculada: '{nombre_transpuesta}'")
             
         except Exception as e:
@@ -570,20 +650,25 @@ class InterfazGraficaNP:
                 matriz1 = self.matrices[nombre1]
                 matriz2 = self.matrices[nombre2]
                 
-                if operacion == "suma":
-                    resultado = matriz1 + matriz2
-                elif operacion == "resta":
-                    resultado = matriz1 - matriz2
-                elif operacion == "multiplicacion":
-                    resultado = matriz1 @ matriz2
+                def calcular(tarea):
+                    if operacion == "suma":
+                        return matriz1 + matriz2
+                    elif operacion == "resta":
+                        return matriz1 - matriz2
+                    return _multiplicar_por_paneles(matriz1, matriz2, tarea)
                 
-                self.matrices[nombre_resultado] = resultado
-                self.actualizar_lista_matrices()
+                def al_terminar(resultado):
+                    if not self._guardar_resultado(nombre_resultado, resultado):
+                        return
+                    messagebox.showinfo("Éxito", f"{operacion.capitalize()} completada: '{nombre_resultado}'")
+                    self.historial.registrar(operacion, self.matrices, (nombre1, nombre2), (nombre_resultado,),
+                                             tarea.duracion,
+                                             f"{operacion.capitalize()}: {nombre_resultado} = {nombre1} {'+' if operacion=='suma' else '-' if operacion=='resta' else '×'} {nombre2}")
+                    self.status_bar.config(text=f"✅ {operacion.capitalize()} completada: '{nombre_resultado}'")
                 
-                messagebox.showinfo("Éxito", f"{operacion.capitalize()} completada: '{nombre_resultado}'")
-                self.historial_operaciones.append(f"{operacion.capitalize()}: {nombre_resultado} = {nombre1} {'+' if operacion=='suma' else '-' if operacion=='resta' else '×'} {nombre2}")
-                self.status_bar.config(text=f"✅ {operacion.capitalize()} completada: '{nombre_resultado}'")
                 dialogo.destroy()
+                tarea = self.ejecutar_en_fondo(f"{operacion.capitalize()} de '{nombre1}' y '{nombre2}'", calcular,
+                                               al_terminar, f"Error en {operacion}")
                 
             except Exception as e:
                 messagebox.showerror("Error", f"Error en {operacion}: {e}")
@@ -608,14 +693,17 @@ class InterfazGraficaNP:
                     messagebox.showerror("Error", "Ya existe una matriz con ese nombre")
                     return
                 
-                datos = np.loadtxt(archivo, delimiter=',')
-                matriz = MatrizNumPy(datos)
-                self.matrices[nombre] = matriz
-                self.actualizar_lista_matrices()
+                def al_terminar(matriz):
+                    if not self._guardar_resultado(nombre, matriz):
+                        return
+                    messagebox.showinfo("Éxito", f"Matriz '{nombre}' cargada exitosamente")
+                    self.historial.registrar('cargar_csv', self.matrices, (), (nombre,), tarea.duracion,
+                                             f"Cargada matriz '{nombre}' desde: {archivo}", archivo=archivo)
+                    self.status_bar.config(text=f"✅ Matriz '{nombre}' cargada desde CSV")
                 
-                messagebox.showinfo("Éxito", f"Matriz '{nombre}' cargada exitosamente")
-                self.historial_operaciones.append(f"Cargada matriz '{nombre}' desde: {archivo}")
-                self.status_bar.config(text=f"✅ Matriz '{nombre}' cargada desde CSV")
+                tarea = self.ejecutar_en_fondo(f"Cargando '{os.path.basename(archivo)}'",
+                                               lambda tarea: MatrizNumPy(_leer_csv(archivo, tarea)),
+                                               al_terminar, "Error al cargar archivo")
                 
             except Exception as e:
                 messagebox.showerror("Error", f"Error al cargar archivo: {e}")
@@ -637,15 +725,45 @@ class InterfazGraficaNP:
         if archivo:
             try:
                 matriz = self.matrices[nombre]
-                np.savetxt(archivo, matriz.datos, delimiter=',', fmt='%.6f')
                 
-                messagebox.showinfo("Éxito", f"Matriz '{nombre}' guardada exitosamente")
-                self.historial_operaciones.append(f"Guardada matriz '{nombre}' en: {archivo}")
-                self.status_bar.config(text=f"✅ Matriz '{nombre}' guardada como CSV")
+                def al_terminar(_):
+                    messagebox.showinfo("Éxito", f"Matriz '{nombre}' guardada exitosamente")
+                    self.historial.registrar('guardar_csv', self.matrices, (nombre,), duracion=tarea.duracion,
+                                             descripcion=f"Guardada matriz '{nombre}' en: {archivo}", archivo=archivo)
+                    self.status_bar.config(text=f"✅ Matriz '{nombre}' guardada como CSV")
+                
+                tarea = self.ejecutar_en_fondo(f"Guardando '{os.path.basename(archivo)}'",
+                                               lambda tarea: _escribir_csv(archivo, matriz.datos, tarea),
+                                               al_terminar, "Error al guardar archivo")
                 
             except Exception as e:
                 messagebox.showerror("Error", f"Error al guardar archivo: {e}")
     
+    def exportar_historial(self):
+        """Exporta el historial de operaciones a JSON Lines."""
+        archivo = filedialog.asksaveasfilename(
+            title="Exportar historial",
+            defaultextension=".jsonl",
+            filetypes=[("JSON Lines", "*.jsonl"), ("Todos los archivos", "*.*")],
+            initialfile="historial.jsonl"
+        )
+        
+        if archivo:
+            try:
+                escritos = self.historial.exportar(archivo)
+                self.status_bar.config(text=f"✅ {escritos} registros exportados a {os.path.basename(archivo)}")
+            except OSError as e:
+                messagebox.showerror("Error", f"Error al exportar historial: {e}")
+    
+    def _guardar_resultado(self, nombre, matriz):
+        """Registra el resultado de una tarea si el nombre sigue libre."""
+        if nombre in self.matrices:
+            messagebox.showerror("Error", f"Ya existe una matriz llamada '{nombre}'")
+            return False
+        self.matrices[nombre] = matriz
+        self.actualizar_lista_matrices()
+        return True
+    
     def mostrar_ayuda(self):
         """Muestra la ayuda del programa."""
         ayuda_texto = """
@@ -654,7 +772,7 @@ class InterfazGraficaNP:
 📚 FUNCIONALIDADES PRINCIPALES:
 
 🏗️ CREACIÓN DE MATRICES:
-• Manual: Ingresa valores uno por uno
+• Manual: Escribe en la rejilla o pega un bloque (Ctrl+V)
 • Aleatoria: Valores aleatorios en rango especificado
 • Especiales: Ceros, unos, identidad
 
@@ -665,7 +783,7 @@ class InterfazGraficaNP:
 • Eigenvalores
 
 📊 VISUALIZACIÓN:
-• Heatmaps de matrices
+• Pestaña 🌡️ Mapa de calor: arrastra para ampliar una región, clic derecho para volver
 • Gráficos de eigenvalores
 • Histogramas de valores
 
@@ -675,7 +793,7 @@ class InterfazGraficaNP:
 
 🎯 CONSEJOS:
 • Para operaciones como determinante e inversa, usa matrices cuadradas
-• Las visualizaciones requieren matplotlib
+• Los gráficos requieren matplotlib; el mapa de calor no
 • Los heatmaps son útiles para matrices grandes
 
 🚀 ¡NumPy acelera los cálculos hasta 1000x vs Python puro!
@@ -713,5 +831,62 @@ Versión 2.0.0 (NumPy Edition)
         messagebox.showinfo("ℹ️ Acerca de", mensaje)
 
 
+# ============ MÉTODOS PRIVADOS ============
+
+def _invertir(matriz: MatrizNumPy, tarea: TareaFondo) -> MatrizNumPy:
+    """Inversa con progreso: por teselas si la matriz es grande."""
+    if matriz.filas <= TAM_TESELA or not np.issubdtype(matriz.dtype, np.inexact):
+        return matriz.inversa()
+    trabajo = inversa_teselas(matriz.datos, al_progresar=tarea.reportar)
+    tarea.al_cancelar(trabajo.cancelar)
+    try:
+        return MatrizNumPy(trabajo.resultado())
+    except np.linalg.LinAlgError:
+        raise ValueError("La matriz es singular (no invertible)")
+
+
+def _multiplicar_por_paneles(a: MatrizNumPy, b: MatrizNumPy, tarea: TareaFondo) -> MatrizNumPy:
+    """Producto por paneles de filas, informando del progreso entre paneles."""
+    if a.columnas != b.filas or a.filas <= FILAS_PANEL:
+        return a @ b
+    paneles = []
+    for inicio in range(0, a.filas, FILAS_PANEL):
+        tarea.comprobar()
+        paneles.append((MatrizNumPy(a.datos[inicio:inicio + FILAS_PANEL]) @ b).datos)
+        tarea.reportar(min(inicio + FILAS_PANEL, a.filas), a.filas)
+    return MatrizNumPy(np.vstack(paneles))
+
+
+def _leer_csv(ruta: str, tarea: TareaFondo) -> np.ndarray:
+    """Lee un CSV numérico por bloques de líneas, informando de los bytes leídos."""
+    total = os.path.getsize(ruta)
+    bloques = []
+    with open(ruta, 'rb') as archivo:
+        while True:
+            lineas = list(itertools.islice(archivo, LINEAS_BLOQUE))
+            if not lineas:
+                break
+            tarea.comprobar()
+            bloques.append(np.loadtxt([linea.decode('utf-8') for linea in lineas], delimiter=',', ndmin=2))
+            tarea.reportar(archivo.tell(), total)
+    if not bloques:
+        raise ValueError("El archivo está vacío")
+    return np.vstack(bloques)
+
+
+def _escribir_csv(ruta: str, datos: np.ndarray, tarea: TareaFondo) -> None:
+    """Escribe un CSV por bloques de filas, informando del progreso."""
+    try:
+        with open(ruta, 'w') as archivo:
+            for inicio in range(0, datos.shape[0], LINEAS_BLOQUE):
+                tarea.comprobar()
+                np.savetxt(archivo, datos[inicio:inicio + LINEAS_BLOQUE], delimiter=',', fmt='%.6f')
+                tarea.reportar(min(inicio + LINEAS_BLOQUE, datos.shape[0]), datos.shape[0])
+    except CancelledError:
+        # No dejar un archivo a medias
+        os.remove(ruta)
+        raise
+
+
 # Importar simpledialog para algunas funciones
 import tkinter.simpledialog
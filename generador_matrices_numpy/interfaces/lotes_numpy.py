@@ -0,0 +1,249 @@
+"""
+Ejecución por Lotes con NumPy
+=============================
+
+Modo no interactivo: ejecuta un guion de órdenes (una por línea) sobre un
+espacio de trabajo de matrices con nombre, sin menús ni tkinter.
+
+Órdenes disponibles:
+
+    cargar A datos.csv|datos.npy    Lee una matriz (CSV o formato .npy)
+    guardar C resultado.csv|.npy    Escribe una matriz
+    aleatoria A 300 400 [-1 1] [semilla]
+    identidad I 100
+    ceros Z 20 30
+    unos U 20 30
+    mostrar C                       Imprime la matriz en la salida
+    eliminar A
+    C = A @ B.T + 2*inv(D)          Cualquier expresión de ``src/expresiones.py``
+
+Las líneas vacías y lo que sigue a ``#`` se ignoran. Los mensajes de
+progreso van a la salida de errores para no mezclarse con los resultados.
+
+Códigos de salida: 0 éxito, 1 error al ejecutar una orden, 2 error de
+sintaxis en el guion.
+
+Autor: Nicolas
+Versión: 2.0.0 (NumPy Edition)
+"""
+
+import ast
+import sys
+import os
+import numpy as np
+from typing import Callable, Dict, Iterable, Optional, TextIO, Tuple
+
+# Importar la clase principal
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.matriz_numpy import MatrizNumPy
+from src.expresiones import evaluar_expresion
+
+EXITO = 0
+ERROR_EJECUCION = 1
+ERROR_SINTAXIS = 2
+
+
+class ErrorSintaxis(ValueError):
+    """Error en la escritura de una orden del guion."""
+
+
+class EjecutorLotesNP:
+    """Ejecuta guiones de órdenes sobre un espacio de trabajo de MatrizNumPy."""
+
+    def __init__(self, salida: Optional[TextIO] = None, registro: Optional[TextIO] = None):
+        """
+        Inicializa el ejecutor.
+
+        Parameters:
+            salida: Flujo para los resultados de ``mostrar`` (default: stdout)
+            registro: Flujo para mensajes de progreso y errores (default: stderr)
+        """
+        self.matrices: Dict[str, MatrizNumPy] = {}
+        self.salida = salida or sys.stdout
+        self.registro = registro or sys.stderr
+        self.ordenes: Dict[str, Callable[..., None]] = {
+            'cargar': self.orden_cargar,
+            'guardar': self.orden_guardar,
+            'aleatoria': self.orden_aleatoria,
+            'identidad': self.orden_identidad,
+            'ceros': self.orden_ceros,
+            'unos': self.orden_unos,
+            'mostrar': self.orden_mostrar,
+            'eliminar': self.orden_eliminar,
+        }
+
+    def ejecutar(self, lineas: Iterable[str]) -> int:
+        """
+        Ejecuta un guion completo, deteniéndose en el primer error.
+
+        Parameters:
+            lineas (Iterable[str]): Líneas del guion
+
+        Returns:
+            int: Código de salida
+        """
+        for numero, linea in enumerate(lineas, 1):
+            linea = linea.split('#', 1)[0].strip()
+            if not linea:
+                continue
+
+            try:
+                self.ejecutar_linea(linea)
+            except ErrorSintaxis as e:
+                print(f"❌ Línea {numero}: {e}", file=self.registro)
+                return ERROR_SINTAXIS
+            except (ValueError, ZeroDivisionError, OSError, MemoryError, np.linalg.LinAlgError) as e:
+                print(f"❌ Línea {numero}: {e}", file=self.registro)
+                return ERROR_EJECUCION
+
+        return EXITO
+
+    def ejecutar_linea(self, linea: str) -> None:
+        """
+        Ejecuta una orden o asignación.
+
+        Parameters:
+            linea (str): Orden sin comentarios
+
+        Raises:
+            ErrorSintaxis: Si la orden está mal escrita
+            ValueError: Si la operación no se puede realizar
+        """
+        orden, *argumentos = linea.split()
+        if orden in self.ordenes:
+            self.ordenes[orden](*argumentos)
+            return
+
+        if '=' not in linea:
+            raise ErrorSintaxis(f"Orden desconocida: '{orden}'")
+        try:
+            ast.parse(linea)
+        except SyntaxError as e:
+            raise ErrorSintaxis(f"Expresión no válida: {e.msg}")
+
+        nombre, resultado, info = evaluar_expresion(linea, self.matrices)
+        if nombre is None:
+            raise ErrorSintaxis("La expresión debe asignarse a un nombre")
+        self.matrices[nombre] = resultado
+        print(f"✅ {nombre} = {info['plan']} ({resultado.filas}×{resultado.columnas}, "
+              f"{info['tiempo'] * 1000:.2f} ms)", file=self.registro)
+
+    # ============ ÓRDENES ============
+
+    def orden_cargar(self, *argumentos: str) -> None:
+        """cargar NOMBRE ARCHIVO.csv|ARCHIVO.npy"""
+        nombre, ruta = self._argumentos(argumentos, 2, "cargar NOMBRE ARCHIVO")
+
+        if ruta.endswith('.npy'):
+            datos = np.load(ruta, allow_pickle=False)
+        else:
+            datos = np.loadtxt(ruta, delimiter=',', ndmin=2)
+        if datos.ndim != 2:
+            raise ValueError(f"El archivo '{ruta}' no contiene una matriz 2D")
+
+        self.matrices[nombre] = MatrizNumPy(datos)
+        print(f"✅ Cargada {nombre} ({datos.shape[0]}×{datos.shape[1]}) desde {ruta}", file=self.registro)
+
+    def orden_guardar(self, *argumentos: str) -> None:
+        """guardar NOMBRE ARCHIVO.csv|ARCHIVO.npy"""
+        nombre, ruta = self._argumentos(argumentos, 2, "guardar NOMBRE ARCHIVO")
+        matriz = self._obtener(nombre)
+
+        if ruta.endswith('.npy'):
+            np.save(ruta, matriz.datos, allow_pickle=False)
+        else:
+            formato = '%d' if np.issubdtype(matriz.datos.dtype, np.integer) else '%.17g'
+            np.savetxt(ruta, matriz.datos, delimiter=',', fmt=formato)
+        print(f"💾 Guardada {nombre} en {ruta}", file=self.registro)
+
+    def orden_aleatoria(self, *argumentos: str) -> None:
+        """aleatoria NOMBRE FILAS COLUMNAS [MIN MAX] [SEMILLA]"""
+        if len(argumentos) not in (3, 5, 6):
+            raise ErrorSintaxis("Uso: aleatoria NOMBRE FILAS COLUMNAS [MIN MAX] [SEMILLA]")
+        nombre = argumentos[0]
+        filas, columnas = self._entero(argumentos[1]), self._entero(argumentos[2])
+        minimo, maximo = (0.0, 1.0) if len(argumentos) == 3 else map(self._real, argumentos[3:5])
+        semilla = self._entero(argumentos[5]) if len(argumentos) == 6 else None
+
+        self.matrices[nombre] = MatrizNumPy.crear_aleatoria(filas, columnas, minimo, maximo, seed=semilla)
+        print(f"✅ Creada {nombre} aleatoria ({filas}×{columnas})", file=self.registro)
+
+    def orden_identidad(self, *argumentos: str) -> None:
+        """identidad NOMBRE N"""
+        nombre, n = self._argumentos(argumentos, 2, "identidad NOMBRE N")
+        self.matrices[nombre] = MatrizNumPy.crear_identidad(self._entero(n))
+
+    def orden_ceros(self, *argumentos: str) -> None:
+        """ceros NOMBRE FILAS COLUMNAS"""
+        nombre, filas, columnas = self._argumentos(argumentos, 3, "ceros NOMBRE FILAS COLUMNAS")
+        self.matrices[nombre] = MatrizNumPy.crear_ceros(self._entero(filas), self._entero(columnas))
+
+    def orden_unos(self, *argumentos: str) -> None:
+        """unos NOMBRE FILAS COLUMNAS"""
+        nombre, filas, columnas = self._argumentos(argumentos, 3, "unos NOMBRE FILAS COLUMNAS")
+        self.matrices[nombre] = MatrizNumPy.crear_unos(self._entero(filas), self._entero(columnas))
+
+    def orden_mostrar(self, *argumentos: str) -> None:
+        """mostrar NOMBRE"""
+        nombre, = self._argumentos(argumentos, 1, "mostrar NOMBRE")
+        with np.printoptions(threshold=sys.maxsize, linewidth=sys.maxsize):
+            print(self._obtener(nombre).datos, file=self.salida)
+
+    def orden_eliminar(self, *argumentos: str) -> None:
+        """eliminar NOMBRE"""
+        nombre, = self._argumentos(argumentos, 1, "eliminar NOMBRE")
+        self._obtener(nombre)
+        del self.matrices[nombre]
+
+    # ============ MÉTODOS PRIVADOS ============
+
+    def _obtener(self, nombre: str) -> MatrizNumPy:
+        """Obtiene una matriz del espacio de trabajo."""
+        if nombre not in self.matrices:
+            raise ValueError(f"No existe la matriz '{nombre}'")
+        return self.matrices[nombre]
+
+    @staticmethod
+    def _argumentos(argumentos: Tuple[str, ...], cantidad: int, uso: str) -> Tuple[str, ...]:
+        """Valida el número de argumentos de una orden."""
+        if len(argumentos) != cantidad:
+            raise ErrorSintaxis(f"Uso: {uso}")
+        return argumentos
+
+    @staticmethod
+    def _entero(texto: str) -> int:
+        """Convierte un argumento en entero."""
+        try:
+            return int(texto)
+        except ValueError:
+            raise ErrorSintaxis(f"Se esperaba un entero: '{texto}'")
+
+    @staticmethod
+    def _real(texto: str) -> float:
+        """Convierte un argumento en número real."""
+        try:
+            return float(texto)
+        except ValueError:
+            raise ErrorSintaxis(f"Se esperaba un número: '{texto}'")
+
+
+def ejecutar_script(ruta: str) -> int:
+    """
+    Ejecuta un guion desde un archivo o desde la entrada estándar ('-').
+
+    Parameters:
+        ruta (str): Ruta del guion o '-'
+
+    Returns:
+        int: Código de salida
+    """
+    ejecutor = EjecutorLotesNP()
+    if ruta == '-':
+        return ejecutor.ejecutar(sys.stdin)
+
+    try:
+        with open(ruta, encoding='utf-8') as archivo:
+            return ejecutor.ejecutar(archivo)
+    except OSError as e:
+        print(f"❌ No se pudo leer el guion: {e}", file=sys.stderr)
+        return ERROR_SINTAXIS
@@ -0,0 +1,370 @@
+"""
+Mapa de Calor de Matrices
+=========================
+
+Widget de tkinter que dibuja una matriz como imagen (un píxel por bloque
+de elementos) para ver su estructura: dispersión, bandas, bloques.
+
+- Los valores se reducen por bloques con ``reduceat`` (máximo de |x| o
+  media) hasta el tamaño de la ventana y se colorean con una paleta en
+  una sola indexación de NumPy; el búfer RGB resultante se entrega a
+  ``tk.PhotoImage`` como PPM, sin matplotlib.
+- El máximo de |x| es siempre exacto: se recorre la matriz por franjas de
+  filas de como mucho ``PRESUPUESTO_ELEMENTOS`` elementos, así que una
+  banda fina o un elemento aislado nunca desaparecen del dibujo.
+- La media de las matrices enormes se estima sobre una submuestra regular
+  de filas y columnas de modo que nunca se lean más de
+  ``PRESUPUESTO_ELEMENTOS`` elementos: el coste depende de la ventana y
+  no de la matriz (una 50k×50k se dibuja igual de rápido que una 5k×5k).
+- Arrastrando el ratón se amplía la región seleccionada, que se vuelve a
+  dibujar con sus propios bloques; en cuanto la región cabe en el
+  presupuesto se usa cada elemento. Clic derecho vuelve a la vista anterior.
+
+Autor: Nicolas
+"""
+
+import time
+import tkinter as tk
+from tkinter import ttk
+import numpy as np
+from typing import List, Optional, Sequence, Tuple
+
+# Elementos leídos como máximo por repintado (media) o por franja (máximo)
+PRESUPUESTO_ELEMENTOS = 2_000_000
+
+MODOS = {'Máximo |x|': 'max', 'Media': 'media'}
+COLOR_NO_FINITO = (128, 128, 128)
+
+# Región (fila_inicio, fila_fin, columna_inicio, columna_fin), fines exclusivos
+Region = Tuple[int, int, int, int]
+
+
+def _paleta(anclas: Sequence[Tuple[int, int, int]]) -> np.ndarray:
+    """Interpola 256 colores entre los colores ancla."""
+    posiciones = np.linspace(0, 255, len(anclas))
+    niveles = np.arange(256)
+    return np.stack([np.interp(niveles, posiciones, [color[canal] for color in anclas])
+                     for canal in range(3)], axis=1).round().astype(np.uint8)
+
+
+# Secuencial (aproximación a viridis) para valores de un solo signo y
+# divergente (azul-blanco-rojo, centrada en 0) para valores con ambos signos
+PALETA_SECUENCIAL = _paleta([(68, 1, 84), (59, 82, 139), (33, 145, 140), (94, 201, 98), (253, 231, 37)])
+PALETA_DIVERGENTE = _paleta([(33, 102, 172), (146, 197, 222), (247, 247, 247), (244, 165, 130), (178, 24, 43)])
+
+
+def reducir_bloques(datos: np.ndarray, alto: int, ancho: int, modo: str = 'max',
+                    presupuesto: int = PRESUPUESTO_ELEMENTOS) -> Tuple[np.ndarray, Tuple[int, int], int]:
+    """
+    Reduce una matriz a como mucho ``alto × ancho`` valores, uno por bloque.
+
+    Parameters:
+        datos (np.ndarray): Matriz 2D (puede ser un memmap o una vista)
+        alto (int): Filas máximas del resultado (píxeles)
+        ancho (int): Columnas máximas del resultado (píxeles)
+        modo (str): 'max' (máximo de |x|, resalta la estructura) o 'media'
+        presupuesto (int): En 'media', elementos leídos como máximo (por
+            encima se submuestrea dentro de cada bloque); en 'max',
+            elementos por franja de filas
+
+    Returns:
+        Tuple[np.ndarray, Tuple[int, int], int]: Valores reducidos (float64),
+        tamaño del bloque (filas, columnas) y paso de submuestreo (1 = exacto,
+        siempre en 'max')
+
+    Raises:
+        ValueError: Si el modo no es válido
+    """
+    if modo not in ('max', 'media'):
+        raise ValueError(f"Modo de reducción inválido: {modo}")
+    filas, columnas = datos.shape
+    bloque_filas = -(-filas // max(alto, 1))
+    bloque_columnas = -(-columnas // max(ancho, 1))
+    if modo == 'max':
+        return _maximos_por_franjas(datos, bloque_filas, bloque_columnas, presupuesto), \
+            (bloque_filas, bloque_columnas), 1
+
+    # Paso de muestreo uniforme, sin superar el bloque para que cada bloque tenga muestras
+    paso = max(1, int(np.ceil(np.sqrt(filas * columnas / presupuesto))))
+    paso_filas, paso_columnas = min(paso, bloque_filas), min(paso, bloque_columnas)
+    muestra = np.asarray(datos[::paso_filas, ::paso_columnas])
+    if np.iscomplexobj(muestra):
+        muestra = np.abs(muestra)
+    muestra = np.asarray(muestra, dtype=np.float64)
+
+    # Primera muestra de cada bloque (un último bloque más corto que el paso
+    # puede no tener muestra propia: usa la última)
+    inicios_filas = np.minimum(-(-np.arange(0, filas, bloque_filas) // paso_filas), muestra.shape[0] - 1)
+    inicios_columnas = np.minimum(-(-np.arange(0, columnas, bloque_columnas) // paso_columnas),
+                                  muestra.shape[1] - 1)
+    sumas = np.add.reduceat(np.add.reduceat(muestra, inicios_filas, axis=0), inicios_columnas, axis=1)
+    # Con índices repetidos reduceat devuelve un único elemento
+    cuenta_filas = np.maximum(np.diff(np.append(inicios_filas, muestra.shape[0])), 1)
+    cuenta_columnas = np.maximum(np.diff(np.append(inicios_columnas, muestra.shape[1])), 1)
+    reducida = sumas / np.outer(cuenta_filas, cuenta_columnas)
+
+    paso_efectivo = max(paso_filas, paso_columnas)
+    return reducida, (bloque_filas, bloque_columnas), paso_efectivo
+
+
+def _maximos_por_franjas(datos: np.ndarray, bloque_filas: int, bloque_columnas: int,
+                         presupuesto: int) -> np.ndarray:
+    """
+    Máximo exacto de |x| por bloque, leyendo franjas de bloques completos.
+
+    Un submuestreo regular no sirve para el máximo: una diagonal o una
+    banda estrecha cae entre las muestras y el bloque sale a cero.
+    """
+    filas, columnas = datos.shape
+    inicios_columnas = np.arange(0, columnas, bloque_columnas)
+    bloques_por_franja = max(1, presupuesto // max(bloque_filas * columnas, 1))
+    filas_franja = bloques_por_franja * bloque_filas
+
+    reducida = np.empty((-(-filas // bloque_filas), len(inicios_columnas)))
+    bufer = np.empty((min(filas_franja, filas), columnas))
+    for indice, inicio in enumerate(range(0, filas, filas_franja)):
+        franja = np.asarray(datos[inicio:inicio + filas_franja])
+        absolutos = bufer[:franja.shape[0]]
+        if np.iscomplexobj(franja):
+            np.abs(franja, out=absolutos)
+        else:
+            # Se copia antes del valor absoluto: |mínimo| de un entero desborda
+            absolutos[...] = franja
+            np.abs(absolutos, out=absolutos)
+        inicios_filas = np.arange(0, franja.shape[0], bloque_filas)
+        primero = indice * bloques_por_franja
+        reducida[primero:primero + len(inicios_filas)] = np.maximum.reduceat(
+            np.maximum.reduceat(absolutos, inicios_filas, axis=0), inicios_columnas, axis=1)
+    return reducida
+
+
+def colorear(valores: np.ndarray) -> Tuple[np.ndarray, Tuple[float, float]]:
+    """
+    Convierte valores en píxeles RGB.
+
+    Si hay valores de ambos signos se usa una paleta divergente simétrica
+    en torno a 0; si no, una secuencial entre el mínimo y el máximo. Los
+    valores no finitos se pintan de gris.
+
+    Parameters:
+        valores (np.ndarray): Valores 2D
+
+    Returns:
+        Tuple[np.ndarray, Tuple[float, float]]: Búfer ``(alto, ancho, 3)``
+        uint8 y rango (mínimo, máximo) de la escala
+    """
+    finitos = np.isfinite(valores)
+    if not finitos.any():
+        return np.full(valores.shape + (3,), COLOR_NO_FINITO, dtype=np.uint8), (0.0, 0.0)
+
+    minimo, maximo = float(valores[finitos].min()), float(valores[finitos].max())
+    if minimo < 0 < maximo:
+        paleta = PALETA_DIVERGENTE
+        limite = max(-minimo, maximo)
+        minimo, maximo = -limite, limite
+    else:
+        paleta = PALETA_SECUENCIAL
+    rango = maximo - minimo
+
+    with np.errstate(invalid='ignore'):
+        normalizados = (valores - minimo) * (255.0 / rango) if rango > 0 else np.zeros_like(valores)
+    indices = np.clip(np.nan_to_num(normalizados, nan=0.0), 0, 255).astype(np.uint8)
+    rgb = paleta[indices]
+    rgb[~finitos] = COLOR_NO_FINITO
+    return rgb, (minimo, maximo)
+
+
+def ampliar_pixeles(rgb: np.ndarray, alto: int, ancho: int) -> Tuple[np.ndarray, int]:
+    """
+    Repite cada píxel el mayor número entero de veces que quepa en la ventana.
+
+    Returns:
+        Tuple[np.ndarray, int]: Búfer ampliado y factor aplicado
+    """
+    factor = max(1, min(alto // rgb.shape[0], ancho // rgb.shape[1]))
+    if factor > 1:
+        rgb = np.repeat(np.repeat(rgb, factor, axis=0), factor, axis=1)
+    return rgb, factor
+
+
+def imagen_ppm(rgb: np.ndarray) -> bytes:
+    """Empaqueta un búfer RGB uint8 como imagen PPM binaria (P6)."""
+    alto, ancho = rgb.shape[:2]
+    return b'P6\n%d %d\n255\n' % (ancho, alto) + np.ascontiguousarray(rgb, dtype=np.uint8).tobytes()
+
+
+def region_desde_pixeles(x0: int, y0: int, x1: int, y1: int, region: Region,
+                         bloque: Tuple[int, int], factor: int) -> Region:
+    """
+    Traduce un rectángulo de la imagen a la región de la matriz que cubre.
+
+    Parameters:
+        x0, y0, x1, y1 (int): Esquinas del rectángulo en píxeles (en cualquier orden)
+        region (Region): Región que se está mostrando
+        bloque (Tuple[int, int]): Elementos por píxel (filas, columnas)
+        factor (int): Ampliación de cada píxel
+
+    Returns:
+        Region: Región (fila_inicio, fila_fin, columna_inicio, columna_fin),
+        con al menos un bloque y dentro de la región mostrada
+    """
+    fila_inicio, fila_fin, columna_inicio, columna_fin = region
+
+    def a_matriz(pixel, inicio, fin, tamano):
+        return min(max(inicio + (pixel // factor) * tamano, inicio), fin)
+
+    filas = sorted(a_matriz(y, fila_inicio, fila_fin, bloque[0]) for y in (y0, y1))
+    columnas = sorted(a_matriz(x, columna_inicio, columna_fin, bloque[1]) for x in (x0, x1))
+    return (filas[0], min(max(filas[1], filas[0]) + bloque[0], fila_fin),
+            columnas[0], min(max(columnas[1], columnas[0]) + bloque[1], columna_fin))
+
+
+class MapaCalor(ttk.Frame):
+    """Vista de una matriz como imagen, con ampliación por regiones."""
+
+    def __init__(self, padre, **opciones):
+        """
+        Crea el mapa vacío.
+
+        Parameters:
+            padre: Widget contenedor
+        """
+        super().__init__(padre, **opciones)
+        self.datos: Optional[np.ndarray] = None
+        self.region: Region = (0, 0, 0, 0)
+        self._anteriores: List[Region] = []
+        self._pendiente = False
+        self._imagen: Optional[tk.PhotoImage] = None
+        self._bloque = (1, 1)
+        self._factor = 1
+        self._inicio_arrastre: Optional[Tuple[int, int]] = None
+        self.ultimo_tiempo = 0.0
+
+        barra = ttk.Frame(self)
+        barra.grid(row=0, column=0, sticky=(tk.W, tk.E), pady=(0, 5))
+        barra.columnconfigure(3, weight=1)
+        ttk.Label(barra, text="Reducción:").grid(row=0, column=0, padx=(0, 5))
+        self.modo = tk.StringVar(value=next(iter(MODOS)))
+        selector = ttk.Combobox(barra, textvariable=self.modo, values=list(MODOS), state='readonly', width=12)
+        selector.grid(row=0, column=1)
+        selector.bind('<<ComboboxSelected>>', lambda e: self.refrescar())
+        ttk.Button(barra, text="↩️ Vista completa", command=self.restablecer).grid(row=0, column=2, padx=5)
+        self.etiqueta = ttk.Label(barra, text="")
+        self.etiqueta.grid(row=0, column=3, sticky=tk.W)
+
+        self.canvas = tk.Canvas(self, background='white', highlightthickness=0, cursor='crosshair')
+        self.canvas.grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        self.posicion = ttk.Label(self, text="")
+        self.posicion.grid(row=2, column=0, sticky=tk.W)
+        self.columnconfigure(0, weight=1)
+        self.rowconfigure(1, weight=1)
+
+        self._item_imagen = self.canvas.create_image(0, 0, anchor=tk.NW)
+        self._seleccion = self.canvas.create_rectangle(0, 0, 0, 0, outline='#1a73e8', width=2, state=tk.HIDDEN)
+
+        self.canvas.bind('<Configure>', lambda e: self.refrescar())
+        self.canvas.bind('<Map>', lambda e: self.refrescar())
+        self.canvas.bind('<ButtonPress-1>', self._empezar_arrastre)
+        self.canvas.bind('<B1-Motion>', self._arrastrar)
+        self.canvas.bind('<ButtonRelease-1>', self._soltar)
+        self.canvas.bind('<Button-3>', lambda e: self.volver())
+        self.canvas.bind('<Motion>', self._informar_posicion)
+
+    # ============ API PÚBLICA ============
+
+    def mostrar(self, matriz) -> None:
+        """
+        Muestra una matriz completa.
+
+        Parameters:
+            matriz: MatrizNumPy, array 2D (puede ser un memmap) o None para vaciar
+        """
+        datos = getattr(matriz, 'datos', matriz)
+        self.datos = None if datos is None else np.asanyarray(datos)
+        self._anteriores = []
+        self.region = (0, 0, 0, 0) if self.datos is None else (0, self.datos.shape[0], 0, self.datos.shape[1])
+        self.refrescar()
+
+    def ampliar(self, region: Region) -> None:
+        """Muestra solo una región (fila_inicio, fila_fin, columna_inicio, columna_fin)."""
+        if self.datos is None or region == self.region:
+            return
+        self._anteriores.append(self.region)
+        self.region = region
+        self.refrescar()
+
+    def volver(self) -> None:
+        """Vuelve a la región mostrada antes de la última ampliación."""
+        if self._anteriores:
+            self.region = self._anteriores.pop()
+            self.refrescar()
+
+    def restablecer(self) -> None:
+        """Vuelve a la matriz completa."""
+        if self._anteriores:
+            self.region = self._anteriores[0]
+            self._anteriores = []
+            self.refrescar()
+
+    def refrescar(self) -> None:
+        """Programa un repintado (varios seguidos se agrupan en uno)."""
+        if not self._pendiente:
+            self._pendiente = True
+            self.after_idle(self._dibujar)
+
+    # ============ MÉTODOS PRIVADOS ============
+
+    def _dibujar(self) -> None:
+        self._pendiente = False
+        # Oculto (p. ej. en otra pestaña): se dibujará al mostrarse
+        if not self.canvas.winfo_ismapped():
+            return
+        if self.datos is None or self.datos.size == 0:
+            self.canvas.itemconfigure(self._item_imagen, image='')
+            self.etiqueta.config(text="")
+            return
+
+        inicio = time.perf_counter()
+        fila_inicio, fila_fin, columna_inicio, columna_fin = self.region
+        ancho, alto = max(self.canvas.winfo_width(), 1), max(self.canvas.winfo_height(), 1)
+        valores, self._bloque, paso = reducir_bloques(self.datos[fila_inicio:fila_fin, columna_inicio:columna_fin],
+                                                      alto, ancho, MODOS[self.modo.get()])
+        rgb, (minimo, maximo) = colorear(valores)
+        rgb, self._factor = ampliar_pixeles(rgb, alto, ancho)
+        self._imagen = tk.PhotoImage(data=imagen_ppm(rgb), format='PPM')
+        self.canvas.itemconfigure(self._item_imagen, image=self._imagen)
+        self.ultimo_tiempo = time.perf_counter() - inicio
+
+        texto = (f"Filas {fila_inicio}–{fila_fin - 1}, columnas {columna_inicio}–{columna_fin - 1} · "
+                 f"bloque {self._bloque[0]}×{self._bloque[1]} · rango [{minimo:.4g}, {maximo:.4g}]")
+        if paso > 1:
+            texto += f" · muestreo 1/{paso}"
+        self.etiqueta.config(text=texto + f" · {self.ultimo_tiempo * 1000:.0f} ms")
+
+    def _empezar_arrastre(self, evento) -> None:
+        self._inicio_arrastre = (evento.x, evento.y)
+        self.canvas.coords(self._seleccion, evento.x, evento.y, evento.x, evento.y)
+        self.canvas.itemconfigure(self._seleccion, state=tk.NORMAL)
+
+    def _arrastrar(self, evento) -> None:
+        if self._inicio_arrastre:
+            self.canvas.coords(self._seleccion, *self._inicio_arrastre, evento.x, evento.y)
+
+    def _soltar(self, evento) -> None:
+        self.canvas.itemconfigure(self._seleccion, state=tk.HIDDEN)
+        if self._inicio_arrastre is None or self.datos is None:
+            return
+        x0, y0 = self._inicio_arrastre
+        self._inicio_arrastre = None
+        # Un clic sin arrastre no amplía
+        if abs(evento.x - x0) < 3 and abs(evento.y - y0) < 3:
+            return
+        self.ampliar(region_desde_pixeles(x0, y0, evento.x, evento.y, self.region, self._bloque, self._factor))
+
+    def _informar_posicion(self, evento) -> None:
+        if self.datos is None:
+            return
+        fila, _, columna, _ = region_desde_pixeles(evento.x, evento.y, evento.x, evento.y,
+                                                   self.region, self._bloque, self._factor)
+        if fila < self.region[1] and columna < self.region[3]:
+            self.posicion.config(text=f"fila {fila}, columna {columna}: {self.datos[fila, columna]:.6g}")
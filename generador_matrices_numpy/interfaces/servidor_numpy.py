@@ -0,0 +1,481 @@
+"""
+Servidor Local de Cálculo con NumPy
+===================================
+
+Mantiene un espacio de trabajo de ``MatrizNumPy`` compartido entre varios
+procesos, que se conectan por un socket Unix o TCP local:
+
+    python main.py --servidor /tmp/matrices.sock
+    python main.py --servidor 127.0.0.1:8765
+
+No hay autenticación y ORDEN puede leer y escribir archivos (cargar,
+guardar), así que por TCP solo se admiten direcciones de loopback.
+
+Protocolo binario (enteros little-endian):
+
+    Solicitud:  operación (u8) | longitud (u32) | texto UTF-8 | [matriz .npy]
+    Respuesta:  estado (u8)    | longitud (u32) | texto UTF-8 | [matriz .npy]
+
+Operaciones (``texto`` según la operación):
+
+    ORDEN     Orden de ``lotes_numpy`` (cargar, aleatoria, C = A @ B, ...)
+    PONER     Nombre; la solicitud lleva la matriz a guardar
+    OBTENER   Nombre; la respuesta lleva la matriz
+    ELIMINAR  Nombre
+    EVALUAR   Expresión; la respuesta lleva el resultado
+    MATVEC    Nombre de A; la solicitud lleva x y la respuesta A @ x
+    ESTADO    Sin texto; la respuesta es JSON con estadísticas
+
+Cada conexión se atiende en su propio hilo, y los cálculos se delegan en
+un ``ThreadPoolExecutor`` (NumPy libera el GIL). Los MATVEC concurrentes
+contra la misma matriz se agrupan en un único producto ``A @ [x1 x2 ...]``.
+Las respuestas de OBTENER y EVALUAR se guardan ya codificadas en una caché
+LRU que se vacía cuando cambia el espacio de trabajo.
+
+Autor: Nicolas
+Versión: 2.0.0 (NumPy Edition)
+"""
+
+import io
+import ipaddress
+import json
+import os
+import socket
+import socketserver
+import sys
+import threading
+import numpy as np
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple, Union
+
+# Importar los módulos del proyecto
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.matriz_numpy import MatrizNumPy
+from src.expresiones import evaluar_expresion
+from src.protocolo import codificar_mensaje, leer_mensaje, RESP_OK, RESP_MATRIZ, RESP_ERROR
+from interfaces.lotes_numpy import EjecutorLotesNP
+
+OP_ORDEN, OP_PONER, OP_OBTENER, OP_ELIMINAR, OP_EVALUAR, OP_MATVEC, OP_ESTADO = range(1, 8)
+CON_MATRIZ = (OP_PONER, OP_MATVEC)
+
+MAX_CACHE_BYTES = 256 * 1024 * 1024
+
+
+class EspacioCompartido:
+    """Espacio de trabajo compartido con caché de respuestas y MATVEC agrupados."""
+
+    def __init__(self, trabajadores: Optional[int] = None, max_cache_bytes: int = MAX_CACHE_BYTES):
+        """
+        Inicializa el espacio.
+
+        Parameters:
+            trabajadores (Optional[int]): Hilos de cálculo (default: núcleos)
+            max_cache_bytes (int): Tamaño máximo de la caché de respuestas
+        """
+        self.matrices: Dict[str, MatrizNumPy] = {}
+        self.version = 0
+        self.max_cache_bytes = max_cache_bytes
+        self.estadisticas = {'solicitudes': 0, 'aciertos_cache': 0, 'matvec': 0, 'lotes_matvec': 0}
+
+        # _cerrojo protege el diccionario, la caché y las estadísticas;
+        # _cerrojo_ordenes serializa el ejecutor de lotes, que no es reentrante
+        self._cerrojo = threading.Lock()
+        self._cerrojo_ordenes = threading.Lock()
+        self._cache: 'OrderedDict[Tuple, bytes]' = OrderedDict()
+        self._bytes_cache = 0
+        self._pendientes: Dict[Tuple, List[Tuple[np.ndarray, Future]]] = {}
+        self._ejecutor = EjecutorLotesNP(io.StringIO(), io.StringIO())
+        self._ejecutor.matrices = self.matrices
+        self.pool = ThreadPoolExecutor(trabajadores or os.cpu_count(), thread_name_prefix='calculo')
+
+    def atender(self, operacion: int, texto: str, matriz: Optional[np.ndarray]) -> bytes:
+        """
+        Atiende una solicitud y devuelve la respuesta codificada.
+
+        Parameters:
+            operacion (int): Código de operación (``OP_*``)
+            texto (str): Texto de la solicitud
+            matriz (Optional[np.ndarray]): Matriz adjunta (PONER, MATVEC)
+
+        Returns:
+            bytes: Respuesta lista para enviar
+        """
+        clave = (operacion, texto) if operacion in (OP_OBTENER, OP_EVALUAR) else None
+        with self._cerrojo:
+            self.estadisticas['solicitudes'] += 1
+            if clave is not None and clave in self._cache:
+                self._cache.move_to_end(clave)
+                self.estadisticas['aciertos_cache'] += 1
+                return self._cache[clave]
+
+        version = self.version
+        try:
+            if operacion == OP_ORDEN:
+                respuesta = codificar_mensaje(RESP_OK, self.pool.submit(self._orden, texto).result())
+            elif operacion == OP_PONER:
+                self._guardar(texto, self._envolver(matriz))
+                respuesta = codificar_mensaje(RESP_OK)
+            elif operacion == OP_OBTENER:
+                respuesta = codificar_mensaje(RESP_MATRIZ, matriz=self._obtener(texto).datos)
+            elif operacion == OP_ELIMINAR:
+                self._eliminar(texto)
+                respuesta = codificar_mensaje(RESP_OK)
+            elif operacion == OP_EVALUAR:
+                respuesta = self.pool.submit(self._evaluar, texto).result()
+            elif operacion == OP_MATVEC:
+                respuesta = codificar_mensaje(RESP_MATRIZ, matriz=self.matvec(texto, matriz))
+            elif operacion == OP_ESTADO:
+                respuesta = codificar_mensaje(RESP_OK, json.dumps(self.estado()))
+            else:
+                raise ValueError(f"Operación desconocida: {operacion}")
+        except (ValueError, ZeroDivisionError, MemoryError, OSError, np.linalg.LinAlgError) as e:
+            return codificar_mensaje(RESP_ERROR, str(e))
+        except Exception as e:
+            # Un fallo inesperado no debe cerrar la conexión del cliente
+            return codificar_mensaje(RESP_ERROR, f"{type(e).__name__}: {e}")
+
+        # Las evaluaciones con asignación modifican el espacio: no se cachean
+        if clave is not None and respuesta[0] == RESP_MATRIZ:
+            self._guardar_en_cache(clave, respuesta, version)
+        return respuesta
+
+    def matvec(self, nombre: str, x: np.ndarray) -> np.ndarray:
+        """
+        Calcula A @ x agrupando las solicitudes concurrentes contra A.
+
+        La primera solicitud de un grupo programa el cálculo en el pool; las
+        que llegan mientras espera turno se suman al mismo producto.
+
+        Parameters:
+            nombre (str): Nombre de A en el espacio
+            x (np.ndarray): Vector o matriz con tantas filas como columnas A
+
+        Returns:
+            np.ndarray: A @ x
+
+        Raises:
+            ValueError: Si A no existe o las dimensiones no son compatibles
+        """
+        a = self._obtener(nombre)
+        if x is None or x.ndim not in (1, 2) or x.shape[0] != a.columnas:
+            forma = None if x is None else x.shape
+            raise ValueError(f"x debe tener {a.columnas} filas (forma recibida: {forma})")
+
+        futuro: Future = Future()
+        clave = (nombre, x.dtype)
+        with self._cerrojo:
+            lote = self._pendientes.setdefault(clave, [])
+            lote.append((x, futuro))
+            if len(lote) == 1:
+                self.pool.submit(self._resolver_lote, clave)
+        return futuro.result()
+
+    def estado(self) -> Dict:
+        """Resumen del espacio de trabajo y estadísticas del servidor."""
+        with self._cerrojo:
+            return {
+                'matrices': {nombre: [m.filas, m.columnas, str(m.datos.dtype)]
+                             for nombre, m in list(self.matrices.items())},
+                'version': self.version,
+                'cache_bytes': self._bytes_cache,
+                **self.estadisticas,
+            }
+
+    def cerrar(self) -> None:
+        """Detiene el pool de cálculo."""
+        self.pool.shutdown(wait=True)
+
+    # ============ MÉTODOS PRIVADOS ============
+
+    def _orden(self, linea: str) -> str:
+        """Ejecuta una orden de lotes y devuelve lo que haya mostrado."""
+        # Solo las órdenes esperan entre sí: MATVEC, OBTENER y la caché siguen
+        # atendiéndose mientras tanto
+        with self._cerrojo_ordenes:
+            self._ejecutor.salida = io.StringIO()
+            try:
+                self._ejecutor.ejecutar_linea(linea)
+            finally:
+                with self._cerrojo:
+                    self._invalidar()
+            return self._ejecutor.salida.getvalue()
+
+    def _evaluar(self, texto: str) -> bytes:
+        """Evalúa una expresión; si tiene asignación, guarda el resultado."""
+        destino, resultado, _ = evaluar_expresion(texto, self.matrices)
+        if destino is not None:
+            self._guardar(destino, resultado)
+            return codificar_mensaje(RESP_OK, destino)
+        return codificar_mensaje(RESP_MATRIZ, matriz=resultado.datos)
+
+    def _resolver_lote(self, clave: Tuple) -> None:
+        """Calcula de una vez todos los MATVEC pendientes contra la misma matriz."""
+        with self._cerrojo:
+            lote = self._pendientes.pop(clave)
+        try:
+            a = self._obtener(clave[0])
+            anchos = [1 if x.ndim == 1 else x.shape[1] for x, _ in lote]
+            y = a.datos @ np.hstack([x.reshape(a.columnas, -1) for x, _ in lote])
+        except Exception as e:
+            for _, futuro in lote:
+                futuro.set_exception(e)
+            return
+
+        with self._cerrojo:
+            self.estadisticas['matvec'] += len(lote)
+            self.estadisticas['lotes_matvec'] += 1
+        inicio = 0
+        for (x, futuro), ancho in zip(lote, anchos):
+            bloque = y[:, inicio:inicio + ancho]
+            futuro.set_result(bloque[:, 0] if x.ndim == 1 else bloque)
+            inicio += ancho
+
+    def _guardar(self, nombre: str, matriz: MatrizNumPy) -> None:
+        """Guarda una matriz en el espacio e invalida la caché."""
+        if not nombre.isidentifier():
+            raise ValueError(f"Nombre de matriz no válido: '{nombre}'")
+        with self._cerrojo:
+            self.matrices[nombre] = matriz
+            self._invalidar()
+
+    def _eliminar(self, nombre: str) -> None:
+        """Elimina una matriz del espacio e invalida la caché."""
+        with self._cerrojo:
+            self._obtener(nombre)
+            del self.matrices[nombre]
+            self._invalidar()
+
+    def _invalidar(self) -> None:
+        """Marca un cambio en el espacio (con el cerrojo tomado)."""
+        self.version += 1
+        self._cache.clear()
+        self._bytes_cache = 0
+
+    def _guardar_en_cache(self, clave: Tuple, respuesta: bytes, version: int) -> None:
+        """Guarda una respuesta si el espacio no cambió mientras se calculaba."""
+        if len(respuesta) > self.max_cache_bytes:
+            return
+        with self._cerrojo:
+            if version != self.version:
+                return
+            self._cache[clave] = respuesta
+            self._bytes_cache += len(respuesta)
+            while self._bytes_cache > self.max_cache_bytes:
+                _, antigua = self._cache.popitem(last=False)
+                self._bytes_cache -= len(antigua)
+
+    def _obtener(self, nombre: str) -> MatrizNumPy:
+        """Obtiene una matriz del espacio de trabajo."""
+        matriz = self.matrices.get(nombre)
+        if matriz is None:
+            raise ValueError(f"No existe la matriz '{nombre}'")
+        return matriz
+
+    @staticmethod
+    def _envolver(datos: np.ndarray) -> MatrizNumPy:
+        """Envuelve el array recibido (ya es propio) sin copiarlo."""
+        if datos is None or datos.ndim != 2:
+            raise ValueError("Se esperaba una matriz 2D")
+        matriz = MatrizNumPy(datos.shape[0], datos.shape[1], dtype=datos.dtype, inicializar_ceros=False)
+        matriz.datos = datos
+        return matriz
+
+
+# ============ SERVIDOR ============
+
+class _ManejadorConexion(socketserver.StreamRequestHandler):
+    """Atiende las solicitudes de una conexión, una tras otra."""
+
+    wbufsize = 1 << 16
+
+    def setup(self):
+        super().setup()
+        if self.connection.family in (socket.AF_INET, socket.AF_INET6):
+            self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def handle(self):
+        espacio = self.server.espacio
+        while True:
+            try:
+                mensaje = leer_mensaje(self.rfile, CON_MATRIZ.__contains__)
+            except (ValueError, OSError) as e:
+                self._enviar(codificar_mensaje(RESP_ERROR, str(e)))
+                return
+            if mensaje is None:
+                return
+            self._enviar(espacio.atender(*mensaje))
+
+    def _enviar(self, respuesta: bytes) -> None:
+        try:
+            self.wfile.write(respuesta)
+            self.wfile.flush()
+        except OSError:
+            pass
+
+
+class _ServidorTCP(socketserver.ThreadingMixIn, socketserver.TCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class _ServidorUnix(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+class ServidorMatrices:
+    """Servidor de cálculo sobre un ``EspacioCompartido``."""
+
+    def __init__(self, direccion: str, trabajadores: Optional[int] = None):
+        """
+        Crea el servidor y reserva la dirección.
+
+        Parameters:
+            direccion (str): Ruta de socket Unix o ``host:puerto``
+            trabajadores (Optional[int]): Hilos de cálculo
+
+        Raises:
+            ValueError: Si la dirección TCP no es de loopback
+        """
+        self.direccion = analizar_direccion(direccion)
+        if not isinstance(self.direccion, str) and not _es_loopback(self.direccion[0]):
+            raise ValueError(f"El servidor solo puede escuchar en una dirección local "
+                             f"(127.0.0.1, localhost), no en '{self.direccion[0]}'")
+        self.espacio = EspacioCompartido(trabajadores)
+        if isinstance(self.direccion, str):
+            if os.path.exists(self.direccion):
+                os.unlink(self.direccion)
+            self._servidor = _ServidorUnix(self.direccion, _ManejadorConexion)
+        else:
+            self._servidor = _ServidorTCP(self.direccion, _ManejadorConexion)
+            self.direccion = self._servidor.server_address[:2]
+        self._servidor.espacio = self.espacio
+        self._hilo: Optional[threading.Thread] = None
+
+    def iniciar(self) -> None:
+        """Atiende conexiones hasta que se llame a ``detener``."""
+        self._servidor.serve_forever()
+
+    def iniciar_en_segundo_plano(self) -> None:
+        """Atiende conexiones en un hilo aparte."""
+        self._hilo = threading.Thread(target=self.iniciar, daemon=True)
+        self._hilo.start()
+
+    def detener(self) -> None:
+        """Cierra el servidor, el pool y el socket Unix."""
+        if self._hilo is not None:
+            self._servidor.shutdown()
+            self._hilo.join()
+        self._servidor.server_close()
+        self.espacio.cerrar()
+        if isinstance(self.direccion, str) and os.path.exists(self.direccion):
+            os.unlink(self.direccion)
+
+
+def analizar_direccion(direccion: str) -> Union[str, Tuple[str, int]]:
+    """
+    Interpreta una dirección como socket Unix o TCP.
+
+    Parameters:
+        direccion (str): ``/ruta/al.sock``, ``unix:ruta`` o ``host:puerto``
+
+    Returns:
+        Union[str, Tuple[str, int]]: Ruta del socket Unix o (host, puerto)
+
+    Raises:
+        ValueError: Si la dirección no es válida
+    """
+    if direccion.startswith('unix:'):
+        return direccion[5:]
+    host, separador, puerto = direccion.rpartition(':')
+    if not separador or '/' in direccion:
+        return direccion
+    try:
+        return host or '127.0.0.1', int(puerto)
+    except ValueError:
+        raise ValueError(f"Dirección no válida: '{direccion}'")
+
+
+def _es_loopback(host: str) -> bool:
+    """Indica si todas las direcciones a las que resuelve ``host`` son de loopback."""
+    try:
+        direcciones = {info[4][0] for info in socket.getaddrinfo(host, None, socket.AF_INET)}
+    except socket.gaierror:
+        return False
+    return bool(direcciones) and all(ipaddress.ip_address(ip).is_loopback for ip in direcciones)
+
+
+# ============ CLIENTE ============
+
+class ClienteMatrices:
+    """Cliente síncrono del servidor de cálculo."""
+
+    def __init__(self, direccion: str):
+        """
+        Conecta con el servidor.
+
+        Parameters:
+            direccion (str): Ruta de socket Unix o ``host:puerto``
+        """
+        destino = analizar_direccion(direccion)
+        if isinstance(destino, str):
+            self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        else:
+            self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            self._socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._socket.connect(destino)
+        self._entrada = self._socket.makefile('rb')
+        self._salida = self._socket.makefile('wb')
+
+    def orden(self, linea: str) -> str:
+        """Ejecuta una orden de lotes; devuelve lo mostrado."""
+        return self._solicitar(OP_ORDEN, linea)[0]
+
+    def poner(self, nombre: str, matriz) -> None:
+        """Guarda una matriz (MatrizNumPy o array) en el espacio compartido."""
+        self._solicitar(OP_PONER, nombre, getattr(matriz, 'datos', matriz))
+
+    def obtener(self, nombre: str) -> np.ndarray:
+        """Obtiene una copia de una matriz del espacio."""
+        return self._solicitar(OP_OBTENER, nombre)[1]
+
+    def eliminar(self, nombre: str) -> None:
+        """Elimina una matriz del espacio."""
+        self._solicitar(OP_ELIMINAR, nombre)
+
+    def evaluar(self, expresion: str) -> Optional[np.ndarray]:
+        """Evalúa una expresión; devuelve el resultado si no se asigna."""
+        return self._solicitar(OP_EVALUAR, expresion)[1]
+
+    def matvec(self, nombre: str, x: np.ndarray) -> np.ndarray:
+        """Calcula A @ x en el servidor."""
+        return self._solicitar(OP_MATVEC, nombre, x)[1]
+
+    def estado(self) -> Dict:
+        """Estadísticas del servidor."""
+        return json.loads(self._solicitar(OP_ESTADO, '')[0])
+
+    def cerrar(self) -> None:
+        """Cierra la conexión."""
+        self._entrada.close()
+        self._salida.close()
+        self._socket.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excepcion):
+        self.cerrar()
+
+    def _solicitar(self, operacion: int, texto: str, matriz: Optional[np.ndarray] = None
+                   ) -> Tuple[str, Optional[np.ndarray]]:
+        """Envía una solicitud y espera su respuesta."""
+        self._salida.write(codificar_mensaje(operacion, texto, matriz))
+        self._salida.flush()
+        respuesta = leer_mensaje(self._entrada, lambda estado: estado == RESP_MATRIZ)
+        if respuesta is None:
+            raise ConnectionError("El servidor cerró la conexión")
+        estado, texto, matriz = respuesta
+        if estado == RESP_ERROR:
+            raise ValueError(texto)
+        return texto, matriz
@@ -0,0 +1,185 @@
+"""
+Tareas en Segundo Plano
+=======================
+
+Ejecutor para las interfaces gráficas: los cálculos y las lecturas de
+archivos largos corren en hilos aparte y el bucle de eventos recoge los
+resultados sondeando con ``after()``, sin bloquear la ventana.
+
+- La función de cada tarea recibe la propia ``TareaFondo`` para informar
+  del progreso (``reportar``) y comprobar si se canceló (``cancelada``).
+- Las callbacks ``al_terminar`` y ``al_fallar`` se llaman siempre desde el
+  hilo que sondea (el de Tk), nunca desde el hilo de trabajo.
+- Cancelar descarta el resultado; los cálculos que lo comprueban
+  periódicamente (o que registran ``al_cancelar``) se detienen antes.
+
+Este módulo no depende de tkinter, así que se puede probar sin pantalla.
+
+Autor: Nicolas
+"""
+
+import threading
+import time
+from concurrent.futures import CancelledError, ThreadPoolExecutor
+from typing import Any, Callable, List, Optional
+
+# Intervalo de sondeo recomendado para after() (ms)
+INTERVALO_SONDEO = 100
+
+
+class TareaFondo:
+    """Estado compartido entre el hilo de trabajo y la interfaz."""
+
+    def __init__(self, descripcion: str, funcion: Callable[['TareaFondo'], Any],
+                 al_terminar: Optional[Callable[[Any], None]] = None,
+                 al_fallar: Optional[Callable[[BaseException], None]] = None):
+        self.descripcion = descripcion
+        self.funcion = funcion
+        self.al_terminar = al_terminar
+        self.al_fallar = al_fallar
+        self.inicio = time.perf_counter()
+        self.hechas = 0
+        self.total = 0
+        self.resultado: Any = None
+        # Segundos de trabajo en el hilo (sin la espera en la cola ni el sondeo)
+        self.duracion = 0.0
+        self.error: Optional[BaseException] = None
+        self._cancelado = threading.Event()
+        self._terminado = threading.Event()
+        self._al_cancelar: List[Callable[[], None]] = []
+        self._cerrojo = threading.Lock()
+
+    # ============ DESDE EL HILO DE TRABAJO ============
+
+    def reportar(self, hechas: int, total: int) -> None:
+        """Actualiza el progreso (total 0 significa progreso indeterminado)."""
+        self.hechas, self.total = hechas, total
+
+    def comprobar(self) -> None:
+        """Lanza CancelledError si la tarea se canceló."""
+        if self.cancelada:
+            raise CancelledError()
+
+    def al_cancelar(self, accion: Callable[[], None]) -> None:
+        """Registra una acción para detener un cálculo interno al cancelar."""
+        with self._cerrojo:
+            if not self.cancelada:
+                self._al_cancelar.append(accion)
+                return
+        accion()
+
+    # ============ DESDE LA INTERFAZ ============
+
+    def cancelar(self) -> None:
+        """Pide la cancelación; el resultado se descartará."""
+        with self._cerrojo:
+            self._cancelado.set()
+            acciones, self._al_cancelar = self._al_cancelar, []
+        for accion in acciones:
+            accion()
+
+    @property
+    def cancelada(self) -> bool:
+        return self._cancelado.is_set()
+
+    def terminada(self) -> bool:
+        return self._terminado.is_set()
+
+    def fraccion(self) -> Optional[float]:
+        """Fracción completada entre 0 y 1, o None si es indeterminada."""
+        return min(self.hechas / self.total, 1.0) if self.total else None
+
+    def transcurrido(self) -> float:
+        """Segundos desde que se envió."""
+        return time.perf_counter() - self.inicio
+
+    def _ejecutar(self) -> None:
+        comienzo = time.perf_counter()
+        try:
+            if not self.cancelada:
+                self.resultado = self.funcion(self)
+        except BaseException as e:
+            self.error = e
+        finally:
+            self.duracion = time.perf_counter() - comienzo
+            self._terminado.set()
+
+
+class EjecutorFondo:
+    """Pool de hilos cuyos resultados se entregan al sondear."""
+
+    def __init__(self, hilos: int = 2):
+        """
+        Crea el ejecutor.
+
+        Parameters:
+            hilos (int): Tareas que pueden correr a la vez
+        """
+        self._pool = ThreadPoolExecutor(max_workers=hilos, thread_name_prefix='fondo')
+        self.activas: List[TareaFondo] = []
+
+    def enviar(self, descripcion: str, funcion: Callable[[TareaFondo], Any],
+               al_terminar: Optional[Callable[[Any], None]] = None,
+               al_fallar: Optional[Callable[[BaseException], None]] = None) -> TareaFondo:
+        """
+        Lanza una tarea en segundo plano.
+
+        Parameters:
+            descripcion (str): Texto para la barra de progreso
+            funcion (Callable[[TareaFondo], Any]): Trabajo; recibe la tarea
+            al_terminar (Optional[Callable]): Recibe el resultado al sondear
+            al_fallar (Optional[Callable]): Recibe la excepción al sondear
+
+        Returns:
+            TareaFondo: La tarea enviada
+        """
+        tarea = TareaFondo(descripcion, funcion, al_terminar, al_fallar)
+        self.activas.append(tarea)
+        self._pool.submit(tarea._ejecutar)
+        return tarea
+
+    def sondear(self) -> List[TareaFondo]:
+        """
+        Entrega los resultados de las tareas terminadas (llamar desde la interfaz).
+
+        Las tareas canceladas se retiran sin llamar a ninguna callback.
+
+        Returns:
+            List[TareaFondo]: Tareas retiradas en esta llamada
+        """
+        # Una sola consulta por tarea: si termina durante el sondeo se
+        # queda en activas y se entrega en la siguiente llamada
+        terminadas, pendientes = [], []
+        for tarea in self.activas:
+            (terminadas if tarea.terminada() else pendientes).append(tarea)
+        self.activas = pendientes
+        for tarea in terminadas:
+            if tarea.cancelada:
+                continue
+            if tarea.error is not None:
+                if tarea.al_fallar:
+                    tarea.al_fallar(tarea.error)
+            elif tarea.al_terminar:
+                tarea.al_terminar(tarea.resultado)
+        return terminadas
+
+    def en_curso(self) -> List[TareaFondo]:
+        """
+        Tareas activas que no se han cancelado, en orden de envío.
+
+        Una tarea cancelada sigue en ``activas`` hasta que su función
+        termina, pero ya no se muestra ni puede volver a cancelarse.
+
+        Returns:
+            List[TareaFondo]: La primera es la que muestra la barra de progreso
+        """
+        return [tarea for tarea in self.activas if not tarea.cancelada]
+
+    def cancelar_todas(self) -> None:
+        for tarea in self.activas:
+            tarea.cancelar()
+
+    def cerrar(self) -> None:
+        """Cancela lo pendiente y libera los hilos sin esperar."""
+        self.cancelar_todas()
+        self._pool.shutdown(wait=False, cancel_futures=True)
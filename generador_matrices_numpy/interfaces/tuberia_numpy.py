@@ -0,0 +1,190 @@
+"""
+Modo Tubería Binaria con NumPy
+==============================
+
+Lee de la entrada estándar una secuencia de matrices en formato ``.npy``
+(ver ``src/protocolo.py``), aplica a cada una la operación configurada a
+medida que llega y escribe los resultados, también en ``.npy``, en la
+salida estándar. Permite encadenar el programa con otros procesos sin
+pasar por texto:
+
+    productor | python main.py --pipe transponer | consumidor
+    productor | python main.py --pipe resolver --matriz A.npy > x.npy
+
+Operaciones:
+
+    copiar        Reenvía cada matriz sin cambios
+    transponer    Xᵀ (sin copiar: se escribe con orden Fortran)
+    multiplicar   X @ M, con M leída de ``--matriz``
+    resolver      Solución de M·Y = X (M se factoriza una sola vez)
+    normalizar    X / ||X||_F (las matrices nulas se reenvían sin cambios)
+
+La memoria está acotada: solo hay una matriz en vuelo y los búferes de
+entrada y salida se reutilizan mientras la forma no cambie.
+
+Códigos de salida: 0 éxito, 1 error en el flujo o en una operación,
+2 argumentos no válidos.
+
+Autor: Nicolas
+Versión: 2.0.0 (NumPy Edition)
+"""
+
+import sys
+import os
+import numpy as np
+from typing import BinaryIO, Callable, Dict, Optional, TextIO, Tuple
+
+# Importar los módulos del proyecto
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.algebra_lineal import factorizar_lu, resolver_lu
+from src.protocolo import iterar_matrices, escribir_matriz
+
+EXITO = 0
+ERROR_EJECUCION = 1
+ERROR_ARGUMENTOS = 2
+
+OPERACIONES = ('copiar', 'transponer', 'multiplicar', 'resolver', 'normalizar')
+REQUIEREN_MATRIZ = ('multiplicar', 'resolver')
+
+
+class ProcesadorTuberia:
+    """Aplica una operación fija a cada matriz de un flujo binario."""
+
+    def __init__(self, operacion: str, matriz: Optional[np.ndarray] = None):
+        """
+        Prepara la operación.
+
+        Parameters:
+            operacion (str): Una de ``OPERACIONES``
+            matriz (Optional[np.ndarray]): Matriz fija para ``multiplicar`` y
+                ``resolver``
+
+        Raises:
+            ValueError: Si la operación o la matriz no son válidas
+        """
+        if operacion not in OPERACIONES:
+            raise ValueError(f"Operación desconocida: '{operacion}' (opciones: {', '.join(OPERACIONES)})")
+        if operacion in REQUIEREN_MATRIZ:
+            if matriz is None:
+                raise ValueError(f"La operación '{operacion}' requiere --matriz")
+            if matriz.ndim != 2:
+                raise ValueError("La matriz fija debe ser 2D")
+
+        self.operacion = operacion
+        self.matriz = matriz
+        self.procesadas = 0
+        self._salidas: Dict[Tuple, np.ndarray] = {}
+        self._factorizacion = None
+        if operacion == 'resolver':
+            if matriz.shape[0] != matriz.shape[1]:
+                raise ValueError("Solo se pueden resolver sistemas con matriz cuadrada")
+            if not np.issubdtype(matriz.dtype, np.inexact):
+                matriz = matriz.astype(np.float64)
+            try:
+                self._factorizacion = factorizar_lu(matriz)
+            except np.linalg.LinAlgError:
+                raise ValueError("La matriz es singular (no invertible)")
+
+        self.aplicar: Callable[[np.ndarray], np.ndarray] = getattr(self, f"_{operacion}")
+
+    def procesar(self, entrada: BinaryIO, salida: BinaryIO) -> int:
+        """
+        Procesa el flujo completo.
+
+        Parameters:
+            entrada (BinaryIO): Flujo de matrices .npy
+            salida (BinaryIO): Flujo donde se escriben los resultados
+
+        Returns:
+            int: Número de matrices procesadas
+
+        Raises:
+            ValueError: Si el flujo está mal formado o una matriz no es
+                compatible con la operación
+        """
+        for matriz in iterar_matrices(entrada, reutilizar=True):
+            if matriz.ndim != 2:
+                raise ValueError(f"Se esperaba una matriz 2D y llegó un array de forma {matriz.shape}")
+            escribir_matriz(salida, self.aplicar(matriz))
+            salida.flush()
+            self.procesadas += 1
+        return self.procesadas
+
+    # ============ OPERACIONES ============
+
+    def _copiar(self, x: np.ndarray) -> np.ndarray:
+        return x
+
+    def _transponer(self, x: np.ndarray) -> np.ndarray:
+        return x.T
+
+    def _multiplicar(self, x: np.ndarray) -> np.ndarray:
+        if x.shape[1] != self.matriz.shape[0]:
+            raise ValueError(f"No se puede multiplicar {x.shape[0]}×{x.shape[1]} por "
+                             f"{self.matriz.shape[0]}×{self.matriz.shape[1]}")
+        dtype = np.result_type(x, self.matriz)
+        return np.matmul(x, self.matriz, out=self._bufer((x.shape[0], self.matriz.shape[1]), dtype))
+
+    def _resolver(self, x: np.ndarray) -> np.ndarray:
+        if x.shape[0] != self.matriz.shape[0]:
+            raise ValueError(f"El lado derecho debe tener {self.matriz.shape[0]} filas (tiene {x.shape[0]})")
+        return resolver_lu(self._factorizacion, x)
+
+    def _normalizar(self, x: np.ndarray) -> np.ndarray:
+        norma = np.linalg.norm(x)
+        if norma == 0:
+            return x
+        if np.issubdtype(x.dtype, np.inexact):
+            # El búfer de entrada es nuestro: se divide en el sitio
+            x /= norma
+            return x
+        return np.divide(x, norma, out=self._bufer(x.shape, np.float64))
+
+    def _bufer(self, forma: Tuple[int, int], dtype) -> np.ndarray:
+        """Búfer de salida reutilizado entre matrices de la misma forma."""
+        clave = (forma, np.dtype(dtype))
+        if clave not in self._salidas:
+            # Solo se conserva un búfer: la memoria no crece con formas variadas
+            self._salidas.clear()
+            self._salidas[clave] = np.empty(forma, dtype=dtype)
+        return self._salidas[clave]
+
+
+def ejecutar_tuberia(operacion: str, ruta_matriz: Optional[str] = None,
+                     entrada: Optional[BinaryIO] = None, salida: Optional[BinaryIO] = None,
+                     registro: Optional[TextIO] = None) -> int:
+    """
+    Ejecuta el modo tubería sobre la entrada y salida estándar.
+
+    Parameters:
+        operacion (str): Operación a aplicar
+        ruta_matriz (Optional[str]): Archivo .npy con la matriz fija
+        entrada (Optional[BinaryIO]): Flujo de entrada (default: stdin binario)
+        salida (Optional[BinaryIO]): Flujo de salida (default: stdout binario)
+        registro (Optional[TextIO]): Flujo para mensajes (default: stderr)
+
+    Returns:
+        int: Código de salida
+    """
+    entrada = entrada or sys.stdin.buffer
+    salida = salida or sys.stdout.buffer
+    registro = registro or sys.stderr
+
+    try:
+        matriz = np.load(ruta_matriz, allow_pickle=False) if ruta_matriz else None
+        procesador = ProcesadorTuberia(operacion, matriz)
+    except (ValueError, OSError, MemoryError) as e:
+        print(f"❌ {e}", file=registro)
+        return ERROR_ARGUMENTOS
+
+    try:
+        procesador.procesar(entrada, salida)
+    except BrokenPipeError:
+        # El consumidor dejó de leer: no es un error de este proceso
+        if salida is sys.stdout.buffer:
+            os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return EXITO
+    except (ValueError, np.linalg.LinAlgError, MemoryError) as e:
+        print(f"❌ Matriz {procesador.procesadas + 1}: {e}", file=registro)
+        return ERROR_EJECUCION
+    return EXITO
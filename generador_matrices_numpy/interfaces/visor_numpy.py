@@ -0,0 +1,293 @@
+"""
+Visor Virtual de Matrices
+=========================
+
+Widget de tkinter que muestra matrices de cualquier tamaño (incluidos
+arrays mapeados en memoria) dibujando solo las celdas que caben en la
+ventana. El coste de cada repintado depende del tamaño de la ventana, no
+del de la matriz:
+
+- Las barras de desplazamiento son virtuales: representan la posición de
+  la primera fila/columna visible, sin crear una fila de widgets por fila
+  de la matriz.
+- Solo se lee y se formatea el bloque visible (``datos[f0:f1, c0:c1]``);
+  con un memmap, solo se tocan las páginas de ese bloque. Para una
+  ``MatrizNumPy`` los textos salen de ``src.cache_visualizacion``, así que
+  volver a una matriz ya vista no reformatea nada.
+- Los elementos del Canvas se reutilizan entre repintados y los eventos
+  de desplazamiento seguidos se agrupan en un único repintado.
+
+Autor: Nicolas
+"""
+
+import tkinter as tk
+from tkinter import ttk
+import tkinter.font as tkfont
+import numpy as np
+from typing import Callable, List, Optional, Sequence, Tuple
+
+from src.cache_visualizacion import CACHE, formateador
+
+# Ancho mínimo de columna (caracteres) y separación entre celdas (px)
+ANCHO_MINIMO = 6
+SEPARACION = 12
+
+COLOR_ENCABEZADO = '#e8e8e8'
+COLOR_TEXTO_ENCABEZADO = '#555555'
+
+
+def formatear_bloque(bloque: np.ndarray) -> List[List[str]]:
+    """
+    Convierte un bloque 2D en textos de celda.
+
+    Parameters:
+        bloque (np.ndarray): Bloque visible de la matriz
+
+    Returns:
+        List[List[str]]: Texto de cada celda
+    """
+    formato = formateador(bloque.dtype)
+    return [[formato(valor) for valor in fila] for fila in bloque.tolist()]
+
+
+def posicion_desde_scroll(argumentos: Sequence[str], actual: int, total: int, pagina: int) -> int:
+    """
+    Traduce un comando de barra de desplazamiento a la primera fila/columna visible.
+
+    Parameters:
+        argumentos (Sequence[str]): ``('moveto', fraccion)`` o ``('scroll', n, 'units'|'pages')``
+        actual (int): Primera fila/columna visible ahora
+        total (int): Filas/columnas de la matriz
+        pagina (int): Filas/columnas que caben en la ventana
+
+    Returns:
+        int: Nueva primera fila/columna visible, dentro de los límites
+    """
+    if argumentos[0] == 'moveto':
+        nueva = int(float(argumentos[1]) * total)
+    else:
+        pasos = int(argumentos[1])
+        nueva = actual + pasos * (max(pagina - 1, 1) if argumentos[2] == 'pages' else 1)
+    return limitar_inicio(nueva, total, pagina)
+
+
+def limitar_inicio(inicio: int, total: int, pagina: int) -> int:
+    """Ajusta la primera posición visible para no dejar huecos al final."""
+    return max(0, min(inicio, total - pagina))
+
+
+class VisorMatriz(ttk.Frame):
+    """Rejilla virtual de solo lectura para matrices grandes."""
+
+    def __init__(self, padre, fuente: Tuple = ('Courier', 10), **opciones):
+        """
+        Crea el visor vacío.
+
+        Parameters:
+            padre: Widget contenedor
+            fuente (Tuple): Fuente de las celdas (monoespaciada)
+        """
+        super().__init__(padre, **opciones)
+        self.datos: Optional[np.ndarray] = None
+        self._matriz = None
+        self.fila_inicio = 0
+        self.columna_inicio = 0
+        self._formatear: Callable[[np.ndarray], List[List[str]]] = formatear_bloque
+        self._ancho_caracteres = ANCHO_MINIMO
+        self._items: List[int] = []
+        self._pendiente = False
+        self._visibles = (1, 1)
+        self._geometria = (0, 1)
+
+        self._fuente = tkfont.Font(font=fuente)
+        self._ancho_caracter = self._fuente.measure('0')
+        self._alto_fila = self._fuente.metrics('linespace') + 4
+
+        self.canvas = tk.Canvas(self, background='white', highlightthickness=0, takefocus=True)
+        self.barra_y = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self._desplazar_y)
+        self.barra_x = ttk.Scrollbar(self, orient=tk.HORIZONTAL, command=self._desplazar_x)
+        self.canvas.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        self.barra_y.grid(row=0, column=1, sticky=(tk.N, tk.S))
+        self.barra_x.grid(row=1, column=0, sticky=(tk.W, tk.E))
+        self.columnconfigure(0, weight=1)
+        self.rowconfigure(0, weight=1)
+
+        self._fondo_columnas = self.canvas.create_rectangle(0, 0, 0, 0, fill=COLOR_ENCABEZADO, width=0)
+        self._fondo_filas = self.canvas.create_rectangle(0, 0, 0, 0, fill=COLOR_ENCABEZADO, width=0)
+
+        self.canvas.bind('<Configure>', lambda e: self.refrescar())
+        self.canvas.bind('<MouseWheel>', self._rueda)
+        self.canvas.bind('<Shift-MouseWheel>', lambda e: self._rueda(e, horizontal=True))
+        self.canvas.bind('<Button-4>', lambda e: self.desplazar(-3, 0))
+        self.canvas.bind('<Button-5>', lambda e: self.desplazar(3, 0))
+        self.canvas.bind('<Shift-Button-4>', lambda e: self.desplazar(0, -3))
+        self.canvas.bind('<Shift-Button-5>', lambda e: self.desplazar(0, 3))
+        self.canvas.bind('<Button-1>', lambda e: self.canvas.focus_set())
+        for tecla, (df, dc) in {'<Up>': (-1, 0), '<Down>': (1, 0), '<Left>': (0, -1), '<Right>': (0, 1)}.items():
+            self.canvas.bind(tecla, lambda e, df=df, dc=dc: self.desplazar(df, dc))
+        self.canvas.bind('<Prior>', lambda e: self.desplazar(-self._visibles[0], 0))
+        self.canvas.bind('<Next>', lambda e: self.desplazar(self._visibles[0], 0))
+        self.canvas.bind('<Home>', lambda e: self.ir_a(0, 0))
+        self.canvas.bind('<End>', lambda e: self.ir_a(self.filas, self.columnas))
+
+    # ============ API PÚBLICA ============
+
+    @property
+    def filas(self) -> int:
+        return 0 if self.datos is None else self.datos.shape[0]
+
+    @property
+    def columnas(self) -> int:
+        return 0 if self.datos is None else self.datos.shape[1]
+
+    def mostrar(self, matriz, formatear: Optional[Callable[[np.ndarray], List[List[str]]]] = None) -> None:
+        """
+        Muestra una matriz desde la esquina superior izquierda.
+
+        Parameters:
+            matriz: MatrizNumPy, array 2D (puede ser un memmap) o None para vaciar
+            formatear (Optional[Callable]): Convierte un bloque en textos de celda
+                (default: ``formatear_bloque``)
+        """
+        datos = getattr(matriz, 'datos', matriz)
+        if datos is not None:
+            datos = np.asanyarray(datos)
+            if datos.ndim != 2:
+                raise ValueError("El visor requiere una matriz 2D")
+        self.datos = datos
+        self._formatear = formatear or formatear_bloque
+        # Las MatrizNumPy (versionadas) se formatean a través de la caché compartida
+        self._matriz = matriz if formatear is None and hasattr(matriz, 'cambios_desde') else None
+        self.fila_inicio = self.columna_inicio = 0
+        self._ancho_caracteres = ANCHO_MINIMO
+        self.refrescar()
+
+    def ir_a(self, fila: int, columna: int) -> None:
+        """Desplaza la vista para que (fila, columna) quede arriba a la izquierda."""
+        self.fila_inicio = limitar_inicio(fila, self.filas, self._visibles[0])
+        self.columna_inicio = limitar_inicio(columna, self.columnas, self._visibles[1])
+        self.refrescar()
+
+    def desplazar(self, filas: int, columnas: int) -> None:
+        """Desplaza la vista un número de filas y columnas."""
+        self.ir_a(self.fila_inicio + filas, self.columna_inicio + columnas)
+
+    def refrescar(self) -> None:
+        """Programa un repintado (varios seguidos se agrupan en uno)."""
+        if not self._pendiente:
+            self._pendiente = True
+            self.after_idle(self._dibujar)
+
+    def celda_en(self, x: int, y: int) -> Optional[Tuple[int, int]]:
+        """Celda bajo un punto del Canvas, o None si cae en los encabezados o fuera."""
+        ancho_indice, ancho_columna = self._geometria
+        if self.datos is None or x < ancho_indice or y < self._alto_fila:
+            return None
+        fila = self.fila_inicio + y // self._alto_fila - 1
+        columna = self.columna_inicio + (x - ancho_indice) // ancho_columna
+        if fila >= self.filas or columna >= self.columnas:
+            return None
+        return fila, columna
+
+    def rectangulo_celda(self, fila: int, columna: int) -> Tuple[int, int, int, int]:
+        """Coordenadas (x0, y0, x1, y1) de una celda en el Canvas."""
+        ancho_indice, ancho_columna = self._geometria
+        x0 = ancho_indice + (columna - self.columna_inicio) * ancho_columna
+        y0 = (fila - self.fila_inicio + 1) * self._alto_fila
+        return x0, y0, x0 + ancho_columna, y0 + self._alto_fila
+
+    # ============ MÉTODOS PRIVADOS ============
+
+    def _desplazar_y(self, *argumentos) -> None:
+        self.fila_inicio = posicion_desde_scroll(argumentos, self.fila_inicio, self.filas, self._visibles[0])
+        self.refrescar()
+
+    def _desplazar_x(self, *argumentos) -> None:
+        self.columna_inicio = posicion_desde_scroll(argumentos, self.columna_inicio, self.columnas,
+                                                    self._visibles[1])
+        self.refrescar()
+
+    def _rueda(self, evento, horizontal: bool = False) -> None:
+        pasos = -3 if evento.delta > 0 else 3
+        if horizontal:
+            self.desplazar(0, pasos)
+        else:
+            self.desplazar(pasos, 0)
+
+    def _dibujar(self) -> None:
+        self._pendiente = False
+        ancho, alto = self.canvas.winfo_width(), self.canvas.winfo_height()
+        if self.datos is None or self.datos.size == 0:
+            self._ocultar_desde(0)
+            self.canvas.coords(self._fondo_columnas, 0, 0, 0, 0)
+            self.canvas.coords(self._fondo_filas, 0, 0, 0, 0)
+            self.barra_y.set(0, 1)
+            self.barra_x.set(0, 1)
+            return
+
+        ancho_indice = (len(str(self.filas - 1)) + 1) * self._ancho_caracter + SEPARACION
+        filas_visibles = max((alto - self._alto_fila) // self._alto_fila, 1)
+        self.fila_inicio = limitar_inicio(self.fila_inicio, self.filas, filas_visibles)
+        fila_fin = min(self.fila_inicio + filas_visibles + 1, self.filas)
+
+        # El ancho de columna solo crece con lo que se ha visto, para no saltar al desplazarse
+        ancho_columna = self._ancho_caracteres * self._ancho_caracter + SEPARACION
+        columnas_visibles = max((ancho - ancho_indice) // ancho_columna, 1)
+        self.columna_inicio = limitar_inicio(self.columna_inicio, self.columnas, columnas_visibles)
+        columna_fin = min(self.columna_inicio + columnas_visibles + 1, self.columnas)
+
+        celdas = self._textos_bloque(self.fila_inicio, fila_fin, self.columna_inicio, columna_fin)
+        mas_ancha = max((len(texto) for fila in celdas for texto in fila), default=0)
+        if mas_ancha > self._ancho_caracteres:
+            self._ancho_caracteres = mas_ancha
+            ancho_columna = mas_ancha * self._ancho_caracter + SEPARACION
+        self._visibles = (filas_visibles, columnas_visibles)
+        self._geometria = (ancho_indice, ancho_columna)
+
+        self.canvas.coords(self._fondo_columnas, 0, 0, ancho, self._alto_fila)
+        self.canvas.coords(self._fondo_filas, 0, 0, ancho_indice, alto)
+
+        usados = 0
+        for j in range(columna_fin - self.columna_inicio):
+            x = ancho_indice + (j + 1) * ancho_columna - SEPARACION // 2
+            usados = self._colocar(usados, x, self._alto_fila // 2, str(self.columna_inicio + j),
+                                   COLOR_TEXTO_ENCABEZADO)
+        for i, fila in enumerate(celdas):
+            y = (i + 1) * self._alto_fila + self._alto_fila // 2
+            usados = self._colocar(usados, ancho_indice - SEPARACION // 2, y, str(self.fila_inicio + i),
+                                   COLOR_TEXTO_ENCABEZADO)
+            for j, texto in enumerate(fila):
+                usados = self._colocar(usados, ancho_indice + (j + 1) * ancho_columna - SEPARACION // 2, y,
+                                       texto, self._color_celda(self.fila_inicio + i, self.columna_inicio + j))
+        self._ocultar_desde(usados)
+        self._despues_de_dibujar()
+
+        self.barra_y.set(self.fila_inicio / self.filas, (self.fila_inicio + filas_visibles) / self.filas)
+        self.barra_x.set(self.columna_inicio / self.columnas,
+                         (self.columna_inicio + columnas_visibles) / self.columnas)
+
+    def _textos_bloque(self, fila_inicio: int, fila_fin: int, columna_inicio: int, columna_fin: int) -> List[List[str]]:
+        """Textos de las celdas visibles (los editores lo amplían)."""
+        if self._matriz is not None and self._matriz.datos is self.datos:
+            return CACHE.textos(self._matriz, fila_inicio, fila_fin, columna_inicio, columna_fin)[0]
+        return self._formatear(self.datos[fila_inicio:fila_fin, columna_inicio:columna_fin])
+
+    def _color_celda(self, fila: int, columna: int) -> str:
+        return 'black'
+
+    def _despues_de_dibujar(self) -> None:
+        """Punto de extensión tras cada repintado."""
+
+    def _colocar(self, indice: int, x: int, y: int, texto: str, color: str) -> int:
+        """Reutiliza (o crea) el elemento de texto ``indice``; devuelve el siguiente."""
+        if indice == len(self._items):
+            self._items.append(self.canvas.create_text(0, 0, anchor=tk.E, font=self._fuente))
+        item = self._items[indice]
+        self.canvas.coords(item, x, y)
+        self.canvas.itemconfigure(item, text=texto, fill=color, state=tk.NORMAL)
+        return indice + 1
+
+    def _ocultar_desde(self, indice: int) -> None:
+        for item in self._items[indice:]:
+            self.canvas.itemconfigure(item, state=tk.HIDDEN)
+
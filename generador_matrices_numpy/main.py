@@ -4,12 +4,28 @@ Generador de Matrices con NumPy - Programa Principal
 ===================================================
 
 Programa simple para operaciones básicas con matrices usando NumPy.
-Ofrece interfaces de consola y gráfica.
+Ofrece interfaces de consola y gráfica, y un modo por lotes sin interacción:
+
+    python main.py --script trabajo.txt
+    python main.py --script - < trabajo.txt
+
+y un modo tubería que transforma un flujo binario de matrices .npy:
+
+    productor | python main.py --pipe resolver --matriz A.npy | consumidor
+
+o como servidor local que comparte un espacio de trabajo entre procesos:
+
+    python main.py --servidor /tmp/matrices.sock
+
+o como trabajador del motor distribuido por bloques (``src/distribuido.py``):
+
+    python main.py --trabajador 0.0.0.0:9000
 
 Autor: Nicolas
 Versión: 2.0.0 (NumPy Edition)
 """
 
+import argparse
 import sys
 import os
 import numpy as np
@@ -30,15 +46,24 @@ except ImportError:
     print("   pip install numpy")
     sys.exit(1)
 
-# Importar interfaces cuando NumPy esté disponible
-if HAS_NUMPY:
+
+def importar_interfaces():
+    """
+    Importa las interfaces interactivas.
+
+    Se hace bajo demanda para que el modo por lotes no cargue tkinter.
+    """
+    global InterfazConsolaNP, InterfazGraficaNP
     try:
         from interfaces.consola_numpy import InterfazConsolaNP
+    except ImportError as e:
+        print(f"⚠️ Error al importar la interfaz de consola: {e}")
+        InterfazConsolaNP = None
+    try:
         from interfaces.grafica_numpy import InterfazGraficaNP
     except ImportError as e:
-        print(f"⚠️ Error al importar interfaces: {e}")
+        print(f"⚠️ Error al importar la interfaz gráfica: {e}")
         print("Usando modo de compatibilidad...")
-        InterfazConsolaNP = None
         InterfazGraficaNP = None
 
 
@@ -63,8 +88,76 @@ def mostrar_menu_principal():
 
 
 
-def main():
+def iniciar_servidor(direccion):
+    """Atiende conexiones hasta recibir Ctrl+C."""
+    from interfaces.servidor_numpy import ServidorMatrices
+    try:
+        servidor = ServidorMatrices(direccion)
+    except (ValueError, OSError) as e:
+        print(f"❌ No se pudo iniciar el servidor: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    print(f"🖧 Servidor de matrices escuchando en {servidor.direccion}", file=sys.stderr)
+    try:
+        servidor.iniciar()
+    except KeyboardInterrupt:
+        print("\n👋 Servidor detenido", file=sys.stderr)
+    finally:
+        servidor.detener()
+
+
+def iniciar_trabajador(direccion):
+    """Atiende a los coordinadores hasta recibir Ctrl+C."""
+    from src.distribuido import TrabajadorBloques
+    try:
+        trabajador = TrabajadorBloques(direccion)
+    except (ValueError, OSError) as e:
+        print(f"❌ No se pudo iniciar el trabajador: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    print(f"🧩 Trabajador de bloques escuchando en {trabajador.direccion}", file=sys.stderr)
+    try:
+        trabajador.iniciar()
+    except KeyboardInterrupt:
+        print("\n👋 Trabajador detenido", file=sys.stderr)
+    finally:
+        trabajador.detener()
+
+
+def procesar_argumentos(argv=None):
+    """Procesa los argumentos de la línea de comandos."""
+    parser = argparse.ArgumentParser(description="Generador de Matrices con NumPy")
+    parser.add_argument('--script', metavar='ARCHIVO',
+                        help="Ejecuta un guion de órdenes sin interacción ('-' para leer de stdin)")
+    parser.add_argument('--pipe', metavar='OPERACION',
+                        help="Aplica OPERACION a cada matriz .npy de stdin y escribe el resultado en stdout "
+                             "(copiar, transponer, multiplicar, resolver, normalizar)")
+    parser.add_argument('--matriz', metavar='ARCHIVO.npy',
+                        help="Matriz fija para --pipe multiplicar y --pipe resolver")
+    parser.add_argument('--servidor', metavar='DIRECCION',
+                        help="Inicia el servidor de cálculo en un socket Unix (ruta) o TCP local (host:puerto)")
+    parser.add_argument('--trabajador', metavar='HOST:PUERTO',
+                        help="Inicia un trabajador del motor distribuido por bloques")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
     """Función principal del programa."""
+    argumentos = procesar_argumentos(argv)
+    if argumentos.script:
+        from interfaces.lotes_numpy import ejecutar_script
+        sys.exit(ejecutar_script(argumentos.script))
+    if argumentos.pipe:
+        from interfaces.tuberia_numpy import ejecutar_tuberia
+        sys.exit(ejecutar_tuberia(argumentos.pipe, argumentos.matriz))
+    if argumentos.servidor:
+        iniciar_servidor(argumentos.servidor)
+        return
+    if argumentos.trabajador:
+        iniciar_trabajador(argumentos.trabajador)
+        return
+    
+    importar_interfaces()
     try:
         mostrar_banner()
         
@@ -7,12 +7,45 @@ Optimizada para rendimiento y funcionalidades científicas.
 
 Modules:
     matriz_numpy: Clase principal MatrizNumPy
+    algebra_lineal: Factorización LU, precisión mixta y gradiente conjugado
+    operaciones: Núcleos optimizados (producto entero exacto, cadenas de productos)
+    aleatorio: Generación aleatoria paralela y reproducible
+    estructuradas: Matrices implícitas Toeplitz, circulante, Kronecker e inversa
+    perezosa: Grafos de expresión con evaluación fusionada
+    expresiones: Lenguaje de expresiones sobre un espacio de trabajo
+    protocolo: Flujos binarios de matrices en formato .npy
+    procesos: Producto repartido entre procesos con memoria compartida
+    distribuido: Matrices repartidas por bloques entre trabajadores TCP
+    teselas: Cholesky, LU y QR por teselas con robo de trabajo
+    entrada: Análisis en bloque de texto numérico pegado o escrito
+    cache_visualizacion: Caché LRU del texto formateado de las matrices
+    paginacion: Resumen y paginación de matrices grandes en consola
+    perfilador: Tiempos, FLOPs y memoria de las operaciones
+    historial: Historial acotado de operaciones con exportación y reproducción
 
 Autor: Nicolas
 Versión: 2.0.0 (NumPy Edition)
 """
 
 from .matriz_numpy import MatrizNumPy
+from .algebra_lineal import (factorizar_lu, resolver_lu, resolver_precision_mixta,
+                             gradiente_conjugado)
+from .operaciones import multiplicar_enteros, multiplicar_cadena
+from .aleatorio import generar_aleatoria, llenar_aleatorio_paralelo
+from .estructuradas import (MatrizImplicita, MatrizToeplitz, MatrizCirculante, MatrizKronecker,
+                            MatrizInversa)
+from .perezosa import ExpresionPerezosa
+from .expresiones import compilar_expresion, evaluar_expresion
+from .protocolo import leer_matriz, escribir_matriz, iterar_matrices
+from .procesos import multiplicar_en_procesos, cerrar_pool
+from .distribuido import ClusterBloques, MatrizDistribuida, TrabajadorBloques
+from .teselas import (PlanificadorTeselas, cholesky_teselas, lu_teselas, inversa_teselas,
+                      qr_teselas)
+from .entrada import analizar_bloque, analizar_matriz, leer_filas
+from .cache_visualizacion import CacheVisualizacion
+from .paginacion import resumir, Paginador
+from .perfilador import Perfilador, PERFILADOR, perfilado
+from .historial import Historial, Registro
 
 __version__ = "2.0.0"
 __author__ = "Nicolas"
@@ -20,5 +53,45 @@ __description__ = "Generador de Matrices con NumPy - Edición Científica"
 
 # Información del proyecto
 __all__ = [
-    'MatrizNumPy'
+    'MatrizNumPy',
+    'factorizar_lu',
+    'resolver_lu',
+    'resolver_precision_mixta',
+    'gradiente_conjugado',
+    'multiplicar_enteros',
+    'multiplicar_cadena',
+    'generar_aleatoria',
+    'llenar_aleatorio_paralelo',
+    'MatrizImplicita',
+    'MatrizToeplitz',
+    'MatrizCirculante',
+    'MatrizKronecker',
+    'MatrizInversa',
+    'ExpresionPerezosa',
+    'compilar_expresion',
+    'evaluar_expresion',
+    'leer_matriz',
+    'escribir_matriz',
+    'iterar_matrices',
+    'multiplicar_en_procesos',
+    'cerrar_pool',
+    'ClusterBloques',
+    'MatrizDistribuida',
+    'TrabajadorBloques',
+    'PlanificadorTeselas',
+    'cholesky_teselas',
+    'lu_teselas',
+    'inversa_teselas',
+    'qr_teselas',
+    'analizar_bloque',
+    'analizar_matriz',
+    'leer_filas',
+    'CacheVisualizacion',
+    'resumir',
+    'Paginador',
+    'Perfilador',
+    'PERFILADOR',
+    'perfilado',
+    'Historial',
+    'Registro'
 ]
@@ -0,0 +1,198 @@
+"""
+Caché de Visualización
+======================
+
+Guarda el texto ya formateado de las matrices, por teselas de
+``TESELA_FILAS × TESELA_COLUMNAS`` elementos, para que volver a mostrar
+una matriz (p. ej. al cambiar de matriz en la interfaz gráfica) no
+reformatee sus elementos.
+
+- Cada tesela guarda sus cadenas y el ancho de cada columna. Solo se
+  formatean las teselas que se llegan a mostrar, así que una matriz
+  enorme no se formatea entera.
+- Las teselas se identifican por la matriz (id comprobado con una
+  referencia débil), la precisión y su posición, y se validan con la
+  versión de la matriz, que ``MatrizNumPy`` incrementa en cada
+  modificación. Si desde entonces solo cambiaron elementos sueltos, se
+  reformatean solo esos.
+- Las teselas menos usadas se descartan cuando el tamaño estimado supera
+  la capacidad.
+
+Quien escriba en ``matriz.datos`` directamente debe llamar después a
+``matriz.marcar_modificada()``.
+
+Autor: Nicolas
+"""
+
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Callable, Iterable, List, Tuple
+
+import numpy as np
+
+TESELA_FILAS = 64
+TESELA_COLUMNAS = 16
+PRECISION_POR_DEFECTO = 6
+CAPACIDAD_POR_DEFECTO = 32 * 1024 * 1024
+
+# Coste fijo aproximado de un str y de cada posición de una lista (CPython, 64 bits)
+_BYTES_CADENA = 49
+_BYTES_LISTA = 56
+_BYTES_PUNTERO = 8
+
+
+def formateador(dtype: np.dtype, precision: int = PRECISION_POR_DEFECTO) -> Callable[[object], str]:
+    """
+    Función que convierte un elemento de ``dtype`` en texto.
+
+    Parameters:
+        dtype (np.dtype): Tipo de los elementos
+        precision (int): Cifras significativas de los flotantes (los
+            complejos usan dos menos)
+
+    Returns:
+        Callable[[object], str]: Formateador de un elemento
+    """
+    if dtype.kind == 'f':
+        return lambda valor: f"{valor:.{precision}g}"
+    if dtype.kind == 'c':
+        return lambda valor: f"{valor:.{max(precision - 2, 1)}g}"
+    return str
+
+
+class _Tesela:
+    """Textos de una tesela de la matriz en una versión concreta."""
+
+    def __init__(self, matriz, fila: int, columna: int, formato: Callable[[object], str]):
+        self.referencia = weakref.ref(matriz)
+        self.version = matriz.version
+        self.origen = (fila, columna)
+        bloque = matriz.datos[fila:fila + TESELA_FILAS, columna:columna + TESELA_COLUMNAS]
+        self.textos = [[formato(valor) for valor in valores] for valores in bloque.tolist()]
+        self.anchos = [max(len(textos[j]) for textos in self.textos) for j in range(bloque.shape[1])]
+        self.bytes = (sum(len(texto) for textos in self.textos for texto in textos)
+                      + bloque.shape[0] * (_BYTES_LISTA + bloque.shape[1] * (_BYTES_CADENA + _BYTES_PUNTERO)))
+
+    def actualizar(self, matriz, celdas: Iterable[Tuple[int, int]], formato: Callable[[object], str]) -> None:
+        """Reformatea las celdas de la lista que caen dentro de la tesela."""
+        fila_origen, columna_origen = self.origen
+        for fila, columna in set(celdas):
+            i, j = fila - fila_origen, columna - columna_origen
+            if not (0 <= i < len(self.textos) and 0 <= j < len(self.anchos)):
+                continue
+            anterior = self.textos[i][j]
+            texto = formato(matriz.datos[fila, columna].item())
+            self.textos[i][j] = texto
+            self.bytes += len(texto) - len(anterior)
+            if len(texto) >= self.anchos[j]:
+                self.anchos[j] = len(texto)
+            elif len(anterior) == self.anchos[j]:
+                self.anchos[j] = max(len(textos[j]) for textos in self.textos)
+        self.version = matriz.version
+
+
+class CacheVisualizacion:
+    """Caché LRU, por teselas, del texto formateado de las matrices."""
+
+    def __init__(self, capacidad_bytes: int = CAPACIDAD_POR_DEFECTO):
+        """
+        Crea una caché vacía.
+
+        Parameters:
+            capacidad_bytes (int): Tamaño estimado máximo de lo guardado
+        """
+        self.capacidad_bytes = capacidad_bytes
+        self.bytes = 0
+        self.aciertos = 0
+        self.fallos = 0
+        self.incrementales = 0
+        self._teselas: 'OrderedDict[tuple, _Tesela]' = OrderedDict()
+        self._cerrojo = threading.Lock()
+
+    def textos(self, matriz, fila_inicio: int, fila_fin: int, columna_inicio: int, columna_fin: int,
+               precision: int = PRECISION_POR_DEFECTO) -> Tuple[List[List[str]], List[int]]:
+        """
+        Textos de un bloque de la matriz y ancho de cada una de sus columnas.
+
+        Parameters:
+            matriz (MatrizNumPy): Matriz a formatear
+            fila_inicio, fila_fin (int): Filas del bloque (fin exclusivo)
+            columna_inicio, columna_fin (int): Columnas del bloque (fin exclusivo)
+            precision (int): Cifras significativas de los flotantes
+
+        Returns:
+            Tuple[List[List[str]], List[int]]: Textos (listas nuevas, que se
+            pueden modificar) y ancho máximo de cada columna en las teselas
+            que cubren el bloque
+        """
+        formato = formateador(matriz.datos.dtype, precision)
+        filas = [[] for _ in range(fila_fin - fila_inicio)]
+        anchos = [0] * (columna_fin - columna_inicio)
+        with self._cerrojo:
+            for fila_tesela in range(fila_inicio - fila_inicio % TESELA_FILAS, fila_fin, TESELA_FILAS):
+                for columna_tesela in range(columna_inicio - columna_inicio % TESELA_COLUMNAS, columna_fin,
+                                            TESELA_COLUMNAS):
+                    tesela = self._tesela(matriz, fila_tesela, columna_tesela, precision, formato)
+                    desde_i, hasta_i = max(fila_inicio, fila_tesela), min(fila_fin, fila_tesela + TESELA_FILAS)
+                    desde_j = max(columna_inicio, columna_tesela)
+                    hasta_j = min(columna_fin, columna_tesela + TESELA_COLUMNAS)
+                    for i in range(desde_i, hasta_i):
+                        filas[i - fila_inicio].extend(
+                            tesela.textos[i - fila_tesela][desde_j - columna_tesela:hasta_j - columna_tesela])
+                    for j in range(desde_j, hasta_j):
+                        anchos[j - columna_inicio] = tesela.anchos[j - columna_tesela]
+            self._liberar()
+        return filas, anchos
+
+    def limpiar(self) -> None:
+        """Descarta todas las teselas."""
+        with self._cerrojo:
+            self._teselas.clear()
+            self.bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._teselas)
+
+    # ============ MÉTODOS PRIVADOS ============
+
+    def _tesela(self, matriz, fila: int, columna: int, precision: int, formato) -> _Tesela:
+        clave = (id(matriz), precision, fila, columna)
+        tesela = self._teselas.get(clave)
+        if tesela is not None and tesela.referencia() is not matriz:
+            self._descartar(clave)
+            tesela = None
+
+        celdas = None
+        if tesela is not None and tesela.version != matriz.version:
+            celdas = matriz.cambios_desde(tesela.version)
+            if celdas is None:
+                self._descartar(clave)
+                tesela = None
+
+        if tesela is None:
+            self.fallos += 1
+            tesela = _Tesela(matriz, fila, columna, formato)
+            self._teselas[clave] = tesela
+            self.bytes += tesela.bytes
+        elif celdas is not None:
+            self.incrementales += 1
+            self.bytes -= tesela.bytes
+            tesela.actualizar(matriz, celdas, formato)
+            self.bytes += tesela.bytes
+        else:
+            self.aciertos += 1
+        self._teselas.move_to_end(clave)
+        return tesela
+
+    def _descartar(self, clave: tuple) -> None:
+        self.bytes -= self._teselas.pop(clave).bytes
+
+    def _liberar(self) -> None:
+        """Descarta las teselas menos usadas hasta caber en la capacidad (siempre queda la última)."""
+        while self.bytes > self.capacidad_bytes and len(self._teselas) > 1:
+            self._descartar(next(iter(self._teselas)))
+
+
+# Caché compartida por los visores de la interfaz gráfica
+CACHE = CacheVisualizacion()
@@ -0,0 +1,719 @@
+"""
+Matrices Distribuidas por Bloques
+=================================
+
+Motor coordinador/trabajadores sobre TCP para matrices que no caben en una
+sola máquina. Cada matriz se divide en bloques de ``tam_bloque`` ×
+``tam_bloque`` repartidos de forma cíclica 2-D sobre una rejilla de
+``pr × pc`` trabajadores: el bloque (I, J) vive en el trabajador
+``(I mod pr) · pc + (J mod pc)``.
+
+- Los trabajadores (``TrabajadorBloques``, o ``main.py --trabajador``)
+  guardan sus bloques y calculan los bloques de salida que les
+  corresponden; los bloques remotos que necesitan los piden directamente
+  a otros trabajadores, sin pasar por el coordinador.
+- El coordinador (``ClusterBloques``) solo envía órdenes. Los datos entran
+  y salen bloque a bloque (``distribuir``, ``bloques``, ``guardar``): nunca
+  reúne una matriz completa salvo que se pida con ``reunir``.
+
+Operaciones de ``MatrizDistribuida``: ``@``, ``.T``, ``+``, ``-``, ``*``
+(por escalar o elemento a elemento), ``/`` por escalar y las reducciones
+``suma``, ``norma``, ``maximo`` y ``minimo``.
+
+Los bloques de una matriz se eliminan de los trabajadores con ``liberar``,
+al salir de un bloque ``with`` o, si no, cuando la referencia del
+coordinador deja de usarse: así los resultados intermedios de una
+expresión como ``(a - c) * 2.5 / 3`` no se acumulan. La eliminación de
+las referencias recogidas se envía junto con la siguiente orden (nunca
+desde el recolector de basura, que podría ejecutarse con una conexión
+ocupada).
+
+Para pruebas, ``TrabajadoresLocales`` lanza los trabajadores como procesos
+en localhost.
+
+Autor: Nicolas
+"""
+
+import itertools
+import json
+import math
+import multiprocessing
+import socket
+import socketserver
+import threading
+import weakref
+import numpy as np
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+from .matriz_numpy import MatrizNumPy
+from .protocolo import codificar_mensaje, leer_mensaje, RESP_OK, RESP_MATRIZ, RESP_ERROR
+
+(OP_CONFIGURAR, OP_PONER, OP_OBTENER, OP_CREAR, OP_TRANSPONER, OP_ELEMENTAL,
+ OP_MATMUL, OP_REDUCIR, OP_ELIMINAR, OP_ESTADO) = range(1, 11)
+
+TAM_BLOQUE_DISTRIBUIDO = 256
+
+OPERACIONES_ELEMENTALES = {
+    '+': np.add,
+    '-': np.subtract,
+    '*': np.multiply,
+    '/': np.true_divide,
+}
+
+Escalar = Union[int, float]
+
+
+class ClusterBloques:
+    """Coordinador de un conjunto de trabajadores de bloques."""
+
+    def __init__(self, direcciones: Sequence[str], tam_bloque: int = TAM_BLOQUE_DISTRIBUIDO,
+                 rejilla: Optional[Tuple[int, int]] = None):
+        """
+        Conecta con los trabajadores y les comunica la distribución.
+
+        Parameters:
+            direcciones (Sequence[str]): ``host:puerto`` de cada trabajador
+            tam_bloque (int): Lado de los bloques
+            rejilla (Optional[Tuple[int, int]]): Filas y columnas de la
+                rejilla de trabajadores (default: la más cuadrada posible)
+
+        Raises:
+            ValueError: Si la rejilla no coincide con el número de trabajadores
+        """
+        if not direcciones:
+            raise ValueError("Se necesita al menos un trabajador")
+        if tam_bloque < 1:
+            raise ValueError("El tamaño de bloque debe ser positivo")
+        self.rejilla = rejilla or _rejilla_cuadrada(len(direcciones))
+        if self.rejilla[0] * self.rejilla[1] != len(direcciones):
+            raise ValueError(f"La rejilla {self.rejilla[0]}×{self.rejilla[1]} no coincide con "
+                             f"{len(direcciones)} trabajadores")
+
+        self.direcciones = list(direcciones)
+        self.tam_bloque = tam_bloque
+        self._contador = itertools.count()
+        # Identificadores de matrices recogidas cuyos bloques aún no se han eliminado
+        self._por_liberar: deque = deque()
+        self._conexiones = [_Conexion(direccion) for direccion in self.direcciones]
+        self._hilos = ThreadPoolExecutor(len(self._conexiones), thread_name_prefix='coordinador')
+
+        configuracion = {'pares': self.direcciones, 'rejilla': list(self.rejilla), 'bloque': tam_bloque}
+        for indice, conexion in enumerate(self._conexiones):
+            conexion.solicitar(OP_CONFIGURAR, {**configuracion, 'indice': indice})
+
+    def propietario(self, i: int, j: int) -> int:
+        """Índice del trabajador que guarda el bloque (i, j)."""
+        return _propietario(i, j, self.rejilla)
+
+    def distribuir(self, matriz: Union[MatrizNumPy, np.ndarray]) -> 'MatrizDistribuida':
+        """
+        Reparte una matriz local entre los trabajadores, bloque a bloque.
+
+        Acepta arrays en memoria o mapeados (``np.load(..., mmap_mode='r')``):
+        solo se lee cada bloque en el momento de enviarlo.
+
+        Parameters:
+            matriz (Union[MatrizNumPy, np.ndarray]): Matriz a repartir
+
+        Returns:
+            MatrizDistribuida: Referencia a la matriz repartida
+        """
+        datos = getattr(matriz, 'datos', matriz)
+        if datos.ndim != 2:
+            raise ValueError("Solo se pueden distribuir matrices 2D")
+        resultado = self._nueva(*datos.shape)
+        b = self.tam_bloque
+
+        def enviar(indice):
+            conexion = self._conexiones[indice]
+            for i, j in resultado.bloques_de(indice):
+                conexion.solicitar(OP_PONER, {'id': resultado.id, 'i': i, 'j': j},
+                                   np.ascontiguousarray(datos[i * b:(i + 1) * b, j * b:(j + 1) * b]))
+
+        self._en_paralelo(enviar)
+        return resultado
+
+    def crear(self, filas: int, columnas: int, tipo: str = 'ceros',
+              semilla: Optional[int] = None) -> 'MatrizDistribuida':
+        """
+        Crea una matriz directamente en los trabajadores.
+
+        Parameters:
+            filas (int): Número de filas
+            columnas (int): Número de columnas
+            tipo (str): 'ceros', 'unos', 'identidad' o 'aleatoria' (uniforme en [0, 1))
+            semilla (Optional[int]): Semilla de 'aleatoria'; el resultado no
+                depende del número de trabajadores
+
+        Returns:
+            MatrizDistribuida: Matriz creada
+        """
+        if filas < 1 or columnas < 1:
+            raise ValueError("Las dimensiones deben ser positivas")
+        if tipo not in ('ceros', 'unos', 'identidad', 'aleatoria'):
+            raise ValueError(f"Tipo de matriz desconocido: '{tipo}'")
+        resultado = self._nueva(filas, columnas)
+        self._en_todos(OP_CREAR, {**resultado._describir(), 'tipo': tipo,
+                                  'semilla': semilla if semilla is not None else np.random.SeedSequence().entropy})
+        return resultado
+
+    def estado(self) -> List[Dict]:
+        """Bloques y bytes guardados en cada trabajador."""
+        return [json.loads(texto) for texto, _ in self._en_todos(OP_ESTADO, {})]
+
+    def cerrar(self) -> None:
+        """Elimina los bloques pendientes de liberar y cierra las conexiones."""
+        try:
+            self._liberar_pendientes()
+        except (ValueError, OSError):
+            pass
+        self._hilos.shutdown()
+        for conexion in self._conexiones:
+            conexion.cerrar()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excepcion):
+        self.cerrar()
+
+    # ============ MÉTODOS PRIVADOS ============
+
+    def _nueva(self, filas: int, columnas: int) -> 'MatrizDistribuida':
+        return MatrizDistribuida(self, f"m{next(self._contador)}", filas, columnas)
+
+    def _en_paralelo(self, funcion) -> List:
+        """Ejecuta ``funcion(indice)`` para cada trabajador a la vez."""
+        return list(self._hilos.map(funcion, range(len(self._conexiones))))
+
+    def _en_todos(self, operacion: int, argumentos: Dict) -> List[Tuple[str, Optional[np.ndarray]]]:
+        """Envía la misma orden a todos los trabajadores y espera las respuestas."""
+        self._liberar_pendientes()
+        return self._difundir(operacion, argumentos)
+
+    def _difundir(self, operacion: int, argumentos: Dict) -> List[Tuple[str, Optional[np.ndarray]]]:
+        return self._en_paralelo(lambda indice: self._conexiones[indice].solicitar(operacion, argumentos))
+
+    def _liberar_pendientes(self) -> None:
+        """Elimina en los trabajadores los bloques de las matrices ya recogidas."""
+        identificadores = []
+        while self._por_liberar:
+            identificadores.append(self._por_liberar.popleft())
+        if identificadores:
+            self._difundir(OP_ELIMINAR, {'ids': identificadores})
+
+
+class MatrizDistribuida:
+    """Referencia a una matriz repartida por bloques en un ``ClusterBloques``."""
+
+    def __init__(self, cluster: ClusterBloques, identificador: str, filas: int, columnas: int):
+        self.cluster = cluster
+        self.id = identificador
+        self.filas = filas
+        self.columnas = columnas
+        # Solo apunta el identificador: la orden se envía con la siguiente del cluster
+        self._finalizador = weakref.finalize(self, cluster._por_liberar.append, identificador)
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return (self.filas, self.columnas)
+
+    @property
+    def bloques_por_dimension(self) -> Tuple[int, int]:
+        b = self.cluster.tam_bloque
+        return (-(-self.filas // b), -(-self.columnas // b))
+
+    def bloques_de(self, trabajador: int) -> Iterator[Tuple[int, int]]:
+        """Índices de los bloques que guarda un trabajador."""
+        return _bloques_de(trabajador, self.bloques_por_dimension, self.cluster.rejilla)
+
+    # ============ OPERACIONES ============
+
+    def __matmul__(self, otra: 'MatrizDistribuida') -> 'MatrizDistribuida':
+        if not isinstance(otra, MatrizDistribuida):
+            return NotImplemented
+        self._mismo_cluster(otra)
+        if self.columnas != otra.filas:
+            raise ValueError(f"Para multiplicar matrices, las columnas de la primera ({self.columnas}) "
+                             f"deben ser iguales a las filas de la segunda ({otra.filas})")
+        resultado = self.cluster._nueva(self.filas, otra.columnas)
+        self.cluster._en_todos(OP_MATMUL, {'a': self._describir(), 'b': otra._describir(),
+                                           'c': resultado._describir()})
+        return resultado
+
+    def transponer(self) -> 'MatrizDistribuida':
+        """Transpuesta; cada bloque se calcula en el trabajador que lo guardará."""
+        resultado = self.cluster._nueva(self.columnas, self.filas)
+        self.cluster._en_todos(OP_TRANSPONER, {'a': self._describir(), 'c': resultado._describir()})
+        return resultado
+
+    @property
+    def T(self) -> 'MatrizDistribuida':
+        return self.transponer()
+
+    def __add__(self, otra):
+        return self._elemental('+', otra)
+
+    def __sub__(self, otra):
+        return self._elemental('-', otra)
+
+    def __mul__(self, otra):
+        return self._elemental('*', otra)
+
+    def __rmul__(self, escalar):
+        return self._elemental('*', escalar)
+
+    def __truediv__(self, escalar):
+        if isinstance(escalar, MatrizDistribuida):
+            raise ValueError("Solo se puede dividir entre un escalar")
+        return self._elemental('/', escalar)
+
+    def __neg__(self):
+        return self._elemental('*', -1)
+
+    # ============ REDUCCIONES ============
+
+    def suma(self) -> Escalar:
+        """Suma de todos los elementos."""
+        return sum(parcial['suma'] for parcial in self._reducir())
+
+    def norma(self) -> float:
+        """Norma de Frobenius."""
+        return math.sqrt(sum(parcial['cuadrados'] for parcial in self._reducir()))
+
+    def maximo(self) -> Escalar:
+        """
+        Mayor elemento.
+
+        Raises:
+            ValueError: Si la matriz está vacía
+        """
+        return max(parcial['maximo'] for parcial in self._reducir_no_vacia('máximo'))
+
+    def minimo(self) -> Escalar:
+        """
+        Menor elemento.
+
+        Raises:
+            ValueError: Si la matriz está vacía
+        """
+        return min(parcial['minimo'] for parcial in self._reducir_no_vacia('mínimo'))
+
+    # ============ TRANSFERENCIA ============
+
+    def bloques(self) -> Iterator[Tuple[int, int, np.ndarray]]:
+        """
+        Recorre los bloques por filas, pidiéndolos uno a uno.
+
+        Yields:
+            Tuple[int, int, np.ndarray]: Fila y columna del bloque, y sus datos
+        """
+        filas_bloque, columnas_bloque = self.bloques_por_dimension
+        for i in range(filas_bloque):
+            for j in range(columnas_bloque):
+                conexion = self.cluster._conexiones[self.cluster.propietario(i, j)]
+                yield i, j, conexion.solicitar(OP_OBTENER, {'id': self.id, 'i': i, 'j': j})[1]
+
+    def guardar(self, ruta: str) -> None:
+        """
+        Escribe la matriz en un archivo .npy bloque a bloque, sin reunirla en memoria.
+
+        Parameters:
+            ruta (str): Archivo de destino
+        """
+        destino = None
+        b = self.cluster.tam_bloque
+        for i, j, bloque in self.bloques():
+            if destino is None:
+                destino = np.lib.format.open_memmap(ruta, mode='w+', dtype=bloque.dtype, shape=self.shape)
+            destino[i * b:i * b + bloque.shape[0], j * b:j * b + bloque.shape[1]] = bloque
+        destino.flush()
+        del destino
+
+    def reunir(self) -> MatrizNumPy:
+        """Trae la matriz completa al coordinador."""
+        b = self.cluster.tam_bloque
+        partes: Dict[Tuple[int, int], np.ndarray] = {}
+
+        def traer(indice):
+            conexion = self.cluster._conexiones[indice]
+            for i, j in self.bloques_de(indice):
+                partes[(i, j)] = conexion.solicitar(OP_OBTENER, {'id': self.id, 'i': i, 'j': j})[1]
+
+        self.cluster._en_paralelo(traer)
+        dtype = np.result_type(*partes.values())
+        datos = np.empty(self.shape, dtype=dtype)
+        for (i, j), bloque in partes.items():
+            datos[i * b:i * b + bloque.shape[0], j * b:j * b + bloque.shape[1]] = bloque
+
+        resultado = MatrizNumPy(self.filas, self.columnas, dtype=dtype, inicializar_ceros=False)
+        resultado.datos = datos
+        return resultado
+
+    def liberar(self) -> None:
+        """Elimina los bloques de los trabajadores."""
+        self._finalizador.detach()
+        self.cluster._en_todos(OP_ELIMINAR, {'ids': [self.id]})
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excepcion):
+        self.liberar()
+
+    def __str__(self) -> str:
+        return f"MatrizDistribuida({self.id}, {self.filas}×{self.columnas})"
+
+    # ============ MÉTODOS PRIVADOS ============
+
+    def _describir(self) -> Dict:
+        return {'id': self.id, 'filas': self.filas, 'columnas': self.columnas}
+
+    def _mismo_cluster(self, otra: 'MatrizDistribuida') -> None:
+        if otra.cluster is not self.cluster:
+            raise ValueError("Las matrices pertenecen a clusters distintos")
+
+    def _elemental(self, operador: str, otra) -> 'MatrizDistribuida':
+        argumentos = {'op': operador, 'a': self._describir()}
+        if isinstance(otra, MatrizDistribuida):
+            self._mismo_cluster(otra)
+            if otra.shape != self.shape:
+                raise ValueError(f"Las matrices deben tener las mismas dimensiones: "
+                                 f"{self.filas}×{self.columnas} y {otra.filas}×{otra.columnas}")
+            argumentos['b'] = otra._describir()
+        elif isinstance(otra, (int, float)) and not isinstance(otra, bool):
+            argumentos['escalar'] = otra
+        else:
+            return NotImplemented
+        if operador == '/' and 'escalar' in argumentos and otra == 0:
+            raise ZeroDivisionError("División entre cero")
+
+        resultado = self.cluster._nueva(self.filas, self.columnas)
+        argumentos['c'] = resultado._describir()
+        self.cluster._en_todos(OP_ELEMENTAL, argumentos)
+        return resultado
+
+    def _reducir(self) -> List[Dict]:
+        return [json.loads(texto) for texto, _ in self.cluster._en_todos(OP_REDUCIR, {'a': self._describir()})]
+
+    def _reducir_no_vacia(self, nombre: str) -> List[Dict]:
+        """Reducciones parciales de los trabajadores que guardan algún elemento."""
+        parciales = [parcial for parcial in self._reducir() if parcial['elementos']]
+        if not parciales:
+            raise ValueError(f"La matriz {self.filas}×{self.columnas} está vacía: no tiene {nombre}")
+        return parciales
+
+
+# ============ TRABAJADOR ============
+
+class TrabajadorBloques:
+    """Proceso trabajador: guarda bloques y ejecuta las órdenes del coordinador."""
+
+    def __init__(self, direccion: str = '127.0.0.1:0'):
+        """
+        Reserva la dirección de escucha.
+
+        Parameters:
+            direccion (str): ``host:puerto`` (puerto 0: uno libre)
+        """
+        self._servidor = _ServidorTCP(_analizar(direccion), _ManejadorTrabajador)
+        self._servidor.trabajador = self
+        self.direccion = "{}:{}".format(*self._servidor.server_address[:2])
+        self.bloques: Dict[Tuple[str, int, int], np.ndarray] = {}
+        self.indice = 0
+        self.pares: List[str] = []
+        self.rejilla = (1, 1)
+        self.tam_bloque = TAM_BLOQUE_DISTRIBUIDO
+        self._conexiones_pares: Dict[int, _Conexion] = {}
+        self._cerrojo_pares = threading.Lock()
+        self._hilo: Optional[threading.Thread] = None
+
+    def iniciar(self) -> None:
+        """Atiende conexiones hasta que se llame a ``detener``."""
+        self._servidor.serve_forever()
+
+    def iniciar_en_segundo_plano(self) -> None:
+        """Atiende conexiones en un hilo aparte."""
+        self._hilo = threading.Thread(target=self.iniciar, daemon=True)
+        self._hilo.start()
+
+    def detener(self) -> None:
+        """Cierra el servidor y las conexiones con otros trabajadores."""
+        if self._hilo is not None:
+            self._servidor.shutdown()
+            self._hilo.join()
+        self._servidor.server_close()
+        for conexion in self._conexiones_pares.values():
+            conexion.cerrar()
+
+    def atender(self, operacion: int, texto: str, matriz: Optional[np.ndarray]) -> bytes:
+        """
+        Ejecuta una orden y devuelve la respuesta codificada.
+
+        Parameters:
+            operacion (int): Código de operación (``OP_*``)
+            texto (str): Argumentos en JSON
+            matriz (Optional[np.ndarray]): Bloque adjunto (PONER)
+
+        Returns:
+            bytes: Respuesta
+        """
+        try:
+            argumentos = json.loads(texto) if texto else {}
+            if operacion == OP_OBTENER:
+                return codificar_mensaje(RESP_MATRIZ, matriz=self._bloque(argumentos['id'], argumentos['i'],
+                                                                          argumentos['j']))
+            if operacion == OP_PONER:
+                self.bloques[(argumentos['id'], argumentos['i'], argumentos['j'])] = matriz
+                return codificar_mensaje(RESP_OK)
+            if operacion == OP_REDUCIR:
+                return codificar_mensaje(RESP_OK, json.dumps(self._reducir(argumentos['a'])))
+            if operacion == OP_ESTADO:
+                estado = {'bloques': len(self.bloques), 'bytes': sum(b.nbytes for b in self.bloques.values())}
+                return codificar_mensaje(RESP_OK, json.dumps(estado))
+
+            ordenes = {
+                OP_CONFIGURAR: self._configurar,
+                OP_CREAR: self._crear,
+                OP_TRANSPONER: self._transponer,
+                OP_ELEMENTAL: self._elemental,
+                OP_MATMUL: self._matmul,
+                OP_ELIMINAR: self._eliminar,
+            }
+            if operacion not in ordenes:
+                raise ValueError(f"Operación desconocida: {operacion}")
+            ordenes[operacion](argumentos)
+            return codificar_mensaje(RESP_OK)
+        except (ValueError, KeyError, TypeError, ZeroDivisionError, MemoryError, ConnectionError) as e:
+            return codificar_mensaje(RESP_ERROR, f"Trabajador {self.indice}: {type(e).__name__}: {e}")
+
+    # ============ ÓRDENES ============
+
+    def _configurar(self, argumentos: Dict) -> None:
+        self.indice = argumentos['indice']
+        self.pares = argumentos['pares']
+        self.rejilla = tuple(argumentos['rejilla'])
+        self.tam_bloque = argumentos['bloque']
+
+    def _crear(self, argumentos: Dict) -> None:
+        for i, j in self._mis_bloques(argumentos):
+            forma = self._forma_bloque(argumentos, i, j)
+            tipo = argumentos['tipo']
+            if tipo == 'ceros':
+                bloque = np.zeros(forma)
+            elif tipo == 'unos':
+                bloque = np.ones(forma)
+            elif tipo == 'identidad':
+                bloque = np.eye(*forma) if i == j else np.zeros(forma)
+            else:
+                # Semilla por bloque: el resultado no depende de la rejilla
+                bloque = np.random.default_rng([argumentos['semilla'], i, j]).random(forma)
+            self.bloques[(argumentos['id'], i, j)] = bloque
+
+    def _transponer(self, argumentos: Dict) -> None:
+        a, c = argumentos['a'], argumentos['c']
+        for i, j in self._mis_bloques(c):
+            self.bloques[(c['id'], i, j)] = np.ascontiguousarray(self._bloque(a['id'], j, i).T)
+
+    def _elemental(self, argumentos: Dict) -> None:
+        funcion = OPERACIONES_ELEMENTALES[argumentos['op']]
+        a, c = argumentos['a'], argumentos['c']
+        for i, j in self._mis_bloques(c):
+            segundo = self._bloque(argumentos['b']['id'], i, j) if 'b' in argumentos else argumentos['escalar']
+            self.bloques[(c['id'], i, j)] = funcion(self._bloque(a['id'], i, j), segundo)
+
+    def _matmul(self, argumentos: Dict) -> None:
+        """C(I,J) = Σ_K A(I,K)·B(K,J) para los bloques de C propios."""
+        a, b, c = argumentos['a'], argumentos['b'], argumentos['c']
+        bloques_k = -(-a['columnas'] // self.tam_bloque)
+        columnas_b: Dict[Tuple[int, int], np.ndarray] = {}
+        fila_actual, fila_a = None, {}
+
+        for i, j in sorted(self._mis_bloques(c)):
+            if i != fila_actual:
+                # Solo se conserva el panel de A de la fila de bloques en curso
+                fila_actual, fila_a = i, {}
+            acumulado = None
+            for k in range(bloques_k):
+                if k not in fila_a:
+                    fila_a[k] = self._bloque(a['id'], i, k)
+                if (k, j) not in columnas_b:
+                    columnas_b[(k, j)] = self._bloque(b['id'], k, j)
+                producto = fila_a[k] @ columnas_b[(k, j)]
+                acumulado = producto if acumulado is None else acumulado + producto
+            self.bloques[(c['id'], i, j)] = acumulado
+
+    def _reducir(self, a: Dict) -> Dict:
+        parcial = {'suma': 0, 'cuadrados': 0.0, 'maximo': None, 'minimo': None, 'elementos': 0}
+        for i, j in self._mis_bloques(a):
+            bloque = self.bloques[(a['id'], i, j)]
+            if np.iscomplexobj(bloque):
+                raise ValueError("Las reducciones distribuidas requieren datos reales")
+            parcial['suma'] += bloque.sum().item()
+            parcial['cuadrados'] += float(np.vdot(bloque, bloque))
+            maximo, minimo = bloque.max().item(), bloque.min().item()
+            parcial['maximo'] = maximo if parcial['maximo'] is None else max(parcial['maximo'], maximo)
+            parcial['minimo'] = minimo if parcial['minimo'] is None else min(parcial['minimo'], minimo)
+            parcial['elementos'] += bloque.size
+        return parcial
+
+    def _eliminar(self, argumentos: Dict) -> None:
+        identificadores = set(argumentos['ids'])
+        for clave in [clave for clave in self.bloques if clave[0] in identificadores]:
+            del self.bloques[clave]
+
+    # ============ MÉTODOS PRIVADOS ============
+
+    def _mis_bloques(self, descripcion: Dict) -> Iterator[Tuple[int, int]]:
+        b = self.tam_bloque
+        dimensiones = (-(-descripcion['filas'] // b), -(-descripcion['columnas'] // b))
+        return _bloques_de(self.indice, dimensiones, self.rejilla)
+
+    def _forma_bloque(self, descripcion: Dict, i: int, j: int) -> Tuple[int, int]:
+        b = self.tam_bloque
+        return (min(b, descripcion['filas'] - i * b), min(b, descripcion['columnas'] - j * b))
+
+    def _bloque(self, identificador: str, i: int, j: int) -> np.ndarray:
+        """Un bloque propio o, si pertenece a otro trabajador, pedido a ese trabajador."""
+        propietario = _propietario(i, j, self.rejilla)
+        if propietario == self.indice:
+            bloque = self.bloques.get((identificador, i, j))
+            if bloque is None:
+                raise ValueError(f"No existe el bloque ({i}, {j}) de '{identificador}'")
+            return bloque
+
+        with self._cerrojo_pares:
+            if propietario not in self._conexiones_pares:
+                self._conexiones_pares[propietario] = _Conexion(self.pares[propietario])
+            conexion = self._conexiones_pares[propietario]
+        return conexion.solicitar(OP_OBTENER, {'id': identificador, 'i': i, 'j': j})[1]
+
+
+class TrabajadoresLocales:
+    """Lanza trabajadores como procesos en localhost (pruebas y una sola máquina)."""
+
+    def __init__(self, cantidad: int):
+        """
+        Inicia los procesos y espera a que escuchen.
+
+        Parameters:
+            cantidad (int): Número de trabajadores
+        """
+        self.procesos: List[multiprocessing.Process] = []
+        self.direcciones: List[str] = []
+        for _ in range(cantidad):
+            receptor, emisor = multiprocessing.Pipe(duplex=False)
+            proceso = multiprocessing.Process(target=_ejecutar_trabajador, args=(emisor,), daemon=True)
+            proceso.start()
+            self.procesos.append(proceso)
+            self.direcciones.append(receptor.recv())
+
+    def detener(self) -> None:
+        """Termina los procesos."""
+        for proceso in self.procesos:
+            proceso.terminate()
+        for proceso in self.procesos:
+            proceso.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excepcion):
+        self.detener()
+
+
+# ============ MÉTODOS PRIVADOS ============
+
+class _Conexion:
+    """Conexión síncrona con un trabajador, segura entre hilos."""
+
+    def __init__(self, direccion: str):
+        self._socket = socket.create_connection(_analizar(direccion))
+        self._socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._entrada = self._socket.makefile('rb')
+        self._salida = self._socket.makefile('wb')
+        self._cerrojo = threading.Lock()
+
+    def solicitar(self, operacion: int, argumentos: Dict,
+                  matriz: Optional[np.ndarray] = None) -> Tuple[str, Optional[np.ndarray]]:
+        with self._cerrojo:
+            self._salida.write(codificar_mensaje(operacion, json.dumps(argumentos), matriz))
+            self._salida.flush()
+            respuesta = leer_mensaje(self._entrada, lambda estado: estado == RESP_MATRIZ)
+        if respuesta is None:
+            raise ConnectionError("El trabajador cerró la conexión")
+        estado, texto, bloque = respuesta
+        if estado == RESP_ERROR:
+            raise ValueError(texto)
+        return texto, bloque
+
+    def cerrar(self) -> None:
+        self._entrada.close()
+        self._salida.close()
+        self._socket.close()
+
+
+class _ManejadorTrabajador(socketserver.StreamRequestHandler):
+    """Atiende las órdenes de una conexión (coordinador u otro trabajador)."""
+
+    wbufsize = 1 << 16
+
+    def setup(self):
+        super().setup()
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def handle(self):
+        trabajador = self.server.trabajador
+        con_matriz = (OP_PONER,).__contains__
+        while True:
+            try:
+                mensaje = leer_mensaje(self.rfile, con_matriz)
+            except (ValueError, OSError):
+                return
+            if mensaje is None:
+                return
+            try:
+                self.wfile.write(trabajador.atender(*mensaje))
+                self.wfile.flush()
+            except OSError:
+                return
+
+
+class _ServidorTCP(socketserver.ThreadingMixIn, socketserver.TCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+def _propietario(i: int, j: int, rejilla: Tuple[int, int]) -> int:
+    return (i % rejilla[0]) * rejilla[1] + (j % rejilla[1])
+
+
+def _bloques_de(trabajador: int, dimensiones: Tuple[int, int], rejilla: Tuple[int, int]
+                ) -> Iterator[Tuple[int, int]]:
+    fila, columna = divmod(trabajador, rejilla[1])
+    for i in range(fila, dimensiones[0], rejilla[0]):
+        for j in range(columna, dimensiones[1], rejilla[1]):
+            yield i, j
+
+
+def _rejilla_cuadrada(cantidad: int) -> Tuple[int, int]:
+    filas = max(d for d in range(1, math.isqrt(cantidad) + 1) if cantidad % d == 0)
+    return filas, cantidad // filas
+
+
+def _analizar(direccion: str) -> Tuple[str, int]:
+    host, separador, puerto = direccion.rpartition(':')
+    try:
+        return host or '127.0.0.1', int(puerto)
+    except ValueError:
+        raise ValueError(f"Dirección no válida: '{direccion}' (se esperaba host:puerto)")
+
+
+def _ejecutar_trabajador(emisor) -> None:
+    """Punto de entrada de los procesos de ``TrabajadoresLocales``."""
+    trabajador = TrabajadorBloques('127.0.0.1:0')
+    emisor.send(trabajador.direccion)
+    emisor.close()
+    trabajador.iniciar()
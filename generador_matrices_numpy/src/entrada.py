@@ -0,0 +1,209 @@
+"""
+Análisis de Texto Numérico
+==========================
+
+Conversión en bloque de texto pegado o escrito por el usuario (filas en
+líneas, elementos separados por tabuladores, punto y coma, comas o
+espacios) a arrays de NumPy.
+
+- Todos los elementos del bloque se convierten con una sola llamada a
+  ``np.array(..., dtype=np.float64)``, que analiza los textos en C.
+- Solo si esa conversión falla (fracciones como ``3/4`` o errores) se
+  recurre a analizar elemento por elemento, anotando la fila y la columna
+  de cada texto inválido en lugar de detenerse en el primero.
+- Las fracciones se convierten a float, igual que en ``MatrizNumPy``.
+- ``leer_filas`` pide una matriz línea a línea en la consola (una fila
+  por línea, un bloque pegado o un archivo redirigido). En una terminal
+  cada fila se analiza al escribirla, para avisar del error enseguida; en
+  un archivo o tubería se analiza cada tanda de líneas de una vez.
+
+Autor: Nicolas
+"""
+
+import sys
+from fractions import Fraction
+import numpy as np
+from typing import Callable, List, Optional, Sequence, Tuple
+
+# (fila, columna, texto) de un elemento inválido, con índices desde 0
+ErrorElemento = Tuple[int, int, str]
+
+
+def dividir_linea(linea: str) -> List[str]:
+    """
+    Separa los elementos de una línea.
+
+    Reconoce tabuladores (copiado desde una hoja de cálculo), punto y coma,
+    comas o espacios, en ese orden de preferencia.
+
+    Parameters:
+        linea (str): Línea de texto
+
+    Returns:
+        List[str]: Texto de cada elemento
+    """
+    for separador in ('\t', ';', ','):
+        if separador in linea:
+            return [parte.strip() for parte in linea.split(separador)]
+    return linea.split()
+
+
+def convertir_numero(texto: str) -> float:
+    """
+    Convierte un elemento (entero, decimal o fracción) a float.
+
+    Raises:
+        ValueError: Si el texto no es un número válido
+    """
+    texto = texto.strip()
+    try:
+        if '/' in texto:
+            return float(Fraction(texto))
+        return float(texto)
+    except (ValueError, ZeroDivisionError):
+        raise ValueError(f"Número inválido: '{texto}'")
+
+
+def convertir_elementos(textos: Sequence[str]) -> Tuple[np.ndarray, List[int]]:
+    """
+    Convierte una secuencia de textos en un vector float64.
+
+    Parameters:
+        textos (Sequence[str]): Elementos a convertir
+
+    Returns:
+        Tuple[np.ndarray, List[int]]: Valores (NaN en los inválidos) e
+        índices de los elementos inválidos
+    """
+    try:
+        return np.array(textos, dtype=np.float64), []
+    except ValueError:
+        pass
+
+    valores = np.empty(len(textos), dtype=np.float64)
+    invalidos = []
+    for indice, texto in enumerate(textos):
+        try:
+            valores[indice] = convertir_numero(texto)
+        except ValueError:
+            valores[indice] = np.nan
+            invalidos.append(indice)
+    return valores, invalidos
+
+
+def analizar_bloque(texto: str) -> Tuple[List[np.ndarray], List[ErrorElemento]]:
+    """
+    Convierte un bloque con una fila por línea (las líneas vacías se ignoran).
+
+    Parameters:
+        texto (str): Bloque de texto
+
+    Returns:
+        Tuple[List[np.ndarray], List[ErrorElemento]]: Una fila de valores por
+        línea (pueden tener longitudes distintas) y los elementos inválidos
+    """
+    partes = [dividir_linea(linea) for linea in texto.splitlines() if linea.strip()]
+    longitudes = [len(fila) for fila in partes]
+    valores, invalidos = convertir_elementos([elemento for fila in partes for elemento in fila])
+
+    inicios = np.cumsum([0] + longitudes)
+    filas = [valores[inicio:inicio + longitud] for inicio, longitud in zip(inicios, longitudes)]
+
+    errores = []
+    for indice in invalidos:
+        fila = int(np.searchsorted(inicios, indice, side='right')) - 1
+        errores.append((fila, indice - int(inicios[fila]), partes[fila][indice - inicios[fila]]))
+    return filas, errores
+
+
+def analizar_matriz(texto: str) -> np.ndarray:
+    """
+    Convierte un bloque en una matriz, exigiendo filas de igual longitud.
+
+    Parameters:
+        texto (str): Bloque de texto con una fila por línea
+
+    Returns:
+        np.ndarray: Matriz float64
+
+    Raises:
+        ValueError: Con un mensaje por cada fila con elementos inválidos o
+            con un número de columnas distinto al de la primera
+    """
+    filas, errores = analizar_bloque(texto)
+    if not filas:
+        raise ValueError("No se ingresó ninguna fila")
+
+    mensajes = [f"Fila {fila + 1}, columna {columna + 1}: '{elemento}' no es un número"
+                for fila, columna, elemento in errores]
+    columnas = len(filas[0])
+    mensajes += [f"Fila {indice + 1}: tiene {len(fila)} elementos, esperaba {columnas}"
+                 for indice, fila in enumerate(filas) if len(fila) != columnas]
+    if mensajes:
+        raise ValueError("\n".join(mensajes))
+    return np.vstack(filas)
+
+
+def leer_filas(filas: int, columnas: int, leer: Callable[[str], str] = input,
+               escribir: Callable[[str], None] = print,
+               interactivo: Optional[bool] = None) -> np.ndarray:
+    """
+    Lee una matriz fila a fila: cada línea es una fila completa.
+
+    Se puede escribir una fila por línea o pegar un bloque de varias líneas
+    (una línea vacía lo termina antes de tiempo); la entrada también puede
+    venir de un archivo o tubería. Solo se vuelven a pedir las filas con
+    elementos inválidos o con un número de elementos distinto.
+
+    En modo interactivo cada línea se analiza en cuanto llega, de modo que
+    un error en la fila 2 se avisa antes de escribir la 3. Si no, cada
+    tanda de líneas se convierte con una sola llamada a ``analizar_bloque``.
+
+    Parameters:
+        filas (int): Número de filas a leer
+        columnas (int): Elementos de cada fila
+        leer (Callable): Lee una línea dado un mensaje (default: input)
+        escribir (Callable): Muestra los errores de cada fila (default: print)
+        interactivo (Optional[bool]): Analizar línea a línea (default: si
+            ``leer`` es ``input`` y la entrada estándar es una terminal)
+
+    Returns:
+        np.ndarray: Matriz float64 de filas × columnas
+
+    Raises:
+        ValueError: Si la entrada termina antes de completar la matriz
+    """
+    if interactivo is None:
+        interactivo = leer is input and sys.stdin is not None and sys.stdin.isatty()
+    datos = np.empty((filas, columnas), dtype=np.float64)
+    pendientes = list(range(filas))
+
+    while pendientes:
+        lineas = []
+        while len(lineas) < (1 if interactivo else len(pendientes)):
+            try:
+                linea = leer(f"  Fila {pendientes[len(lineas)] + 1}: ")
+            except EOFError:
+                leidas = filas - len(pendientes) + len(lineas)
+                raise ValueError(f"La entrada terminó con {leidas} de {filas} filas")
+            if linea.strip():
+                lineas.append(linea)
+            elif lineas:
+                break
+
+        valores, errores = analizar_bloque("\n".join(lineas))
+        invalidas = {}
+        for fila, columna, elemento in errores:
+            invalidas.setdefault(fila, f"'{elemento}' (columna {columna + 1}) no es un número")
+        for indice, fila in enumerate(valores):
+            if indice not in invalidas and len(fila) != columnas:
+                invalidas[indice] = f"tiene {len(fila)} elementos, se esperaban {columnas}"
+
+        for indice, mensaje in sorted(invalidas.items()):
+            escribir(f"❌ Fila {pendientes[indice] + 1}: {mensaje}")
+        validas = [indice for indice in range(len(valores)) if indice not in invalidas]
+        if validas:
+            datos[[pendientes[indice] for indice in validas]] = np.vstack([valores[indice] for indice in validas])
+        pendientes = [pendientes[indice] for indice in sorted(invalidas)] + pendientes[len(valores):]
+
+    return datos
@@ -0,0 +1,369 @@
+"""
+Matrices Estructuradas Implícitas
+=================================
+
+Representaciones que guardan solo los generadores de la matriz en lugar de
+sus n² elementos:
+
+- ``MatrizToeplitz``: primera columna y primera fila; producto O(n log n)
+  embebiendo la matriz en una circulante y usando la FFT.
+- ``MatrizCirculante``: primera columna; producto y resolución O(n log n)
+  mediante su diagonalización por la FFT.
+- ``MatrizKronecker``: factores A y B; (A⊗B)·x se calcula como A·X·Bᵀ
+  reorganizando x, sin formar el producto de Kronecker.
+- ``MatrizInversa``: A⁻¹ representada por la factorización LU de A;
+  A⁻¹·x es una resolución O(n²) en lugar de formar la inversa.
+
+Todas se combinan con ``@`` con MatrizNumPy (en ambos órdenes) y con arrays
+de NumPy, y se pueden pasar a ``algebra_lineal.gradiente_conjugado``.
+
+Autor: Nicolas
+"""
+
+import numpy as np
+from abc import ABC, abstractmethod
+from typing import Optional, Tuple, Union
+
+from .matriz_numpy import MatrizNumPy
+from .algebra_lineal import factorizar_lu, resolver_lu
+
+
+class MatrizImplicita(ABC):
+    """
+    Clase base para operadores lineales que no almacenan sus elementos.
+
+    Las subclases implementan ``matvec`` (producto por un vector o por una
+    matriz de columnas) y ``transponer``; el resto de operaciones se derivan
+    de ellas.
+
+    Attributes:
+        filas (int): Número de filas
+        columnas (int): Número de columnas
+        dtype (np.dtype): Tipo de datos resultante de los productos
+    """
+
+    # Hace que ndarray @ MatrizImplicita delegue en __rmatmul__
+    __array_ufunc__ = None
+
+    def __init__(self, filas: int, columnas: int, dtype: np.dtype):
+        self.filas = filas
+        self.columnas = columnas
+        self.dtype = np.dtype(dtype)
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        """Devuelve la forma (dimensiones) de la matriz."""
+        return (self.filas, self.columnas)
+
+    @property
+    def costo_matvec(self) -> float:
+        """Estimación de operaciones de punto flotante de un producto por vector."""
+        return float(self.filas * self.columnas)
+
+    def es_cuadrada(self) -> bool:
+        """Verifica si la matriz es cuadrada."""
+        return self.filas == self.columnas
+
+    @abstractmethod
+    def matvec(self, x: np.ndarray) -> np.ndarray:
+        """Calcula A·x para un vector (n,) o una matriz de columnas (n, k)."""
+
+    @abstractmethod
+    def transponer(self) -> 'MatrizImplicita':
+        """Devuelve la transpuesta como otra matriz implícita."""
+
+    def a_densa(self) -> MatrizNumPy:
+        """Materializa la matriz como MatrizNumPy (O(n²) memoria)."""
+        return MatrizNumPy(self.matvec(np.eye(self.columnas, dtype=self.dtype)))
+
+    def __matmul__(self, otra: Union[MatrizNumPy, np.ndarray]) -> Union[MatrizNumPy, np.ndarray]:
+        """Producto A @ otra sin materializar A."""
+        if isinstance(otra, MatrizNumPy):
+            self._validar_producto(self.columnas, otra.filas)
+            return MatrizNumPy(self.matvec(otra.datos))
+        if isinstance(otra, np.ndarray):
+            self._validar_producto(self.columnas, otra.shape[0])
+            return self.matvec(otra)
+        return NotImplemented
+
+    def __rmatmul__(self, otra: Union[MatrizNumPy, np.ndarray]) -> Union[MatrizNumPy, np.ndarray]:
+        """Producto otra @ A calculado como (Aᵀ @ otraᵀ)ᵀ."""
+        if isinstance(otra, MatrizNumPy):
+            self._validar_producto(otra.columnas, self.filas)
+            return MatrizNumPy(self.transponer().matvec(otra.datos.T).T)
+        if isinstance(otra, np.ndarray):
+            self._validar_producto(otra.shape[-1], self.filas)
+            return self.transponer().matvec(otra.T).T
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        """Representación técnica de la matriz."""
+        return f"{type(self).__name__}(filas={self.filas}, columnas={self.columnas}, dtype={self.dtype})"
+
+    @staticmethod
+    def _validar_producto(columnas: int, filas: int) -> None:
+        """Valida que las dimensiones sean compatibles para multiplicar."""
+        if columnas != filas:
+            raise ValueError(f"Para multiplicar matrices, las columnas de la primera ({columnas}) "
+                             f"deben ser iguales a las filas de la segunda ({filas})")
+
+
+class MatrizCirculante(MatrizImplicita):
+    """
+    Matriz circulante C[i,j] = c[(i-j) mod n] almacenada por su primera columna.
+
+    La FFT diagonaliza toda matriz circulante: C = F⁻¹·diag(fft(c))·F, así que
+    tanto C·x como C⁻¹·b cuestan O(n log n).
+    """
+
+    def __init__(self, c: Union[list, np.ndarray]):
+        """
+        Parameters:
+            c: Primera columna
+        """
+        self.c = np.asarray(c)
+        if self.c.ndim != 1 or len(self.c) == 0:
+            raise ValueError("La primera columna debe ser un vector no vacío")
+        dtype = np.result_type(self.c.dtype, np.float64)
+        super().__init__(len(self.c), len(self.c), dtype)
+        self._eigenvalores = None
+
+    @property
+    def eigenvalores(self) -> np.ndarray:
+        """Eigenvalores fft(c), calculados una sola vez."""
+        if self._eigenvalores is None:
+            self._eigenvalores = np.fft.fft(self.c)
+        return self._eigenvalores
+
+    @property
+    def costo_matvec(self) -> float:
+        """Dos FFT de tamaño n más el producto diagonal."""
+        n = self.filas
+        return 10.0 * n * max(np.log2(n), 1.0)
+
+    def matvec(self, x: np.ndarray) -> np.ndarray:
+        """Calcula C·x = ifft(fft(c) · fft(x))."""
+        lamb = self.eigenvalores if x.ndim == 1 else self.eigenvalores[:, None]
+        return self._ajustar_tipo(np.fft.ifft(lamb * np.fft.fft(x, axis=0), axis=0), x)
+
+    def resolver(self, b: np.ndarray, tolerancia: float = 1e-12) -> np.ndarray:
+        """
+        Resuelve C·x = b en O(n log n) dividiendo por los eigenvalores.
+
+        Raises:
+            ValueError: Si la matriz es singular
+        """
+        lamb = self.eigenvalores
+        if np.min(np.abs(lamb)) <= tolerancia * np.max(np.abs(lamb)):
+            raise ValueError("La matriz es singular (no invertible)")
+        if b.ndim > 1:
+            lamb = lamb[:, None]
+        return self._ajustar_tipo(np.fft.ifft(np.fft.fft(b, axis=0) / lamb, axis=0), b)
+
+    def transponer(self) -> 'MatrizCirculante':
+        """La transpuesta es circulante con columna c[(-i) mod n]."""
+        return MatrizCirculante(np.roll(self.c[::-1], 1))
+
+    def a_densa(self) -> MatrizNumPy:
+        """Materializa la matriz como MatrizNumPy."""
+        return MatrizNumPy.crear_circulante(self.c, dtype=self.c.dtype)
+
+    def _ajustar_tipo(self, y: np.ndarray, x: np.ndarray) -> np.ndarray:
+        """Descarta la parte imaginaria residual de la FFT si los datos son reales."""
+        if not (np.iscomplexobj(self.c) or np.iscomplexobj(x)):
+            return y.real
+        return y
+
+
+class MatrizToeplitz(MatrizImplicita):
+    """
+    Matriz de Toeplitz T[i,j] = c[i-j] (i ≥ j), r[j-i] (j > i).
+
+    Se almacenan solo la primera columna y la primera fila. El producto se
+    calcula embebiendo T en una circulante de tamaño L ≥ m+n-1 (potencia
+    de dos) y aplicando la FFT.
+    """
+
+    def __init__(self, c: Union[list, np.ndarray], r: Optional[Union[list, np.ndarray]] = None):
+        """
+        Parameters:
+            c: Primera columna
+            r: Primera fila (default: c, matriz simétrica); r[0] se ignora
+        """
+        self.c = np.asarray(c)
+        self.r = self.c if r is None else np.asarray(r)
+        if self.c.ndim != 1 or self.r.ndim != 1 or len(self.c) == 0 or len(self.r) == 0:
+            raise ValueError("La primera columna y la primera fila deben ser vectores no vacíos")
+
+        dtype = np.result_type(self.c.dtype, self.r.dtype, np.float64)
+        super().__init__(len(self.c), len(self.r), dtype)
+        self._longitud = 1 << (self.filas + self.columnas - 2).bit_length()
+        self._espectro = None
+
+    @property
+    def costo_matvec(self) -> float:
+        """Dos FFT de tamaño L más el producto diagonal."""
+        return 10.0 * self._longitud * max(np.log2(self._longitud), 1.0)
+
+    def matvec(self, x: np.ndarray) -> np.ndarray:
+        """Calcula T·x con la circulante embebida."""
+        L = self._longitud
+        real = not np.iscomplexobj(x) and not np.iscomplexobj(self._generador())
+
+        espectro = self._obtener_espectro(real)
+        if x.ndim > 1:
+            espectro = espectro[:, None]
+
+        if real:
+            y = np.fft.irfft(espectro * np.fft.rfft(x, n=L, axis=0), n=L, axis=0)
+        else:
+            y = np.fft.ifft(espectro * np.fft.fft(x, n=L, axis=0), axis=0)
+        return y[:self.filas]
+
+    def transponer(self) -> 'MatrizToeplitz':
+        """La transpuesta intercambia la primera columna y la primera fila."""
+        return MatrizToeplitz(np.concatenate((self.c[:1], self.r[1:])), self.c)
+
+    def precondicionador_circulante(self) -> MatrizCirculante:
+        """
+        Precondicionador circulante de Strang para T cuadrada.
+
+        Copia las diagonales centrales de T en una circulante, de modo que
+        C⁻¹·T tiene los eigenvalores agrupados cerca de 1 y el gradiente
+        conjugado converge en pocas iteraciones.
+        """
+        if not self.es_cuadrada():
+            raise ValueError("El precondicionador requiere una matriz cuadrada")
+        n = self.filas
+        mitad = n // 2
+        columna = np.empty(n, dtype=self.dtype)
+        columna[:mitad + 1] = self.c[:mitad + 1]
+        # c_circ[k] = r[n-k] para k > n/2
+        columna[mitad + 1:] = self.r[1:n - mitad][::-1]
+        return MatrizCirculante(columna)
+
+    def a_densa(self) -> MatrizNumPy:
+        """Materializa la matriz como MatrizNumPy."""
+        return MatrizNumPy.crear_toeplitz(self.c, self.r, dtype=np.result_type(self.c, self.r))
+
+    def _generador(self) -> np.ndarray:
+        """Primera columna de la circulante embebida de tamaño L."""
+        v = np.zeros(self._longitud, dtype=np.result_type(self.c, self.r))
+        v[:self.filas] = self.c
+        if self.columnas > 1:
+            v[self._longitud - (self.columnas - 1):] = self.r[1:][::-1]
+        return v
+
+    def _obtener_espectro(self, real: bool) -> np.ndarray:
+        """FFT (real o compleja) de la circulante embebida, en caché."""
+        if self._espectro is None or self._espectro[0] != real:
+            v = self._generador()
+            self._espectro = (real, np.fft.rfft(v) if real else np.fft.fft(v))
+        return self._espectro[1]
+
+
+class MatrizKronecker(MatrizImplicita):
+    """
+    Producto de Kronecker A⊗B almacenado por sus factores.
+
+    Con x = vec(X) por filas, (A⊗B)·x = vec(A·X·Bᵀ): dos productos pequeños
+    en lugar de uno de tamaño (pa·pb)×(qa·qb).
+    """
+
+    def __init__(self, a: Union[MatrizNumPy, np.ndarray], b: Union[MatrizNumPy, np.ndarray]):
+        """
+        Parameters:
+            a, b: Factores densos (MatrizNumPy o arrays 2D)
+        """
+        self.a = a.datos if isinstance(a, MatrizNumPy) else np.asarray(a)
+        self.b = b.datos if isinstance(b, MatrizNumPy) else np.asarray(b)
+        if self.a.ndim != 2 or self.b.ndim != 2:
+            raise ValueError("Los factores deben ser matrices 2D")
+
+        super().__init__(self.a.shape[0] * self.b.shape[0], self.a.shape[1] * self.b.shape[1],
+                         np.result_type(self.a, self.b))
+
+    @property
+    def costo_matvec(self) -> float:
+        """Productos A·X y X·Bᵀ."""
+        (pa, qa), (pb, qb) = self.a.shape, self.b.shape
+        return 2.0 * (pa * qa * qb + pa * pb * qb)
+
+    def matvec(self, x: np.ndarray) -> np.ndarray:
+        """Calcula (A⊗B)·x sin formar A⊗B."""
+        (pa, qa), (pb, qb) = self.a.shape, self.b.shape
+        k = 1 if x.ndim == 1 else x.shape[1]
+
+        # X[i, j, :] = x[i·qb + j, :]
+        y = (self.a @ x.reshape(qa, qb * k)).reshape(pa, qb, k)
+        z = self.b @ y  # (pb, qb) @ (pa, qb, k) → (pa, pb, k)
+        return z.reshape(pa * pb) if x.ndim == 1 else z.reshape(pa * pb, k)
+
+    def resolver(self, b: np.ndarray) -> np.ndarray:
+        """
+        Resuelve (A⊗B)·x = b usando (A⊗B)⁻¹ = A⁻¹⊗B⁻¹.
+
+        Raises:
+            ValueError: Si algún factor no es cuadrado o es singular
+        """
+        if self.a.shape[0] != self.a.shape[1] or self.b.shape[0] != self.b.shape[1]:
+            raise ValueError("Ambos factores deben ser cuadrados")
+
+        qa, qb = self.a.shape[1], self.b.shape[1]
+        k = 1 if b.ndim == 1 else b.shape[1]
+        try:
+            y = np.linalg.solve(self.a, b.reshape(qa, qb * k)).reshape(qa, qb, k)
+            z = np.linalg.solve(self.b, y)
+        except np.linalg.LinAlgError:
+            raise ValueError("La matriz es singular (no invertible)")
+        return z.reshape(qa * qb) if b.ndim == 1 else z.reshape(qa * qb, k)
+
+    def transponer(self) -> 'MatrizKronecker':
+        """(A⊗B)ᵀ = Aᵀ⊗Bᵀ."""
+        return MatrizKronecker(self.a.T, self.b.T)
+
+    def a_densa(self) -> MatrizNumPy:
+        """Materializa la matriz como MatrizNumPy."""
+        return MatrizNumPy(np.kron(self.a, self.b))
+
+
+class MatrizInversa(MatrizImplicita):
+    """
+    Inversa A⁻¹ aplicada mediante la factorización LU de A.
+
+    La factorización (O(n³)) se calcula una vez; cada producto A⁻¹·X es
+    una sustitución hacia adelante y hacia atrás, más estable y barata
+    que formar la inversa y multiplicar.
+    """
+
+    def __init__(self, a: Union[MatrizNumPy, np.ndarray]):
+        """
+        Parameters:
+            a: Matriz cuadrada a invertir
+
+        Raises:
+            ValueError: Si la matriz no es cuadrada o es singular
+        """
+        self.a = a.datos if isinstance(a, MatrizNumPy) else np.asarray(a)
+        if self.a.ndim != 2 or self.a.shape[0] != self.a.shape[1]:
+            raise ValueError("Solo las matrices cuadradas tienen inversa")
+
+        dtype = np.result_type(self.a.dtype, np.float64)
+        super().__init__(self.a.shape[0], self.a.shape[1], dtype)
+        try:
+            self._factorizacion = factorizar_lu(self.a.astype(dtype, copy=False))
+        except np.linalg.LinAlgError:
+            raise ValueError("La matriz es singular (no invertible)")
+
+    @property
+    def costo_matvec(self) -> float:
+        """Sustituciones triangulares: 2n² operaciones por columna."""
+        return 2.0 * self.filas * self.columnas
+
+    def matvec(self, x: np.ndarray) -> np.ndarray:
+        """Calcula A⁻¹·x resolviendo A·y = x."""
+        return resolver_lu(self._factorizacion, x)
+
+    def transponer(self) -> 'MatrizInversa':
+        """(A⁻¹)ᵀ = (Aᵀ)⁻¹."""
+        return MatrizInversa(self.a.T)
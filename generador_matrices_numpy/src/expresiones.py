@@ -0,0 +1,201 @@
+"""
+Lenguaje de Expresiones Matriciales
+===================================
+
+Compila una línea como ``C = A @ B.T + 2*inv(D)`` en un grafo perezoso
+(``perezosa.ExpresionPerezosa``) sobre un espacio de trabajo de matrices
+con nombre, y lo evalúa de una sola vez: las subexpresiones repetidas se
+calculan una vez, los productos se reordenan y las operaciones elemento a
+elemento se fusionan.
+
+Sintaxis admitida:
+
+- Nombres de matrices del espacio de trabajo (identificadores válidos)
+- Números enteros, decimales y complejos
+- ``+``, ``-``, ``*`` (por escalar), ``/`` (entre escalar), ``@``, ``**``
+  (exponente entero; ``-1`` es la inversa)
+- Transpuesta con ``X.T`` y funciones ``inv(X)``, ``transpuesta(X)``
+- Asignación opcional a un nombre: ``C = ...``
+
+La expresión se analiza con el módulo ``ast`` y solo se aceptan estos
+elementos; nunca se ejecuta código arbitrario.
+
+Autor: Nicolas
+"""
+
+import ast
+import numbers
+import time
+import tracemalloc
+from typing import Dict, Optional, Tuple
+
+from .matriz_numpy import MatrizNumPy
+from .perezosa import ExpresionPerezosa
+
+FUNCIONES = {
+    'inv': lambda x: x.inversa(),
+    'transpuesta': lambda x: x.T,
+}
+
+
+def compilar_expresion(texto: str, espacio: Dict[str, MatrizNumPy]
+                       ) -> Tuple[Optional[str], ExpresionPerezosa]:
+    """
+    Convierte una línea de texto en un grafo perezoso.
+
+    Parameters:
+        texto (str): Expresión, opcionalmente con asignación ``nombre = ...``
+        espacio (Dict[str, MatrizNumPy]): Matrices disponibles por nombre
+
+    Returns:
+        Tuple[Optional[str], ExpresionPerezosa]: Nombre de destino (None si
+        no hay asignación) y expresión sin evaluar
+
+    Raises:
+        ValueError: Si la expresión no es válida
+    """
+    try:
+        arbol = ast.parse(texto.strip(), mode='exec')
+    except SyntaxError as e:
+        raise ValueError(f"Expresión no válida: {e.msg}")
+
+    if len(arbol.body) != 1:
+        raise ValueError("Escribe una sola expresión por línea")
+
+    sentencia = arbol.body[0]
+    if isinstance(sentencia, ast.Assign):
+        if len(sentencia.targets) != 1 or not isinstance(sentencia.targets[0], ast.Name):
+            raise ValueError("Solo se puede asignar el resultado a un nombre")
+        destino = sentencia.targets[0].id
+        nodo = sentencia.value
+    elif isinstance(sentencia, ast.Expr):
+        destino = None
+        nodo = sentencia.value
+    else:
+        raise ValueError("Expresión no válida")
+
+    valor = _Compilador(espacio).visitar(nodo)
+    if not isinstance(valor, ExpresionPerezosa):
+        raise ValueError("El resultado de la expresión debe ser una matriz")
+    return destino, valor
+
+
+def evaluar_expresion(texto: str, espacio: Dict[str, MatrizNumPy]
+                      ) -> Tuple[Optional[str], MatrizNumPy, Dict]:
+    """
+    Compila y evalúa una expresión midiendo tiempo y memoria.
+
+    Parameters:
+        texto (str): Expresión, opcionalmente con asignación
+        espacio (Dict[str, MatrizNumPy]): Matrices disponibles por nombre
+
+    Returns:
+        Tuple[Optional[str], MatrizNumPy, Dict]: Nombre de destino,
+        resultado e información (``plan``, ``tiempo`` en segundos y
+        ``memoria_pico`` en bytes)
+
+    Raises:
+        ValueError: Si la expresión no es válida o no se puede calcular
+    """
+    destino, expresion = compilar_expresion(texto, espacio)
+
+    midiendo = tracemalloc.is_tracing()
+    if not midiendo:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    inicio = time.perf_counter()
+    try:
+        resultado = expresion.evaluar()
+    finally:
+        tiempo = time.perf_counter() - inicio
+        memoria_pico = tracemalloc.get_traced_memory()[1]
+        if not midiendo:
+            tracemalloc.stop()
+
+    info = {'plan': str(expresion), 'tiempo': tiempo, 'memoria_pico': memoria_pico}
+    return destino, resultado, info
+
+
+# ============ MÉTODOS PRIVADOS ============
+
+class _Compilador:
+    """Recorre el árbol de ``ast`` construyendo la expresión perezosa."""
+
+    def __init__(self, espacio: Dict[str, MatrizNumPy]):
+        self.espacio = espacio
+
+    def visitar(self, nodo: ast.AST):
+        """Compila un nodo del árbol sintáctico."""
+        metodo = getattr(self, f"_visitar_{type(nodo).__name__}", None)
+        if metodo is None:
+            raise ValueError(f"Elemento no permitido en la expresión: {ast.unparse(nodo)}")
+        return metodo(nodo)
+
+    def _visitar_Name(self, nodo: ast.Name) -> ExpresionPerezosa:
+        if nodo.id not in self.espacio:
+            raise ValueError(f"No existe la matriz '{nodo.id}'")
+        return ExpresionPerezosa.hoja(self.espacio[nodo.id], nombre=nodo.id)
+
+    def _visitar_Constant(self, nodo: ast.Constant) -> numbers.Number:
+        if isinstance(nodo.value, bool) or not isinstance(nodo.value, numbers.Number):
+            raise ValueError(f"Constante no válida: {nodo.value!r}")
+        return nodo.value
+
+    def _visitar_UnaryOp(self, nodo: ast.UnaryOp):
+        operando = self.visitar(nodo.operand)
+        if isinstance(nodo.op, ast.USub):
+            return -operando
+        if isinstance(nodo.op, ast.UAdd):
+            return operando
+        raise ValueError(f"Operador no permitido: {ast.unparse(nodo)}")
+
+    def _visitar_BinOp(self, nodo: ast.BinOp):
+        izquierda = self.visitar(nodo.left)
+        derecha = self.visitar(nodo.right)
+        matriz_izq = isinstance(izquierda, ExpresionPerezosa)
+        matriz_der = isinstance(derecha, ExpresionPerezosa)
+        op = nodo.op
+
+        if isinstance(op, (ast.Add, ast.Sub)):
+            if matriz_izq != matriz_der:
+                raise ValueError("No se puede sumar o restar una matriz y un escalar")
+            return izquierda + derecha if isinstance(op, ast.Add) else izquierda - derecha
+        if isinstance(op, ast.Mult):
+            if matriz_izq and matriz_der:
+                raise ValueError("Usa @ para el producto matricial")
+            return izquierda * derecha
+        if isinstance(op, ast.Div):
+            if matriz_der:
+                raise ValueError("Solo se puede dividir entre un escalar")
+            return izquierda * (1 / derecha) if matriz_izq else izquierda / derecha
+        if isinstance(op, ast.MatMult):
+            if not (matriz_izq and matriz_der):
+                raise ValueError("El operador @ requiere dos matrices")
+            return izquierda @ derecha
+        if isinstance(op, ast.Pow):
+            return self._potencia(izquierda, derecha)
+        raise ValueError(f"Operador no permitido: {ast.unparse(nodo)}")
+
+    def _visitar_Attribute(self, nodo: ast.Attribute) -> ExpresionPerezosa:
+        if nodo.attr != 'T':
+            raise ValueError(f"Atributo no permitido: .{nodo.attr}")
+        return self._como_matriz(self.visitar(nodo.value)).T
+
+    def _visitar_Call(self, nodo: ast.Call) -> ExpresionPerezosa:
+        if not isinstance(nodo.func, ast.Name) or nodo.func.id not in FUNCIONES:
+            raise ValueError(f"Función no permitida: {ast.unparse(nodo.func)}")
+        if len(nodo.args) != 1 or nodo.keywords:
+            raise ValueError(f"{nodo.func.id}() recibe una sola matriz")
+        return FUNCIONES[nodo.func.id](self._como_matriz(self.visitar(nodo.args[0])))
+
+    def _potencia(self, base, exponente):
+        """Potencia entera de una matriz, calculada por cuadrados sucesivos."""
+        if not isinstance(base, ExpresionPerezosa):
+            return base ** exponente
+        return base.potencia(exponente)
+
+    @staticmethod
+    def _como_matriz(valor) -> ExpresionPerezosa:
+        if not isinstance(valor, ExpresionPerezosa):
+            raise ValueError("Se esperaba una matriz")
+        return valor
@@ -0,0 +1,460 @@
+"""
+Historial Estructurado de Operaciones
+=====================================
+
+Registro acotado de las operaciones de una sesión (consola o interfaz
+gráfica) que se puede consultar, exportar a JSON Lines y volver a
+ejecutar sobre un espacio de trabajo nuevo.
+
+- Cada ``Registro`` guarda la operación, los nombres y versiones de sus
+  operandos, los parámetros necesarios para repetirla (semillas
+  incluidas), los nombres y formas de los resultados y la duración.
+- ``Historial`` es un búfer circular: al llenarse descarta los registros
+  más antiguos (``descartados`` cuenta cuántos).
+- ``reproducir`` repite los registros en orden con los mismos
+  parámetros, así que el espacio de trabajo resultante es idéntico y las
+  nuevas duraciones permiten comparar versiones. Las matrices que se
+  crearon antes del primer registro conservado deben pasarse en
+  ``matrices``.
+
+Las interfaces registran con::
+
+    with self.historial.medir('suma', self.matrices, (a, b), (nombre,)):
+        self.matrices[nombre] = self.matrices[a] + self.matrices[b]
+
+Autor: Nicolas
+"""
+
+import json
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .matriz_numpy import MatrizNumPy
+from .expresiones import evaluar_expresion
+
+CAPACIDAD_POR_DEFECTO = 1000
+
+
+def nueva_semilla() -> int:
+    """Semilla aleatoria que se registra para poder repetir la operación."""
+    return int(np.random.SeedSequence().generate_state(1)[0])
+
+
+def _serializable(valor: Any) -> Any:
+    """Convierte arrays, escalares de NumPy y tuplas a tipos de JSON."""
+    if isinstance(valor, np.ndarray):
+        return valor.tolist()
+    if isinstance(valor, np.generic):
+        return valor.item()
+    if isinstance(valor, (list, tuple)):
+        return [_serializable(elemento) for elemento in valor]
+    if isinstance(valor, dict):
+        return {clave: _serializable(elemento) for clave, elemento in valor.items()}
+    return valor
+
+
+class Registro:
+    """Una operación del historial."""
+
+    __slots__ = ('indice', 'instante', 'operacion', 'operandos', 'versiones', 'parametros',
+                 'resultados', 'formas', 'duracion', 'descripcion')
+
+    def __init__(self, operacion: str, operandos: Sequence[str] = (), versiones: Sequence[Optional[int]] = (),
+                 parametros: Optional[Dict[str, Any]] = None, resultados: Sequence[str] = (),
+                 formas: Sequence[Optional[Tuple[int, int]]] = (), duracion: float = 0.0,
+                 descripcion: str = "", indice: int = 0, instante: Optional[float] = None):
+        self.indice = indice
+        self.instante = time.time() if instante is None else instante
+        self.operacion = operacion
+        self.operandos = tuple(operandos)
+        self.versiones = tuple(versiones)
+        self.parametros = dict(parametros or {})
+        self.resultados = tuple(resultados)
+        self.formas = tuple(tuple(forma) if forma is not None else None for forma in formas)
+        self.duracion = duracion
+        self.descripcion = descripcion
+
+    def guardar_resultados(self, matrices: Dict[str, MatrizNumPy], *nombres: str) -> None:
+        """Anota resultados guardados después de medir (p. ej. si el usuario decide guardarlos)."""
+        self.resultados += nombres
+        self.formas += tuple(matrices[nombre].shape if nombre in matrices else None for nombre in nombres)
+
+    def a_dict(self) -> Dict[str, Any]:
+        """Diccionario con tipos de JSON."""
+        return {campo: _serializable(getattr(self, campo)) for campo in self.__slots__}
+
+    @classmethod
+    def desde_dict(cls, datos: Dict[str, Any]) -> 'Registro':
+        """Reconstruye un registro exportado con ``a_dict``."""
+        return cls(**datos)
+
+    def __str__(self) -> str:
+        texto = self.descripcion or f"{self.operacion}({', '.join(self.operandos)})"
+        return f"#{self.indice} {texto} [{self.duracion * 1e3:.2f} ms]"
+
+    def __repr__(self) -> str:
+        return (f"Registro({self.operacion!r}, operandos={self.operandos}, resultados={self.resultados}, "
+                f"duracion={self.duracion:.6f})")
+
+
+class Historial:
+    """Búfer circular de registros de operaciones."""
+
+    def __init__(self, capacidad: int = CAPACIDAD_POR_DEFECTO):
+        """
+        Crea un historial vacío.
+
+        Parameters:
+            capacidad (int): Registros que se conservan
+        """
+        self.capacidad = capacidad
+        self.descartados = 0
+        self._registros: deque = deque(maxlen=capacidad)
+        self._siguiente = 1
+        self._cerrojo = threading.Lock()
+
+    @contextmanager
+    def medir(self, operacion: str, matrices: Dict[str, MatrizNumPy], operandos: Sequence[str] = (),
+              resultados: Sequence[str] = (), descripcion: str = "", **parametros):
+        """
+        Mide el bloque ``with`` y lo registra si termina sin errores.
+
+        Las versiones de los operandos se toman al entrar y las formas de
+        los resultados (que el bloque debe guardar en ``matrices``) al salir.
+
+        Parameters:
+            operacion (str): Nombre de la operación (ver ``REPRODUCTORES``)
+            matrices (Dict[str, MatrizNumPy]): Espacio de trabajo
+            operandos (Sequence[str]): Nombres de las matrices de entrada
+            resultados (Sequence[str]): Nombres bajo los que se guardan los resultados
+            descripcion (str): Texto para mostrar
+            **parametros: Lo necesario para repetir la operación
+
+        Yields:
+            Registro: El registro, que el bloque puede completar
+        """
+        registro = Registro(operacion, operandos,
+                            [matrices[nombre].version if nombre in matrices else None for nombre in operandos],
+                            _serializable(parametros), descripcion=descripcion)
+        inicio = time.perf_counter()
+        yield registro
+        registro.duracion = time.perf_counter() - inicio
+        registro.guardar_resultados(matrices, *resultados)
+        self.agregar(registro)
+
+    def registrar(self, operacion: str, matrices: Dict[str, MatrizNumPy], operandos: Sequence[str] = (),
+                  resultados: Sequence[str] = (), duracion: float = 0.0, descripcion: str = "",
+                  **parametros) -> Registro:
+        """
+        Registra una operación ya ejecutada (p. ej. en segundo plano).
+
+        Parameters:
+            Los de ``medir``, más la duración medida en segundos
+
+        Returns:
+            Registro: El registro añadido
+        """
+        registro = Registro(operacion, operandos,
+                            [matrices[nombre].version if nombre in matrices else None for nombre in operandos],
+                            _serializable(parametros), duracion=duracion, descripcion=descripcion)
+        registro.guardar_resultados(matrices, *resultados)
+        self.agregar(registro)
+        return registro
+
+    def agregar(self, registro: Registro) -> None:
+        """Añade un registro numerándolo (descarta el más antiguo si está lleno)."""
+        with self._cerrojo:
+            registro.indice = self._siguiente
+            self._siguiente += 1
+            if len(self._registros) == self._registros.maxlen:
+                self.descartados += 1
+            self._registros.append(registro)
+
+    def registros(self, operacion: Optional[str] = None) -> List[Registro]:
+        """
+        Registros conservados, del más antiguo al más reciente.
+
+        Parameters:
+            operacion (Optional[str]): Solo los de esta operación
+
+        Returns:
+            List[Registro]: Copia de la lista de registros
+        """
+        with self._cerrojo:
+            return [r for r in self._registros if operacion is None or r.operacion == operacion]
+
+    def ultimos(self, cantidad: int) -> List[Registro]:
+        """Los ``cantidad`` registros más recientes."""
+        return self.registros()[-cantidad:] if cantidad > 0 else []
+
+    def __len__(self) -> int:
+        return len(self._registros)
+
+    def __iter__(self) -> Iterator[Registro]:
+        return iter(self.registros())
+
+    def limpiar(self) -> None:
+        """Descarta todos los registros."""
+        with self._cerrojo:
+            self._registros.clear()
+            self.descartados = 0
+
+    # ============ EXPORTACIÓN ============
+
+    def a_jsonl(self) -> str:
+        """Un objeto JSON por línea y por registro."""
+        return "".join(json.dumps(r.a_dict(), ensure_ascii=False) + "\n" for r in self.registros())
+
+    def exportar(self, ruta: str) -> int:
+        """
+        Escribe el historial en un archivo JSON Lines.
+
+        Returns:
+            int: Registros escritos
+        """
+        registros = self.registros()
+        with open(ruta, 'w', encoding='utf-8') as archivo:
+            for registro in registros:
+                archivo.write(json.dumps(registro.a_dict(), ensure_ascii=False) + "\n")
+        return len(registros)
+
+    @classmethod
+    def desde_jsonl(cls, texto: str, capacidad: int = CAPACIDAD_POR_DEFECTO) -> 'Historial':
+        """
+        Reconstruye un historial desde texto JSON Lines.
+
+        Raises:
+            ValueError: Si una línea no es un registro válido
+        """
+        historial = cls(capacidad)
+        for numero, linea in enumerate(texto.splitlines(), 1):
+            if not linea.strip():
+                continue
+            try:
+                registro = Registro.desde_dict(json.loads(linea))
+            except (json.JSONDecodeError, TypeError) as e:
+                raise ValueError(f"Línea {numero} del historial no válida: {e}")
+            historial._registros.append(registro)
+            historial._siguiente = max(historial._siguiente, registro.indice + 1)
+        return historial
+
+    @classmethod
+    def importar(cls, ruta: str, capacidad: int = CAPACIDAD_POR_DEFECTO) -> 'Historial':
+        """Lee un historial exportado con ``exportar``."""
+        with open(ruta, encoding='utf-8') as archivo:
+            return cls.desde_jsonl(archivo.read(), capacidad)
+
+    # ============ REPRODUCCIÓN ============
+
+    def reproducir(self, matrices: Optional[Dict[str, MatrizNumPy]] = None
+                   ) -> Tuple[Dict[str, MatrizNumPy], 'Historial']:
+        """
+        Repite los registros en orden sobre un espacio de trabajo nuevo.
+
+        Parameters:
+            matrices (Optional[Dict[str, MatrizNumPy]]): Matrices iniciales
+                (se copia el diccionario, no las matrices)
+
+        Returns:
+            Tuple[Dict[str, MatrizNumPy], Historial]: Espacio de trabajo final
+            y un historial nuevo con las duraciones de esta ejecución
+
+        Raises:
+            ValueError: Si una operación no se puede reproducir o falta un
+                operando (p. ej. porque su registro se descartó)
+        """
+        espacio = dict(matrices or {})
+        nuevo = Historial(self.capacidad)
+        for registro in self.registros():
+            reproductor = REPRODUCTORES.get(registro.operacion)
+            if reproductor is None:
+                raise ValueError(f"Registro #{registro.indice}: la operación '{registro.operacion}' "
+                                 f"no se puede reproducir")
+            for nombre in registro.operandos:
+                if nombre not in espacio:
+                    raise ValueError(f"Registro #{registro.indice}: no existe la matriz '{nombre}' "
+                                     f"(¿se descartó el registro que la creó?)")
+            with nuevo.medir(registro.operacion, espacio, registro.operandos, registro.resultados,
+                             registro.descripcion, **registro.parametros):
+                reproductor(espacio, registro)
+        return espacio, nuevo
+
+
+# ============ REPRODUCTORES ============
+
+# Función que repite un registro sobre el espacio de trabajo
+Reproductor = Callable[[Dict[str, MatrizNumPy], Registro], None]
+REPRODUCTORES: Dict[str, Reproductor] = {}
+
+
+def reproductor(operacion: str) -> Callable[[Reproductor], Reproductor]:
+    """Decorador que registra cómo repetir una operación."""
+    def registrar(funcion: Reproductor) -> Reproductor:
+        REPRODUCTORES[operacion] = funcion
+        return funcion
+    return registrar
+
+
+def _guardar(matrices: Dict[str, MatrizNumPy], registro: Registro, *valores: MatrizNumPy) -> None:
+    """Guarda cada valor bajo el resultado del registro en la misma posición."""
+    for nombre, valor in zip(registro.resultados, valores):
+        matrices[nombre] = valor
+
+
+def _operandos(matrices: Dict[str, MatrizNumPy], registro: Registro) -> List[MatrizNumPy]:
+    return [matrices[nombre] for nombre in registro.operandos]
+
+
+@reproductor('crear')
+def _crear(matrices, registro):
+    metodo = registro.parametros['metodo']
+    if not metodo.startswith('crear_'):
+        raise ValueError(f"Método de creación no válido: '{metodo}'")
+    _guardar(matrices, registro, getattr(MatrizNumPy, metodo)(**registro.parametros.get('argumentos', {})))
+
+
+@reproductor('manual')
+def _manual(matrices, registro):
+    _guardar(matrices, registro, MatrizNumPy(np.array(registro.parametros['datos'], dtype=np.float64)))
+
+
+@reproductor('cargar_csv')
+def _cargar_csv(matrices, registro):
+    _guardar(matrices, registro, MatrizNumPy(np.loadtxt(registro.parametros['archivo'], delimiter=',', ndmin=2)))
+
+
+@reproductor('guardar_csv')
+def _guardar_csv(matrices, registro):
+    # No se sobrescriben archivos del usuario al reproducir
+    pass
+
+
+@reproductor('suma')
+def _suma(matrices, registro):
+    a, b = _operandos(matrices, registro)
+    _guardar(matrices, registro, a + b)
+
+
+@reproductor('resta')
+def _resta(matrices, registro):
+    a, b = _operandos(matrices, registro)
+    _guardar(matrices, registro, a - b)
+
+
+@reproductor('multiplicacion')
+def _multiplicacion(matrices, registro):
+    a, b = _operandos(matrices, registro)
+    _guardar(matrices, registro, a @ b)
+
+
+@reproductor('transpuesta')
+def _transpuesta(matrices, registro):
+    a, = _operandos(matrices, registro)
+    _guardar(matrices, registro, a.transponer())
+
+
+@reproductor('escalado')
+def _escalado(matrices, registro):
+    a, = _operandos(matrices, registro)
+    _guardar(matrices, registro, a * registro.parametros['escalar'])
+
+
+@reproductor('potencia')
+def _potencia(matrices, registro):
+    a, = _operandos(matrices, registro)
+    _guardar(matrices, registro, a ** registro.parametros['exponente'])
+
+
+@reproductor('determinante')
+def _determinante(matrices, registro):
+    a, = _operandos(matrices, registro)
+    a.determinante()
+
+
+@reproductor('inversa')
+def _inversa(matrices, registro):
+    a, = _operandos(matrices, registro)
+    _guardar(matrices, registro, a.inversa())
+
+
+@reproductor('eigen')
+def _eigen(matrices, registro):
+    a, = _operandos(matrices, registro)
+    _, vectores = a.eigenvectores()
+    _guardar(matrices, registro, MatrizNumPy(vectores))
+
+
+@reproductor('svd')
+def _svd(matrices, registro):
+    a, = _operandos(matrices, registro)
+    u, s, vt = a.svd()
+    _guardar(matrices, registro, MatrizNumPy(u), MatrizNumPy(np.diag(s)), MatrizNumPy(vt))
+
+
+@reproductor('qr')
+def _qr(matrices, registro):
+    a, = _operandos(matrices, registro)
+    q, r = a.qr()
+    _guardar(matrices, registro, MatrizNumPy(q), MatrizNumPy(r))
+
+
+@reproductor('cholesky')
+def _cholesky(matrices, registro):
+    a, = _operandos(matrices, registro)
+    _guardar(matrices, registro, a.cholesky())
+
+
+@reproductor('resolver')
+def _resolver(matrices, registro):
+    operandos = _operandos(matrices, registro)
+    b = operandos[1] if len(operandos) > 1 else np.array(registro.parametros['b'], dtype=np.float64)
+    _guardar(matrices, registro,
+             operandos[0].resolver_sistema(b, precision_mixta=registro.parametros.get('precision_mixta', False)))
+
+
+@reproductor('normas')
+def _normas(matrices, registro):
+    a, = _operandos(matrices, registro)
+    for tipo in ('fro', '2', 'inf', '1'):
+        a.norma(tipo)
+    if a.es_cuadrada():
+        a.condicion()
+
+
+@reproductor('expresion')
+def _expresion(matrices, registro):
+    _, resultado, _ = evaluar_expresion(registro.parametros['linea'], matrices)
+    _guardar(matrices, registro, resultado)
+
+
+@reproductor('renombrar')
+def _renombrar(matrices, registro):
+    nombre, = registro.operandos
+    _guardar(matrices, registro, matrices.pop(nombre))
+
+
+@reproductor('copiar')
+def _copiar(matrices, registro):
+    a, = _operandos(matrices, registro)
+    _guardar(matrices, registro, a.copiar())
+
+
+@reproductor('eliminar')
+def _eliminar(matrices, registro):
+    for nombre in registro.operandos:
+        del matrices[nombre]
+
+
+@reproductor('limpiar')
+def _limpiar(matrices, registro):
+    matrices.clear()
+
+
+@reproductor('ver')
+def _ver(matrices, registro):
+    pass
@@ -16,12 +16,25 @@ Autor: Nicolas
 """
 
 import numpy as np
+from collections import deque
 from typing import Union, Tuple, Optional, List, Any
 from fractions import Fraction
 import warnings
 
+from .algebra_lineal import resolver_precision_mixta
+from .operaciones import multiplicar_enteros, multiplicar_cadena, MIN_OPERACIONES_BLAS
+from .aleatorio import llenar_aleatorio_paralelo
+from .procesos import multiplicar_objetos
+from .teselas import cholesky_teselas, inversa_teselas, qr_teselas
+from .paginacion import BORDES_RESUMEN, FILAS_POR_PAGINA, Paginador, resumir
+from .perfilador import (instrumentar_clase, forma, flops_elementos, flops_producto,
+                         flops_cubicos)
+
 # Sin dependencias de matplotlib - solo operaciones básicas con matrices
 
+# Cambios de elementos sueltos que se recuerdan para actualizar la caché de visualización
+MAX_CAMBIOS_REGISTRADOS = 256
+
 
 class MatrizNumPy:
     """
@@ -35,6 +48,7 @@ class MatrizNumPy:
         filas (int): Número de filas
         columnas (int): Número de columnas
         dtype (np.dtype): Tipo de datos de la matriz
+        version (int): Contador de modificaciones (lo usa la caché de visualización)
     """
     
     def __init__(self, datos_o_filas: Union[List[List], np.ndarray, int], 
@@ -55,6 +69,9 @@ class MatrizNumPy:
         Raises:
             ValueError: Si las dimensiones son inválidas
         """
+        self.version = 0
+        self._cambios = deque(maxlen=MAX_CAMBIOS_REGISTRADOS)
+        
         if isinstance(datos_o_filas, (list, tuple)):
             # Constructor desde lista de listas
             if not datos_o_filas or not datos_o_filas[0]:
@@ -150,33 +167,26 @@ class MatrizNumPy:
     @classmethod
     def crear_aleatoria(cls, filas: int, columnas: int, min_val: float = 0.0, 
                        max_val: float = 1.0, dtype: np.dtype = np.float64, 
-                       seed: Optional[int] = None) -> 'MatrizNumPy':
+                       seed: Optional[int] = None, hilos: Optional[int] = None) -> 'MatrizNumPy':
         """
         Crea una matriz con valores aleatorios.
         
+        Usa flujos independientes de ``np.random.Generator`` por tesela, de modo
+        que no altera el estado global de ``np.random`` y el resultado para una
+        semilla es el mismo con cualquier número de hilos.
+        
         Parameters:
             filas, columnas: Dimensiones
             min_val, max_val: Rango de valores
             dtype: Tipo de datos
             seed: Semilla para reproducibilidad
+            hilos: Hilos para el llenado (default: núcleos disponibles)
             
         Returns:
             MatrizNumPy: Matriz con valores aleatorios
         """
-        if seed is not None:
-            np.random.seed(seed)
-        
         matriz = cls(filas, columnas, dtype=dtype, inicializar_ceros=False)
-        
-        if dtype in [np.int32, np.int64]:
-            # Para enteros, usar randint
-            matriz.datos = np.random.randint(int(min_val), int(max_val) + 1, 
-                                           size=(filas, columnas), dtype=dtype)
-        else:
-            # Para flotantes, usar uniform
-            matriz.datos = np.random.uniform(min_val, max_val, size=(filas, columnas))
-            matriz.datos = matriz.datos.astype(dtype)
-        
+        llenar_aleatorio_paralelo(matriz.datos, min_val, max_val, seed=seed, hilos=hilos)
         return matriz
     
     @classmethod
@@ -186,7 +196,236 @@ class MatrizNumPy:
         matriz = cls(tamaño, tamaño, dtype=dtype, inicializar_ceros=False)
         matriz.datos = np.diag(valores).astype(dtype)
         return matriz
-    
+
+    # ============ MATRICES ESPECIALES ============
+    # Todas se construyen con broadcasting escribiendo directamente en el
+    # array preasignado de la matriz, sin bucles de Python por elemento.
+
+    @classmethod
+    def crear_hilbert(cls, n: int, dtype: np.dtype = np.float64) -> 'MatrizNumPy':
+        """
+        Crea la matriz de Hilbert H[i,j] = 1/(i+j+1).
+
+        Parameters:
+            n (int): Tamaño n×n
+            dtype: Tipo de datos flotante o complejo
+
+        Raises:
+            ValueError: Si el dtype no es flotante ni complejo
+        """
+        if not np.issubdtype(dtype, np.inexact):
+            raise ValueError(f"La matriz de Hilbert necesita un dtype flotante o complejo, "
+                             f"no {np.dtype(dtype)}")
+        matriz = cls(n, n, dtype=dtype, inicializar_ceros=False)
+        indices = np.arange(n, dtype=dtype)
+        np.add(indices[:, None], indices[None, :] + 1, out=matriz.datos)
+        np.reciprocal(matriz.datos, out=matriz.datos)
+        return matriz
+
+    @classmethod
+    def crear_vandermonde(cls, x: Union[List[float], np.ndarray], columnas: Optional[int] = None,
+                          creciente: bool = False, dtype: np.dtype = np.float64) -> 'MatrizNumPy':
+        """
+        Crea una matriz de Vandermonde.
+
+        Parameters:
+            x: Vector base
+            columnas (Optional[int]): Número de columnas (default: len(x))
+            creciente (bool): Si las potencias crecen de izquierda a derecha
+                (por defecto decrecen, como ``np.vander``)
+            dtype: Tipo de datos
+        """
+        x = np.asarray(x, dtype=dtype)
+        columnas = len(x) if columnas is None else columnas
+        matriz = cls(len(x), columnas, dtype=dtype, inicializar_ceros=False)
+
+        destino = matriz.datos if creciente else matriz.datos[:, ::-1]
+        destino[:, 0] = 1
+        if columnas > 1:
+            np.multiply.accumulate(np.broadcast_to(x[:, None], (len(x), columnas - 1)),
+                                   axis=1, out=destino[:, 1:])
+        return matriz
+
+    @classmethod
+    def crear_toeplitz(cls, c: Union[List[float], np.ndarray],
+                       r: Optional[Union[List[float], np.ndarray]] = None,
+                       dtype: np.dtype = np.float64) -> 'MatrizNumPy':
+        """
+        Crea una matriz de Toeplitz T[i,j] = c[i-j] (i ≥ j) y r[j-i] (j > i).
+
+        Parameters:
+            c: Primera columna
+            r: Primera fila (default: c, matriz simétrica); r[0] se ignora
+            dtype: Tipo de datos
+        """
+        c = np.asarray(c, dtype=dtype)
+        r = c if r is None else np.asarray(r, dtype=dtype)
+
+        # T[i, j] = valores[len(r) - 1 + i - j]: cada fila es una ventana invertida
+        valores = np.concatenate((r[:0:-1], c))
+        matriz = cls(len(c), len(r), dtype=dtype, inicializar_ceros=False)
+        ventanas = np.lib.stride_tricks.sliding_window_view(valores, len(r))
+        np.copyto(matriz.datos, ventanas[:, ::-1])
+        return matriz
+
+    @classmethod
+    def crear_hankel(cls, c: Union[List[float], np.ndarray],
+                     r: Optional[Union[List[float], np.ndarray]] = None,
+                     dtype: np.dtype = np.float64) -> 'MatrizNumPy':
+        """
+        Crea una matriz de Hankel H[i,j] = c[i+j] con última fila r.
+
+        Parameters:
+            c: Primera columna
+            r: Última fila (default: ceros); r[0] se ignora
+            dtype: Tipo de datos
+        """
+        c = np.asarray(c, dtype=dtype)
+        r = np.zeros(len(c), dtype=dtype) if r is None else np.asarray(r, dtype=dtype)
+
+        valores = np.concatenate((c, r[1:]))
+        matriz = cls(len(c), len(r), dtype=dtype, inicializar_ceros=False)
+        np.copyto(matriz.datos, np.lib.stride_tricks.sliding_window_view(valores, len(r)))
+        return matriz
+
+    @classmethod
+    def crear_circulante(cls, c: Union[List[float], np.ndarray],
+                         dtype: np.dtype = np.float64) -> 'MatrizNumPy':
+        """
+        Crea una matriz circulante C[i,j] = c[(i-j) mod n].
+
+        Parameters:
+            c: Primera columna
+            dtype: Tipo de datos
+        """
+        c = np.asarray(c, dtype=dtype)
+        return cls.crear_toeplitz(c, np.roll(c[::-1], 1), dtype=dtype)
+
+    @classmethod
+    def crear_pascal(cls, n: int, tipo: str = 'simetrica', dtype: np.dtype = np.float64) -> 'MatrizNumPy':
+        """
+        Crea una matriz de Pascal.
+
+        Parameters:
+            n (int): Tamaño n×n
+            tipo (str): 'simetrica' (P[i,j] = C(i+j, i)), 'inferior' (C(i, j))
+                o 'superior' (C(j, i))
+            dtype: Tipo de datos (los enteros desbordan para n > 34 en int64)
+        """
+        if tipo not in ('simetrica', 'inferior', 'superior'):
+            raise ValueError(f"Tipo de matriz de Pascal no soportado: {tipo}")
+
+        matriz = cls(n, n, dtype=dtype, inicializar_ceros=True)
+        datos = matriz.datos
+
+        if tipo == 'simetrica':
+            # Cada fila es la suma acumulada de la anterior
+            datos[0] = 1
+            for i in range(1, n):
+                np.cumsum(datos[i - 1], out=datos[i])
+        else:
+            # Regla de Pascal sobre la triangular inferior (la superior es su vista transpuesta)
+            destino = datos if tipo == 'inferior' else datos.T
+            destino[:, 0] = 1
+            for i in range(1, n):
+                np.add(destino[i - 1, :i], destino[i - 1, 1:i + 1], out=destino[i, 1:i + 1])
+        return matriz
+
+    @classmethod
+    def crear_banda(cls, n: int, diagonales: dict, columnas: Optional[int] = None,
+                    dtype: np.dtype = np.float64) -> 'MatrizNumPy':
+        """
+        Crea una matriz de banda a partir de sus diagonales.
+
+        Parameters:
+            n (int): Número de filas
+            diagonales (dict): {desplazamiento: valor escalar o vector}; 0 es la
+                diagonal principal, positivos por encima y negativos por debajo
+            columnas (Optional[int]): Número de columnas (default: n)
+            dtype: Tipo de datos
+        """
+        columnas = n if columnas is None else columnas
+        matriz = cls(n, columnas, dtype=dtype, inicializar_ceros=True)
+        plano = matriz.datos.reshape(-1)
+
+        for desplazamiento, valores in diagonales.items():
+            if desplazamiento >= 0:
+                inicio = desplazamiento
+                longitud = min(n, columnas - desplazamiento)
+            else:
+                inicio = -desplazamiento * columnas
+                longitud = min(n + desplazamiento, columnas)
+            if longitud <= 0:
+                raise ValueError(f"La diagonal {desplazamiento} está fuera de la matriz")
+
+            # La diagonal es una vista con paso columnas + 1 sobre el array plano
+            plano[inicio:inicio + longitud * (columnas + 1):columnas + 1] = valores
+        return matriz
+
+    @classmethod
+    def crear_tridiagonal(cls, inferior: Union[float, List[float], np.ndarray],
+                          diagonal: Union[float, List[float], np.ndarray],
+                          superior: Union[float, List[float], np.ndarray],
+                          n: Optional[int] = None, dtype: np.dtype = np.float64) -> 'MatrizNumPy':
+        """
+        Crea una matriz tridiagonal.
+
+        Parameters:
+            inferior, diagonal, superior: Escalares o vectores de cada diagonal
+            n (Optional[int]): Tamaño (obligatorio si la diagonal es un escalar)
+            dtype: Tipo de datos
+        """
+        if n is None:
+            if np.isscalar(diagonal):
+                raise ValueError("Debe especificar el tamaño si la diagonal es un escalar")
+            n = len(diagonal)
+        return cls.crear_banda(n, {-1: inferior, 0: diagonal, 1: superior}, dtype=dtype)
+
+    @classmethod
+    def crear_ortogonal_aleatoria(cls, n: int, seed: Optional[int] = None,
+                                  dtype: np.dtype = np.float64) -> 'MatrizNumPy':
+        """
+        Crea una matriz ortogonal aleatoria con distribución uniforme (Haar).
+
+        Se obtiene de la QR de una matriz gaussiana corrigiendo los signos
+        de la diagonal de R.
+        """
+        matriz = cls(n, n, dtype=dtype, inicializar_ceros=False)
+        generador = np.random.default_rng(seed)
+        generador.standard_normal(out=matriz.datos, dtype=dtype)
+
+        q, r = np.linalg.qr(matriz.datos)
+        np.multiply(q, np.sign(np.diag(r)), out=matriz.datos)
+        return matriz
+
+    @classmethod
+    def crear_spd_aleatoria(cls, n: int, condicion: float = 10.0, seed: Optional[int] = None,
+                            dtype: np.dtype = np.float64) -> 'MatrizNumPy':
+        """
+        Crea una matriz simétrica definida positiva aleatoria.
+
+        A = Q·diag(λ)·Qᵀ con Q ortogonal aleatoria y eigenvalores espaciados
+        geométricamente entre 1 y ``condicion``.
+
+        Parameters:
+            n (int): Tamaño n×n
+            condicion (float): Número de condición (en norma 2) deseado
+            seed: Semilla para reproducibilidad
+            dtype: Tipo de datos flotante
+        """
+        if condicion < 1:
+            raise ValueError("El número de condición debe ser al menos 1")
+
+        q = cls.crear_ortogonal_aleatoria(n, seed=seed, dtype=dtype).datos
+        eigenvalores = np.geomspace(1.0, condicion, n).astype(dtype)
+
+        matriz = cls(n, n, dtype=dtype, inicializar_ceros=False)
+        np.matmul(q * eigenvalores, q.T, out=matriz.datos)
+        # Simetrizar para eliminar el redondeo del producto
+        matriz.datos += matriz.datos.T.copy()
+        matriz.datos *= 0.5
+        return matriz
+
     def llenar_manual(self, datos: List[List[Union[int, float, str]]]) -> None:
         """Llena la matriz con datos específicos."""
         if len(datos) != self.filas:
@@ -198,18 +437,16 @@ class MatrizNumPy:
         
         # Convertir a array de NumPy directamente
         self.datos = np.array(datos, dtype=self.dtype)
+        self.marcar_modificada()
     
-    def llenar_aleatorio(self, min_val: float = -10, max_val: float = 10, seed: Optional[int] = None) -> None:
-        """Llena la matriz con valores aleatorios."""
-        if seed is not None:
-            np.random.seed(seed)
-        
-        if self.dtype in [np.int32, np.int64]:
-            self.datos = np.random.randint(int(min_val), int(max_val) + 1, 
-                                         size=(self.filas, self.columnas), dtype=self.dtype)
-        else:
-            self.datos = np.random.uniform(min_val, max_val, size=(self.filas, self.columnas))
-            self.datos = self.datos.astype(self.dtype)
+    def llenar_aleatorio(self, min_val: float = -10, max_val: float = 10, seed: Optional[int] = None,
+                         hilos: Optional[int] = None) -> None:
+        """Llena la matriz con valores aleatorios (ver ``crear_aleatoria``)."""
+        if (self.datos.dtype != self.dtype or not self.datos.flags.c_contiguous or
+                not self.datos.flags.writeable):
+            self.datos = np.empty((self.filas, self.columnas), dtype=self.dtype)
+        llenar_aleatorio_paralelo(self.datos, min_val, max_val, seed=seed, hilos=hilos)
+        self.marcar_modificada()
     
     def obtener_elemento(self, fila: int, columna: int) -> Union[int, float]:
         """Obtiene un elemento específico."""
@@ -218,6 +455,40 @@ class MatrizNumPy:
     def establecer_elemento(self, fila: int, columna: int, valor: Union[int, float]) -> None:
         """Establece un elemento específico."""
         self.datos[fila, columna] = valor
+        self.marcar_modificada(fila, columna)
+    
+    def marcar_modificada(self, fila: Optional[int] = None, columna: Optional[int] = None) -> None:
+        """
+        Registra una modificación de la matriz.
+        
+        Debe llamarse tras escribir en ``self.datos`` directamente, para que
+        la caché de visualización no muestre texto desactualizado.
+        
+        Parameters:
+            fila (Optional[int]): Fila del elemento modificado (None si cambió más de uno)
+            columna (Optional[int]): Columna del elemento modificado
+        """
+        self.version += 1
+        self._cambios.append(None if fila is None else (int(fila) % self.filas, int(columna) % self.columnas))
+    
+    def cambios_desde(self, version: int) -> Optional[List[Tuple[int, int]]]:
+        """
+        Elementos modificados desde una versión anterior.
+        
+        Parameters:
+            version (int): Versión de referencia
+            
+        Returns:
+            Optional[List[Tuple[int, int]]]: Celdas modificadas, o None si no se
+            puede saber (cambió un bloque o hubo demasiados cambios)
+        """
+        pendientes = self.version - version
+        if pendientes < 0 or pendientes > len(self._cambios):
+            return None
+        recientes = list(self._cambios)[len(self._cambios) - pendientes:]
+        if None in recientes:
+            return None
+        return recientes
     
     def es_cuadrada(self) -> bool:
         """Verifica si la matriz es cuadrada."""
@@ -237,10 +508,23 @@ class MatrizNumPy:
         nueva_matriz.datos = self.datos.copy()
         return nueva_matriz
     
+    def perezosa(self) -> 'ExpresionPerezosa':
+        """
+        Devuelve la matriz como hoja de una expresión perezosa.
+
+        Los operadores sobre el resultado construyen un grafo que se calcula
+        al llamar a ``evaluar()``, fusionando las operaciones elemento a
+        elemento y reordenando los productos (ver ``src/perezosa.py``).
+        """
+        from .perezosa import ExpresionPerezosa
+        return ExpresionPerezosa.hoja(self)
+
     # ============ OPERACIONES BÁSICAS ============
     
     def __add__(self, otra: 'MatrizNumPy') -> 'MatrizNumPy':
         """Suma de matrices usando el operador +."""
+        if not isinstance(otra, MatrizNumPy):
+            return NotImplemented
         if not self.son_dimensiones_compatibles(otra):
             raise ValueError("Las matrices deben tener las mismas dimensiones para sumar")
         
@@ -250,6 +534,8 @@ class MatrizNumPy:
     
     def __sub__(self, otra: 'MatrizNumPy') -> 'MatrizNumPy':
         """Resta de matrices usando el operador -."""
+        if not isinstance(otra, MatrizNumPy):
+            return NotImplemented
         if not self.son_dimensiones_compatibles(otra):
             raise ValueError("Las matrices deben tener las mismas dimensiones para restar")
         
@@ -259,14 +545,51 @@ class MatrizNumPy:
     
     def __matmul__(self, otra: 'MatrizNumPy') -> 'MatrizNumPy':
         """Multiplicación de matrices usando el operador @."""
+        if not isinstance(otra, MatrizNumPy):
+            # Permite que las matrices implícitas resuelvan el producto (__rmatmul__)
+            return NotImplemented
         if self.columnas != otra.filas:
             raise ValueError(f"Para multiplicar matrices, las columnas de la primera ({self.columnas}) "
                            f"deben ser iguales a las filas de la segunda ({otra.filas})")
         
         resultado = MatrizNumPy(self.filas, otra.columnas, dtype=self.dtype, inicializar_ceros=False)
-        resultado.datos = self.datos @ otra.datos
+        if self.filas * self.columnas * otra.columnas < MIN_OPERACIONES_BLAS:
+            # En matrices pequeñas cualquier preparación cuesta más que el producto
+            resultado.datos = self.datos @ otra.datos
+        elif (np.issubdtype(self.datos.dtype, np.integer) and 
+                np.issubdtype(otra.datos.dtype, np.integer)):
+            # El producto entero de NumPy no usa BLAS
+            resultado.datos = multiplicar_enteros(self.datos, otra.datos)
+        elif self.datos.dtype.hasobject or otra.datos.dtype.hasobject:
+            # El bucle de objetos retiene el GIL: se reparte entre procesos
+            resultado.datos = multiplicar_objetos(self.datos, otra.datos)
+        else:
+            resultado.datos = self.datos @ otra.datos
         return resultado
     
+    @staticmethod
+    def multiplicar_cadena(matrices: List[Any]) -> 'MatrizNumPy':
+        """
+        Multiplica una cadena de matrices en el orden de menor costo.
+
+        ``A @ B @ v`` se evalúa de izquierda a derecha; con A, B de n×n y v de
+        n×1, ``multiplicar_cadena([A, B, v])`` calcula A @ (B @ v) en O(n²).
+        Acepta también matrices implícitas (ver ``src/estructuradas.py``).
+
+        Parameters:
+            matrices (List): MatrizNumPy, arrays 2D o matrices implícitas
+
+        Returns:
+            MatrizNumPy: Producto de todas las matrices
+
+        Raises:
+            ValueError: Si la lista está vacía o las dimensiones no son compatibles
+        """
+        datos = multiplicar_cadena(matrices)
+        resultado = MatrizNumPy(datos.shape[0], datos.shape[1], dtype=datos.dtype, inicializar_ceros=False)
+        resultado.datos = datos
+        return resultado
+
     def __mul__(self, escalar: Union[int, float]) -> 'MatrizNumPy':
         """Multiplicación por escalar usando el operador *."""
         resultado = MatrizNumPy(self.filas, self.columnas, dtype=self.dtype, inicializar_ceros=False)
@@ -305,11 +628,23 @@ class MatrizNumPy:
         
         return float(np.linalg.det(self.datos))
     
-    def inversa(self) -> 'MatrizNumPy':
-        """Calcula la inversa de la matriz."""
+    def inversa(self, tam_tesela: Optional[int] = None) -> 'MatrizNumPy':
+        """
+        Calcula la inversa de la matriz.
+
+        Parameters:
+            tam_tesela (Optional[int]): Si se indica, usa la LU por teselas en
+                el pool compartido (ver ``teselas.inversa_teselas``)
+        """
         if not self.es_cuadrada():
             raise ValueError("Solo las matrices cuadradas tienen inversa")
         
+        if tam_tesela is not None:
+            try:
+                return MatrizNumPy(inversa_teselas(self.datos, tam_tesela).resultado())
+            except np.linalg.LinAlgError:
+                raise ValueError("La matriz es singular (no invertible)")
+        
         det = self.determinante()
         if abs(det) < 1e-14:
             raise ValueError("La matriz es singular (no invertible)")
@@ -318,6 +653,41 @@ class MatrizNumPy:
         resultado.datos = np.linalg.inv(self.datos)
         return resultado
     
+    def resolver_sistema(self, b: Union['MatrizNumPy', np.ndarray],
+                         precision_mixta: bool = False) -> 'MatrizNumPy':
+        """
+        Resuelve el sistema lineal A·x = b.
+
+        Parameters:
+            b: Lado derecho (MatrizNumPy o array con tantas filas como A)
+            precision_mixta (bool): Si factorizar en float32 y refinar el
+                residuo en float64 (ver ``algebra_lineal.resolver_precision_mixta``)
+
+        Returns:
+            MatrizNumPy: Solución x como vector columna o matriz
+
+        Raises:
+            ValueError: Si A no es cuadrada, las dimensiones no coinciden o A es singular
+        """
+        if not self.es_cuadrada():
+            raise ValueError("El sistema requiere una matriz de coeficientes cuadrada")
+
+        datos_b = b.datos if isinstance(b, MatrizNumPy) else np.asarray(b)
+        if datos_b.ndim == 1:
+            datos_b = datos_b.reshape(-1, 1)
+        if datos_b.shape[0] != self.filas:
+            raise ValueError(f"El lado derecho debe tener {self.filas} filas, tiene {datos_b.shape[0]}")
+
+        if precision_mixta:
+            x, _ = resolver_precision_mixta(self.datos, datos_b)
+        else:
+            try:
+                x = np.linalg.solve(self.datos, datos_b)
+            except np.linalg.LinAlgError:
+                raise ValueError("La matriz es singular (no invertible)")
+
+        return MatrizNumPy(x)
+
     def rango(self) -> int:
         """Calcula el rango de la matriz."""
         return int(np.linalg.matrix_rank(self.datos))
@@ -327,14 +697,15 @@ class MatrizNumPy:
         Calcula diferentes normas de la matriz.
         
         Parameters:
-            tipo (str): 'fro' (Frobenius), '1', '2', 'inf', 'nuc' (nuclear)
+            tipo (str): 'fro' (Frobenius), '1', '2', 'inf', 'nuc' (nuclear);
+                también se aceptan 1, 2 y np.inf
         """
-        if tipo == 'fro':
-            return float(np.linalg.norm(self.datos, 'fro'))
-        elif tipo in ['1', '2', 'inf', 'nuc']:
-            return float(np.linalg.norm(self.datos, tipo))
-        else:
+        if not isinstance(tipo, str):
+            tipo = 'inf' if tipo == np.inf else str(tipo)
+        ordenes = {'fro': 'fro', 'nuc': 'nuc', '1': 1, '2': 2, 'inf': np.inf}
+        if tipo not in ordenes:
             raise ValueError(f"Tipo de norma no soportado: {tipo}")
+        return float(np.linalg.norm(self.datos, ordenes[tipo]))
     
     def eigenvalores(self) -> np.ndarray:
         """Calcula los eigenvalores de la matriz."""
@@ -368,25 +739,42 @@ class MatrizNumPy:
         """
         return np.linalg.svd(self.datos, compute_uv=computar_uv)
     
-    def qr(self) -> Tuple[np.ndarray, np.ndarray]:
+    def qr(self, tam_tesela: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
         """
         Descomposición QR.
         
+        Parameters:
+            tam_tesela (Optional[int]): Si se indica, usa la QR por teselas en
+                el pool compartido (solo si filas >= columnas; si no, se usa
+                ``np.linalg.qr``)
+        
         Returns:
             Tuple: (Q, R) donde Q es ortogonal y R es triangular superior
         """
+        if tam_tesela is not None and self.filas >= self.columnas:
+            return qr_teselas(self.datos, tam_tesela).resultado()
         return np.linalg.qr(self.datos)
     
-    def cholesky(self) -> 'MatrizNumPy':
+    def cholesky(self, tam_tesela: Optional[int] = None) -> 'MatrizNumPy':
         """
         Descomposición de Cholesky (para matrices definidas positivas).
         
+        Parameters:
+            tam_tesela (Optional[int]): Si se indica, usa la Cholesky por
+                teselas en el pool compartido
+        
         Returns:
             MatrizNumPy: Matriz triangular inferior L tal que A = L @ L.T
         """
         if not self.es_cuadrada():
             raise ValueError("La descomposición de Cholesky requiere una matriz cuadrada")
         
+        if tam_tesela is not None:
+            try:
+                return MatrizNumPy(cholesky_teselas(self.datos, tam_tesela).resultado())
+            except np.linalg.LinAlgError:
+                raise ValueError("La matriz debe ser definida positiva para Cholesky")
+        
         if not self.es_definida_positiva():
             raise ValueError("La matriz debe ser definida positiva para Cholesky")
         
@@ -431,13 +819,18 @@ class MatrizNumPy:
         """Verifica si las dimensiones son compatibles para suma/resta."""
         return self.filas == otra.filas and self.columnas == otra.columnas
     
-    def mostrar(self, titulo: str = "Matriz", precision: int = 3) -> None:
+    def mostrar(self, titulo: str = "Matriz", precision: int = 3, bordes: int = BORDES_RESUMEN) -> None:
         """
         Muestra la matriz de forma formateada.
         
+        Las matrices de más de 20×20 se resumen con sus primeras y últimas
+        filas y columnas (sin formatear el resto); ``paginar`` las recorre
+        enteras.
+        
         Parameters:
             titulo (str): Título a mostrar
             precision (int): Decimales a mostrar para números flotantes
+            bordes (int): Filas/columnas de cada extremo en el resumen
         """
         print(f"\n{titulo}:")
         print("-" * len(titulo + ":"))
@@ -445,7 +838,7 @@ class MatrizNumPy:
         print(f"Tipo de datos: {self.dtype}")
         print(f"Es cuadrada: {'Sí' if self.es_cuadrada() else 'No'}")
         
-        if self.filas <= 20 and self.columnas <= 20:  # Solo mostrar matrices no muy grandes
+        if self.filas <= 20 and self.columnas <= 20:  # Las pequeñas se muestran completas
             print("\nContenido:")
             
             # Formatear según el tipo de datos
@@ -455,9 +848,20 @@ class MatrizNumPy:
                 with np.printoptions(precision=precision, suppress=True):
                     print(self.datos)
         else:
-            print(f"\n(Matriz muy grande para mostrar: {self.filas}×{self.columnas})")
+            print(f"\nContenido (resumen de {self.filas}×{self.columnas}):")
+            print(resumir(self.datos, precision, bordes))
         print()
     
+    def paginar(self, precision: int = 3, filas_por_pagina: int = FILAS_POR_PAGINA) -> None:
+        """
+        Recorre la matriz por páginas en la consola (ver ``src.paginacion``).
+        
+        Parameters:
+            precision (int): Decimales a mostrar para números flotantes
+            filas_por_pagina (int): Filas de cada página
+        """
+        Paginador(self.datos, precision, filas_por_pagina).ejecutar()
+    
     # ============ VISUALIZACIÓN ============
     
     def __str__(self) -> str:
@@ -484,6 +888,11 @@ class MatrizNumPy:
     def __setitem__(self, key, valor) -> None:
         """Permite asignación directa a la matriz."""
         self.datos[key] = valor
+        if (isinstance(key, tuple) and len(key) == 2
+                and all(isinstance(indice, (int, np.integer)) for indice in key)):
+            self.marcar_modificada(*key)
+        else:
+            self.marcar_modificada()
     
     # ============ MÉTODOS PRIVADOS ============
     
@@ -520,3 +929,49 @@ class MatrizNumPy:
             return np.float64
         else:
             return np.int64
+
+
+# ============ INSTRUMENTACIÓN ============
+
+def _flops_potencia(args: tuple, kwargs: dict) -> Optional[float]:
+    """Productos de n×n que hace __pow__ (exponente - 1)."""
+    n = args[0].filas
+    return 2.0 * n ** 3 * max(abs(args[1]) - 1, 0)
+
+
+def _flops_sistema(args: tuple, kwargs: dict) -> Optional[float]:
+    """Factorización LU más sustituciones para cada columna de b."""
+    n = args[0].filas
+    forma_b = forma(args[1] if len(args) > 1 else kwargs.get('b'))
+    columnas_b = forma_b[1] if forma_b and len(forma_b) == 2 else 1
+    return 2.0 / 3.0 * n ** 3 + 2.0 * n ** 2 * columnas_b
+
+
+# Métodos baratos o interactivos: medirlos solo añadiría ruido
+_SIN_PERFILAR = ('obtener_elemento', 'establecer_elemento', 'marcar_modificada', 'cambios_desde',
+                 'es_cuadrada', 'son_dimensiones_compatibles', 'perezosa', 'mostrar', 'paginar')
+
+instrumentar_clase(
+    MatrizNumPy, 'MatrizNumPy',
+    excluir=_SIN_PERFILAR,
+    especiales=('__add__', '__sub__', '__matmul__', '__mul__', '__rmul__', '__pow__'),
+    flops={
+        '__add__': flops_elementos,
+        '__sub__': flops_elementos,
+        '__mul__': flops_elementos,
+        '__rmul__': flops_elementos,
+        '__matmul__': flops_producto,
+        '__pow__': _flops_potencia,
+        'norma': flops_elementos,
+        'es_simetrica': flops_elementos,
+        'determinante': flops_cubicos(2 / 3),
+        'inversa': flops_cubicos(2),
+        'resolver_sistema': _flops_sistema,
+        'cholesky': flops_cubicos(1 / 3),
+        'qr': flops_cubicos(2),
+        'eigenvalores': flops_cubicos(10),
+        'eigenvectores': flops_cubicos(25),
+        'svd': flops_cubicos(22),
+        'rango': flops_cubicos(4),
+        'condicion': flops_cubicos(4),
+    })
@@ -0,0 +1,383 @@
+"""
+Operaciones Matriciales Optimizadas
+===================================
+
+Núcleos de cálculo que MatrizNumPy utiliza cuando la operación directa de
+NumPy no aprovecha BLAS.
+
+- ``multiplicar_enteros``: producto exacto de matrices enteras usando
+  BLAS en float64 (directo o dividiendo los operandos en limbs), con un
+  núcleo entero por bloques y multihilo como último recurso.
+- ``orden_cadena_optimo`` / ``ejecutar_cadena``: parentización óptima de
+  un producto encadenado A₁·A₂·…·Aₙ por programación dinámica.
+- ``multiplicar_cadena``: producto encadenado que tiene en cuenta las
+  matrices implícitas (Toeplitz, circulante, Kronecker) al elegir el orden.
+
+Autor: Nicolas
+"""
+
+import os
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional, Sequence, Tuple
+
+from .perfilador import forma, flops_producto, perfilado
+
+# Los enteros de magnitud menor que 2**53 son exactos en float64
+LIMITE_EXACTO_FLOAT64 = 2.0 ** 53
+
+# Por debajo de este número de multiplicaciones escalares no compensa preparar BLAS
+MIN_OPERACIONES_BLAS = 32 ** 3
+
+# Máximo de productos BLAS por limbs antes de recurrir al núcleo entero
+MAX_PRODUCTOS_LIMB = 16
+
+TAM_BLOQUE_ENTERO = 256
+
+
+def multiplicar_enteros(a: np.ndarray, b: np.ndarray,
+                        max_productos: int = MAX_PRODUCTOS_LIMB,
+                        hilos: Optional[int] = None) -> np.ndarray:
+    """
+    Multiplica dos matrices enteras con resultado idéntico a ``a @ b``.
+
+    Estrategia, en orden:
+
+    1. Si la cota max_i Σ_k |a_ik| · max|b| (o la simétrica por columnas)
+       es menor que 2**53, todos los resultados parciales son exactos en
+       float64 y basta un único producto BLAS.
+    2. Si no, cada operando se divide en limbs de ``s`` bits
+       (a = Σ a_i · 2**(s·i)) tales que cada producto a_i @ b_j cumple la
+       cota anterior; los productos se combinan con aritmética entera
+       modular, de modo que incluso el desbordamiento coincide con NumPy.
+    3. Si harían falta más de ``max_productos`` productos, se usa un núcleo
+       entero por bloques repartido entre hilos.
+
+    Parameters:
+        a (np.ndarray): Matriz entera m×n
+        b (np.ndarray): Matriz entera n×p
+        max_productos (int): Límite de productos BLAS por limbs
+        hilos (Optional[int]): Hilos del núcleo entero (default: núcleos disponibles)
+
+    Returns:
+        np.ndarray: Producto con el dtype entero resultante
+    """
+    dtype_resultado = np.result_type(a.dtype, b.dtype)
+    m, n = a.shape
+    p = b.shape[1]
+
+    # int64 con uint64 promociona a float64: NumPy ya multiplica en flotante
+    if m * n * p < MIN_OPERACIONES_BLAS or not np.issubdtype(dtype_resultado, np.integer):
+        return a @ b
+
+    # 1. Producto directo en float64
+    fa = a.astype(np.float64)
+    fb = b.astype(np.float64)
+    if _cota_producto(*_cotas_izquierda(fa), *_cotas_derecha(fb), n) < LIMITE_EXACTO_FLOAT64:
+        # El producto es exacto pero puede no caber en un dtype estrecho: pasar
+        # por int64 hace que se reduzca módulo 2**bits como en NumPy (convertir
+        # directamente un flotante fuera de rango a int32 está indefinido)
+        return (fa @ fb).astype(np.int64).astype(dtype_resultado)
+    del fa, fb
+
+    # 2. Productos por limbs
+    bits_resultado = np.iinfo(dtype_resultado).bits
+    plan = _planificar_limbs(a, b, bits_resultado, max_productos)
+    if plan is not None:
+        return _multiplicar_por_limbs(plan, (m, p), dtype_resultado)
+
+    # 3. Núcleo entero por bloques
+    return _multiplicar_enteros_bloques(a.astype(dtype_resultado, copy=False),
+                                        b.astype(dtype_resultado, copy=False), hilos)
+
+
+def multiplicar_cadena(operandos: Sequence) -> np.ndarray:
+    """
+    Multiplica A₁·A₂·…·Aₙ en el orden de menor costo.
+
+    Los operandos pueden ser arrays 2D, MatrizNumPy o matrices implícitas
+    (objetos con ``matvec`` y ``costo_matvec``, ver ``estructuradas``).
+    Aplicar una implícita a una matriz de r columnas cuesta
+    r·costo_matvec en lugar de p·q·r, lo que suele favorecer órdenes que
+    la mantienen como operando directo.
+
+    Parameters:
+        operandos (Sequence): Matrices a multiplicar en orden
+
+    Returns:
+        np.ndarray: Producto de todas las matrices
+
+    Raises:
+        ValueError: Si no hay operandos o las dimensiones no son compatibles
+    """
+    if not operandos:
+        raise ValueError("Debe indicar al menos una matriz para multiplicar")
+
+    factores = [x.datos if isinstance(getattr(x, 'datos', None), np.ndarray) else x
+                for x in operandos]
+    for izquierda, derecha in zip(factores, factores[1:]):
+        if izquierda.shape[1] != derecha.shape[0]:
+            raise ValueError(f"Para multiplicar matrices, las columnas de la primera ({izquierda.shape[1]}) "
+                             f"deben ser iguales a las filas de la segunda ({derecha.shape[0]})")
+
+    if len(factores) == 1:
+        unico = factores[0]
+        return unico.a_densa().datos if _es_implicita(unico) else unico.copy()
+
+    dimensiones = [f.shape[0] for f in factores] + [factores[-1].shape[1]]
+
+    def costo(i: int, k: int, j: int) -> float:
+        p, q, r = dimensiones[i], dimensiones[k + 1], dimensiones[j + 1]
+        izquierda = factores[i] if i == k and _es_implicita(factores[i]) else None
+        derecha = factores[j] if k + 1 == j and _es_implicita(factores[j]) else None
+        if izquierda is not None and derecha is not None:
+            # Una de las dos debe materializarse
+            return r * (derecha.costo_matvec + izquierda.costo_matvec)
+        if izquierda is not None:
+            return r * izquierda.costo_matvec
+        if derecha is not None:
+            return p * derecha.costo_matvec
+        return float(p) * q * r
+
+    _, division = orden_cadena_optimo(dimensiones, costo)
+    return ejecutar_cadena(factores, division, _multiplicar_estructurado)
+
+
+def orden_cadena_optimo(dimensiones: Sequence[int],
+                        costo: Optional[Callable[[int, int, int], float]] = None
+                        ) -> Tuple[float, List[List[int]]]:
+    """
+    Calcula la parentización de menor costo de un producto encadenado.
+
+    Programación dinámica clásica O(n³) sobre las formas: el operando i
+    tiene forma dimensiones[i] × dimensiones[i+1] y multiplicar p×q por q×r
+    cuesta p·q·r multiplicaciones escalares.
+
+    Parameters:
+        dimensiones (Sequence[int]): n+1 dimensiones de los n operandos
+        costo (Optional[Callable]): costo(i, k, j) de multiplicar el producto
+            de los operandos i..k por el de k+1..j (default: p·q·r)
+
+    Returns:
+        Tuple[float, List[List[int]]]: Costo mínimo y tabla de divisiones,
+        donde division[i][j] = k indica (A_i…A_k)·(A_k+1…A_j)
+    """
+    if costo is None:
+        costo = lambda i, k, j: float(dimensiones[i]) * dimensiones[k + 1] * dimensiones[j + 1]
+
+    n = len(dimensiones) - 1
+    tabla = [[0.0] * n for _ in range(n)]
+    division = [[0] * n for _ in range(n)]
+
+    for longitud in range(2, n + 1):
+        for i in range(n - longitud + 1):
+            j = i + longitud - 1
+            mejor = float('inf')
+            for k in range(i, j):
+                candidato = tabla[i][k] + tabla[k + 1][j] + costo(i, k, j)
+                if candidato < mejor:
+                    mejor = candidato
+                    division[i][j] = k
+            tabla[i][j] = mejor
+
+    return (tabla[0][n - 1] if n else 0.0), division
+
+
+def ejecutar_cadena(operandos: Sequence, division: List[List[int]],
+                    multiplicar: Callable = None) -> object:
+    """
+    Ejecuta un producto encadenado siguiendo la tabla de ``orden_cadena_optimo``.
+
+    Parameters:
+        operandos (Sequence): Operandos en orden
+        division (List[List[int]]): Tabla de divisiones
+        multiplicar (Callable): Producto de dos operandos (default: ``@``)
+
+    Returns:
+        El producto de todos los operandos
+    """
+    if multiplicar is None:
+        multiplicar = lambda x, y: x @ y
+
+    def producto(i: int, j: int):
+        if i == j:
+            return operandos[i]
+        k = division[i][j]
+        return multiplicar(producto(i, k), producto(k + 1, j))
+
+    return producto(0, len(operandos) - 1)
+
+
+# ============ MÉTODOS PRIVADOS ============
+
+def _es_implicita(x) -> bool:
+    """Indica si un operando es una matriz implícita (sin elementos en memoria)."""
+    return hasattr(x, 'matvec')
+
+
+def _multiplicar_estructurado(a, b) -> np.ndarray:
+    """Producto de dos factores de una cadena, densos o implícitos."""
+    if _es_implicita(a) and _es_implicita(b):
+        b = b.a_densa().datos
+    if _es_implicita(a) or _es_implicita(b):
+        return a @ b
+    if np.issubdtype(a.dtype, np.integer) and np.issubdtype(b.dtype, np.integer):
+        return multiplicar_enteros(a, b)
+    return a @ b
+
+
+def _cotas_izquierda(fa: np.ndarray) -> Tuple[float, float]:
+    """Devuelve (max suma absoluta por fila, max valor absoluto) del factor izquierdo."""
+    absoluto = np.abs(fa)
+    return float(absoluto.sum(axis=1).max()), float(absoluto.max())
+
+
+def _cotas_derecha(fb: np.ndarray) -> Tuple[float, float]:
+    """Devuelve (max suma absoluta por columna, max valor absoluto) del factor derecho."""
+    absoluto = np.abs(fb)
+    return float(absoluto.sum(axis=0).max()), float(absoluto.max())
+
+
+def _cota_producto(suma_filas_a: float, max_a: float,
+                   suma_columnas_b: float, max_b: float, n: int) -> float:
+    """
+    Cota superior de toda suma parcial de (a @ b)_ij.
+
+    El factor (1 + n·2⁻⁵²) absorbe el redondeo de las sumas en float64.
+    """
+    cota = min(suma_filas_a * max_b, suma_columnas_b * max_a)
+    return cota * (1.0 + n * 2.0 ** -52)
+
+
+def _dividir_limbs(x: np.ndarray, bits: int, cantidad: int) -> List[np.ndarray]:
+    """
+    Divide una matriz entera en ``cantidad`` limbs de ``bits`` bits como float64.
+
+    Los limbs inferiores son no negativos (< 2**bits); el superior conserva
+    el signo gracias al desplazamiento aritmético.
+    """
+    x = x.astype(np.int64, copy=False)
+    mascara = (1 << bits) - 1
+    limbs = []
+    for i in range(cantidad - 1):
+        limbs.append(((x >> (bits * i)) & mascara).astype(np.float64))
+    limbs.append((x >> (bits * (cantidad - 1))).astype(np.float64))
+    return limbs
+
+
+def _bits_necesarios(x: np.ndarray) -> int:
+    """Número de bits de magnitud del mayor valor absoluto de la matriz."""
+    return max(int(x.max()), -int(x.min()), 1).bit_length()
+
+
+def _planificar_limbs(a: np.ndarray, b: np.ndarray, bits_resultado: int,
+                      max_productos: int) -> Optional[Tuple]:
+    """
+    Elige el tamaño de limb más grande cuyos productos sean todos exactos.
+
+    Returns:
+        Optional[Tuple]: (limbs_a, limbs_b, [(i, j, desplazamiento), ...]) o
+        None si no existe un plan con a lo sumo ``max_productos`` productos
+    """
+    n = a.shape[1]
+    bits_a = _bits_necesarios(a)
+    bits_b = _bits_necesarios(b)
+
+    # Con limbs de s bits, n·2**(2s) < 2**53 garantiza exactitud
+    s = (53 - n.bit_length()) // 2
+    while s >= 1:
+        cantidad_a = -(-bits_a // s)
+        cantidad_b = -(-bits_b // s)
+        pares = [(i, j, s * (i + j))
+                 for i in range(cantidad_a) for j in range(cantidad_b)
+                 if s * (i + j) < bits_resultado]
+        if len(pares) > max_productos:
+            return None
+
+        limbs_a = _dividir_limbs(a, s, cantidad_a)
+        limbs_b = _dividir_limbs(b, s, cantidad_b)
+        cotas_a = [_cotas_izquierda(limb) for limb in limbs_a]
+        cotas_b = [_cotas_derecha(limb) for limb in limbs_b]
+
+        if all(_cota_producto(*cotas_a[i], *cotas_b[j], n) < LIMITE_EXACTO_FLOAT64
+               for i, j, _ in pares):
+            return limbs_a, limbs_b, pares
+        s -= 1
+
+    return None
+
+
+def _multiplicar_por_limbs(plan: Tuple, forma: Tuple[int, int], dtype_resultado) -> np.ndarray:
+    """
+    Combina los productos de limbs con aritmética módulo 2**64.
+
+    Cada producto parcial es exacto y menor que 2**53, por lo que su
+    conversión a entero es exacta; el acumulador sin signo desborda de forma
+    bien definida, igual que el producto entero nativo de NumPy.
+    """
+    limbs_a, limbs_b, pares = plan
+    acumulado = np.zeros(forma, dtype=np.uint64)
+
+    for i, j, desplazamiento in pares:
+        parcial = (limbs_a[i] @ limbs_b[j]).astype(np.int64).view(np.uint64)
+        if desplazamiento:
+            parcial *= np.uint64(1 << desplazamiento)
+        acumulado += parcial
+
+    return acumulado.view(np.int64).astype(dtype_resultado)
+
+
+def _multiplicar_enteros_bloques(a: np.ndarray, b: np.ndarray,
+                                 hilos: Optional[int]) -> np.ndarray:
+    """
+    Producto entero por teselas repartidas en un pool de hilos.
+
+    Cada tesela de salida se calcula con el bucle entero de NumPy, que
+    libera el GIL, sobre bloques que caben en caché.
+    """
+    m, p = a.shape[0], b.shape[1]
+    resultado = np.empty((m, p), dtype=a.dtype)
+    teselas = [(i, j) for i in range(0, m, TAM_BLOQUE_ENTERO)
+               for j in range(0, p, TAM_BLOQUE_ENTERO)]
+
+    def calcular(tesela):
+        i, j = tesela
+        bloque_b = np.ascontiguousarray(b[:, j:j + TAM_BLOQUE_ENTERO])
+        np.matmul(a[i:i + TAM_BLOQUE_ENTERO], bloque_b,
+                  out=resultado[i:i + TAM_BLOQUE_ENTERO, j:j + TAM_BLOQUE_ENTERO])
+
+    with ThreadPoolExecutor(max_workers=hilos or os.cpu_count() or 1) as ejecutor:
+        list(ejecutor.map(calcular, teselas))
+
+    return resultado
+
+
+# ============ INSTRUMENTACIÓN ============
+
+def _flops_cadena(args: tuple, kwargs: dict) -> Optional[float]:
+    """2·(multiplicaciones escalares del orden óptimo), como si todas fueran densas."""
+    formas = [forma(operando) for operando in args[0]]
+    dimensiones = [f[0] for f in formas] + [formas[-1][1]]
+    # La función sin envolver: el estimador no debe registrar mediciones propias
+    return 2.0 * orden_cadena_optimo.__wrapped__(dimensiones)[0]
+
+
+def _flops_division(args: tuple, kwargs: dict) -> Optional[float]:
+    """2·(multiplicaciones escalares del orden dado), como si todas fueran densas."""
+    formas = [forma(operando) for operando in args[0]]
+    dimensiones = [f[0] for f in formas] + [formas[-1][1]]
+    division = args[1] if len(args) > 1 else kwargs['division']
+
+    def costo(i: int, j: int) -> float:
+        if i == j:
+            return 0.0
+        k = division[i][j]
+        return costo(i, k) + costo(k + 1, j) + float(dimensiones[i]) * dimensiones[k + 1] * dimensiones[j + 1]
+
+    return 2.0 * costo(0, len(formas) - 1)
+
+
+multiplicar_enteros = perfilado('operaciones.multiplicar_enteros', flops_producto)(multiplicar_enteros)
+multiplicar_cadena = perfilado('operaciones.multiplicar_cadena', _flops_cadena)(multiplicar_cadena)
+orden_cadena_optimo = perfilado('operaciones.orden_cadena_optimo')(orden_cadena_optimo)
+ejecutar_cadena = perfilado('operaciones.ejecutar_cadena', _flops_division)(ejecutar_cadena)
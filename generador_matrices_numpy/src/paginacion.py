@@ -0,0 +1,240 @@
+"""
+Paginación y Resumen de Matrices en Consola
+===========================================
+
+Presentación de matrices grandes en la terminal sin volcarlas enteras:
+
+- ``resumir``: primeras y últimas filas/columnas con elipsis (``…``,
+  ``⋮``, ``⋱``). Solo se leen y formatean los elementos de los bordes
+  (``np.ix_``), así que cuesta lo mismo para 10×10 que para 10k×10k.
+- ``Paginador``: recorre la matriz por páginas de filas y ventanas de
+  columnas que caben en la terminal, formateando solo la página pedida.
+  Órdenes: Enter/``s`` siguiente, ``a`` anterior, ``d``/``i`` columnas a
+  la derecha/izquierda, ``f N`` ir a la fila N, ``c N`` ir a la columna
+  N, ``q`` salir.
+
+Autor: Nicolas
+"""
+
+import shutil
+import numpy as np
+from typing import Callable, List, Optional, Sequence
+
+
+FILAS_POR_PAGINA = 20
+BORDES_RESUMEN = 3
+DECIMALES_CONSOLA = 3
+# A partir de este valor absoluto los flotantes se escriben en notación científica
+LIMITE_NOTACION_FIJA = 1e8
+# Columnas que se formatean como máximo para decidir cuántas caben
+MAX_COLUMNAS_VENTANA = 64
+SEPARACION = 2
+
+ELIPSIS_HORIZONTAL = '…'
+ELIPSIS_VERTICAL = '⋮'
+ELIPSIS_DIAGONAL = '⋱'
+
+AYUDA_PAGINADOR = "[Enter/s] siguiente  [a] anterior  [d/i] columnas →/←  [f N] fila  [c N] columna  [q] salir"
+
+
+def formateador_consola(dtype: np.dtype, decimales: int = DECIMALES_CONSOLA) -> Callable[[object], str]:
+    """
+    Formateador con decimales fijos, como ``np.printoptions(suppress=True)``.
+
+    Parameters:
+        dtype (np.dtype): Tipo de los elementos
+        decimales (int): Decimales de los flotantes y complejos
+
+    Returns:
+        Callable[[object], str]: Formateador de un elemento
+    """
+    if dtype.kind in 'fc':
+        def formato(valor):
+            if abs(valor) >= LIMITE_NOTACION_FIJA:
+                return f"{valor:.{decimales}e}"
+            return f"{valor:.{decimales}f}"
+        return formato
+    return str
+
+
+def _indices_bordes(total: int, bordes: int) -> List[Optional[int]]:
+    """Índices de los bordes con None en el hueco central (si lo hay)."""
+    if total <= 2 * bordes + 1:
+        return list(range(total))
+    return list(range(bordes)) + [None] + list(range(total - bordes, total))
+
+
+def componer(textos: Sequence[Sequence[str]], etiquetas_filas: Sequence[str],
+             etiquetas_columnas: Sequence[str]) -> str:
+    """
+    Alinea una rejilla de textos con índices de fila y columna.
+
+    Parameters:
+        textos (Sequence[Sequence[str]]): Texto de cada celda
+        etiquetas_filas (Sequence[str]): Índice de cada fila
+        etiquetas_columnas (Sequence[str]): Índice de cada columna
+
+    Returns:
+        str: Tabla con una línea de encabezado y una por fila
+    """
+    anchos = [max([len(etiqueta)] + [len(fila[j]) for fila in textos])
+              for j, etiqueta in enumerate(etiquetas_columnas)]
+    ancho_indice = max((len(etiqueta) for etiqueta in etiquetas_filas), default=0)
+    separador = ' ' * SEPARACION
+
+    lineas = [' ' * ancho_indice + separador
+              + separador.join(etiqueta.rjust(ancho) for etiqueta, ancho in zip(etiquetas_columnas, anchos))]
+    for etiqueta, fila in zip(etiquetas_filas, textos):
+        lineas.append(etiqueta.rjust(ancho_indice) + separador
+                      + separador.join(texto.rjust(ancho) for texto, ancho in zip(fila, anchos)))
+    return "\n".join(lineas)
+
+
+def resumir(datos: np.ndarray, decimales: int = DECIMALES_CONSOLA, bordes: int = BORDES_RESUMEN) -> str:
+    """
+    Resume una matriz con sus primeras y últimas filas y columnas.
+
+    Parameters:
+        datos (np.ndarray): Matriz 2D
+        decimales (int): Decimales de los flotantes
+        bordes (int): Filas/columnas que se muestran en cada extremo
+
+    Returns:
+        str: Tabla con elipsis en lugar de la parte central
+    """
+    filas = _indices_bordes(datos.shape[0], bordes)
+    columnas = _indices_bordes(datos.shape[1], bordes)
+    reales_filas = [i for i in filas if i is not None]
+    reales_columnas = [j for j in columnas if j is not None]
+
+    formato = formateador_consola(datos.dtype, decimales)
+    bloque = iter(datos[np.ix_(reales_filas, reales_columnas)].tolist())
+    textos = []
+    for i in filas:
+        if i is None:
+            textos.append([ELIPSIS_DIAGONAL if j is None else ELIPSIS_VERTICAL for j in columnas])
+            continue
+        valores = iter(next(bloque))
+        textos.append([ELIPSIS_HORIZONTAL if j is None else formato(next(valores)) for j in columnas])
+
+    return componer(textos,
+                    [ELIPSIS_VERTICAL if i is None else str(i) for i in filas],
+                    [ELIPSIS_HORIZONTAL if j is None else str(j) for j in columnas])
+
+
+def columnas_que_caben(datos: np.ndarray, fila: int, columna: int, filas: int, ancho: int,
+                       decimales: int = DECIMALES_CONSOLA) -> int:
+    """
+    Cuántas columnas desde ``columna`` caben en ``ancho`` caracteres.
+
+    Solo formatea las filas de la página y como mucho ``MAX_COLUMNAS_VENTANA`` columnas.
+
+    Returns:
+        int: Número de columnas (al menos 1)
+    """
+    fin = min(columna + MAX_COLUMNAS_VENTANA, datos.shape[1])
+    formato = formateador_consola(datos.dtype, decimales)
+    bloque = datos[fila:fila + filas, columna:fin].tolist()
+    usado = len(str(min(fila + filas, datos.shape[0]) - 1))
+    for j in range(fin - columna):
+        ancho_columna = max([len(str(columna + j))] + [len(formato(valores[j])) for valores in bloque])
+        usado += SEPARACION + ancho_columna
+        if usado > ancho:
+            return max(j, 1)
+    return fin - columna
+
+
+class Paginador:
+    """Recorrido interactivo de una matriz por páginas en la consola."""
+
+    def __init__(self, datos: np.ndarray, decimales: int = DECIMALES_CONSOLA,
+                 filas_por_pagina: int = FILAS_POR_PAGINA, ancho: Optional[int] = None,
+                 entrada: Callable[[str], str] = input, salida: Callable[[str], None] = print):
+        """
+        Prepara el recorrido desde la esquina superior izquierda.
+
+        Parameters:
+            datos (np.ndarray): Matriz 2D
+            decimales (int): Decimales de los flotantes
+            filas_por_pagina (int): Filas de cada página
+            ancho (Optional[int]): Ancho de la terminal (default: el detectado)
+            entrada (Callable): Lee una orden (default: input)
+            salida (Callable): Escribe una página (default: print)
+        """
+        self.datos = datos
+        self.decimales = decimales
+        self.filas_por_pagina = max(1, filas_por_pagina)
+        self.ancho = ancho or shutil.get_terminal_size().columns
+        self.fila = 0
+        self.columna = 0
+        self.columnas_visibles = 1
+        self._entrada = entrada
+        self._salida = salida
+
+    def pagina(self) -> str:
+        """Texto de la página actual (solo formatea sus elementos)."""
+        filas, columnas = self.datos.shape
+        self.columnas_visibles = columnas_que_caben(self.datos, self.fila, self.columna, self.filas_por_pagina,
+                                                    self.ancho, self.decimales)
+        fila_fin = min(self.fila + self.filas_por_pagina, filas)
+        columna_fin = min(self.columna + self.columnas_visibles, columnas)
+
+        formato = formateador_consola(self.datos.dtype, self.decimales)
+        bloque = self.datos[self.fila:fila_fin, self.columna:columna_fin].tolist()
+        tabla = componer([[formato(valor) for valor in valores] for valores in bloque],
+                         [str(i) for i in range(self.fila, fila_fin)],
+                         [str(j) for j in range(self.columna, columna_fin)])
+        return (f"{tabla}\n"
+                f"Filas {self.fila}–{fila_fin - 1} de {filas} · columnas {self.columna}–{columna_fin - 1} de {columnas}")
+
+    def procesar(self, orden: str) -> bool:
+        """
+        Aplica una orden del usuario.
+
+        Parameters:
+            orden (str): Orden (ver ``AYUDA_PAGINADOR``)
+
+        Returns:
+            bool: False si la orden es salir
+
+        Raises:
+            ValueError: Si la orden no es válida
+        """
+        partes = orden.strip().lower().split()
+        comando = partes[0] if partes else 's'
+        filas, columnas = self.datos.shape
+
+        if comando == 'q':
+            return False
+        if comando == 's':
+            if self.fila + self.filas_por_pagina < filas:
+                self.fila += self.filas_por_pagina
+        elif comando == 'a':
+            self.fila = max(self.fila - self.filas_por_pagina, 0)
+        elif comando == 'd':
+            self.columna = min(self.columna + self.columnas_visibles, columnas - 1)
+        elif comando == 'i':
+            self.columna = max(self.columna - self.columnas_visibles, 0)
+        elif comando in ('f', 'c') and len(partes) == 2 and partes[1].lstrip('-').isdigit():
+            destino = int(partes[1])
+            if comando == 'f':
+                self.fila = min(max(destino, 0), filas - 1)
+            else:
+                self.columna = min(max(destino, 0), columnas - 1)
+        else:
+            raise ValueError(f"Orden no válida: '{orden.strip()}'")
+        return True
+
+    def ejecutar(self) -> None:
+        """Muestra páginas y lee órdenes hasta que el usuario sale."""
+        while True:
+            self._salida(self.pagina())
+            try:
+                orden = self._entrada(AYUDA_PAGINADOR + "\n> ")
+            except EOFError:
+                return
+            try:
+                if not self.procesar(orden):
+                    return
+            except ValueError as e:
+                self._salida(f"❌ {e}")
@@ -0,0 +1,445 @@
+"""
+Evaluación Perezosa de Expresiones Matriciales
+==============================================
+
+Modo opcional en el que los operadores de MatrizNumPy construyen un grafo
+de expresión en lugar de calcular cada paso:
+
+    resultado = (A.perezosa() + B - C * 2).evaluar()
+
+Al evaluar:
+
+- Las subexpresiones repetidas se identifican por su estructura y se
+  calculan una sola vez.
+- Las transpuestas se propagan hasta las hojas, donde son vistas sin copia.
+- Una inversa dentro de un producto (``inv(A) @ B``) se aplica como
+  resolución con la factorización LU, sin formar A⁻¹.
+- Las potencias enteras (``A ** k``) se calculan por cuadrados sucesivos
+  con ``np.linalg.matrix_power``: O(log k) productos.
+- Los productos encadenados ``@`` se reordenan según la parentización de
+  menor costo (``operaciones.multiplicar_cadena``); las matrices
+  implícitas de ``estructuradas`` se usan como hojas sin materializarlas.
+- Las cadenas de operaciones elemento a elemento se fusionan: se recorren
+  por bloques de filas que caben en caché, con búferes de bloque
+  reutilizados y una única matriz de salida.
+
+Las hojas referencian los arrays de las matrices originales; si éstas se
+modifican en sitio antes de evaluar, el resultado refleja los nuevos datos.
+
+Autor: Nicolas
+"""
+
+import numbers
+import numpy as np
+from collections import Counter
+from typing import Dict, List, Optional, Tuple, Union
+
+from .matriz_numpy import MatrizNumPy
+from .operaciones import multiplicar_cadena
+from .estructuradas import MatrizInversa
+
+# Elementos por bloque fusionado: 256 KB en float64, cabe en la caché L2
+ELEMENTOS_POR_BLOQUE = 1 << 15
+
+_ELEMENTALES = {'+', '-', 'neg', 'escalar'}
+_UFUNCS = {'+': np.add, '-': np.subtract}
+
+
+class _Clave(tuple):
+    """Clave estructural de un nodo con hash calculado una sola vez."""
+
+    def __hash__(self) -> int:
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash = tuple.__hash__(self)
+            return self._hash
+
+
+class ExpresionPerezosa:
+    """
+    Nodo de un grafo de expresión matricial sin evaluar.
+
+    Attributes:
+        operacion (str): 'hoja', 'T', '+', '-', 'neg', 'escalar', '@', 'inv' o '**'
+        hijos (Tuple[ExpresionPerezosa, ...]): Operandos del nodo
+        valor: Array de la hoja, escalar del nodo 'escalar' o exponente del nodo '**'
+        nombre (Optional[str]): Nombre de la hoja en los planes impresos
+        forma (Tuple[int, int]): Forma del resultado
+        dtype (np.dtype): Tipo de datos del resultado
+    """
+
+    # Evita que NumPy intente operar elemento a elemento con la expresión
+    __array_ufunc__ = None
+
+    def __init__(self, operacion: str, hijos: Tuple['ExpresionPerezosa', ...],
+                 forma: Tuple[int, int], dtype: np.dtype, valor=None, nombre: Optional[str] = None):
+        self.operacion = operacion
+        self.hijos = hijos
+        self.forma = forma
+        self.dtype = np.dtype(dtype)
+        self.valor = valor
+        self.nombre = nombre
+
+        if operacion == 'hoja':
+            self.clave = _Clave(('hoja', id(valor)))
+        else:
+            etiqueta = (valor, type(valor).__name__) if valor is not None else None
+            self.clave = _Clave((operacion, etiqueta) + tuple(h.clave for h in hijos))
+
+    @classmethod
+    def hoja(cls, datos: Union[MatrizNumPy, np.ndarray], nombre: Optional[str] = None) -> 'ExpresionPerezosa':
+        """Crea una hoja que referencia (sin copiar) los datos de una matriz."""
+        if _es_implicita(datos):
+            return cls('hoja', (), datos.shape, datos.dtype, valor=datos, nombre=nombre)
+        if isinstance(datos, MatrizNumPy):
+            datos = datos.datos
+        if not isinstance(datos, np.ndarray) or datos.ndim != 2:
+            raise ValueError("Las hojas deben ser matrices 2D")
+        return cls('hoja', (), datos.shape, datos.dtype, valor=datos, nombre=nombre)
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        """Devuelve la forma (dimensiones) del resultado."""
+        return self.forma
+
+    # ============ CONSTRUCCIÓN DEL GRAFO ============
+
+    @property
+    def T(self) -> 'ExpresionPerezosa':
+        """Transpuesta, propagada hasta las hojas."""
+        op = self.operacion
+        if op == 'T':
+            return self.hijos[0]
+        if op == 'hoja':
+            return ExpresionPerezosa('T', (self,), self.forma[::-1], self.dtype)
+        if op == '@':
+            return self.hijos[1].T @ self.hijos[0].T
+        if op == 'escalar':
+            return self.hijos[0].T._escalar(self.valor)
+        if op == 'inv':
+            return self.hijos[0].T.inversa()
+        if op == '**':
+            return self.hijos[0].T.potencia(self.valor)
+        hijos = tuple(h.T for h in self.hijos)
+        return ExpresionPerezosa(op, hijos, self.forma[::-1], self.dtype)
+
+    def transponer(self) -> 'ExpresionPerezosa':
+        """Calcula la transpuesta de la expresión."""
+        return self.T
+
+    def inversa(self) -> 'ExpresionPerezosa':
+        """
+        Inversa perezosa; dentro de un producto se aplica como resolución.
+
+        Raises:
+            ValueError: Si la matriz no es cuadrada
+        """
+        if self.forma[0] != self.forma[1]:
+            raise ValueError("Solo las matrices cuadradas tienen inversa")
+        return ExpresionPerezosa('inv', (self,), self.forma, np.result_type(self.dtype, np.float64))
+
+    def potencia(self, exponente: int) -> 'ExpresionPerezosa':
+        """
+        Potencia entera perezosa; los exponentes negativos usan la inversa.
+
+        Parameters:
+            exponente (int): Exponente entero distinto de cero
+
+        Raises:
+            ValueError: Si la matriz no es cuadrada o el exponente no es válido
+        """
+        if self.forma[0] != self.forma[1]:
+            raise ValueError("Solo se pueden elevar a potencias las matrices cuadradas")
+        if isinstance(exponente, bool) or not isinstance(exponente, numbers.Integral) or exponente == 0:
+            raise ValueError("El exponente debe ser un entero distinto de cero")
+        base = self.inversa() if exponente < 0 else self
+        if abs(exponente) == 1:
+            return base
+        return ExpresionPerezosa('**', (base,), self.forma, base.dtype, valor=abs(int(exponente)))
+
+    def __add__(self, otra) -> 'ExpresionPerezosa':
+        """Suma perezosa usando el operador +."""
+        return self._elemental('+', otra, "Las matrices deben tener las mismas dimensiones para sumar")
+
+    def __radd__(self, otra) -> 'ExpresionPerezosa':
+        """Suma perezosa (orden inverso)."""
+        otra = _como_expresion(otra)
+        return NotImplemented if otra is None else otra + self
+
+    def __sub__(self, otra) -> 'ExpresionPerezosa':
+        """Resta perezosa usando el operador -."""
+        return self._elemental('-', otra, "Las matrices deben tener las mismas dimensiones para restar")
+
+    def __rsub__(self, otra) -> 'ExpresionPerezosa':
+        """Resta perezosa (orden inverso)."""
+        otra = _como_expresion(otra)
+        return NotImplemented if otra is None else otra - self
+
+    def __neg__(self) -> 'ExpresionPerezosa':
+        """Negación perezosa."""
+        return ExpresionPerezosa('neg', (self,), self.forma, self.dtype)
+
+    def __mul__(self, escalar: Union[int, float]) -> 'ExpresionPerezosa':
+        """Multiplicación perezosa por escalar usando el operador *."""
+        if not isinstance(escalar, numbers.Number):
+            return NotImplemented
+        return self._escalar(escalar)
+
+    def __rmul__(self, escalar: Union[int, float]) -> 'ExpresionPerezosa':
+        """Multiplicación perezosa por escalar (orden inverso)."""
+        return self.__mul__(escalar)
+
+    def __matmul__(self, otra) -> 'ExpresionPerezosa':
+        """Producto matricial perezoso usando el operador @."""
+        otra = _como_expresion(otra)
+        if otra is None:
+            return NotImplemented
+        if self.forma[1] != otra.forma[0]:
+            raise ValueError(f"Para multiplicar matrices, las columnas de la primera ({self.forma[1]}) "
+                             f"deben ser iguales a las filas de la segunda ({otra.forma[0]})")
+        return ExpresionPerezosa('@', (self, otra), (self.forma[0], otra.forma[1]),
+                                 np.result_type(self.dtype, otra.dtype))
+
+    def __rmatmul__(self, otra) -> 'ExpresionPerezosa':
+        """Producto matricial perezoso (orden inverso)."""
+        otra = _como_expresion(otra)
+        return NotImplemented if otra is None else otra @ self
+
+    def __pow__(self, exponente: int) -> 'ExpresionPerezosa':
+        """Potencia perezosa usando el operador **."""
+        return self.potencia(exponente)
+
+    # ============ EVALUACIÓN ============
+
+    def evaluar(self) -> MatrizNumPy:
+        """
+        Evalúa el grafo y devuelve el resultado como MatrizNumPy.
+
+        Returns:
+            MatrizNumPy: Resultado en una matriz nueva
+        """
+        datos = _Evaluador(self).materializar(self)
+        if self.operacion in ('hoja', 'T'):
+            datos = datos.copy()
+
+        resultado = MatrizNumPy(self.forma[0], self.forma[1], dtype=datos.dtype, inicializar_ceros=False)
+        resultado.datos = datos
+        return resultado
+
+    def __str__(self) -> str:
+        """Representación legible de la expresión."""
+        op = self.operacion
+        if op == 'hoja':
+            return self.nombre or f"M{self.forma[0]}×{self.forma[1]}"
+        if op == 'T':
+            return f"{self.hijos[0]}.T"
+        if op == 'neg':
+            return f"-({self.hijos[0]})"
+        if op == 'escalar':
+            return f"{self.valor}*({self.hijos[0]})"
+        if op == 'inv':
+            return f"inv({self.hijos[0]})"
+        if op == '**':
+            return f"({self.hijos[0]})**{self.valor}"
+        return f"({self.hijos[0]} {op} {self.hijos[1]})"
+
+    def __repr__(self) -> str:
+        """Representación técnica de la expresión."""
+        return f"ExpresionPerezosa({self}, forma={self.forma}, dtype={self.dtype})"
+
+    # ============ MÉTODOS PRIVADOS ============
+
+    def _elemental(self, operacion: str, otra, mensaje: str) -> 'ExpresionPerezosa':
+        """Crea un nodo binario elemento a elemento."""
+        otra = _como_expresion(otra)
+        if otra is None:
+            return NotImplemented
+        if self.forma != otra.forma:
+            raise ValueError(mensaje)
+        return ExpresionPerezosa(operacion, (self, otra), self.forma,
+                                 np.result_type(self.dtype, otra.dtype))
+
+    def _escalar(self, escalar: Union[int, float]) -> 'ExpresionPerezosa':
+        """Crea un nodo de multiplicación por escalar."""
+        dtype = (np.empty(0, dtype=self.dtype) * escalar).dtype
+        return ExpresionPerezosa('escalar', (self,), self.forma, dtype, valor=escalar)
+
+
+def perezosa(matriz: Union[MatrizNumPy, np.ndarray]) -> ExpresionPerezosa:
+    """Envuelve una matriz como hoja de una expresión perezosa."""
+    return ExpresionPerezosa.hoja(matriz)
+
+
+def inversa(matriz: Union[ExpresionPerezosa, MatrizNumPy, np.ndarray]) -> ExpresionPerezosa:
+    """Inversa perezosa de una matriz o expresión."""
+    return _como_expresion(matriz).inversa()
+
+
+# ============ MÉTODOS PRIVADOS ============
+
+def _como_expresion(x) -> Optional[ExpresionPerezosa]:
+    """Convierte un operando en expresión, o None si no es compatible."""
+    if isinstance(x, ExpresionPerezosa):
+        return x
+    if isinstance(x, (MatrizNumPy, np.ndarray)) or _es_implicita(x):
+        return ExpresionPerezosa.hoja(x)
+    return None
+
+
+def _es_implicita(x) -> bool:
+    """Indica si un operando es una matriz implícita (ver ``estructuradas``)."""
+    return hasattr(x, 'matvec')
+
+
+class _Evaluador:
+    """Evalúa un grafo de expresión reutilizando resultados compartidos."""
+
+    def __init__(self, raiz: ExpresionPerezosa):
+        self.materializados: Dict[_Clave, np.ndarray] = {}
+        self.inversas: Dict[_Clave, MatrizInversa] = {}
+        self.referencias: Counter = Counter()
+        self.buferes: Dict[Tuple, List[np.ndarray]] = {}
+        self.forma_bufer: Tuple[int, int] = (0, 0)
+
+        # Cuántos padres distintos usa cada subexpresión
+        visitados = set()
+        pendientes = [raiz]
+        while pendientes:
+            nodo = pendientes.pop()
+            if nodo.clave in visitados:
+                continue
+            visitados.add(nodo.clave)
+            for hijo in nodo.hijos:
+                self.referencias[hijo.clave] += 1
+                pendientes.append(hijo)
+
+    def materializar(self, nodo: ExpresionPerezosa) -> np.ndarray:
+        """Calcula (una sola vez) el array completo de un nodo."""
+        if nodo.clave in self.materializados:
+            return self.materializados[nodo.clave]
+
+        if nodo.operacion == 'hoja':
+            resultado = nodo.valor.a_densa().datos if _es_implicita(nodo.valor) else nodo.valor
+        elif nodo.operacion == 'T':
+            resultado = self.materializar(nodo.hijos[0]).T
+        elif nodo.operacion == '@':
+            resultado = self._cadena(nodo)
+        elif nodo.operacion == 'inv':
+            n = nodo.forma[0]
+            resultado = MatrizInversa(self.materializar(nodo.hijos[0])).matvec(np.eye(n, dtype=nodo.dtype))
+        elif nodo.operacion == '**':
+            resultado = np.linalg.matrix_power(self.materializar(nodo.hijos[0]), nodo.valor)
+        else:
+            resultado = self._fusionar(nodo)
+
+        self.materializados[nodo.clave] = resultado
+        return resultado
+
+    def _cadena(self, nodo: ExpresionPerezosa) -> np.ndarray:
+        """Evalúa una cadena de productos en el orden de menor costo."""
+        operandos = []
+        for factor in self._aplanar(nodo):
+            hoja = factor.hijos[0] if factor.operacion == 'T' else factor
+            if hoja.operacion == 'hoja' and _es_implicita(hoja.valor):
+                # Las implícitas se aplican sin materializarse
+                operandos.append(hoja.valor.transponer() if factor is not hoja else hoja.valor)
+            elif factor.operacion == 'inv' and factor.clave not in self.materializados:
+                # La factorización se comparte entre todos los usos de la inversa
+                if factor.clave not in self.inversas:
+                    self.inversas[factor.clave] = MatrizInversa(self.materializar(factor.hijos[0]))
+                operandos.append(self.inversas[factor.clave])
+            else:
+                operandos.append(self.materializar(factor))
+        return multiplicar_cadena(operandos)
+
+    def _aplanar(self, nodo: ExpresionPerezosa) -> List[ExpresionPerezosa]:
+        """Lista los factores de una cadena; los productos compartidos son un solo factor."""
+        factores = []
+        for hijo in nodo.hijos:
+            if hijo.operacion == '@' and self.referencias[hijo.clave] <= 1:
+                factores.extend(self._aplanar(hijo))
+            else:
+                factores.append(hijo)
+        return factores
+
+    def _fusionar(self, raiz: ExpresionPerezosa) -> np.ndarray:
+        """Evalúa una región elemento a elemento por bloques de filas."""
+        # Las entradas de la región (hojas, transpuestas, productos) se
+        # calculan antes para que el recorrido por bloques no se anide
+        pendientes = [raiz]
+        while pendientes:
+            nodo = pendientes.pop()
+            if nodo.operacion in _ELEMENTALES and nodo.clave not in self.materializados:
+                pendientes.extend(nodo.hijos)
+            else:
+                self.materializar(nodo)
+
+        filas, columnas = raiz.forma
+        salida = np.empty(raiz.forma, dtype=raiz.dtype)
+        filas_bloque = max(1, ELEMENTOS_POR_BLOQUE // max(columnas, 1))
+        self.forma_bufer = (filas_bloque, columnas)
+
+        for inicio in range(0, filas, filas_bloque):
+            bloque = slice(inicio, min(inicio + filas_bloque, filas))
+            compartidos: Dict[_Clave, np.ndarray] = {}
+            destino = salida[bloque]
+            # Si la raíz también se usa fuera de la región, _calcular la deja
+            # en un búfer de bloque y no en destino
+            resultado = self._calcular(raiz, bloque, destino, compartidos)
+            if resultado is not destino:
+                destino[...] = resultado
+            for bufer in compartidos.values():
+                self._liberar(bufer)
+
+        return salida
+
+    def _calcular(self, nodo: ExpresionPerezosa, bloque: slice, destino: np.ndarray,
+                  compartidos: Dict[_Clave, np.ndarray]) -> np.ndarray:
+        """
+        Calcula un bloque de filas de ``nodo``.
+
+        ``destino`` es un búfer del dtype del nodo que puede sobrescribirse;
+        el resultado se devuelve en él o, para entradas y subexpresiones
+        compartidas, en otro array que no debe modificarse.
+        """
+        if nodo.operacion not in _ELEMENTALES or nodo.clave in self.materializados:
+            return self.materializar(nodo)[bloque]
+        if nodo.clave in compartidos:
+            return compartidos[nodo.clave]
+        if self.referencias[nodo.clave] > 1:
+            # Se conserva hasta terminar el bloque para los demás usos
+            destino = self._tomar(nodo.dtype, bloque)
+            compartidos[nodo.clave] = destino
+
+        temporales = []
+        operandos = []
+        for hijo in nodo.hijos:
+            if hijo.dtype == destino.dtype and all(x is not destino for x in operandos):
+                destino_hijo = destino
+            else:
+                destino_hijo = self._tomar(hijo.dtype, bloque)
+                temporales.append(destino_hijo)
+            operandos.append(self._calcular(hijo, bloque, destino_hijo, compartidos))
+
+        if nodo.operacion == 'escalar':
+            np.multiply(operandos[0], nodo.valor, out=destino)
+        elif nodo.operacion == 'neg':
+            np.negative(operandos[0], out=destino)
+        else:
+            _UFUNCS[nodo.operacion](operandos[0], operandos[1], out=destino)
+
+        for bufer in temporales:
+            self._liberar(bufer)
+        return destino
+
+    def _tomar(self, dtype: np.dtype, bloque: slice) -> np.ndarray:
+        """Obtiene un búfer de bloque libre del dtype pedido."""
+        libres = self.buferes.setdefault((np.dtype(dtype), self.forma_bufer), [])
+        bufer = libres.pop() if libres else np.empty(self.forma_bufer, dtype=dtype)
+        return bufer[:bloque.stop - bloque.start]
+
+    def _liberar(self, bufer: np.ndarray) -> None:
+        """Devuelve un búfer al conjunto de libres."""
+        base = bufer.base if bufer.base is not None else bufer
+        self.buferes[(base.dtype, base.shape)].append(base)
@@ -0,0 +1,354 @@
+"""
+Perfilador de Operaciones
+=========================
+
+Registro en memoria de lo que cuestan las operaciones de ``MatrizNumPy``
+y de ``operaciones``: tiempo real y de CPU, FLOPs estimados, bytes
+reservados y formas/tipos de las entradas.
+
+- Las funciones se envuelven una sola vez al importar el módulo
+  (``perfilado`` / ``instrumentar_clase``). Con el perfilador desactivado
+  (el estado inicial) el envoltorio solo comprueba un atributo y llama a
+  la función original.
+- Los bytes se miden con ``tracemalloc`` (pico durante la llamada menos lo
+  reservado al empezar) solo si se activa con ``memoria=True``, y solo en
+  las llamadas de primer nivel: las anidadas reiniciarían el pico de la
+  que las contiene.
+- Cada operación guarda sus últimas ``MAX_MEDICIONES`` mediciones;
+  ``resumen`` calcula percentiles del tiempo real.
+
+Uso::
+
+    from src.perfilador import PERFILADOR
+
+    with PERFILADOR.perfilando(memoria=True):
+        (a @ b).inversa()
+    print(PERFILADOR.informe())
+
+Autor: Nicolas
+"""
+
+import functools
+import threading
+import time
+import tracemalloc
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+MAX_MEDICIONES = 10_000
+PERCENTILES = (50, 90, 99)
+
+# Estimador de FLOPs: recibe los argumentos posicionales y con nombre de la llamada
+EstimadorFlops = Callable[[tuple, dict], Optional[float]]
+
+
+class Medicion:
+    """Costo de una llamada a una operación."""
+
+    __slots__ = ('operacion', 'tiempo', 'cpu', 'flops', 'bytes', 'formas', 'tipos', 'profundidad')
+
+    def __init__(self, operacion: str, tiempo: float, cpu: float, flops: Optional[float],
+                 bytes: Optional[int], formas: Tuple, tipos: Tuple, profundidad: int):
+        self.operacion = operacion
+        self.tiempo = tiempo
+        self.cpu = cpu
+        self.flops = flops
+        self.bytes = bytes
+        self.formas = formas
+        self.tipos = tipos
+        self.profundidad = profundidad
+
+    def __repr__(self) -> str:
+        return (f"Medicion({self.operacion}, {self.tiempo * 1e3:.3f} ms, formas={self.formas}, "
+                f"flops={self.flops}, bytes={self.bytes})")
+
+
+def forma(valor: Any) -> Optional[Tuple[int, ...]]:
+    """Forma de una MatrizNumPy, array o matriz implícita (None si no tiene)."""
+    datos = getattr(valor, 'datos', valor)
+    forma_valor = getattr(datos, 'shape', None)
+    if forma_valor is None:
+        forma_valor = getattr(valor, 'shape', None)
+    return tuple(forma_valor) if forma_valor is not None and len(forma_valor) > 0 else None
+
+
+def tipo(valor: Any) -> Optional[str]:
+    """Nombre del dtype de una MatrizNumPy o array (None si no tiene)."""
+    dtype = getattr(getattr(valor, 'datos', valor), 'dtype', None)
+    return str(dtype) if dtype is not None else None
+
+
+# ============ ESTIMADORES DE FLOPS ============
+
+def flops_elementos(args: tuple, kwargs: dict) -> Optional[float]:
+    """Una operación por elemento del primer operando."""
+    forma_a = forma(args[0]) if args else None
+    return float(np.prod(forma_a)) if forma_a else None
+
+
+def flops_producto(args: tuple, kwargs: dict) -> Optional[float]:
+    """2·m·k·n para el producto de los dos primeros operandos."""
+    forma_a, forma_b = (forma(args[0]), forma(args[1])) if len(args) > 1 else (None, None)
+    if not forma_a or not forma_b or len(forma_a) != 2:
+        return None
+    columnas_b = forma_b[1] if len(forma_b) == 2 else 1
+    return 2.0 * forma_a[0] * forma_a[1] * columnas_b
+
+
+def flops_cubicos(factor: float) -> EstimadorFlops:
+    """factor·n³ con n el lado del primer operando (factorizaciones, inversas)."""
+    def estimar(args: tuple, kwargs: dict) -> Optional[float]:
+        forma_a = forma(args[0]) if args else None
+        if not forma_a or len(forma_a) != 2:
+            return None
+        m, n = forma_a
+        return factor * float(max(m, n)) * min(m, n) ** 2
+    return estimar
+
+
+class Perfilador:
+    """Registro de mediciones por operación."""
+
+    def __init__(self, max_mediciones: int = MAX_MEDICIONES):
+        """
+        Crea un perfilador desactivado y vacío.
+
+        Parameters:
+            max_mediciones (int): Mediciones que se guardan por operación
+        """
+        self.activo = False
+        self.memoria = False
+        self.max_mediciones = max_mediciones
+        self._mediciones: Dict[str, deque] = {}
+        self._cerrojo = threading.Lock()
+        self._local = threading.local()
+        self._tracemalloc_propio = False
+
+    def activar(self, memoria: bool = False) -> None:
+        """
+        Empieza a medir.
+
+        Parameters:
+            memoria (bool): Medir también los bytes reservados (tracemalloc,
+                que ralentiza notablemente todas las reservas de memoria)
+        """
+        self.memoria = memoria
+        if memoria and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._tracemalloc_propio = True
+        self.activo = True
+
+    def desactivar(self) -> None:
+        """Deja de medir (las mediciones se conservan)."""
+        self.activo = False
+        self.memoria = False
+        if self._tracemalloc_propio:
+            tracemalloc.stop()
+            self._tracemalloc_propio = False
+
+    @contextmanager
+    def perfilando(self, memoria: bool = False):
+        """Activa el perfilador dentro de un bloque ``with``."""
+        self.activar(memoria)
+        try:
+            yield self
+        finally:
+            self.desactivar()
+
+    def medir(self, operacion: str, funcion: Callable, args: tuple, kwargs: dict,
+              flops: Optional[EstimadorFlops] = None) -> Any:
+        """
+        Ejecuta una llamada y registra su medición.
+
+        Parameters:
+            operacion (str): Nombre con el que se registra
+            funcion (Callable): Función a ejecutar
+            args, kwargs: Argumentos de la llamada
+            flops (Optional[EstimadorFlops]): Estimador de FLOPs
+
+        Returns:
+            El resultado de la llamada
+        """
+        profundidad = getattr(self._local, 'profundidad', 0)
+        medir_memoria = self.memoria and profundidad == 0 and tracemalloc.is_tracing()
+        if medir_memoria:
+            reservado, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+
+        self._local.profundidad = profundidad + 1
+        cpu_inicio = time.process_time()
+        inicio = time.perf_counter()
+        try:
+            return funcion(*args, **kwargs)
+        finally:
+            tiempo = time.perf_counter() - inicio
+            cpu = time.process_time() - cpu_inicio
+            self._local.profundidad = profundidad
+
+            bytes_reservados = None
+            if medir_memoria:
+                bytes_reservados = max(tracemalloc.get_traced_memory()[1] - reservado, 0)
+            try:
+                estimados = flops(args, kwargs) if flops is not None else None
+            except Exception:
+                estimados = None
+            valores = tuple(args) + tuple(kwargs.values())
+            formas = tuple(f for f in map(forma, valores) if f is not None)
+            tipos = tuple(t for t in map(tipo, valores) if t is not None)
+            self.registrar(Medicion(operacion, tiempo, cpu, estimados, bytes_reservados, formas, tipos,
+                                    profundidad))
+
+    def registrar(self, medicion: Medicion) -> None:
+        """Añade una medición al registro de su operación."""
+        with self._cerrojo:
+            registro = self._mediciones.get(medicion.operacion)
+            if registro is None:
+                registro = self._mediciones[medicion.operacion] = deque(maxlen=self.max_mediciones)
+            registro.append(medicion)
+
+    def mediciones(self, operacion: Optional[str] = None) -> List[Medicion]:
+        """
+        Mediciones guardadas, de una operación o de todas.
+
+        Parameters:
+            operacion (Optional[str]): Nombre de la operación (default: todas)
+
+        Returns:
+            List[Medicion]: Mediciones en orden de registro por operación
+        """
+        with self._cerrojo:
+            if operacion is not None:
+                return list(self._mediciones.get(operacion, ()))
+            return [m for registro in self._mediciones.values() for m in registro]
+
+    def resumen(self, percentiles: Sequence[float] = PERCENTILES) -> Dict[str, Dict[str, float]]:
+        """
+        Estadísticas por operación.
+
+        Parameters:
+            percentiles (Sequence[float]): Percentiles del tiempo real
+
+        Returns:
+            Dict[str, Dict[str, float]]: Para cada operación: ``llamadas``,
+            ``total``, ``media``, ``p50``… (segundos), ``cpu`` (segundos),
+            ``flops`` (suma de las estimadas), ``gflops`` (por segundo real)
+            y ``bytes_max`` (None si no se midió)
+        """
+        with self._cerrojo:
+            registros = {operacion: list(registro) for operacion, registro in self._mediciones.items()}
+
+        resumen = {}
+        for operacion, registro in sorted(registros.items()):
+            tiempos = np.fromiter((m.tiempo for m in registro), dtype=np.float64, count=len(registro))
+            flops = [m.flops for m in registro if m.flops is not None]
+            bytes_medidos = [m.bytes for m in registro if m.bytes is not None]
+            estadisticas = {
+                'llamadas': len(registro),
+                'total': float(tiempos.sum()),
+                'media': float(tiempos.mean()),
+                'cpu': sum(m.cpu for m in registro),
+                'flops': float(sum(flops)) if flops else None,
+                'gflops': None,
+                'bytes_max': max(bytes_medidos) if bytes_medidos else None,
+            }
+            for p, valor in zip(percentiles, np.percentile(tiempos, percentiles)):
+                estadisticas[f"p{p:g}"] = float(valor)
+            tiempo_con_flops = sum(m.tiempo for m in registro if m.flops is not None)
+            if flops and tiempo_con_flops > 0:
+                estadisticas['gflops'] = estadisticas['flops'] / tiempo_con_flops / 1e9
+            resumen[operacion] = estadisticas
+        return resumen
+
+    def informe(self, percentiles: Sequence[float] = PERCENTILES) -> str:
+        """
+        Tabla de texto con el resumen, de mayor a menor tiempo total.
+
+        Returns:
+            str: Una línea por operación
+        """
+        resumen = self.resumen(percentiles)
+        if not resumen:
+            return "(sin mediciones)"
+
+        columnas_p = [f"p{p:g}" for p in percentiles]
+        ancho = max(len(operacion) for operacion in resumen)
+        lineas = [f"{'Operación':<{ancho}}  {'llamadas':>8}  {'total ms':>10}  "
+                  + "  ".join(f"{c + ' ms':>9}" for c in columnas_p)
+                  + f"  {'GFLOP/s':>8}  {'pico MB':>8}"]
+        for operacion, e in sorted(resumen.items(), key=lambda par: -par[1]['total']):
+            gflops = f"{e['gflops']:.2f}" if e['gflops'] is not None else "—"
+            pico = f"{e['bytes_max'] / 2**20:.1f}" if e['bytes_max'] is not None else "—"
+            lineas.append(f"{operacion:<{ancho}}  {e['llamadas']:>8}  {e['total'] * 1e3:>10.3f}  "
+                          + "  ".join(f"{e[c] * 1e3:>9.3f}" for c in columnas_p)
+                          + f"  {gflops:>8}  {pico:>8}")
+        return "\n".join(lineas)
+
+    def limpiar(self) -> None:
+        """Descarta todas las mediciones."""
+        with self._cerrojo:
+            self._mediciones.clear()
+
+
+# Perfilador compartido por MatrizNumPy y operaciones
+PERFILADOR = Perfilador()
+
+
+def perfilado(operacion: str, flops: Optional[EstimadorFlops] = None) -> Callable[[Callable], Callable]:
+    """
+    Decorador que registra las llamadas en ``PERFILADOR`` cuando está activo.
+
+    Parameters:
+        operacion (str): Nombre con el que se registran las llamadas
+        flops (Optional[EstimadorFlops]): Estimador de FLOPs de la llamada
+
+    Returns:
+        Callable: Decorador
+    """
+    def decorar(funcion: Callable) -> Callable:
+        @functools.wraps(funcion)
+        def envoltorio(*args, **kwargs):
+            if not PERFILADOR.activo:
+                return funcion(*args, **kwargs)
+            return PERFILADOR.medir(operacion, funcion, args, kwargs, flops)
+        envoltorio.__wrapped_perfilado__ = True
+        return envoltorio
+    return decorar
+
+
+def instrumentar_clase(clase: type, prefijo: str, excluir: Iterable[str] = (),
+                       especiales: Iterable[str] = (),
+                       flops: Optional[Dict[str, EstimadorFlops]] = None) -> type:
+    """
+    Envuelve con ``perfilado`` los métodos públicos de una clase.
+
+    Se instrumentan los métodos cuyo nombre no empieza por ``_`` (también
+    classmethod y staticmethod) y los indicados en ``especiales``; las
+    propiedades no.
+
+    Parameters:
+        clase (type): Clase a instrumentar (se modifica en el sitio)
+        prefijo (str): Prefijo de los nombres registrados (``prefijo.metodo``)
+        excluir (Iterable[str]): Métodos que no se instrumentan
+        especiales (Iterable[str]): Métodos ``__x__`` que sí se instrumentan
+        flops (Optional[Dict[str, EstimadorFlops]]): Estimador por método
+
+    Returns:
+        type: La misma clase
+    """
+    excluir = set(excluir)
+    especiales = set(especiales)
+    flops = flops or {}
+    for nombre, atributo in list(vars(clase).items()):
+        if nombre in excluir or (nombre.startswith('_') and nombre not in especiales):
+            continue
+        decorador = perfilado(f"{prefijo}.{nombre}", flops.get(nombre))
+        if isinstance(atributo, classmethod):
+            setattr(clase, nombre, classmethod(decorador(atributo.__func__)))
+        elif isinstance(atributo, staticmethod):
+            setattr(clase, nombre, staticmethod(decorador(atributo.__func__)))
+        elif callable(atributo) and not getattr(atributo, '__wrapped_perfilado__', False):
+            setattr(clase, nombre, decorador(atributo))
+    return clase
@@ -0,0 +1,245 @@
+"""
+Producto Matricial Repartido entre Procesos
+===========================================
+
+Para dtypes que NumPy multiplica sin BLAS, y en especial ``object``
+(enteros de precisión arbitraria, ``Fraction``), cuyo bucle se ejecuta con
+el GIL tomado, el producto se reparte en teselas de salida entre los
+procesos de un pool que se crea una vez y se reutiliza entre llamadas.
+
+- dtypes de tamaño fijo (int64, ...): A, B y C se colocan en un único
+  segmento de ``multiprocessing.shared_memory``. Cada tarea solo transporta
+  el nombre del segmento y las coordenadas de su tesela, y el proceso
+  escribe el resultado directamente en C: los datos nunca se serializan.
+- ``object``: los elementos son objetos de Python y no pueden compartirse.
+  A y B se serializan una sola vez en un segmento compartido, cada proceso
+  los deserializa una vez por llamada y devuelve sus teselas.
+
+Las teselas dividen filas y columnas del resultado pero nunca la dimensión
+interna. Con enteros y ``object`` la aritmética es exacta (o desborda igual
+que NumPy) y el resultado es idéntico a ``a @ b``. Con coma flotante, el
+orden de las sumas dentro de cada tesela puede diferir del de ``a @ b``
+sobre la matriz completa (BLAS agrupa según la forma), así que el resultado
+coincide solo salvo redondeo.
+
+Autor: Nicolas
+"""
+
+import atexit
+import os
+import pickle
+import threading
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import List, Optional, Tuple
+
+# Lado máximo de las teselas de salida
+TAM_TESELA_PROCESOS = 256
+
+# Por debajo de este número de productos escalares ``object`` no compensa repartir
+MIN_OPERACIONES_PROCESOS = 1 << 18
+
+# Alineación de cada operando dentro del segmento compartido
+_ALINEACION = 64
+
+_pool: Optional[ProcessPoolExecutor] = None
+_procesos_pool = 0
+_cerrojo_pool = threading.Lock()
+
+# Operandos ``object`` deserializados en el proceso trabajador: (segmento, a, b)
+_operandos_trabajador: Optional[Tuple] = None
+
+
+def multiplicar_en_procesos(a: np.ndarray, b: np.ndarray, procesos: Optional[int] = None,
+                            tam_tesela: Optional[int] = None) -> np.ndarray:
+    """
+    Calcula ``a @ b`` repartiendo teselas de salida entre procesos.
+
+    Parameters:
+        a (np.ndarray): Matriz m×n
+        b (np.ndarray): Matriz n×p
+        procesos (Optional[int]): Procesos del pool (default: núcleos disponibles)
+        tam_tesela (Optional[int]): Lado de las teselas (default: el mayor
+            hasta ``TAM_TESELA_PROCESOS`` que da al menos 4 teselas por proceso)
+
+    Returns:
+        np.ndarray: Producto; idéntico a ``a @ b`` con enteros y ``object``,
+        igual salvo redondeo con coma flotante
+
+    Raises:
+        ValueError: Si las dimensiones no son compatibles
+    """
+    if a.ndim != 2 or b.ndim != 2 or a.shape[1] != b.shape[0]:
+        raise ValueError(f"No se puede multiplicar {a.shape} por {b.shape}")
+    procesos = procesos or os.cpu_count() or 1
+    m, p = a.shape[0], b.shape[1]
+    if tam_tesela is None:
+        tam_tesela = TAM_TESELA_PROCESOS
+        while tam_tesela > 16 and -(-m // tam_tesela) * -(-p // tam_tesela) < 4 * procesos:
+            tam_tesela //= 2
+    if tam_tesela < 1:
+        raise ValueError("El tamaño de tesela debe ser positivo")
+
+    teselas = [(i, min(i + tam_tesela, m), j, min(j + tam_tesela, p))
+               for i in range(0, m, tam_tesela) for j in range(0, p, tam_tesela)]
+    dtype = np.result_type(a, b)
+    if not teselas or a.shape[1] == 0:
+        return a @ b
+
+    pool = obtener_pool(procesos)
+    bloque_tareas = max(1, len(teselas) // (4 * procesos))
+    if dtype.hasobject:
+        return _multiplicar_objetos(pool, a, b, teselas, bloque_tareas)
+    return _multiplicar_compartido(pool, a.astype(dtype, copy=False), b.astype(dtype, copy=False),
+                                   teselas, bloque_tareas)
+
+
+def multiplicar_objetos(a: np.ndarray, b: np.ndarray, procesos: Optional[int] = None) -> np.ndarray:
+    """
+    Calcula ``a @ b`` para matrices ``object``, en paralelo si compensa.
+
+    Parameters:
+        a (np.ndarray): Matriz m×n
+        b (np.ndarray): Matriz n×p
+        procesos (Optional[int]): Procesos del pool (default: núcleos disponibles)
+
+    Returns:
+        np.ndarray: Producto, idéntico a ``a @ b`` (aritmética exacta de los objetos)
+    """
+    procesos = procesos or os.cpu_count() or 1
+    if procesos == 1 or a.shape[0] * a.shape[1] * b.shape[1] < MIN_OPERACIONES_PROCESOS:
+        return a @ b
+    return multiplicar_en_procesos(a, b, procesos)
+
+
+def obtener_pool(procesos: int) -> ProcessPoolExecutor:
+    """
+    Devuelve el pool compartido, creándolo si no existe o cambia su tamaño.
+
+    Parameters:
+        procesos (int): Número de procesos
+
+    Returns:
+        ProcessPoolExecutor: Pool reutilizable
+    """
+    global _pool, _procesos_pool
+    with _cerrojo_pool:
+        if _pool is None or _procesos_pool != procesos or getattr(_pool, '_broken', False):
+            if _pool is not None:
+                _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = ProcessPoolExecutor(procesos)
+            _procesos_pool = procesos
+        return _pool
+
+
+def cerrar_pool() -> None:
+    """Detiene el pool compartido (se llama también al salir del programa)."""
+    global _pool
+    with _cerrojo_pool:
+        if _pool is not None:
+            _pool.shutdown(wait=True)
+            _pool = None
+
+
+atexit.register(cerrar_pool)
+
+
+# ============ MÉTODOS PRIVADOS ============
+
+def _multiplicar_compartido(pool: ProcessPoolExecutor, a: np.ndarray, b: np.ndarray,
+                            teselas: List[Tuple[int, int, int, int]], bloque_tareas: int) -> np.ndarray:
+    """Producto con A, B y C en un segmento compartido."""
+    formas = (a.shape, b.shape, (a.shape[0], b.shape[1]))
+    desplazamientos = []
+    total = 0
+    for forma in formas:
+        desplazamientos.append(total)
+        total += -(-forma[0] * forma[1] * a.dtype.itemsize // _ALINEACION) * _ALINEACION
+
+    segmento = shared_memory.SharedMemory(create=True, size=max(total, 1))
+    try:
+        descripcion = (segmento.name, formas, tuple(desplazamientos), a.dtype.str)
+        vista_a, vista_b, _ = _vistas(segmento.buf, *descripcion[1:])
+        vista_a[...] = a
+        vista_b[...] = b
+        del vista_a, vista_b
+
+        list(pool.map(_calcular_tesela, [descripcion] * len(teselas), teselas, chunksize=bloque_tareas))
+        return np.array(_vistas(segmento.buf, *descripcion[1:])[2])
+    finally:
+        _liberar(segmento)
+
+
+def _multiplicar_objetos(pool: ProcessPoolExecutor, a: np.ndarray, b: np.ndarray,
+                         teselas: List[Tuple[int, int, int, int]], bloque_tareas: int) -> np.ndarray:
+    """Producto ``object`` con los operandos serializados una vez en un segmento."""
+    datos = pickle.dumps((a, b), protocol=pickle.HIGHEST_PROTOCOL)
+    segmento = shared_memory.SharedMemory(create=True, size=len(datos))
+    try:
+        segmento.buf[:len(datos)] = datos
+        descripcion = (segmento.name, len(datos))
+
+        resultado = np.empty((a.shape[0], b.shape[1]), dtype=object)
+        bloques = pool.map(_calcular_tesela_objetos, [descripcion] * len(teselas), teselas,
+                           chunksize=bloque_tareas)
+        for (i0, i1, j0, j1), bloque in zip(teselas, bloques):
+            resultado[i0:i1, j0:j1] = bloque
+        return resultado
+    finally:
+        _liberar(segmento)
+
+
+def _calcular_tesela(descripcion: Tuple, tesela: Tuple[int, int, int, int]) -> None:
+    """Tarea de un proceso: escribe una tesela de C en el segmento compartido."""
+    nombre, *formato = descripcion
+    segmento = _abrir_segmento(nombre)
+    try:
+        a, b, c = _vistas(segmento.buf, *formato)
+        i0, i1, j0, j1 = tesela
+        np.matmul(a[i0:i1], b[:, j0:j1], out=c[i0:i1, j0:j1])
+        del a, b, c
+    finally:
+        segmento.close()
+
+
+def _calcular_tesela_objetos(descripcion: Tuple[str, int], tesela: Tuple[int, int, int, int]) -> np.ndarray:
+    """Tarea de un proceso: calcula una tesela ``object`` y la devuelve."""
+    global _operandos_trabajador
+    nombre, longitud = descripcion
+    if _operandos_trabajador is None or _operandos_trabajador[0] != nombre:
+        _operandos_trabajador = None
+        segmento = _abrir_segmento(nombre)
+        try:
+            _operandos_trabajador = (nombre, *pickle.loads(segmento.buf[:longitud]))
+        finally:
+            segmento.close()
+
+    _, a, b = _operandos_trabajador
+    i0, i1, j0, j1 = tesela
+    return a[i0:i1] @ b[:, j0:j1]
+
+
+def _vistas(buffer, formas: Tuple, desplazamientos: Tuple, dtype: str) -> List[np.ndarray]:
+    """Arrays sobre el segmento compartido, sin copiar."""
+    return [np.ndarray(forma, dtype=dtype, buffer=buffer, offset=desplazamiento)
+            for forma, desplazamiento in zip(formas, desplazamientos)]
+
+
+def _abrir_segmento(nombre: str) -> shared_memory.SharedMemory:
+    """Se adjunta a un segmento existente sin registrarlo para su borrado."""
+    try:
+        return shared_memory.SharedMemory(name=nombre, track=False)
+    except TypeError:
+        # Python < 3.13: el proceso comparte el resource_tracker del padre
+        return shared_memory.SharedMemory(name=nombre)
+
+
+def _liberar(segmento: shared_memory.SharedMemory) -> None:
+    """Cierra y elimina un segmento creado por este proceso."""
+    try:
+        segmento.close()
+    except BufferError:
+        # Aún hay vistas vivas (p. ej. en la traza de una excepción)
+        pass
+    segmento.unlink()
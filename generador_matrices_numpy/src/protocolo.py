@@ -0,0 +1,222 @@
+"""
+Flujos Binarios de Matrices
+===========================
+
+Lectura y escritura de secuencias de matrices con el encabezado del
+formato ``.npy`` de NumPy, una tras otra en el mismo flujo. Cada matriz
+de la secuencia puede leerse también con ``np.load`` sobre el flujo.
+
+- Los datos se leen con ``readinto`` directamente en el array de destino
+  (que puede reutilizarse entre matrices de la misma forma), sin copias
+  intermedias.
+- Las matrices en orden Fortran (p. ej. una transpuesta) se escriben con
+  ``fortran_order: True`` en el encabezado, sin reordenar los datos.
+- Nunca se admiten arrays de objetos (``allow_pickle`` desactivado).
+
+Los servicios en red (``interfaces/servidor_numpy.py``, ``distribuido.py``)
+envuelven estas matrices en mensajes con un código y un texto:
+
+    código (u8) | longitud (u32, little-endian) | texto UTF-8 | [matriz .npy]
+
+Autor: Nicolas
+"""
+
+import io
+import math
+import struct
+import numpy as np
+from numpy.lib import format as formato_npy
+from typing import BinaryIO, Callable, Iterator, Optional, Tuple
+
+# Tamaño máximo de encabezado aceptado (protege frente a flujos corruptos)
+MAX_ENCABEZADO = 1 << 16
+
+# Tamaño máximo de los datos de una matriz (una forma enorme en un
+# encabezado corrupto no debe llegar a reservarse)
+MAX_MATRIZ = 1 << 32
+
+# Estados de respuesta de los mensajes
+RESP_OK, RESP_MATRIZ, RESP_ERROR = range(3)
+
+_CABECERA_MENSAJE = struct.Struct('<BI')
+MAX_TEXTO = 1 << 20
+
+
+def leer_matriz(flujo: BinaryIO, reutilizar: Optional[np.ndarray] = None,
+                max_bytes: int = MAX_MATRIZ) -> Optional[np.ndarray]:
+    """
+    Lee la siguiente matriz de un flujo binario.
+
+    Parameters:
+        flujo (BinaryIO): Flujo de entrada (con ``read`` y ``readinto``)
+        reutilizar (Optional[np.ndarray]): Array a sobrescribir si la forma,
+            el dtype y el orden coinciden con la matriz entrante
+        max_bytes (int): Tamaño máximo aceptado para los datos de la matriz
+
+    Returns:
+        Optional[np.ndarray]: La matriz, o None si el flujo terminó
+
+    Raises:
+        ValueError: Si el flujo está truncado, no tiene formato .npy o la
+            matriz supera ``max_bytes``
+    """
+    magia = flujo.read(len(formato_npy.MAGIC_PREFIX))
+    if not magia:
+        return None
+    if magia != formato_npy.MAGIC_PREFIX:
+        raise ValueError("El flujo no contiene una matriz en formato .npy")
+
+    version = _leer_exacto(flujo, 2)[0]
+    if version not in (1, 2, 3):
+        raise ValueError("Encabezado .npy no válido")
+    leer_encabezado = (formato_npy.read_array_header_1_0 if version == 1
+                       else formato_npy.read_array_header_2_0)
+    forma, fortran, dtype = leer_encabezado(flujo, max_header_size=MAX_ENCABEZADO)
+    if dtype.hasobject:
+        raise ValueError("No se admiten matrices de objetos")
+    tamaño = math.prod(forma) * dtype.itemsize
+    if tamaño > max_bytes:
+        raise ValueError(f"La matriz {forma} ocupa {tamaño} bytes y supera el máximo de {max_bytes}")
+
+    orden = 'F' if fortran else 'C'
+    if (reutilizar is not None and reutilizar.shape == forma and reutilizar.dtype == dtype
+            and (reutilizar.flags.f_contiguous if fortran else reutilizar.flags.c_contiguous)):
+        matriz = reutilizar
+    else:
+        matriz = np.empty(forma, dtype=dtype, order=orden)
+
+    if matriz.size:
+        # La transpuesta de un array Fortran es C-contigua y comparte memoria
+        contigua = matriz.T if fortran else matriz
+        _leer_en(flujo, memoryview(contigua).cast('B'))
+    return matriz
+
+
+def escribir_matriz(flujo: BinaryIO, matriz: np.ndarray) -> None:
+    """
+    Escribe una matriz en un flujo binario con encabezado .npy.
+
+    Los arrays C-contiguos y Fortran-contiguos se escriben sin copiar; el
+    resto se copia a orden C.
+
+    Parameters:
+        flujo (BinaryIO): Flujo de salida
+        matriz (np.ndarray): Matriz a escribir
+
+    Raises:
+        ValueError: Si el dtype es de objetos
+    """
+    if matriz.dtype.hasobject:
+        raise ValueError("No se admiten matrices de objetos")
+    if not (matriz.flags.c_contiguous or matriz.flags.f_contiguous):
+        matriz = np.ascontiguousarray(matriz)
+
+    encabezado = formato_npy.header_data_from_array_1_0(matriz)
+    if len(repr(encabezado)) < MAX_ENCABEZADO - 1024:
+        formato_npy.write_array_header_1_0(flujo, encabezado)
+    else:
+        formato_npy.write_array_header_2_0(flujo, encabezado)
+
+    if matriz.size:
+        contigua = matriz if matriz.flags.c_contiguous else matriz.T
+        flujo.write(memoryview(contigua).cast('B'))
+
+
+def iterar_matrices(flujo: BinaryIO, reutilizar: bool = False) -> Iterator[np.ndarray]:
+    """
+    Recorre las matrices de un flujo hasta su final.
+
+    Parameters:
+        flujo (BinaryIO): Flujo de entrada
+        reutilizar (bool): Si True, cada matriz se lee en el array de la
+            anterior cuando la forma coincide (el consumidor no debe
+            conservar referencias entre iteraciones)
+
+    Yields:
+        np.ndarray: Cada matriz del flujo
+    """
+    anterior = None
+    while True:
+        matriz = leer_matriz(flujo, anterior if reutilizar else None)
+        if matriz is None:
+            return
+        anterior = matriz
+        yield matriz
+
+
+def codificar_mensaje(codigo: int, texto: str = '', matriz: Optional[np.ndarray] = None) -> bytes:
+    """
+    Codifica una solicitud o una respuesta completa.
+
+    Parameters:
+        codigo (int): Operación o estado (``RESP_*``)
+        texto (str): Texto del mensaje
+        matriz (Optional[np.ndarray]): Matriz adjunta
+
+    Returns:
+        bytes: Mensaje codificado
+    """
+    datos = texto.encode('utf-8')
+    flujo = io.BytesIO()
+    flujo.write(_CABECERA_MENSAJE.pack(codigo, len(datos)))
+    flujo.write(datos)
+    if matriz is not None:
+        escribir_matriz(flujo, np.asarray(matriz))
+    return flujo.getvalue()
+
+
+def leer_mensaje(flujo: BinaryIO, con_matriz: Callable[[int], bool]
+                 ) -> Optional[Tuple[int, str, Optional[np.ndarray]]]:
+    """
+    Lee una solicitud o respuesta.
+
+    Parameters:
+        flujo (BinaryIO): Flujo binario de entrada
+        con_matriz (Callable[[int], bool]): Indica si el código leído lleva matriz
+
+    Returns:
+        Optional[Tuple[int, str, Optional[np.ndarray]]]: Código, texto y
+        matriz, o None si la conexión se cerró
+
+    Raises:
+        ValueError: Si el mensaje está mal formado
+    """
+    cabecera = flujo.read(_CABECERA_MENSAJE.size)
+    if not cabecera:
+        return None
+    if len(cabecera) != _CABECERA_MENSAJE.size:
+        raise ValueError("Mensaje truncado")
+    codigo, longitud = _CABECERA_MENSAJE.unpack(cabecera)
+    if longitud > MAX_TEXTO:
+        raise ValueError("Texto demasiado largo")
+
+    texto = flujo.read(longitud)
+    if len(texto) != longitud:
+        raise ValueError("Mensaje truncado")
+
+    matriz = None
+    if con_matriz(codigo):
+        matriz = leer_matriz(flujo)
+        if matriz is None:
+            raise ValueError("Mensaje truncado")
+    return codigo, texto.decode('utf-8'), matriz
+
+
+# ============ MÉTODOS PRIVADOS ============
+
+def _leer_exacto(flujo: BinaryIO, cantidad: int) -> bytes:
+    """Lee exactamente ``cantidad`` bytes o falla si el flujo termina antes."""
+    datos = bytearray(cantidad)
+    _leer_en(flujo, memoryview(datos))
+    return bytes(datos)
+
+
+def _leer_en(flujo: BinaryIO, destino: memoryview) -> None:
+    """Llena ``destino`` desde el flujo, tolerando lecturas parciales."""
+    leidos = 0
+    total = len(destino)
+    while leidos < total:
+        n = flujo.readinto(destino[leidos:])
+        if not n:
+            raise ValueError(f"Flujo truncado: se esperaban {total} bytes y llegaron {leidos}")
+        leidos += n
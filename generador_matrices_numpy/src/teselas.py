@@ -0,0 +1,660 @@
+"""
+Factorizaciones por Teselas
+===========================
+
+Cholesky, LU y QR expresadas como un grafo de tareas sobre teselas de
+``tam_tesela`` × ``tam_tesela`` (núcleos al estilo POTRF/TRSM/SYRK/GEMM),
+ejecutado por un pool de hilos con robo de trabajo.
+
+- Las dependencias se deducen de las teselas que cada tarea lee y escribe
+  (lectura tras escritura, escritura tras lectura y tras escritura), así que
+  las etapas se solapan solas: la factorización del panel k+1 empieza en
+  cuanto su columna está actualizada, sin esperar al resto de la etapa k.
+- Cada hilo tiene su propia cola: atiende primero la última tarea que liberó
+  (los datos siguen en su caché) y, si se queda sin trabajo, roba la más
+  antigua de otro hilo. Las tareas del camino crítico (paneles) tienen
+  prioridad.
+- El pool es compartido: varias factorizaciones lanzadas a la vez se
+  reparten los mismos hilos en lugar de competir por los núcleos.
+- Las tareas operan sobre vistas de la entrada y de ``salida``, que pueden
+  ser arrays mapeados en memoria (``np.load(..., mmap_mode='r')``,
+  ``np.lib.format.open_memmap``).
+- Cada factorización devuelve un ``TrabajoTeselas`` con progreso,
+  cancelación y ``resultado()``.
+
+Autor: Nicolas
+"""
+
+import itertools
+import os
+import threading
+import numpy as np
+from collections import deque
+from concurrent.futures import CancelledError
+from functools import partial
+from typing import Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+
+try:
+    from scipy.linalg import solve_triangular
+    HAS_SCIPY = True
+except ImportError:
+    HAS_SCIPY = False
+
+from .algebra_lineal import resolver_lu
+
+TAM_TESELA = 256
+
+# Prioridades: el camino crítico se atiende antes
+PRIORIDAD_PANEL = 3
+PRIORIDAD_TRSM = 2
+PRIORIDAD_ACTUALIZACION = 1
+
+Progreso = Callable[[int, int], None]
+
+
+class Tarea:
+    """Nodo del grafo: una función sobre teselas y sus dependencias."""
+
+    __slots__ = ('nombre', 'funcion', 'prioridad', 'sucesores', 'pendientes', 'trabajo')
+
+    def __init__(self, nombre: str, funcion: Callable[[], None], prioridad: int = 0):
+        self.nombre = nombre
+        self.funcion = funcion
+        self.prioridad = prioridad
+        self.sucesores: List['Tarea'] = []
+        self.pendientes = 0
+        self.trabajo: Optional['TrabajoTeselas'] = None
+
+    def __repr__(self) -> str:
+        return f"Tarea({self.nombre})"
+
+
+class GrafoTareas:
+    """Construye un grafo de tareas deduciendo dependencias de los datos."""
+
+    def __init__(self):
+        self.tareas: List[Tarea] = []
+        self._escritor: Dict[Hashable, Tarea] = {}
+        self._lectores: Dict[Hashable, List[Tarea]] = {}
+
+    def agregar(self, nombre: str, funcion: Callable[[], None], lee: Iterable[Hashable] = (),
+                escribe: Iterable[Hashable] = (), prioridad: int = 0) -> Tarea:
+        """
+        Añade una tarea al grafo.
+
+        Parameters:
+            nombre (str): Nombre para depuración, p. ej. ``"GEMM(2,1,0)"``
+            funcion (Callable[[], None]): Trabajo a realizar
+            lee (Iterable[Hashable]): Claves de los datos que lee
+            escribe (Iterable[Hashable]): Claves de los datos que modifica
+            prioridad (int): Mayor prioridad se ejecuta antes entre las listas
+
+        Returns:
+            Tarea: La tarea añadida
+        """
+        tarea = Tarea(nombre, funcion, prioridad)
+        dependencias = set()
+
+        for clave in lee:
+            if clave in self._escritor:
+                dependencias.add(self._escritor[clave])
+            self._lectores.setdefault(clave, []).append(tarea)
+        for clave in escribe:
+            if clave in self._escritor:
+                dependencias.add(self._escritor[clave])
+            dependencias.update(self._lectores.get(clave, ()))
+            self._escritor[clave] = tarea
+            self._lectores[clave] = []
+
+        dependencias.discard(tarea)
+        for dependencia in dependencias:
+            dependencia.sucesores.append(tarea)
+        tarea.pendientes = len(dependencias)
+        self.tareas.append(tarea)
+        return tarea
+
+    def ejecutar(self, planificador: Optional['PlanificadorTeselas'] = None,
+                 al_progresar: Optional[Progreso] = None,
+                 resultado: Optional[Callable[[], object]] = None) -> 'TrabajoTeselas':
+        """
+        Lanza el grafo en un planificador sin esperar a que termine.
+
+        Parameters:
+            planificador (Optional[PlanificadorTeselas]): Pool a usar (default: el compartido)
+            al_progresar (Optional[Progreso]): Se llama con (hechas, total) tras cada tarea,
+                desde los hilos del pool
+            resultado (Optional[Callable]): Calcula el valor de ``TrabajoTeselas.resultado()``
+
+        Returns:
+            TrabajoTeselas: Seguimiento de la ejecución
+        """
+        trabajo = TrabajoTeselas(len(self.tareas), al_progresar, resultado)
+        for tarea in self.tareas:
+            tarea.trabajo = trabajo
+        iniciales = [tarea for tarea in self.tareas if tarea.pendientes == 0]
+        if not self.tareas:
+            trabajo._terminado.set()
+        (planificador or planificador_compartido()).encolar(iniciales)
+        return trabajo
+
+
+class TrabajoTeselas:
+    """Seguimiento de un grafo en ejecución: progreso, cancelación y resultado."""
+
+    def __init__(self, total: int, al_progresar: Optional[Progreso],
+                 resultado: Optional[Callable[[], object]]):
+        self.total = total
+        self.hechas = 0
+        self._al_progresar = al_progresar
+        self._calcular_resultado = resultado
+        self._cerrojo = threading.Lock()
+        self._terminado = threading.Event()
+        self._cancelado = threading.Event()
+        self._error: Optional[BaseException] = None
+
+    def progreso(self) -> Tuple[int, int]:
+        """Tareas terminadas y total."""
+        return self.hechas, self.total
+
+    def cancelar(self) -> None:
+        """Descarta las tareas que aún no han empezado."""
+        self._cancelado.set()
+
+    @property
+    def cancelado(self) -> bool:
+        return self._cancelado.is_set()
+
+    def hecho(self) -> bool:
+        """Indica si ya no queda ninguna tarea por procesar."""
+        return self._terminado.is_set()
+
+    def esperar(self, timeout: Optional[float] = None) -> bool:
+        """Espera a que termine; devuelve False si se agota el tiempo."""
+        return self._terminado.wait(timeout)
+
+    def resultado(self, timeout: Optional[float] = None):
+        """
+        Espera y devuelve el resultado.
+
+        Raises:
+            TimeoutError: Si no termina en ``timeout`` segundos
+            CancelledError: Si se canceló
+            Exception: El error de la primera tarea que falló
+        """
+        if not self.esperar(timeout):
+            raise TimeoutError("La factorización no terminó a tiempo")
+        if self._error is not None:
+            raise self._error
+        if self.cancelado:
+            raise CancelledError()
+        return self._calcular_resultado() if self._calcular_resultado else None
+
+    def _fallar(self, error: BaseException) -> None:
+        """Guarda el primer error y descarta las tareas que aún no han empezado."""
+        with self._cerrojo:
+            if self._error is None:
+                self._error = error
+            self._cancelado.set()
+
+    def _abortar(self, error: BaseException) -> None:
+        """Da el trabajo por terminado con error cuando ya no puede avanzar."""
+        self._fallar(error)
+        self._terminado.set()
+
+    def _completar(self, tarea: Tarea, error: Optional[BaseException]) -> List[Tarea]:
+        """Registra una tarea procesada y devuelve los sucesores liberados."""
+        if error is not None:
+            self._fallar(error)
+        liberadas = []
+        with self._cerrojo:
+            self.hechas += 1
+            for sucesor in tarea.sucesores:
+                sucesor.pendientes -= 1
+                if sucesor.pendientes == 0:
+                    liberadas.append(sucesor)
+            hechas = self.hechas
+        if self._al_progresar is not None:
+            try:
+                self._al_progresar(hechas, self.total)
+            except Exception as e:
+                # Las tareas restantes se descartan pero se siguen contando
+                self._fallar(e)
+        if hechas == self.total:
+            self._terminado.set()
+        return liberadas
+
+
+class PlanificadorTeselas:
+    """Pool de hilos con una cola por hilo y robo de trabajo."""
+
+    def __init__(self, hilos: Optional[int] = None):
+        """
+        Inicia los hilos.
+
+        Parameters:
+            hilos (Optional[int]): Número de hilos (default: núcleos disponibles)
+        """
+        self.hilos = hilos or os.cpu_count() or 1
+        self._colas = [deque() for _ in range(self.hilos)]
+        self._condicion = threading.Condition()
+        self._disponibles = 0
+        self._cerrado = False
+        self._local = threading.local()
+        self._turno = itertools.count()
+        self._trabajadores = [threading.Thread(target=self._bucle, args=(indice,), daemon=True,
+                                               name=f'teselas-{indice}')
+                              for indice in range(self.hilos)]
+        for hilo in self._trabajadores:
+            hilo.start()
+
+    def encolar(self, tareas: List[Tarea]) -> None:
+        """
+        Pone tareas listas en la cola del hilo actual (o repartidas si se
+        llama desde fuera del pool). La de mayor prioridad queda al final y
+        es la siguiente que atiende su hilo.
+        """
+        if not tareas:
+            return
+        propia = getattr(self._local, 'indice', None)
+        for tarea in sorted(tareas, key=lambda t: t.prioridad):
+            indice = propia if propia is not None else next(self._turno) % self.hilos
+            self._colas[indice].append(tarea)
+        with self._condicion:
+            self._disponibles += len(tareas)
+            self._condicion.notify(len(tareas))
+
+    def cerrar(self) -> None:
+        """Termina los hilos cuando se vacían las colas."""
+        with self._condicion:
+            self._cerrado = True
+            self._condicion.notify_all()
+        for hilo in self._trabajadores:
+            hilo.join()
+
+    def _bucle(self, indice: int) -> None:
+        self._local.indice = indice
+        while True:
+            with self._condicion:
+                while self._disponibles == 0 and not self._cerrado:
+                    self._condicion.wait()
+                if self._disponibles == 0:
+                    return
+                self._disponibles -= 1
+
+            tarea = None
+            while tarea is None:
+                tarea = self._tomar(indice)
+            self._ejecutar(tarea)
+
+    def _tomar(self, indice: int) -> Optional[Tarea]:
+        """La tarea más reciente propia o la más antigua de otro hilo."""
+        try:
+            return self._colas[indice].pop()
+        except IndexError:
+            pass
+        for desplazamiento in range(1, self.hilos):
+            try:
+                return self._colas[(indice + desplazamiento) % self.hilos].popleft()
+            except IndexError:
+                continue
+        return None
+
+    def _ejecutar(self, tarea: Tarea) -> None:
+        trabajo = tarea.trabajo
+        error = None
+        if not trabajo.cancelado:
+            try:
+                tarea.funcion()
+            except Exception as e:
+                error = e
+        try:
+            self.encolar(trabajo._completar(tarea, error))
+        except Exception as e:
+            # Sin los sucesores el trabajo no terminaría nunca; el hilo
+            # sigue atendiendo a los demás trabajos del pool
+            trabajo._abortar(e)
+
+
+_planificador: Optional[PlanificadorTeselas] = None
+_cerrojo_planificador = threading.Lock()
+
+
+def planificador_compartido() -> PlanificadorTeselas:
+    """Pool común a todas las factorizaciones (se crea la primera vez)."""
+    global _planificador
+    with _cerrojo_planificador:
+        if _planificador is None:
+            _planificador = PlanificadorTeselas()
+        return _planificador
+
+
+# ============ FACTORIZACIONES ============
+
+def cholesky_teselas(a: np.ndarray, tam_tesela: int = TAM_TESELA, salida: Optional[np.ndarray] = None,
+                     planificador: Optional[PlanificadorTeselas] = None,
+                     al_progresar: Optional[Progreso] = None) -> TrabajoTeselas:
+    """
+    Cholesky por teselas: A = L·Lᴴ con L triangular inferior.
+
+    Parameters:
+        a (np.ndarray): Matriz hermítica definida positiva (puede ser un memmap)
+        tam_tesela (int): Lado de las teselas
+        salida (Optional[np.ndarray]): Dónde escribir L (puede ser ``a`` o un memmap)
+        planificador (Optional[PlanificadorTeselas]): Pool a usar
+        al_progresar (Optional[Progreso]): Llamada con (hechas, total)
+
+    Returns:
+        TrabajoTeselas: ``resultado()`` devuelve L o lanza LinAlgError si A
+        no es definida positiva
+    """
+    n = _validar_cuadrada(a, tam_tesela)
+    l = _preparar_salida(a, salida, (n, n))
+    rangos = _rangos(n, tam_tesela)
+    t = len(rangos)
+    tesela = partial(_tesela, l, rangos, rangos)
+    grafo = GrafoTareas()
+
+    for i in range(t):
+        for j in range(t):
+            if j > i:
+                grafo.agregar(f"CEROS({i},{j})", partial(_llenar_ceros, tesela(i, j)), escribe=[(i, j)])
+            elif l is not a:
+                grafo.agregar(f"COPIAR({i},{j})", partial(_copiar, tesela(i, j), _tesela(a, rangos, rangos, i, j)),
+                              escribe=[(i, j)])
+
+    for k in range(t):
+        grafo.agregar(f"POTRF({k})", partial(_potrf, tesela(k, k)), escribe=[(k, k)], prioridad=PRIORIDAD_PANEL)
+        for i in range(k + 1, t):
+            grafo.agregar(f"TRSM({i},{k})", partial(_trsm_derecha, tesela(k, k), tesela(i, k)),
+                          lee=[(k, k)], escribe=[(i, k)], prioridad=PRIORIDAD_TRSM)
+        for i in range(k + 1, t):
+            grafo.agregar(f"SYRK({i},{k})", partial(_syrk, tesela(i, k), tesela(i, i)),
+                          lee=[(i, k)], escribe=[(i, i)], prioridad=PRIORIDAD_ACTUALIZACION)
+            for j in range(k + 1, i):
+                grafo.agregar(f"GEMM({i},{j},{k})", partial(_gemm_nt, tesela(i, k), tesela(j, k), tesela(i, j)),
+                              lee=[(i, k), (j, k)], escribe=[(i, j)])
+
+    return grafo.ejecutar(planificador, al_progresar, lambda: l)
+
+
+def lu_teselas(a: np.ndarray, tam_tesela: int = TAM_TESELA, salida: Optional[np.ndarray] = None,
+               planificador: Optional[PlanificadorTeselas] = None,
+               al_progresar: Optional[Progreso] = None) -> TrabajoTeselas:
+    """
+    LU por teselas con pivoteo parcial: A[perm] = L·U.
+
+    Cada panel de columnas se factoriza en una tarea; los intercambios de
+    filas se aplican a las demás columnas de teselas en tareas separadas,
+    seguidas de TRSM sobre la fila de U y GEMM sobre el complemento de Schur.
+
+    Parameters:
+        a (np.ndarray): Matriz cuadrada (puede ser un memmap)
+        tam_tesela (int): Lado de las teselas
+        salida (Optional[np.ndarray]): Dónde escribir la LU compacta
+        planificador (Optional[PlanificadorTeselas]): Pool a usar
+        al_progresar (Optional[Progreso]): Llamada con (hechas, total)
+
+    Returns:
+        TrabajoTeselas: ``resultado()`` devuelve una factorización para
+        ``algebra_lineal.resolver_lu`` o lanza LinAlgError si A es singular
+    """
+    _validar_cuadrada(a, tam_tesela)
+    grafo = GrafoTareas()
+    factorizacion = _agregar_lu(grafo, a, tam_tesela, salida)
+    return grafo.ejecutar(planificador, al_progresar, lambda: factorizacion)
+
+
+def inversa_teselas(a: np.ndarray, tam_tesela: int = TAM_TESELA, salida: Optional[np.ndarray] = None,
+                    planificador: Optional[PlanificadorTeselas] = None,
+                    al_progresar: Optional[Progreso] = None) -> TrabajoTeselas:
+    """
+    Inversa mediante LU por teselas y una sustitución por cada columna de teselas.
+
+    Parameters:
+        a (np.ndarray): Matriz cuadrada (puede ser un memmap)
+        tam_tesela (int): Lado de las teselas
+        salida (Optional[np.ndarray]): Dónde escribir la inversa
+        planificador (Optional[PlanificadorTeselas]): Pool a usar
+        al_progresar (Optional[Progreso]): Llamada con (hechas, total)
+
+    Returns:
+        TrabajoTeselas: ``resultado()`` devuelve A⁻¹ o lanza LinAlgError
+    """
+    n = _validar_cuadrada(a, tam_tesela)
+    grafo = GrafoTareas()
+    factorizacion = _agregar_lu(grafo, a, tam_tesela, None)
+    inversa = _preparar_salida(None, salida, (n, n), factorizacion[1].dtype)
+    rangos = _rangos(n, tam_tesela)
+    todas = [(i, j) for i in range(len(rangos)) for j in range(len(rangos))]
+
+    def resolver_columnas(inicio, fin):
+        identidad = np.zeros((n, fin - inicio), dtype=inversa.dtype)
+        identidad[inicio:fin] = np.eye(fin - inicio)
+        inversa[:, inicio:fin] = resolver_lu(factorizacion, identidad, tam_tesela)
+
+    for j, (inicio, fin) in enumerate(rangos):
+        grafo.agregar(f"GETRS({j})", partial(resolver_columnas, inicio, fin),
+                      lee=todas + ['perm'], escribe=[('inversa', j)])
+    return grafo.ejecutar(planificador, al_progresar, lambda: inversa)
+
+
+def qr_teselas(a: np.ndarray, tam_tesela: int = TAM_TESELA,
+               planificador: Optional[PlanificadorTeselas] = None,
+               al_progresar: Optional[Progreso] = None) -> TrabajoTeselas:
+    """
+    QR reducida por paneles de Householder en forma compacta (I - V·T·Vᴴ).
+
+    Cada panel se factoriza en una tarea (GEQRT); su reflector se aplica a
+    cada columna de teselas a la derecha en tareas independientes (UNMQR), y
+    Q se forma igual, aplicando los reflectores en orden inverso (UNGQR).
+
+    Parameters:
+        a (np.ndarray): Matriz m×n con m ≥ n (puede ser un memmap)
+        tam_tesela (int): Lado de las teselas
+        planificador (Optional[PlanificadorTeselas]): Pool a usar
+        al_progresar (Optional[Progreso]): Llamada con (hechas, total)
+
+    Returns:
+        TrabajoTeselas: ``resultado()`` devuelve (Q, R) como ``np.linalg.qr``
+    """
+    if a.ndim != 2 or a.shape[0] < a.shape[1]:
+        raise ValueError("La QR por teselas requiere una matriz 2D con al menos tantas filas como columnas")
+    if tam_tesela < 1:
+        raise ValueError("El tamaño de tesela debe ser positivo")
+    m, n = a.shape
+    dtype = _dtype_flotante(a.dtype)
+    w = np.empty((m, n), dtype=dtype)
+    q = np.empty((m, n), dtype=dtype)
+    filas, columnas = _rangos(m, tam_tesela), _rangos(n, tam_tesela)
+    tm, tn = len(filas), len(columnas)
+    tesela_w = partial(_tesela, w, filas, columnas)
+    tesela_q = partial(_tesela, q, filas, columnas)
+    reflectores: List[Optional[Tuple[np.ndarray, np.ndarray]]] = [None] * tn
+    grafo = GrafoTareas()
+
+    for i in range(tm):
+        for j in range(tn):
+            grafo.agregar(f"COPIAR({i},{j})", partial(_copiar, tesela_w(i, j), _tesela(a, filas, columnas, i, j)),
+                          escribe=[(i, j)])
+            grafo.agregar(f"IDENTIDAD({i},{j})", partial(_identidad, tesela_q(i, j), filas[i][0] - columnas[j][0]),
+                          escribe=[('q', i, j)])
+
+    for k in range(tn):
+        inicio, fin = columnas[k]
+        grafo.agregar(f"GEQRT({k})", partial(_geqrt, w, inicio, fin, reflectores, k),
+                      escribe=[(i, k) for i in range(k, tm)] + [('V', k)], prioridad=PRIORIDAD_PANEL)
+        for j in range(k + 1, tn):
+            grafo.agregar(f"UNMQR({k},{j})", partial(_aplicar_reflector, reflectores, k, w[inicio:, slice(*columnas[j])],
+                                                     True),
+                          lee=[('V', k)], escribe=[(i, j) for i in range(k, tm)])
+
+    for k in reversed(range(tn)):
+        inicio = columnas[k][0]
+        for j in range(k, tn):
+            grafo.agregar(f"UNGQR({k},{j})", partial(_aplicar_reflector, reflectores, k, q[inicio:, slice(*columnas[j])],
+                                                     False),
+                          lee=[('V', k)], escribe=[('q', i, j) for i in range(k, tm)])
+
+    return grafo.ejecutar(planificador, al_progresar, lambda: (q, np.triu(w[:n])))
+
+
+# ============ MÉTODOS PRIVADOS ============
+
+def _agregar_lu(grafo: GrafoTareas, a: np.ndarray, tam_tesela: int,
+                salida: Optional[np.ndarray]) -> Tuple:
+    """Añade las tareas de la LU al grafo y devuelve la factorización (aún sin calcular)."""
+    n = a.shape[0]
+    lu = _preparar_salida(a, salida, (n, n))
+    perm = np.arange(n)
+    rangos = _rangos(n, tam_tesela)
+    t = len(rangos)
+    tesela = partial(_tesela, lu, rangos, rangos)
+    intercambios: List[List[Tuple[int, int]]] = [[] for _ in range(t)]
+
+    if lu is not a:
+        for i in range(t):
+            for j in range(t):
+                grafo.agregar(f"COPIAR({i},{j})", partial(_copiar, tesela(i, j), _tesela(a, rangos, rangos, i, j)),
+                              escribe=[(i, j)])
+
+    for k, (inicio, fin) in enumerate(rangos):
+        grafo.agregar(f"GETRF({k})", partial(_panel_lu, lu, perm, inicio, fin, intercambios[k]),
+                      escribe=[(i, k) for i in range(k, t)] + [('piv', k), 'perm'], prioridad=PRIORIDAD_PANEL)
+        for j in range(t):
+            if j != k:
+                grafo.agregar(f"LASWP({k},{j})", partial(_intercambiar, lu[:, slice(*rangos[j])], intercambios[k]),
+                              lee=[('piv', k)], escribe=[(i, j) for i in range(k, t)],
+                              prioridad=PRIORIDAD_TRSM if j == k + 1 else PRIORIDAD_ACTUALIZACION)
+        for j in range(k + 1, t):
+            grafo.agregar(f"TRSM({k},{j})", partial(_trsm_unitaria, tesela(k, k), tesela(k, j)),
+                          lee=[(k, k)], escribe=[(k, j)], prioridad=PRIORIDAD_TRSM)
+        for i in range(k + 1, t):
+            for j in range(k + 1, t):
+                grafo.agregar(f"GEMM({i},{j},{k})", partial(_gemm_nn, tesela(i, k), tesela(k, j), tesela(i, j)),
+                              lee=[(i, k), (k, j)], escribe=[(i, j)],
+                              prioridad=PRIORIDAD_TRSM if j == k + 1 else 0)
+
+    return ('numpy', lu, perm)
+
+
+def _potrf(t: np.ndarray) -> None:
+    t[...] = np.linalg.cholesky(t)
+
+
+def _trsm_derecha(l_kk: np.ndarray, t: np.ndarray) -> None:
+    """t ← t · L_kk⁻ᴴ"""
+    t[...] = _resolver_triangular(l_kk, t.conj().T, inferior=True).conj().T
+
+
+def _trsm_unitaria(lu_kk: np.ndarray, t: np.ndarray) -> None:
+    """t ← L_kk⁻¹ · t con L_kk triangular inferior unitaria."""
+    t[...] = _resolver_triangular(lu_kk, t, inferior=True, unitaria=True)
+
+
+def _syrk(a_ik: np.ndarray, t: np.ndarray) -> None:
+    t -= a_ik @ a_ik.conj().T
+
+
+def _gemm_nt(a_ik: np.ndarray, a_jk: np.ndarray, t: np.ndarray) -> None:
+    t -= a_ik @ a_jk.conj().T
+
+
+def _gemm_nn(a_ik: np.ndarray, a_kj: np.ndarray, t: np.ndarray) -> None:
+    t -= a_ik @ a_kj
+
+
+def _panel_lu(lu: np.ndarray, perm: np.ndarray, inicio: int, fin: int,
+              intercambios: List[Tuple[int, int]]) -> None:
+    """Factoriza lu[inicio:, inicio:fin] con pivoteo parcial, anotando los intercambios."""
+    for j in range(inicio, fin):
+        p = j + int(np.argmax(np.abs(lu[j:, j])))
+        if lu[p, j] == 0:
+            raise np.linalg.LinAlgError("Matriz singular")
+        if p != j:
+            lu[[j, p], inicio:fin] = lu[[p, j], inicio:fin]
+            perm[[j, p]] = perm[[p, j]]
+            intercambios.append((j, p))
+        lu[j + 1:, j] /= lu[j, j]
+        if j + 1 < fin:
+            lu[j + 1:, j + 1:fin] -= np.outer(lu[j + 1:, j], lu[j, j + 1:fin])
+
+
+def _intercambiar(columnas: np.ndarray, intercambios: List[Tuple[int, int]]) -> None:
+    for j, p in intercambios:
+        columnas[[j, p]] = columnas[[p, j]]
+
+
+def _geqrt(w: np.ndarray, inicio: int, fin: int, reflectores: List, k: int) -> None:
+    """QR del panel w[inicio:, inicio:fin]; guarda V y T del reflector compacto."""
+    panel = w[inicio:, inicio:fin]
+    compacta, tau = np.linalg.qr(panel, mode='raw')
+    compacta = compacta.T
+    panel[...] = compacta
+
+    filas, columnas = compacta.shape[0], len(tau)
+    v = np.tril(compacta[:, :columnas], -1) + np.eye(filas, columnas, dtype=compacta.dtype)
+    t = np.zeros((columnas, columnas), dtype=compacta.dtype)
+    for i in range(columnas):
+        t[i, i] = tau[i]
+        if i:
+            t[:i, i] = -tau[i] * (t[:i, :i] @ (v[:, :i].conj().T @ v[:, i]))
+    reflectores[k] = (v, t)
+
+
+def _aplicar_reflector(reflectores: List, k: int, c: np.ndarray, adjunto: bool) -> None:
+    """c ← (I - V·T·Vᴴ)ᴴ·c si ``adjunto``, o (I - V·T·Vᴴ)·c si no."""
+    v, t = reflectores[k]
+    c -= v @ ((t.conj().T if adjunto else t) @ (v.conj().T @ c))
+
+
+def _resolver_triangular(t: np.ndarray, b: np.ndarray, inferior: bool, unitaria: bool = False) -> np.ndarray:
+    if HAS_SCIPY:
+        return solve_triangular(t, b, lower=inferior, unit_diagonal=unitaria, check_finite=False)
+    triangular = np.tril(t) if inferior else np.triu(t)
+    if unitaria:
+        np.fill_diagonal(triangular, 1)
+    return np.linalg.solve(triangular, b)
+
+
+def _copiar(destino: np.ndarray, origen: np.ndarray) -> None:
+    destino[...] = origen
+
+
+def _llenar_ceros(t: np.ndarray) -> None:
+    t[...] = 0
+
+
+def _identidad(t: np.ndarray, desplazamiento: int) -> None:
+    """Tesela de la identidad m×n cuya esquina está en (fila, columna) con fila - columna = desplazamiento."""
+    t[...] = np.eye(t.shape[0], t.shape[1], k=desplazamiento, dtype=t.dtype)
+
+
+def _tesela(a: np.ndarray, filas: List[Tuple[int, int]], columnas: List[Tuple[int, int]],
+            i: int, j: int) -> np.ndarray:
+    return a[filas[i][0]:filas[i][1], columnas[j][0]:columnas[j][1]]
+
+
+def _rangos(n: int, tam: int) -> List[Tuple[int, int]]:
+    return [(inicio, min(inicio + tam, n)) for inicio in range(0, n, tam)]
+
+
+def _dtype_flotante(dtype: np.dtype) -> np.dtype:
+    return dtype if np.issubdtype(dtype, np.inexact) else np.dtype(np.float64)
+
+
+def _validar_cuadrada(a: np.ndarray, tam_tesela: int) -> int:
+    if a.ndim != 2 or a.shape[0] != a.shape[1]:
+        raise ValueError("La factorización requiere una matriz cuadrada")
+    if tam_tesela < 1:
+        raise ValueError("El tamaño de tesela debe ser positivo")
+    return a.shape[0]
+
+
+def _preparar_salida(a: Optional[np.ndarray], salida: Optional[np.ndarray], forma: Tuple[int, int],
+                     dtype: Optional[np.dtype] = None) -> np.ndarray:
+    dtype = dtype or _dtype_flotante(a.dtype)
+    if salida is None:
+        return np.empty(forma, dtype=dtype)
+    if salida.shape != forma or not np.issubdtype(salida.dtype, np.inexact):
+        raise ValueError(f"La salida debe ser una matriz flotante de {forma[0]}×{forma[1]}")
+    return salida
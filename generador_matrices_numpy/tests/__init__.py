@@ -0,0 +1,4 @@
+"""
+Módulo de pruebas para el generador de matrices con NumPy.
+Contiene las pruebas unitarias del proyecto.
+"""
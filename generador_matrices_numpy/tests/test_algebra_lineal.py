@@ -0,0 +1,94 @@
+"""
+Pruebas unitarias para álgebra lineal avanzada
+==============================================
+
+Tests para la factorización LU reutilizable y la resolución de
+sistemas en precisión mixta.
+
+Autor: Nicolas
+"""
+
+import unittest
+import sys
+import os
+import numpy as np
+
+# Agregar el directorio raíz al path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.matriz_numpy import MatrizNumPy
+from src.algebra_lineal import factorizar_lu, resolver_lu, resolver_precision_mixta
+
+
+class TestAlgebraLineal(unittest.TestCase):
+    """Pruebas unitarias para algebra_lineal."""
+
+    def setUp(self):
+        """Configuración inicial para cada test."""
+        rng = np.random.default_rng(0)
+        self.n = 300
+        self.a = rng.standard_normal((self.n, self.n)) + self.n * np.eye(self.n)
+        self.x = rng.standard_normal(self.n)
+        self.b = self.a @ self.x
+
+    def test_lu_reutilizable(self):
+        """Testa que la LU resuelva varios lados derechos."""
+        factorizacion = factorizar_lu(self.a, tam_bloque=64)
+        b = np.column_stack([self.b, 2 * self.b])
+        x = resolver_lu(factorizacion, b, tam_bloque=64)
+
+        np.testing.assert_allclose(x[:, 0], self.x, rtol=1e-10)
+        np.testing.assert_allclose(x[:, 1], 2 * self.x, rtol=1e-10)
+
+    def test_lu_singular(self):
+        """Testa que la LU rechace matrices singulares."""
+        with self.assertRaises(np.linalg.LinAlgError):
+            factorizar_lu(np.array([[1.0, 2.0], [2.0, 4.0]]))
+
+    def test_precision_mixta_refina_a_doble(self):
+        """Testa que el refinamiento alcance precisión doble sin respaldo."""
+        x, info = resolver_precision_mixta(self.a, self.b)
+
+        self.assertFalse(info['respaldo'])
+        self.assertGreater(info['iteraciones'], 0)
+        self.assertEqual(x.dtype, np.float64)
+        np.testing.assert_allclose(x, self.x, rtol=1e-12)
+
+    def test_precision_mixta_respaldo(self):
+        """Testa el respaldo en float64 para matrices mal condicionadas."""
+        n = 10
+        i = np.arange(n)
+        hilbert = 1.0 / (i[:, None] + i[None, :] + 1)
+        b = hilbert @ np.ones(n)
+
+        x, info = resolver_precision_mixta(hilbert, b)
+
+        self.assertTrue(info['respaldo'])
+        self.assertLess(np.max(np.abs(hilbert @ x - b)), 1e-12)
+
+    def test_precision_mixta_dimensiones(self):
+        """Testa la validación de dimensiones."""
+        with self.assertRaises(ValueError):
+            resolver_precision_mixta(self.a[:, :10], self.b)
+        with self.assertRaises(ValueError):
+            resolver_precision_mixta(self.a, self.b[:10])
+
+    def test_resolver_sistema_matriz(self):
+        """Testa MatrizNumPy.resolver_sistema en ambos modos."""
+        A = MatrizNumPy(self.a)
+        for mixta in (False, True):
+            x = A.resolver_sistema(self.b, precision_mixta=mixta)
+            self.assertEqual(x.shape, (self.n, 1))
+            np.testing.assert_allclose(x.datos[:, 0], self.x, rtol=1e-10)
+
+    def test_resolver_sistema_singular(self):
+        """Testa que un sistema singular produzca ValueError."""
+        A = MatrizNumPy([[1.0, 2.0], [2.0, 4.0]])
+        with self.assertRaises(ValueError):
+            A.resolver_sistema(np.array([1.0, 2.0]))
+        with self.assertRaises(ValueError):
+            A.resolver_sistema(np.array([1.0, 2.0]), precision_mixta=True)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+"""
+Pruebas unitarias para la caché de visualización
+================================================
+
+Tests para verificar que el texto formateado por teselas se reutiliza
+mientras la matriz no cambia, se actualiza por elementos sueltos y se
+descarta por antigüedad al superar la capacidad.
+
+Autor: Nicolas
+"""
+
+import unittest
+import sys
+import os
+import numpy as np
+
+# Agregar el directorio raíz al path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.matriz_numpy import MatrizNumPy
+from src.cache_visualizacion import CacheVisualizacion, TESELA_FILAS, TESELA_COLUMNAS, formateador
+
+
+class TestCacheVisualizacion(unittest.TestCase):
+    """Pruebas unitarias para src/cache_visualizacion.py."""
+
+    def setUp(self):
+        """Configuración inicial para cada test."""
+        self.cache = CacheVisualizacion()
+        self.matriz = MatrizNumPy(np.random.default_rng(0).standard_normal((150, 40)))
+
+    def esperado(self, f0, f1, c0, c1, precision=6):
+        formato = formateador(self.matriz.datos.dtype, precision)
+        return [[formato(v) for v in fila] for fila in self.matriz.datos[f0:f1, c0:c1].tolist()]
+
+    def test_bloque_entre_teselas(self):
+        """Testa un bloque que cruza varias teselas y la reutilización posterior."""
+        textos, anchos = self.cache.textos(self.matriz, 60, 70, 10, 20)
+        self.assertEqual(textos, self.esperado(60, 70, 10, 20))
+        self.assertEqual(len(anchos), 10)
+        self.assertEqual(self.cache.fallos, 4)
+
+        self.cache.textos(self.matriz, 60, 70, 10, 20)
+        self.assertEqual((self.cache.fallos, self.cache.aciertos), (4, 4))
+
+        textos, _ = self.cache.textos(self.matriz, 60, 70, 10, 20, precision=3)
+        self.assertEqual(textos, self.esperado(60, 70, 10, 20, precision=3))
+        self.assertEqual(self.cache.fallos, 8)
+
+    def test_actualizacion_incremental(self):
+        """Testa que los elementos sueltos se reformatean sin rehacer la tesela."""
+        self.cache.textos(self.matriz, 0, 10, 0, 10)
+        self.matriz.establecer_elemento(3, 4, 123456789.0)
+        self.matriz[5, 6] = 0.5
+        textos, anchos = self.cache.textos(self.matriz, 0, 10, 0, 10)
+        self.assertEqual(textos, self.esperado(0, 10, 0, 10))
+        self.assertEqual(anchos[4], len("1.23457e+08"))
+        self.assertEqual((self.cache.fallos, self.cache.incrementales), (1, 1))
+
+    def test_cambios_de_bloque(self):
+        """Testa que asignar un bloque o marcar la matriz obliga a reformatear."""
+        self.cache.textos(self.matriz, 0, 10, 0, 10)
+        self.matriz[0:2, :] = 7.0
+        self.assertEqual(self.cache.textos(self.matriz, 0, 1, 0, 2)[0], [["7", "7"]])
+
+        self.matriz.datos[1, 1] = -1.0
+        self.matriz.marcar_modificada()
+        self.assertEqual(self.cache.textos(self.matriz, 1, 2, 0, 2)[0], [["7", "-1"]])
+        self.assertEqual(self.cache.fallos, 3)
+
+    def test_descarte_lru(self):
+        """Testa que las teselas menos usadas se descartan al superar la capacidad."""
+        self.cache.textos(self.matriz, 0, TESELA_FILAS, 0, TESELA_COLUMNAS)
+        self.cache.capacidad_bytes = int(self.cache.bytes * 2.5)
+        self.cache.textos(self.matriz, TESELA_FILAS, 2 * TESELA_FILAS, 0, TESELA_COLUMNAS)
+        self.cache.textos(self.matriz, 0, TESELA_FILAS, 0, TESELA_COLUMNAS)
+        self.cache.textos(self.matriz, 0, TESELA_FILAS, TESELA_COLUMNAS, 2 * TESELA_COLUMNAS)
+        self.assertEqual(len(self.cache), 2)
+        self.cache.textos(self.matriz, 0, TESELA_FILAS, 0, TESELA_COLUMNAS)
+        self.assertEqual(self.cache.fallos, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,153 @@
+"""
+Pruebas unitarias para el motor distribuido por bloques
+=======================================================
+
+Tests para verificar la distribución cíclica 2-D, las operaciones
+distribuidas y la transferencia de bloques con trabajadores en localhost.
+
+Autor: Nicolas
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+import numpy as np
+
+# Agregar el directorio raíz al path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.matriz_numpy import MatrizNumPy
+from src.distribuido import ClusterBloques, TrabajadorBloques, TrabajadoresLocales
+
+
+class TestClusterBloques(unittest.TestCase):
+    """Pruebas unitarias para ClusterBloques con trabajadores en hilos."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Inicia cuatro trabajadores compartidos por todos los tests."""
+        cls.trabajadores = [TrabajadorBloques() for _ in range(4)]
+        for trabajador in cls.trabajadores:
+            trabajador.iniciar_en_segundo_plano()
+
+    @classmethod
+    def tearDownClass(cls):
+        for trabajador in cls.trabajadores:
+            trabajador.detener()
+
+    def setUp(self):
+        """Configuración inicial para cada test."""
+        self.cluster = ClusterBloques([t.direccion for t in self.trabajadores], tam_bloque=16)
+        rng = np.random.default_rng(0)
+        self.a = rng.random((50, 37))
+        self.b = rng.random((37, 45))
+
+    def tearDown(self):
+        self.cluster.cerrar()
+        for trabajador in self.trabajadores:
+            trabajador.bloques.clear()
+
+    def test_distribucion_ciclica(self):
+        """Testa que los bloques se reparten cíclicamente y se reúnen intactos."""
+        self.assertEqual(self.cluster.rejilla, (2, 2))
+        self.assertEqual([self.cluster.propietario(i, j) for i in range(3) for j in range(3)],
+                         [0, 1, 0, 2, 3, 2, 0, 1, 0])
+
+        da = self.cluster.distribuir(MatrizNumPy(self.a))
+        np.testing.assert_array_equal(da.reunir().datos, self.a)
+        # 4×3 bloques: los trabajadores 0 y 2 guardan 4 cada uno, 1 y 3 guardan 2
+        self.assertEqual([estado['bloques'] for estado in self.cluster.estado()], [4, 2, 4, 2])
+
+    def test_operaciones(self):
+        """Testa @, transpuesta, operaciones elemento a elemento y reducciones."""
+        da, db = self.cluster.distribuir(self.a), self.cluster.distribuir(self.b)
+
+        np.testing.assert_allclose((da @ db).reunir().datos, self.a @ self.b)
+        np.testing.assert_array_equal(da.T.reunir().datos, self.a.T)
+        np.testing.assert_allclose((da.T @ da).reunir().datos, self.a.T @ self.a)
+        np.testing.assert_allclose((2 * da - da / 4 + da * da).reunir().datos,
+                                   2 * self.a - self.a / 4 + self.a * self.a)
+        np.testing.assert_array_equal((-da).reunir().datos, -self.a)
+
+        self.assertAlmostEqual(da.suma(), self.a.sum())
+        self.assertAlmostEqual(da.norma(), np.linalg.norm(self.a))
+        self.assertEqual(da.maximo(), self.a.max())
+        self.assertEqual(da.minimo(), self.a.min())
+
+    def test_transferencia_por_bloques(self):
+        """Testa el recorrido de bloques y el guardado en .npy sin reunir."""
+        da = self.cluster.distribuir(self.a)
+        bloques = list(da.bloques())
+        self.assertEqual(len(bloques), 12)
+        self.assertEqual(bloques[-1][2].shape, (2, 5))
+
+        with tempfile.TemporaryDirectory() as directorio:
+            ruta = os.path.join(directorio, "a.npy")
+            da.guardar(ruta)
+            np.testing.assert_array_equal(np.load(ruta), self.a)
+
+    def test_crear_independiente_de_la_rejilla(self):
+        """Testa que las matrices creadas en los trabajadores no dependen de la rejilla."""
+        aleatoria = self.cluster.crear(40, 40, 'aleatoria', semilla=7).reunir().datos
+        with ClusterBloques([self.trabajadores[0].direccion], tam_bloque=16) as solo:
+            np.testing.assert_array_equal(solo.crear(40, 40, 'aleatoria', semilla=7).reunir().datos,
+                                          aleatoria)
+        np.testing.assert_array_equal(self.cluster.crear(40, 40, 'identidad').reunir().datos, np.eye(40))
+
+    def test_errores_y_liberar(self):
+        """Testa dimensiones incompatibles, división entre cero y liberación de bloques."""
+        da, db = self.cluster.distribuir(self.a), self.cluster.distribuir(self.b)
+        self.assertEqual(sum(estado['bloques'] for estado in self.cluster.estado()), 21)
+        with self.assertRaises(ValueError):
+            da @ da
+        with self.assertRaises(ValueError):
+            da + db
+        with self.assertRaises(ZeroDivisionError):
+            da / 0
+        with self.assertRaises(ValueError):
+            ClusterBloques([self.trabajadores[0].direccion], rejilla=(2, 1))
+
+        da.liberar()
+        self.assertEqual(sum(estado['bloques'] for estado in self.cluster.estado()), 9)
+        with self.assertRaises(ValueError):
+            da.reunir()
+
+
+    def test_intermedios_y_vacias(self):
+        """Testa que los intermedios de una expresión se liberan y las reducciones vacías."""
+        def bloques():
+            return sum(estado['bloques'] for estado in self.cluster.estado())
+
+        da, dc = self.cluster.distribuir(self.a), self.cluster.distribuir(self.a + 1)
+        resultado = (da - dc) * 2.5 / 3
+        self.assertEqual(bloques(), 3 * 12)
+        np.testing.assert_allclose(resultado.reunir().datos, (self.a - (self.a + 1)) * 2.5 / 3)
+
+        del resultado
+        with self.cluster.distribuir(self.b) as db:
+            self.assertEqual(bloques(), 2 * 12 + 9)
+            (da @ db).T.reunir()
+        self.assertEqual(bloques(), 2 * 12)
+
+        vacia = self.cluster.distribuir(np.zeros((0, 3)))
+        for reduccion in (vacia.maximo, vacia.minimo):
+            with self.assertRaisesRegex(ValueError, "vacía"):
+                reduccion()
+
+
+class TestTrabajadoresLocales(unittest.TestCase):
+    """Pruebas con trabajadores en procesos separados."""
+
+    def test_producto_en_procesos(self):
+        """Testa un producto distribuido entre tres procesos (rejilla 1×3)."""
+        with TrabajadoresLocales(3) as locales:
+            with ClusterBloques(locales.direcciones, tam_bloque=8) as cluster:
+                a = np.arange(600, dtype=np.int64).reshape(20, 30)
+                resultado = (cluster.distribuir(a) @ cluster.distribuir(a.T)).reunir()
+        self.assertEqual(cluster.rejilla, (1, 3))
+        np.testing.assert_array_equal(resultado.datos, a @ a.T)
+
+
+if __name__ == '__main__':
+    unittest.main()
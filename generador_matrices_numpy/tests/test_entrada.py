@@ -0,0 +1,108 @@
+"""
+Pruebas unitarias para el análisis de texto numérico
+====================================================
+
+Tests para verificar la conversión en bloque de texto pegado (tabuladores,
+comas, punto y coma o espacios; fracciones) y el informe de errores por
+fila y columna.
+
+Autor: Nicolas
+"""
+
+import unittest
+import sys
+import os
+import numpy as np
+
+# Agregar el directorio raíz al path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.entrada import dividir_linea, convertir_numero, analizar_bloque, analizar_matriz, leer_filas
+
+
+class TestEntrada(unittest.TestCase):
+    """Pruebas unitarias para src/entrada.py."""
+
+    def test_dividir_linea(self):
+        """Testa los separadores reconocidos y su preferencia."""
+        self.assertEqual(dividir_linea("1\t2.5\t-3"), ["1", "2.5", "-3"])
+        self.assertEqual(dividir_linea("1; 2,5; 3"), ["1", "2,5", "3"])
+        self.assertEqual(dividir_linea("1, 2, 3"), ["1", "2", "3"])
+        self.assertEqual(dividir_linea("  1   2 3 "), ["1", "2", "3"])
+
+    def test_convertir_numero(self):
+        """Testa enteros, decimales, fracciones y errores."""
+        self.assertEqual(convertir_numero(" 3/4 "), 0.75)
+        self.assertEqual(convertir_numero("-2e3"), -2000.0)
+        for texto in ("abc", "1/0", ""):
+            with self.assertRaises(ValueError):
+                convertir_numero(texto)
+
+    def test_analizar_bloque(self):
+        """Testa filas irregulares, líneas vacías y errores con su posición."""
+        filas, errores = analizar_bloque("1 2 3\n\n4 x 1/2\n7\n")
+        self.assertEqual(len(filas), 3)
+        np.testing.assert_array_equal(filas[0], [1, 2, 3])
+        self.assertEqual(filas[1][2], 0.5)
+        self.assertTrue(np.isnan(filas[1][1]))
+        self.assertEqual(len(filas[2]), 1)
+        self.assertEqual(errores, [(1, 1, "x")])
+
+    def test_analizar_matriz(self):
+        """Testa la matriz completa y los mensajes por fila."""
+        texto = "\n".join("\t".join(str(i * 4 + j) for j in range(4)) for i in range(50))
+        np.testing.assert_array_equal(analizar_matriz(texto), np.arange(200.0).reshape(50, 4))
+
+        with self.assertRaises(ValueError) as contexto:
+            analizar_matriz("1 2\n3 y\n4 5 6")
+        mensaje = str(contexto.exception)
+        self.assertIn("Fila 2, columna 2: 'y' no es un número", mensaje)
+        self.assertIn("Fila 3: tiene 3 elementos, esperaba 2", mensaje)
+
+        with self.assertRaises(ValueError):
+            analizar_matriz("\n  \n")
+
+    def test_leer_filas(self):
+        """Testa la lectura por filas, repidiendo solo las filas con errores."""
+        lineas = iter(["1 2 3/4", "4, x, 6", "7 8", "", "4 5 6", "7 8 9"])
+        mensajes = []
+        datos = leer_filas(3, 3, leer=lambda _: next(lineas), escribir=mensajes.append)
+
+        np.testing.assert_array_equal(datos, [[1, 2, 0.75], [4, 5, 6], [7, 8, 9]])
+        self.assertEqual(mensajes, ["❌ Fila 2: 'x' (columna 2) no es un número",
+                                    "❌ Fila 3: tiene 2 elementos, se esperaban 3"])
+
+    def test_leer_filas_interactivo(self):
+        """Testa que en modo interactivo cada fila se revise al escribirla."""
+        lineas = iter(["1 2", "3 x", "3 4", "5 6"])
+        eventos = []
+
+        def leer(mensaje):
+            eventos.append(mensaje)
+            return next(lineas)
+
+        datos = leer_filas(3, 2, leer=leer, escribir=eventos.append, interactivo=True)
+
+        np.testing.assert_array_equal(datos, [[1, 2], [3, 4], [5, 6]])
+        self.assertEqual(eventos[1:3], ["  Fila 2: ", "❌ Fila 2: 'x' (columna 2) no es un número"])
+        self.assertEqual(eventos[3:], ["  Fila 2: ", "  Fila 3: "])
+
+    def test_leer_filas_bloque_y_fin_de_entrada(self):
+        """Testa un bloque grande pegado y el fin de entrada prematuro."""
+        lineas = iter(" ".join(str(i * 50 + j) for j in range(50)) for i in range(50))
+        datos = leer_filas(50, 50, leer=lambda _: next(lineas))
+        np.testing.assert_array_equal(datos, np.arange(2500.0).reshape(50, 50))
+
+        def leer(_, lineas=iter(["1 2"])):
+            try:
+                return next(lineas)
+            except StopIteration:
+                raise EOFError
+
+        with self.assertRaises(ValueError) as contexto:
+            leer_filas(2, 2, leer=leer)
+        self.assertIn("1 de 2 filas", str(contexto.exception))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,122 @@
+"""
+Pruebas unitarias para las matrices estructuradas implícitas
+============================================================
+
+Tests para verificar que los productos rápidos coinciden con las matrices
+densas equivalentes.
+
+Autor: Nicolas
+"""
+
+import unittest
+import sys
+import os
+import numpy as np
+
+# Agregar el directorio raíz al path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.matriz_numpy import MatrizNumPy
+from src.estructuradas import MatrizImplicita, MatrizToeplitz, MatrizCirculante, MatrizKronecker
+from src.algebra_lineal import gradiente_conjugado
+
+
+class TestMatricesEstructuradas(unittest.TestCase):
+    """Pruebas unitarias para Toeplitz, circulante y Kronecker implícitas."""
+
+    def setUp(self):
+        """Configuración inicial para cada test."""
+        self.rng = np.random.default_rng(0)
+
+    def test_toeplitz_rectangular(self):
+        """Testa el producto de una Toeplitz rectangular por vectores y matrices."""
+        c = self.rng.standard_normal(37)
+        r = self.rng.standard_normal(23)
+        T = MatrizToeplitz(c, r)
+        densa = T.a_densa().datos
+        x = self.rng.standard_normal(23)
+        X = self.rng.standard_normal((23, 4))
+
+        self.assertEqual(T.shape, (37, 23))
+        np.testing.assert_allclose(T.matvec(x), densa @ x, atol=1e-12)
+        np.testing.assert_allclose(T @ X, densa @ X, atol=1e-12)
+        np.testing.assert_allclose(T.transponer().a_densa().datos, densa.T)
+
+    def test_interoperabilidad_con_matriz_numpy(self):
+        """Testa el operador @ en ambos órdenes con MatrizNumPy."""
+        T = MatrizToeplitz(self.rng.standard_normal(30), self.rng.standard_normal(30))
+        A = MatrizNumPy(self.rng.standard_normal((5, 30)))
+        B = MatrizNumPy(self.rng.standard_normal((30, 6)))
+        densa = T.a_densa().datos
+
+        izquierda = A @ T
+        derecha = T @ B
+        self.assertIsInstance(izquierda, MatrizNumPy)
+        self.assertIsInstance(derecha, MatrizNumPy)
+        np.testing.assert_allclose(izquierda.datos, A.datos @ densa, atol=1e-12)
+        np.testing.assert_allclose(derecha.datos, densa @ B.datos, atol=1e-12)
+        np.testing.assert_allclose(A.datos @ T, A.datos @ densa, atol=1e-12)
+
+        with self.assertRaises(ValueError):
+            T @ MatrizNumPy(self.rng.standard_normal((4, 4)))
+
+    def test_circulante_producto_y_resolucion(self):
+        """Testa el producto y la resolución FFT de la circulante."""
+        C = MatrizCirculante([4.0, 1.0, 0.0, 0.5, 1.0])
+        densa = C.a_densa().datos
+        b = self.rng.standard_normal(5)
+
+        np.testing.assert_allclose(C.matvec(b), densa @ b, atol=1e-12)
+        np.testing.assert_allclose(C.transponer().a_densa().datos, densa.T, atol=1e-12)
+        np.testing.assert_allclose(densa @ C.resolver(b), b, atol=1e-12)
+
+        with self.assertRaises(ValueError):
+            MatrizCirculante([1.0, -1.0]).resolver(b[:2])
+
+    def test_kronecker(self):
+        """Testa producto y resolución de A⊗B sin formarla."""
+        a = self.rng.standard_normal((4, 3))
+        b = self.rng.standard_normal((5, 6))
+        K = MatrizKronecker(a, b)
+        x = self.rng.standard_normal(18)
+        X = self.rng.standard_normal((18, 3))
+
+        self.assertEqual(K.shape, (20, 18))
+        np.testing.assert_allclose(K.matvec(x), np.kron(a, b) @ x, atol=1e-12)
+        np.testing.assert_allclose(K @ X, np.kron(a, b) @ X, atol=1e-12)
+
+        cuadrada = MatrizKronecker(self.rng.standard_normal((4, 4)) + 4 * np.eye(4),
+                                   self.rng.standard_normal((3, 3)) + 3 * np.eye(3))
+        y = self.rng.standard_normal(12)
+        np.testing.assert_allclose(cuadrada.matvec(cuadrada.resolver(y)), y, atol=1e-10)
+
+    def test_gradiente_conjugado_toeplitz_precondicionado(self):
+        """Testa CG con precondicionador circulante sobre una Toeplitz SPD."""
+        n = 2000
+        c = 1.0 / (1.0 + np.arange(n)) ** 2
+        c[0] = 2.0
+        T = MatrizToeplitz(c)
+        b = np.ones(n)
+
+        x, info = gradiente_conjugado(T, b, tolerancia=1e-10,
+                                      precondicionador=T.precondicionador_circulante())
+        sin_precondicionar = gradiente_conjugado(T, b, tolerancia=1e-10)[1]
+
+        self.assertTrue(info['convergio'])
+        self.assertLess(info['iteraciones'], sin_precondicionar['iteraciones'])
+        np.testing.assert_allclose(T.matvec(x), b, atol=1e-8)
+
+    def test_subclase_incompleta(self):
+        """Testa que una subclase sin transponer falle al crearla y no durante un cálculo."""
+        class SoloMatvec(MatrizImplicita):
+            def matvec(self, x):
+                return 2 * x
+
+        with self.assertRaises(TypeError):
+            SoloMatvec(3, 3, np.float64)
+        with self.assertRaises(TypeError):
+            MatrizImplicita(3, 3, np.float64)
+
+
+if __name__ == '__main__':
+    unittest.main()
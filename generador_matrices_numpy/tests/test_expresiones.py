@@ -0,0 +1,96 @@
+"""
+Pruebas unitarias para el lenguaje de expresiones
+=================================================
+
+Tests para verificar la compilación y evaluación de expresiones sobre un
+espacio de trabajo de matrices.
+
+Autor: Nicolas
+"""
+
+import unittest
+import sys
+import os
+import numpy as np
+
+# Agregar el directorio raíz al path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.matriz_numpy import MatrizNumPy
+from src.expresiones import compilar_expresion, evaluar_expresion
+
+
+class TestExpresiones(unittest.TestCase):
+    """Pruebas unitarias para compilar_expresion y evaluar_expresion."""
+
+    def setUp(self):
+        """Configuración inicial para cada test."""
+        rng = np.random.default_rng(5)
+        self.espacio = {
+            'A': MatrizNumPy(rng.standard_normal((6, 6))),
+            'B': MatrizNumPy(rng.standard_normal((6, 6))),
+            'D': MatrizNumPy(rng.standard_normal((6, 6)) + 6 * np.eye(6)),
+            'v': MatrizNumPy(rng.standard_normal((6, 1))),
+        }
+
+    def _datos(self, nombre):
+        return self.espacio[nombre].datos
+
+    def test_expresion_con_asignacion(self):
+        """Testa el ejemplo de referencia C = A @ B.T + 2*inv(D)."""
+        nombre, resultado, info = evaluar_expresion("C = A @ B.T + 2*inv(D)", self.espacio)
+        esperado = self._datos('A') @ self._datos('B').T + 2 * np.linalg.inv(self._datos('D'))
+
+        self.assertEqual(nombre, 'C')
+        np.testing.assert_allclose(resultado.datos, esperado, rtol=1e-12, atol=1e-12)
+        self.assertGreaterEqual(info['tiempo'], 0)
+        self.assertGreater(info['memoria_pico'], 0)
+
+    def test_inversa_en_producto_y_potencias(self):
+        """Testa inv(D) @ v como resolución y las potencias enteras."""
+        nombre, resultado, _ = evaluar_expresion("inv(D) @ v - D**-1 @ v / 2", self.espacio)
+        self.assertIsNone(nombre)
+        np.testing.assert_allclose(resultado.datos,
+                                   np.linalg.solve(self._datos('D'), self._datos('v')) / 2,
+                                   rtol=1e-10, atol=1e-12)
+
+        _, cubo, _ = evaluar_expresion("A**3", self.espacio)
+        np.testing.assert_allclose(cubo.datos, np.linalg.matrix_power(self._datos('A'), 3), rtol=1e-10)
+
+    def test_potencias_grandes(self):
+        """Testa que A**k use O(log k) productos y que el plan muestre los nombres."""
+        espacio = {'A': MatrizNumPy(np.eye(4) + 1e-3)}
+        nombre, resultado, info = evaluar_expresion("P = A**300 @ A.T", espacio)
+        self.assertEqual(nombre, 'P')
+        self.assertEqual(info['plan'], "((A)**300 @ A.T)")
+        self.assertLess(info['tiempo'], 1.0)
+        np.testing.assert_allclose(resultado.datos,
+                                   np.linalg.matrix_power(espacio['A'].datos, 300) @ espacio['A'].datos.T,
+                                   rtol=1e-10)
+
+    def test_subexpresiones_compartidas(self):
+        """Testa que los nombres repetidos se calculen una vez y den el resultado inmediato."""
+        _, expresion = compilar_expresion("(A + B) @ v + (A + B) @ v", self.espacio)
+        izquierda, derecha = expresion.hijos
+        self.assertEqual(izquierda.clave, derecha.clave)
+
+        suma = self._datos('A') + self._datos('B')
+        casos = {
+            "C = (A + B) @ (A + B)": suma @ suma,
+            "(A + B) @ v + (A + B) @ v": 2 * (suma @ self._datos('v')),
+            "(A + B) - (A + B) @ B": suma - suma @ self._datos('B'),
+        }
+        for texto, esperado in casos.items():
+            _, resultado, _ = evaluar_expresion(texto, self.espacio)
+            np.testing.assert_allclose(resultado.datos, esperado, rtol=1e-12, atol=1e-12, err_msg=texto)
+
+    def test_errores(self):
+        """Testa los mensajes de error de expresiones no válidas."""
+        for texto in ("A @", "X + A", "A * B", "A + 1", "__import__('os')", "A.datos",
+                      "A = B = C", "inv(v)", "A @ v + A", "A**0", "A**1.5", "A**B", "v**2"):
+            with self.assertRaises(ValueError, msg=texto):
+                evaluar_expresion(texto, self.espacio)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,144 @@
+"""
+Pruebas unitarias para el historial de operaciones
+==================================================
+
+Tests para verificar el registro de operaciones con versiones, formas y
+duraciones, el búfer circular, la exportación a JSON Lines y la
+reproducción determinista sobre un espacio de trabajo nuevo.
+
+Autor: Nicolas
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+import numpy as np
+
+# Agregar el directorio raíz al path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.matriz_numpy import MatrizNumPy
+from src.historial import Historial, Registro, nueva_semilla
+from src.expresiones import evaluar_expresion
+
+
+class TestHistorial(unittest.TestCase):
+    """Pruebas unitarias para src/historial.py."""
+
+    def setUp(self):
+        """Configuración inicial para cada test."""
+        self.historial = Historial()
+        self.matrices = {}
+
+    def crear(self, nombre, metodo, **argumentos):
+        """Crea una matriz registrándola como lo hacen las interfaces."""
+        with self.historial.medir('crear', self.matrices, (), (nombre,), metodo=metodo, argumentos=argumentos):
+            self.matrices[nombre] = getattr(MatrizNumPy, metodo)(**argumentos)
+
+    def sesion(self):
+        """Una sesión corta con creación, operaciones y gestión."""
+        self.crear('A', 'crear_aleatoria', filas=4, columnas=4, min_val=-1, max_val=1, seed=nueva_semilla())
+        self.crear('B', 'crear_identidad', tamaño=4)
+        with self.historial.medir('suma', self.matrices, ('A', 'B'), ('C',)):
+            self.matrices['C'] = self.matrices['A'] + self.matrices['B']
+        with self.historial.medir('inversa', self.matrices, ('C',), ('C_inv',)):
+            self.matrices['C_inv'] = self.matrices['C'].inversa()
+        with self.historial.medir('qr', self.matrices, ('A',)) as registro:
+            q, r = self.matrices['A'].qr()
+        self.matrices['A_Q'] = MatrizNumPy(q)
+        registro.guardar_resultados(self.matrices, 'A_Q')
+        with self.historial.medir('renombrar', self.matrices, ('B',), ('I',)):
+            self.matrices['I'] = self.matrices.pop('B')
+        nombre, resultado, info = evaluar_expresion("D = C @ C_inv - I", self.matrices)
+        self.matrices[nombre] = resultado
+        self.historial.registrar('expresion', self.matrices, (), (nombre,), info['tiempo'],
+                                 linea="D = C @ C_inv - I")
+        with self.historial.medir('eliminar', self.matrices, ('C',)):
+            del self.matrices['C']
+
+    def test_medir_registra(self):
+        """medir guarda operandos, versiones, formas y duración."""
+        self.crear('A', 'crear_unos', filas=2, columnas=3)
+        self.matrices['A'].marcar_modificada()
+        with self.historial.medir('transpuesta', self.matrices, ('A',), ('At',), "A transpuesta"):
+            self.matrices['At'] = self.matrices['A'].transponer()
+
+        registro = self.historial.ultimos(1)[0]
+        self.assertEqual(registro.operacion, 'transpuesta')
+        self.assertEqual(registro.operandos, ('A',))
+        self.assertEqual(registro.versiones, (self.matrices['A'].version,))
+        self.assertEqual(registro.formas, ((3, 2),))
+        self.assertGreaterEqual(registro.duracion, 0.0)
+        self.assertEqual(registro.indice, 2)
+        self.assertIn("A transpuesta", str(registro))
+
+    def test_error_no_registra(self):
+        """Un bloque que falla no deja registro."""
+        self.crear('A', 'crear_unos', filas=2, columnas=3)
+        with self.assertRaises(ValueError):
+            with self.historial.medir('inversa', self.matrices, ('A',), ('A_inv',)):
+                self.matrices['A_inv'] = self.matrices['A'].inversa()
+        self.assertEqual(len(self.historial), 1)
+
+    def test_bufer_circular(self):
+        """Al llenarse se descartan los registros más antiguos."""
+        historial = Historial(capacidad=3)
+        for i in range(5):
+            historial.registrar('ver', {}, descripcion=str(i))
+        self.assertEqual(len(historial), 3)
+        self.assertEqual(historial.descartados, 2)
+        self.assertEqual([r.descripcion for r in historial], ['2', '3', '4'])
+        self.assertEqual([r.indice for r in historial], [3, 4, 5])
+
+    def test_jsonl_ida_y_vuelta(self):
+        """Exportar e importar conserva todos los campos."""
+        self.sesion()
+        with tempfile.TemporaryDirectory() as carpeta:
+            ruta = os.path.join(carpeta, 'historial.jsonl')
+            self.assertEqual(self.historial.exportar(ruta), len(self.historial))
+            importado = Historial.importar(ruta)
+
+        self.assertEqual(self.historial.a_jsonl(), importado.a_jsonl())
+        original, copia = self.historial.registros('qr')[0], importado.registros('qr')[0]
+        self.assertEqual(copia.resultados, ('A_Q',))
+        self.assertEqual(copia.formas, original.formas)
+        with self.assertRaises(ValueError):
+            Historial.desde_jsonl('{"operacion": "suma"}\nno es json\n')
+
+    def test_reproducir(self):
+        """Reproducir desde JSON Lines da el mismo espacio de trabajo."""
+        self.sesion()
+        importado = Historial.desde_jsonl(self.historial.a_jsonl())
+        matrices, repeticion = importado.reproducir()
+
+        self.assertEqual(set(matrices), set(self.matrices))
+        for nombre, matriz in self.matrices.items():
+            np.testing.assert_array_equal(matrices[nombre].datos, matriz.datos)
+        self.assertEqual(len(repeticion), len(self.historial))
+        self.assertEqual([r.operacion for r in repeticion], [r.operacion for r in self.historial])
+
+    def test_reproducir_sin_operando(self):
+        """Si el registro que creó un operando se descartó, se avisa."""
+        historial = Historial(capacidad=2)
+        matrices = {}
+        with historial.medir('crear', matrices, (), ('A',), metodo='crear_identidad', argumentos={'tamaño': 2}):
+            matrices['A'] = MatrizNumPy.crear_identidad(2)
+        for nombre in ('B', 'C'):
+            with historial.medir('copiar', matrices, ('A',), (nombre,)):
+                matrices[nombre] = matrices['A'].copiar()
+
+        with self.assertRaisesRegex(ValueError, "no existe la matriz 'A'"):
+            historial.reproducir()
+        matrices_finales, _ = historial.reproducir({'A': MatrizNumPy.crear_identidad(2)})
+        self.assertEqual(set(matrices_finales), {'A', 'B', 'C'})
+
+    def test_operacion_desconocida(self):
+        """Una operación sin reproductor no se puede repetir."""
+        self.historial.agregar(Registro('magia'))
+        with self.assertRaises(ValueError):
+            self.historial.reproducir()
+
+
+if __name__ == '__main__':
+    unittest.main()
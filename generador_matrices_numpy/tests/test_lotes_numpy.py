@@ -0,0 +1,85 @@
+"""
+Pruebas unitarias para la ejecución por lotes
+=============================================
+
+Tests para verificar el modo no interactivo con NumPy: órdenes,
+expresiones, archivos y códigos de salida.
+
+Autor: Nicolas
+"""
+
+import unittest
+import sys
+import os
+import io
+import subprocess
+import tempfile
+import numpy as np
+
+# Agregar el directorio raíz al path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from interfaces.lotes_numpy import EjecutorLotesNP, EXITO, ERROR_EJECUCION, ERROR_SINTAXIS
+
+
+class TestEjecutorLotesNP(unittest.TestCase):
+    """Pruebas unitarias para EjecutorLotesNP."""
+
+    def setUp(self):
+        """Configuración inicial para cada test."""
+        self.salida = io.StringIO()
+        self.registro = io.StringIO()
+        self.ejecutor = EjecutorLotesNP(self.salida, self.registro)
+        self.directorio = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directorio.cleanup()
+
+    def test_guion_completo(self):
+        """Testa creación, expresiones y guardado/carga en CSV y .npy sin pérdida."""
+        csv = os.path.join(self.directorio.name, "c.csv")
+        npy = os.path.join(self.directorio.name, "c.npy")
+        codigo = self.ejecutor.ejecutar([
+            "aleatoria A 20 20 -1 1 7",
+            "identidad I 20",
+            "D = A + 20*I",
+            "C = A @ A.T + 2*inv(D)   # expresión completa",
+            f"guardar C {csv}",
+            f"guardar C {npy}",
+            f"cargar E {csv}",
+            f"cargar F {npy}",
+            "mostrar I",
+        ])
+        matrices = self.ejecutor.matrices
+        A, D = matrices['A'].datos, matrices['D'].datos
+
+        self.assertEqual(codigo, EXITO)
+        np.testing.assert_allclose(matrices['C'].datos, A @ A.T + 2 * np.linalg.inv(D), rtol=1e-12)
+        np.testing.assert_array_equal(matrices['E'].datos, matrices['C'].datos)
+        np.testing.assert_array_equal(matrices['F'].datos, matrices['C'].datos)
+        self.assertEqual(self.salida.getvalue().count("\n"), 20)
+
+    def test_codigos_de_error(self):
+        """Testa los códigos de salida de errores de sintaxis y de ejecución."""
+        self.assertEqual(self.ejecutor.ejecutar(["girar A"]), ERROR_SINTAXIS)
+        self.assertEqual(self.ejecutor.ejecutar(["C = A @"]), ERROR_SINTAXIS)
+        self.assertEqual(self.ejecutor.ejecutar(["C = A + B"]), ERROR_EJECUCION)
+        self.assertEqual(self.ejecutor.ejecutar(["ceros Z 3 3", "C = inv(Z)"]), ERROR_EJECUCION)
+        self.assertEqual(self.ejecutor.ejecutar(["cargar X /no/existe.csv"]), ERROR_EJECUCION)
+
+    def test_main_sin_tkinter(self):
+        """Testa main.py --script leyendo de stdin sin importar tkinter."""
+        raiz = os.path.join(os.path.dirname(__file__), '..')
+        codigo = ("import sys, main\n"
+                  "try:\n"
+                  "    main.main(['--script', '-'])\n"
+                  "except SystemExit as e:\n"
+                  "    print(e.code, 'tkinter' in sys.modules)\n")
+        resultado = subprocess.run([sys.executable, "-c", codigo], cwd=raiz, input="identidad I 3\nmostrar I\n",
+                                   capture_output=True, text=True, timeout=60)
+
+        self.assertEqual(resultado.stdout.splitlines()[-1], "0 False")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+"""
+Pruebas unitarias para el mapa de calor
+=======================================
+
+Tests para verificar la reducción por bloques (exacta y submuestreada),
+el coloreado, el empaquetado PPM y la traducción de selecciones a
+regiones de la matriz.
+
+Autor: Nicolas
+"""
+
+import unittest
+import sys
+import os
+import numpy as np
+from numpy.lib.stride_tricks import as_strided
+
+# Agregar el directorio raíz al path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from interfaces.mapa_calor import (reducir_bloques, colorear, ampliar_pixeles, imagen_ppm,
+                                   region_desde_pixeles, PALETA_SECUENCIAL, PALETA_DIVERGENTE,
+                                   COLOR_NO_FINITO)
+
+
+class TestMapaCalor(unittest.TestCase):
+    """Pruebas unitarias para interfaces/mapa_calor.py."""
+
+    def setUp(self):
+        """Configuración inicial para cada test."""
+        self.rng = np.random.default_rng(0)
+
+    def test_reduccion_exacta(self):
+        """Testa el máximo de |x| y la media por bloques, con bloques finales más cortos."""
+        datos = self.rng.standard_normal((10, 7))
+        maximos, bloque, paso = reducir_bloques(datos, 4, 3, 'max')
+        self.assertEqual((bloque, paso), ((3, 3), 1))
+        self.assertEqual(maximos.shape, (4, 3))
+        self.assertAlmostEqual(maximos[3, 2], abs(datos[9:, 6:]).max())
+        self.assertAlmostEqual(maximos[1, 0], abs(datos[3:6, 0:3]).max())
+
+        medias, _, _ = reducir_bloques(datos, 4, 3, 'media')
+        self.assertAlmostEqual(medias[1, 1], datos[3:6, 3:6].mean())
+        self.assertAlmostEqual(medias[3, 2], datos[9:, 6:].mean())
+
+        with self.assertRaises(ValueError):
+            reducir_bloques(datos, 4, 3, 'mediana')
+
+    def test_reduccion_submuestreada(self):
+        """Testa que la media de una matriz 50k×50k se estima leyendo como mucho el presupuesto."""
+        base = self.rng.standard_normal(100_000)
+        grande = as_strided(base[49_999:], shape=(50_000, 50_000), strides=(-8, 8))
+        valores, bloque, paso = reducir_bloques(grande, 600, 800, 'media', presupuesto=1_000_000)
+        self.assertEqual(valores.shape, (596, 794))
+        self.assertEqual(bloque, (84, 63))
+        self.assertGreater(paso, 1)
+        self.assertTrue(np.isfinite(valores).all())
+
+    def test_maximo_de_una_banda(self):
+        """Testa que el máximo por franjas no pierde una superdiagonal entre muestras."""
+        banda = np.eye(2000, k=1)
+        banda[1000, 1001] = -3
+        maximos, bloque, paso = reducir_bloques(banda, 50, 50, 'max', presupuesto=10_000)
+        self.assertEqual((bloque, paso), ((40, 40), 1))
+
+        esperado = np.zeros((50, 50))
+        filas = np.arange(1999)
+        esperado[filas // 40, (filas + 1) // 40] = 1
+        esperado[25, 25] = 3
+        np.testing.assert_array_equal(maximos, esperado)
+
+        enteros = np.full((5, 5), np.iinfo(np.int8).min, dtype=np.int8)
+        self.assertEqual(reducir_bloques(enteros, 1, 1, 'max')[0][0, 0], 128)
+        complejos = np.full((3, 4), 3 + 4j, dtype=np.complex64)
+        np.testing.assert_allclose(reducir_bloques(complejos, 2, 2, 'max', presupuesto=4)[0], 5)
+
+    def test_colorear(self):
+        """Testa las paletas secuencial y divergente y los valores no finitos."""
+        rgb, rango = colorear(np.array([[0.0, 1.0], [np.nan, 0.5]]))
+        self.assertEqual(rango, (0.0, 1.0))
+        np.testing.assert_array_equal(rgb[0, 0], PALETA_SECUENCIAL[0])
+        np.testing.assert_array_equal(rgb[0, 1], PALETA_SECUENCIAL[255])
+        np.testing.assert_array_equal(rgb[1, 0], COLOR_NO_FINITO)
+
+        rgb, rango = colorear(np.array([[-1.0, 2.0]]))
+        self.assertEqual(rango, (-2.0, 2.0))
+        np.testing.assert_array_equal(rgb[0, 1], PALETA_DIVERGENTE[255])
+
+        rgb, _ = colorear(np.full((2, 2), 3.0))
+        self.assertEqual(rgb.dtype, np.uint8)
+
+    def test_ampliar_y_ppm(self):
+        """Testa la ampliación entera y la cabecera PPM."""
+        rgb, _ = colorear(np.eye(3))
+        ampliada, factor = ampliar_pixeles(rgb, 100, 50)
+        self.assertEqual(factor, 16)
+        self.assertEqual(ampliada.shape, (48, 48, 3))
+
+        ppm = imagen_ppm(ampliada)
+        self.assertTrue(ppm.startswith(b'P6\n48 48\n255\n'))
+        self.assertEqual(len(ppm), len(b'P6\n48 48\n255\n') + 48 * 48 * 3)
+
+    def test_region_desde_pixeles(self):
+        """Testa la traducción de una selección a la región de la matriz."""
+        region = (100, 1100, 0, 500)
+        self.assertEqual(region_desde_pixeles(30, 20, 10, 5, region, (10, 5), 1), (150, 310, 50, 155))
+        # Con píxeles ampliados y fuera de la imagen, la región queda dentro de lo mostrado
+        self.assertEqual(region_desde_pixeles(0, 0, 5000, 5000, (0, 4, 0, 4), (1, 1), 16), (0, 4, 0, 4))
+
+
+if __name__ == '__main__':
+    unittest.main()
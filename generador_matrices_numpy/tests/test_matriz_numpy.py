@@ -0,0 +1,146 @@
+"""
+Pruebas unitarias para la clase MatrizNumPy
+===========================================
+
+Tests para verificar el correcto funcionamiento de la clase MatrizNumPy
+y sus métodos de creación.
+
+Autor: Nicolas
+"""
+
+import unittest
+import sys
+import os
+import numpy as np
+
+# Agregar el directorio raíz al path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.matriz_numpy import MatrizNumPy
+from src import aleatorio
+
+
+class TestMatrizAleatoria(unittest.TestCase):
+    """Pruebas unitarias para la generación aleatoria."""
+
+    def setUp(self):
+        """Usa teselas pequeñas para ejercitar el reparto entre hilos."""
+        self.elementos_originales = aleatorio.ELEMENTOS_POR_TESELA
+        aleatorio.ELEMENTOS_POR_TESELA = 1000
+
+    def tearDown(self):
+        aleatorio.ELEMENTOS_POR_TESELA = self.elementos_originales
+
+    def test_reproducible_con_cualquier_numero_de_hilos(self):
+        """Testa que la semilla determine el resultado sin importar los hilos."""
+        una = MatrizNumPy.crear_aleatoria(200, 70, -5, 5, seed=42, hilos=1)
+        varias = MatrizNumPy.crear_aleatoria(200, 70, -5, 5, seed=42, hilos=4)
+
+        np.testing.assert_array_equal(una.datos, varias.datos)
+        self.assertFalse(np.array_equal(una.datos,
+                                        MatrizNumPy.crear_aleatoria(200, 70, -5, 5, seed=43).datos))
+
+    def test_no_altera_estado_global(self):
+        """Testa que no se reinicie el estado global de np.random."""
+        np.random.seed(7)
+        esperado = np.random.random(5)
+        np.random.seed(7)
+        MatrizNumPy.crear_aleatoria(50, 50, seed=1)
+        np.testing.assert_array_equal(np.random.random(5), esperado)
+
+    def test_rango_y_dtype_flotante(self):
+        """Testa el rango y el dtype de matrices flotantes."""
+        for dtype in (np.float32, np.float64):
+            matriz = MatrizNumPy.crear_aleatoria(100, 100, -2.0, 3.0, dtype=dtype, seed=0)
+            self.assertEqual(matriz.datos.dtype, dtype)
+            self.assertGreaterEqual(matriz.datos.min(), -2.0)
+            self.assertLessEqual(matriz.datos.max(), 3.0)
+
+    def test_rango_entero_inclusivo(self):
+        """Testa que los enteros incluyan ambos extremos."""
+        matriz = MatrizNumPy.crear_aleatoria(100, 100, 0, 3, dtype=np.int64, seed=0)
+        self.assertEqual(matriz.datos.dtype, np.int64)
+        self.assertEqual(set(np.unique(matriz.datos)), {0, 1, 2, 3})
+
+    def test_llenar_aleatorio_en_sitio(self):
+        """Testa que llenar_aleatorio escriba sobre el array existente."""
+        matriz = MatrizNumPy(30, 40)
+        datos_originales = matriz.datos
+        matriz.llenar_aleatorio(-1, 1, seed=5)
+
+        self.assertIs(matriz.datos, datos_originales)
+        np.testing.assert_array_equal(matriz.datos,
+                                      MatrizNumPy.crear_aleatoria(30, 40, -1, 1, seed=5).datos)
+
+
+class TestMatricesEspeciales(unittest.TestCase):
+    """Pruebas unitarias para las fábricas de matrices estructuradas."""
+
+    def test_hilbert(self):
+        """Testa la matriz de Hilbert."""
+        H = MatrizNumPy.crear_hilbert(4)
+        i = np.arange(4)
+        np.testing.assert_allclose(H.datos, 1.0 / (i[:, None] + i[None, :] + 1))
+        self.assertEqual(MatrizNumPy.crear_hilbert(3, dtype=np.float32).datos.dtype, np.float32)
+        with self.assertRaises(ValueError):
+            MatrizNumPy.crear_hilbert(3, dtype=np.int64)
+
+    def test_vandermonde(self):
+        """Testa la matriz de Vandermonde en ambos órdenes."""
+        x = [1.0, 2.0, 3.0, 5.0]
+        np.testing.assert_allclose(MatrizNumPy.crear_vandermonde(x, 3).datos, np.vander(x, 3))
+        np.testing.assert_allclose(MatrizNumPy.crear_vandermonde(x, creciente=True).datos,
+                                   np.vander(x, increasing=True))
+
+    def test_toeplitz_hankel_circulante(self):
+        """Testa Toeplitz, Hankel y circulante contra su definición."""
+        c = np.array([1.0, 2.0, 3.0])
+        r = np.array([1.0, 4.0, 5.0, 6.0])
+        T = MatrizNumPy.crear_toeplitz(c, r).datos
+        H = MatrizNumPy.crear_hankel(c, [3.0, 7.0, 8.0, 9.0]).datos
+        C = MatrizNumPy.crear_circulante(c).datos
+
+        for i in range(3):
+            for j in range(4):
+                self.assertEqual(T[i, j], c[i - j] if i >= j else r[j - i])
+                self.assertEqual(H[i, j], np.concatenate((c, [7.0, 8.0, 9.0]))[i + j])
+        for i in range(3):
+            for j in range(3):
+                self.assertEqual(C[i, j], c[(i - j) % 3])
+
+    def test_pascal(self):
+        """Testa las tres variantes de la matriz de Pascal."""
+        S = MatrizNumPy.crear_pascal(6, dtype=np.int64).datos
+        L = MatrizNumPy.crear_pascal(6, 'inferior', dtype=np.int64).datos
+        U = MatrizNumPy.crear_pascal(6, 'superior', dtype=np.int64).datos
+
+        self.assertEqual(S[3, 2], 10)
+        self.assertEqual(L[4, 2], 6)
+        np.testing.assert_array_equal(U, L.T)
+        np.testing.assert_array_equal(L @ U, S)
+
+    def test_banda_y_tridiagonal(self):
+        """Testa las matrices de banda."""
+        T = MatrizNumPy.crear_tridiagonal(-1, 2, -1, n=4).datos
+        esperado = 2 * np.eye(4) - np.eye(4, k=1) - np.eye(4, k=-1)
+        np.testing.assert_array_equal(T, esperado)
+
+        B = MatrizNumPy.crear_banda(3, {1: [7, 8, 6], -2: 9}, columnas=4).datos
+        self.assertEqual(B[0, 1], 7)
+        self.assertEqual(B[2, 3], 6)
+        self.assertEqual(B[2, 0], 9)
+        self.assertEqual(np.count_nonzero(B), 4)
+
+    def test_aleatorias_estructuradas(self):
+        """Testa las matrices ortogonal y SPD aleatorias."""
+        Q = MatrizNumPy.crear_ortogonal_aleatoria(40, seed=3)
+        self.assertTrue(Q.es_ortogonal())
+
+        A = MatrizNumPy.crear_spd_aleatoria(40, condicion=100.0, seed=3)
+        self.assertTrue(A.es_simetrica())
+        self.assertTrue(A.es_definida_positiva())
+        self.assertAlmostEqual(A.condicion(), 100.0, places=6)
+
+
+if __name__ == '__main__':
+    unittest.main()
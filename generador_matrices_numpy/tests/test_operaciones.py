@@ -0,0 +1,161 @@
+"""
+Pruebas unitarias para operaciones optimizadas
+==============================================
+
+Tests para verificar que los núcleos de src/operaciones.py producen
+exactamente los mismos resultados que NumPy.
+
+Autor: Nicolas
+"""
+
+import unittest
+import warnings
+import sys
+import os
+import numpy as np
+
+# Agregar el directorio raíz al path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.matriz_numpy import MatrizNumPy
+from src.operaciones import multiplicar_enteros, multiplicar_cadena, orden_cadena_optimo
+from src.estructuradas import MatrizToeplitz, MatrizKronecker
+
+
+class TestMultiplicarEnteros(unittest.TestCase):
+    """Pruebas unitarias para el producto entero exacto."""
+
+    def setUp(self):
+        """Configuración inicial para cada test."""
+        self.rng = np.random.default_rng(1)
+
+    def _aleatoria(self, filas, columnas, limite, dtype=np.int64):
+        return self.rng.integers(-limite, limite, size=(filas, columnas), dtype=dtype)
+
+    def test_producto_directo(self):
+        """Testa el camino BLAS directo con valores pequeños."""
+        a = self._aleatoria(120, 90, 1000)
+        b = self._aleatoria(90, 70, 1000)
+        resultado = multiplicar_enteros(a, b)
+
+        self.assertEqual(resultado.dtype, np.int64)
+        np.testing.assert_array_equal(resultado, a @ b)
+
+    def test_producto_por_limbs(self):
+        """Testa el camino por limbs con valores grandes."""
+        a = self._aleatoria(100, 80, 2 ** 40)
+        b = self._aleatoria(80, 60, 2 ** 40)
+        np.testing.assert_array_equal(multiplicar_enteros(a, b), a @ b)
+
+    def test_desbordamiento_identico(self):
+        """Testa que el desbordamiento modular coincida con NumPy."""
+        info = np.iinfo(np.int64)
+        a = self.rng.integers(info.min, info.max, size=(64, 64), dtype=np.int64)
+        b = self.rng.integers(info.min, info.max, size=(64, 64), dtype=np.int64)
+        a[0, 0] = info.min
+        np.testing.assert_array_equal(multiplicar_enteros(a, b), a @ b)
+
+    def test_int32(self):
+        """Testa que se conserve el dtype y el desbordamiento de int32."""
+        a = self._aleatoria(50, 50, 2 ** 30, dtype=np.int32)
+        b = self._aleatoria(50, 50, 2 ** 30, dtype=np.int32)
+        resultado = multiplicar_enteros(a, b)
+
+        self.assertEqual(resultado.dtype, np.int32)
+        np.testing.assert_array_equal(resultado, a @ b)
+
+    def test_desbordamiento_tipos_estrechos(self):
+        """Testa que el desbordamiento de int32 e int16 en el camino directo coincida con NumPy."""
+        for dtype, valor in ((np.int32, 60000), (np.int16, 300)):
+            with self.subTest(dtype=dtype):
+                a = np.full((40, 40), valor, dtype=dtype)
+                with warnings.catch_warnings():
+                    warnings.simplefilter('error', RuntimeWarning)
+                    resultado = multiplicar_enteros(a, a)
+
+                self.assertEqual(resultado.dtype, dtype)
+                np.testing.assert_array_equal(resultado, a @ a)
+                np.testing.assert_array_equal((MatrizNumPy(a) @ MatrizNumPy(a)).datos, a @ a)
+
+    def test_int64_con_uint64(self):
+        """Testa que la mezcla int64/uint64 (que promociona a float64) no falle."""
+        a = self._aleatoria(40, 40, 100)
+        b = self._aleatoria(40, 40, 100).astype(np.uint64) + np.uint64(100)
+        resultado = multiplicar_enteros(a, b)
+
+        self.assertEqual(resultado.dtype, np.float64)
+        np.testing.assert_array_equal(resultado, a @ b)
+
+    def test_nucleo_por_bloques(self):
+        """Testa el núcleo entero multihilo forzando el último recurso."""
+        a = self._aleatoria(300, 270, 2 ** 40)
+        b = self._aleatoria(270, 310, 2 ** 40)
+        resultado = multiplicar_enteros(a, b, max_productos=0, hilos=3)
+        np.testing.assert_array_equal(resultado, a @ b)
+
+    def test_operador_matmul(self):
+        """Testa que el operador @ de MatrizNumPy use el camino entero."""
+        A = MatrizNumPy(self._aleatoria(40, 40, 10 ** 6))
+        B = MatrizNumPy(self._aleatoria(40, 40, 10 ** 6))
+        C = A @ B
+
+        self.assertEqual(C.datos.dtype, np.int64)
+        np.testing.assert_array_equal(C.datos, A.datos @ B.datos)
+
+
+class TestMultiplicarCadena(unittest.TestCase):
+    """Pruebas unitarias para la multiplicación encadenada."""
+
+    def setUp(self):
+        """Configuración inicial para cada test."""
+        self.rng = np.random.default_rng(4)
+
+    def test_resultado_y_tipo(self):
+        """Testa el resultado con MatrizNumPy y arrays mezclados."""
+        A = MatrizNumPy(self.rng.standard_normal((50, 40)))
+        B = self.rng.standard_normal((40, 60))
+        v = MatrizNumPy(self.rng.standard_normal((60, 1)))
+        resultado = MatrizNumPy.multiplicar_cadena([A, B, v])
+
+        self.assertIsInstance(resultado, MatrizNumPy)
+        np.testing.assert_allclose(resultado.datos, A.datos @ B @ v.datos, rtol=1e-12)
+
+        with self.assertRaises(ValueError):
+            multiplicar_cadena([A, A])
+        with self.assertRaises(ValueError):
+            multiplicar_cadena([])
+
+    def test_enteros_exactos(self):
+        """Testa que las cadenas enteras conserven el dtype y sean exactas."""
+        matrices = [self.rng.integers(-9, 9, size=forma) for forma in ((20, 30), (30, 5), (5, 40))]
+        resultado = multiplicar_cadena(matrices)
+
+        self.assertEqual(resultado.dtype, np.int64)
+        np.testing.assert_array_equal(resultado, matrices[0] @ matrices[1] @ matrices[2])
+
+    def test_costo_con_estructura(self):
+        """Testa que una implícita barata cambie el orden elegido."""
+        n = 512
+        T = MatrizToeplitz(self.rng.standard_normal(n), self.rng.standard_normal(n))
+        A = self.rng.standard_normal((n, n))
+        B = self.rng.standard_normal((n, 8))
+        densa = T.a_densa().datos
+
+        np.testing.assert_allclose(multiplicar_cadena([A, T, B]), A @ densa @ B, rtol=1e-9, atol=1e-9)
+        np.testing.assert_allclose(multiplicar_cadena([T, A]), densa @ A, rtol=1e-9, atol=1e-9)
+
+        K = MatrizKronecker(self.rng.standard_normal((8, 8)), self.rng.standard_normal((8, 8)))
+        D = self.rng.standard_normal((64, 64))
+        kron = np.kron(K.a, K.b)
+        np.testing.assert_allclose(multiplicar_cadena([K, D, K]), kron @ D @ kron, rtol=1e-9, atol=1e-9)
+        np.testing.assert_allclose(multiplicar_cadena([K, K]), kron @ kron, rtol=1e-9, atol=1e-9)
+
+    def test_orden_cadena_con_costo_propio(self):
+        """Testa que la función de costo personalizada determine el orden."""
+        dimensiones = [10, 10, 10, 10]
+        _, division = orden_cadena_optimo(dimensiones, lambda i, k, j: 1.0 if (i, k, j) == (0, 1, 2) else 100.0)
+        self.assertEqual(division[0][2], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
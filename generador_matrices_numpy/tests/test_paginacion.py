@@ -0,0 +1,143 @@
+"""
+Pruebas unitarias para la paginación en consola
+===============================================
+
+Tests para verificar el resumen con elipsis de las matrices grandes (sin
+leer su parte central) y el recorrido por páginas con órdenes simuladas.
+
+Autor: Nicolas
+"""
+
+import unittest
+import sys
+import os
+import io
+from contextlib import redirect_stdout
+import numpy as np
+
+# Agregar el directorio raíz al path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.matriz_numpy import MatrizNumPy
+from src.paginacion import (Paginador, resumir, columnas_que_caben, formateador_consola,
+                            ELIPSIS_HORIZONTAL, ELIPSIS_VERTICAL, ELIPSIS_DIAGONAL)
+
+
+def numerada(filas: int, columnas: int) -> np.ndarray:
+    """Matriz cuyo elemento (i, j) vale i*1000 + j."""
+    return np.arange(filas)[:, None] * 1000 + np.arange(columnas)[None, :]
+
+
+class TestResumir(unittest.TestCase):
+    """Pruebas unitarias para resumir."""
+
+    def test_matriz_pequena_sin_elipsis(self):
+        """Una matriz que cabe se muestra entera."""
+        texto = resumir(numerada(3, 4))
+        self.assertNotIn(ELIPSIS_HORIZONTAL, texto)
+        self.assertEqual(len(texto.splitlines()), 4)
+        self.assertIn("2003", texto)
+
+    def test_matriz_grande_con_bordes(self):
+        """Solo se muestran los bordes, con elipsis en el centro."""
+        texto = resumir(numerada(50, 60), bordes=2)
+        lineas = texto.splitlines()
+        self.assertEqual(len(lineas), 1 + 2 + 1 + 2)
+        self.assertIn(ELIPSIS_HORIZONTAL, lineas[0])
+        self.assertIn(ELIPSIS_DIAGONAL, lineas[3])
+        self.assertTrue(lineas[3].lstrip().startswith(ELIPSIS_VERTICAL))
+        self.assertIn("49059", lineas[-1])
+        self.assertNotIn("25030", texto)
+
+    def test_matriz_enorme(self):
+        """10k×10k se resume sin materializar la matriz (vista difundida)."""
+        datos = np.broadcast_to(np.float64(1.5), (10_000, 10_000))
+        texto = resumir(datos, decimales=2)
+        self.assertIn("9999", texto)
+        self.assertIn("1.50", texto)
+        self.assertEqual(len(texto.splitlines()), 1 + 7)
+
+    def test_formateador_decimales(self):
+        """Los flotantes usan decimales fijos y los enormes notación científica."""
+        formato = formateador_consola(np.dtype(np.float64), 2)
+        self.assertEqual(formato(3.14159), "3.14")
+        self.assertEqual(formato(1e12), "1.00e+12")
+        self.assertEqual(formateador_consola(np.dtype(np.int64))(7), "7")
+
+
+class TestMostrar(unittest.TestCase):
+    """Pruebas de MatrizNumPy.mostrar con matrices grandes."""
+
+    def test_mostrar_resume_las_grandes(self):
+        """mostrar resume por encima de 20×20 en lugar de omitir el contenido."""
+        matriz = MatrizNumPy(30, 30, dtype=np.int64)
+        matriz.llenar_manual(numerada(30, 30))
+        salida = io.StringIO()
+        with redirect_stdout(salida):
+            matriz.mostrar("G")
+        self.assertIn("resumen de 30×30", salida.getvalue())
+        self.assertIn("29029", salida.getvalue())
+        self.assertNotIn("15015", salida.getvalue())
+
+
+class TestPaginador(unittest.TestCase):
+    """Pruebas unitarias para Paginador."""
+
+    def test_columnas_que_caben(self):
+        """Caben menos columnas cuanto más estrecha es la terminal."""
+        datos = numerada(30, 50)
+        estrechas = columnas_que_caben(datos, 0, 0, 10, 40)
+        anchas = columnas_que_caben(datos, 0, 0, 10, 200)
+        self.assertGreaterEqual(estrechas, 1)
+        self.assertLess(estrechas, anchas)
+        self.assertEqual(columnas_que_caben(datos, 0, 48, 10, 200), 2)
+
+    def test_ordenes(self):
+        """Las órdenes mueven la página sin salirse de la matriz."""
+        paginador = Paginador(numerada(45, 50), filas_por_pagina=20, ancho=60)
+        paginador.pagina()
+        visibles = paginador.columnas_visibles
+
+        self.assertTrue(paginador.procesar(""))
+        self.assertEqual(paginador.fila, 20)
+        paginador.procesar("s")
+        paginador.procesar("s")
+        self.assertEqual(paginador.fila, 40)
+        paginador.procesar("a")
+        self.assertEqual(paginador.fila, 20)
+        paginador.procesar("d")
+        self.assertEqual(paginador.columna, visibles)
+        paginador.procesar("i")
+        self.assertEqual(paginador.columna, 0)
+        paginador.procesar("f 100")
+        self.assertEqual(paginador.fila, 44)
+        paginador.procesar("c 7")
+        self.assertEqual(paginador.columna, 7)
+        with self.assertRaises(ValueError):
+            paginador.procesar("x")
+        self.assertFalse(paginador.procesar("q"))
+
+    def test_ejecutar(self):
+        """ejecutar muestra páginas hasta salir y avisa de órdenes no válidas."""
+        ordenes = iter(["s", "zz", "q"])
+        salidas = []
+        paginador = Paginador(numerada(30, 5), filas_por_pagina=10, ancho=80,
+                              entrada=lambda _: next(ordenes), salida=salidas.append)
+        paginador.ejecutar()
+        self.assertEqual(len(salidas), 4)
+        self.assertIn("Filas 0–9 de 30", salidas[0])
+        self.assertIn("Filas 10–19 de 30", salidas[1])
+        self.assertIn("Orden no válida", salidas[2])
+
+    def test_pagina_de_matriz_enorme(self):
+        """Una página de una matriz enorme solo formatea esa página."""
+        datos = np.broadcast_to(np.float64(2.0), (10_000, 10_000))
+        paginador = Paginador(datos, decimales=1, filas_por_pagina=5, ancho=80)
+        paginador.procesar("f 9998")
+        texto = paginador.pagina()
+        self.assertIn("Filas 9998–9999 de 10000", texto)
+        self.assertEqual(len(texto.splitlines()), 1 + 2 + 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
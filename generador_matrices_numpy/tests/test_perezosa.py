@@ -0,0 +1,119 @@
+"""
+Pruebas unitarias para la evaluación perezosa
+=============================================
+
+Tests para verificar que las expresiones perezosas producen los mismos
+resultados que la evaluación inmediata de MatrizNumPy.
+
+Autor: Nicolas
+"""
+
+import unittest
+import sys
+import os
+import numpy as np
+
+# Agregar el directorio raíz al path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.matriz_numpy import MatrizNumPy
+from src import perezosa
+from src.perezosa import ExpresionPerezosa
+from src.operaciones import orden_cadena_optimo
+
+
+class TestExpresionPerezosa(unittest.TestCase):
+    """Pruebas unitarias para ExpresionPerezosa."""
+
+    def setUp(self):
+        """Usa bloques pequeños para recorrer varias pasadas fusionadas."""
+        self.elementos_originales = perezosa.ELEMENTOS_POR_BLOQUE
+        perezosa.ELEMENTOS_POR_BLOQUE = 64
+        rng = np.random.default_rng(2)
+        self.A = MatrizNumPy(rng.standard_normal((37, 21)))
+        self.B = MatrizNumPy(rng.standard_normal((37, 21)))
+        self.C = MatrizNumPy(rng.standard_normal((37, 21)))
+
+    def tearDown(self):
+        perezosa.ELEMENTOS_POR_BLOQUE = self.elementos_originales
+
+    def test_fusion_identica_a_evaluacion_inmediata(self):
+        """Testa que la cadena elemento a elemento dé el mismo resultado bit a bit."""
+        A, B, C = self.A, self.B, self.C
+        perezoso = (A.perezosa() + B - C * 2).evaluar()
+        inmediato = A + B - C * 2
+
+        self.assertIsInstance(perezoso, MatrizNumPy)
+        np.testing.assert_array_equal(perezoso.datos, inmediato.datos)
+
+    def test_tipos_mixtos(self):
+        """Testa la promoción de tipos igual que en la evaluación inmediata."""
+        enteros = MatrizNumPy(np.arange(37 * 21, dtype=np.int32).reshape(37, 21))
+        perezoso = ((enteros.perezosa() + enteros) * 2.5 - self.A).evaluar()
+        inmediato = (enteros + enteros) * 2.5 - self.A
+
+        self.assertEqual(perezoso.datos.dtype, inmediato.datos.dtype)
+        np.testing.assert_array_equal(perezoso.datos, inmediato.datos)
+
+    def test_subexpresiones_compartidas_y_transpuestas(self):
+        """Testa CSE y la propagación de transpuestas."""
+        A, B = self.A.perezosa(), self.B.perezosa()
+        suma = A + B
+        expresion = (suma * 3 - suma).T + (A - B).T * 0.5
+        esperado = ((self.A.datos + self.B.datos) * 3 - (self.A.datos + self.B.datos)).T + \
+            (self.A.datos - self.B.datos).T * 0.5
+
+        np.testing.assert_array_equal(expresion.evaluar().datos, esperado)
+        self.assertEqual(expresion.shape, (21, 37))
+        self.assertEqual((A + B).clave, (self.A.perezosa() + self.B.perezosa()).clave)
+
+    def test_subexpresion_compartida_en_producto(self):
+        """Testa una suma compartida que además es operando de un producto."""
+        A, B, C = self.A.datos, self.B.datos, self.C.datos
+        suma = self.A.perezosa() + self.B
+        cuadrada = perezosa.perezosa(A[:21]) + B[:21]
+
+        np.testing.assert_allclose((suma.T @ suma).evaluar().datos, (A + B).T @ (A + B), rtol=1e-12)
+        np.testing.assert_allclose((cuadrada @ cuadrada).evaluar().datos,
+                                   (A[:21] + B[:21]) @ (A[:21] + B[:21]), rtol=1e-12)
+        np.testing.assert_allclose((suma - suma @ C.T @ C).evaluar().datos,
+                                   (A + B) - (A + B) @ C.T @ C, rtol=1e-12, atol=1e-12)
+
+    def test_cadena_de_productos(self):
+        """Testa que una cadena se reordene y dé el resultado correcto."""
+        rng = np.random.default_rng(3)
+        X = MatrizNumPy(rng.standard_normal((60, 60)))
+        Y = MatrizNumPy(rng.standard_normal((60, 60)))
+        v = MatrizNumPy(rng.standard_normal((60, 1)))
+
+        resultado = (X.perezosa() @ Y @ v + v).evaluar()
+        np.testing.assert_allclose(resultado.datos, X.datos @ (Y.datos @ v.datos) + v.datos,
+                                   rtol=1e-12, atol=1e-12)
+        np.testing.assert_allclose((X.perezosa() @ Y).T.evaluar().datos, (X.datos @ Y.datos).T,
+                                   rtol=1e-12, atol=1e-12)
+
+    def test_orden_cadena_optimo(self):
+        """Testa la programación dinámica con el ejemplo clásico de CLRS."""
+        costo, division = orden_cadena_optimo([30, 35, 15, 5, 10, 20, 25])
+        self.assertEqual(costo, 15125)
+        self.assertEqual(division[0][5], 2)
+
+    def test_operandos_mixtos_y_errores(self):
+        """Testa operandos MatrizNumPy a la izquierda y dimensiones inválidas."""
+        expresion = self.A + self.B.perezosa()
+        self.assertIsInstance(expresion, ExpresionPerezosa)
+        np.testing.assert_array_equal(expresion.evaluar().datos, (self.A + self.B).datos)
+
+        with self.assertRaises(ValueError):
+            self.A.perezosa() + MatrizNumPy(3, 3)
+        with self.assertRaises(ValueError):
+            self.A.perezosa() @ self.B
+
+    def test_resultado_no_comparte_memoria(self):
+        """Testa que evaluar una hoja o transpuesta devuelva una copia."""
+        resultado = self.A.perezosa().T.evaluar()
+        self.assertFalse(np.shares_memory(resultado.datos, self.A.datos))
+
+
+if __name__ == '__main__':
+    unittest.main()
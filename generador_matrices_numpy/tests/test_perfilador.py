@@ -0,0 +1,121 @@
+"""
+Pruebas unitarias para el perfilador de operaciones
+===================================================
+
+Tests para verificar que las operaciones de MatrizNumPy y de operaciones
+se registran solo con el perfilador activo, con sus formas, FLOPs
+estimados, memoria y percentiles.
+
+Autor: Nicolas
+"""
+
+import unittest
+import sys
+import os
+import numpy as np
+
+# Agregar el directorio raíz al path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.matriz_numpy import MatrizNumPy
+from src.perfilador import (PERFILADOR, Medicion, Perfilador, perfilado, flops_producto,
+                            flops_cubicos)
+
+
+class TestPerfilador(unittest.TestCase):
+    """Pruebas unitarias para src/perfilador.py."""
+
+    def setUp(self):
+        """Configuración inicial para cada test."""
+        PERFILADOR.desactivar()
+        PERFILADOR.limpiar()
+        self.a = MatrizNumPy(np.arange(12.0).reshape(3, 4))
+        self.b = MatrizNumPy(np.ones((4, 2)))
+
+    def tearDown(self):
+        """Deja el perfilador compartido desactivado y vacío."""
+        PERFILADOR.desactivar()
+        PERFILADOR.limpiar()
+
+    def test_desactivado_no_registra(self):
+        """Sin activar, las operaciones no dejan mediciones."""
+        self.a @ self.b
+        self.a.transponer()
+        self.assertEqual(PERFILADOR.mediciones(), [])
+
+    def test_registra_producto(self):
+        """El producto registra formas, tipos y 2·m·k·n FLOPs."""
+        with PERFILADOR.perfilando():
+            resultado = self.a @ self.b
+        np.testing.assert_array_equal(resultado.datos, self.a.datos @ self.b.datos)
+
+        medicion, = PERFILADOR.mediciones('MatrizNumPy.__matmul__')
+        self.assertEqual(medicion.formas, ((3, 4), (4, 2)))
+        self.assertEqual(medicion.tipos, ('float64', 'float64'))
+        self.assertEqual(medicion.flops, 2 * 3 * 4 * 2)
+        self.assertGreaterEqual(medicion.tiempo, 0)
+        self.assertIsNone(medicion.bytes)
+        self.assertEqual(medicion.profundidad, 0)
+
+    def test_llamadas_anidadas_y_operaciones(self):
+        """El producto entero registra también la llamada a operaciones, anidada."""
+        enteros = MatrizNumPy(np.arange(1600).reshape(40, 40))
+        pequena = MatrizNumPy(np.arange(9).reshape(3, 3))
+        with PERFILADOR.perfilando():
+            enteros @ enteros
+            pequena @ pequena
+            MatrizNumPy.multiplicar_cadena([self.a, self.b])
+        # El producto 3×3 no pasa por multiplicar_enteros
+        anidada, = PERFILADOR.mediciones('operaciones.multiplicar_enteros')
+        self.assertEqual(anidada.profundidad, 1)
+        cadena, = PERFILADOR.mediciones('operaciones.multiplicar_cadena')
+        self.assertEqual(cadena.flops, 2 * 3 * 4 * 2)
+        orden, = PERFILADOR.mediciones('operaciones.orden_cadena_optimo')
+        ejecucion, = PERFILADOR.mediciones('operaciones.ejecutar_cadena')
+        self.assertEqual((orden.profundidad, ejecucion.profundidad), (2, 2))
+        self.assertEqual(ejecucion.flops, 2 * 3 * 4 * 2)
+
+    def test_memoria(self):
+        """Con memoria=True se miden los bytes reservados."""
+        grande = MatrizNumPy(np.ones((200, 200)))
+        with PERFILADOR.perfilando(memoria=True):
+            grande.copiar()
+        medicion, = PERFILADOR.mediciones('MatrizNumPy.copiar')
+        self.assertGreaterEqual(medicion.bytes, 200 * 200 * 8)
+
+    def test_errores_se_registran_y_propagan(self):
+        """Una operación que falla se mide igualmente y el error llega al llamador."""
+        with PERFILADOR.perfilando():
+            with self.assertRaises(ValueError):
+                self.a.determinante()
+        self.assertEqual(len(PERFILADOR.mediciones('MatrizNumPy.determinante')), 1)
+
+    def test_resumen_percentiles(self):
+        """resumen calcula llamadas, percentiles y GFLOP/s por operación."""
+        perfilador = Perfilador(max_mediciones=3)
+        for tiempo in (1.0, 2.0, 3.0, 4.0):
+            perfilador.registrar(Medicion('op', tiempo, tiempo, 1e9, None, (), (), 0))
+        resumen = perfilador.resumen()['op']
+        self.assertEqual(resumen['llamadas'], 3)
+        self.assertEqual(resumen['p50'], 3.0)
+        self.assertAlmostEqual(resumen['gflops'], 3e9 / 9.0 / 1e9)
+        self.assertIn('op', perfilador.informe())
+
+    def test_decorador_y_estimadores(self):
+        """perfilado registra con el nombre indicado y los estimadores usan las formas."""
+        @perfilado('prueba.sumar', flops=lambda args, kwargs: 1.0)
+        def sumar(x, y):
+            return x + y
+
+        self.assertEqual(sumar(1, 2), 3)
+        self.assertEqual(PERFILADOR.mediciones('prueba.sumar'), [])
+        with PERFILADOR.perfilando():
+            self.assertEqual(sumar(1, y=2), 3)
+        self.assertEqual(PERFILADOR.mediciones('prueba.sumar')[0].flops, 1.0)
+
+        self.assertEqual(flops_producto((np.ones((2, 3)), np.ones(3)), {}), 12.0)
+        self.assertEqual(flops_cubicos(2)((np.ones((4, 4)),), {}), 128.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
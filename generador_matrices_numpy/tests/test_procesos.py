@@ -0,0 +1,89 @@
+"""
+Pruebas unitarias para el producto repartido entre procesos
+===========================================================
+
+Tests para verificar que el producto con memoria compartida y el de
+matrices ``object`` coinciden exactamente con ``a @ b``.
+
+Autor: Nicolas
+"""
+
+import unittest
+import sys
+import os
+from fractions import Fraction
+import numpy as np
+
+# Agregar el directorio raíz al path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.matriz_numpy import MatrizNumPy
+from src.procesos import multiplicar_en_procesos, obtener_pool
+import src.procesos as procesos
+
+
+class TestMultiplicarEnProcesos(unittest.TestCase):
+    """Pruebas unitarias para src/procesos.py."""
+
+    def setUp(self):
+        """Configuración inicial para cada test."""
+        self.rng = np.random.default_rng(0)
+
+    def test_enteros_memoria_compartida(self):
+        """Testa int64 (con desbordamiento) y tipos mixtos con teselas irregulares."""
+        a = self.rng.integers(-2 ** 62, 2 ** 62, (37, 21))
+        b = self.rng.integers(-2 ** 62, 2 ** 62, (21, 29))
+        resultado = multiplicar_en_procesos(a, b, procesos=2, tam_tesela=8)
+        self.assertEqual(resultado.dtype, np.int64)
+        np.testing.assert_array_equal(resultado, a @ b)
+
+        c = self.rng.integers(-100, 100, (21, 5), dtype=np.int16)
+        np.testing.assert_array_equal(multiplicar_en_procesos(a, c, procesos=2), a @ c)
+
+    def test_coma_flotante(self):
+        """Testa que con coma flotante el resultado coincide salvo redondeo."""
+        a = self.rng.standard_normal((40, 300))
+        b = self.rng.standard_normal((300, 33))
+        resultado = multiplicar_en_procesos(a, b, procesos=2, tam_tesela=8)
+        self.assertEqual(resultado.dtype, np.float64)
+        np.testing.assert_allclose(resultado, a @ b, rtol=1e-12, atol=1e-12)
+
+    def test_objetos(self):
+        """Testa enteros grandes y fracciones en matrices object."""
+        a = self.rng.integers(-1000, 1000, (12, 9)).astype(object) * 10 ** 30
+        b = self.rng.integers(-1000, 1000, (9, 11)).astype(object)
+        resultado = multiplicar_en_procesos(a, b, procesos=2, tam_tesela=4)
+        self.assertEqual(resultado.dtype, object)
+        self.assertTrue((resultado == a @ b).all())
+
+        f = np.array([[Fraction(i + 1, j + 2) for j in range(5)] for i in range(6)], dtype=object)
+        self.assertTrue((multiplicar_en_procesos(f, f.T, procesos=2, tam_tesela=2) == f @ f.T).all())
+
+    def test_pool_reutilizado(self):
+        """Testa que el pool se reutiliza mientras no cambie el número de procesos."""
+        a = np.arange(16).reshape(4, 4)
+        multiplicar_en_procesos(a, a, procesos=2)
+        pool = obtener_pool(2)
+        multiplicar_en_procesos(a, a, procesos=2)
+        self.assertIs(obtener_pool(2), pool)
+
+    def test_matmul_objetos_en_matriz_numpy(self):
+        """Testa que MatrizNumPy @ reparte los productos object grandes."""
+        minimo = procesos.MIN_OPERACIONES_PROCESOS
+        procesos.MIN_OPERACIONES_PROCESOS = 0
+        try:
+            datos = np.array([[Fraction(1, 2), 1], [2, Fraction(-1, 3)]], dtype=object)
+            a = MatrizNumPy(datos)
+            resultado = a @ a
+        finally:
+            procesos.MIN_OPERACIONES_PROCESOS = minimo
+        self.assertTrue((resultado.datos == datos @ datos).all())
+
+    def test_dimensiones_incompatibles(self):
+        """Testa el error con dimensiones incompatibles."""
+        with self.assertRaises(ValueError):
+            multiplicar_en_procesos(np.ones((2, 3)), np.ones((2, 3)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,174 @@
+"""
+Pruebas unitarias para los flujos binarios y el modo tubería
+============================================================
+
+Tests para verificar la lectura y escritura de secuencias .npy y las
+operaciones del modo --pipe.
+
+Autor: Nicolas
+"""
+
+import unittest
+import sys
+import os
+import io
+import subprocess
+import tempfile
+import numpy as np
+
+# Agregar el directorio raíz al path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.protocolo import leer_matriz, escribir_matriz, iterar_matrices
+from interfaces.tuberia_numpy import ProcesadorTuberia, ejecutar_tuberia, EXITO, ERROR_EJECUCION, ERROR_ARGUMENTOS
+
+
+def _flujo(*matrices):
+    """Crea un flujo en memoria con las matrices dadas."""
+    flujo = io.BytesIO()
+    for matriz in matrices:
+        escribir_matriz(flujo, matriz)
+    flujo.seek(0)
+    return flujo
+
+
+class TestProtocolo(unittest.TestCase):
+    """Pruebas unitarias para src/protocolo.py."""
+
+    def test_ida_y_vuelta(self):
+        """Testa que varias matrices de distintos dtypes se recuperan exactas."""
+        matrices = [np.arange(12, dtype=np.int64).reshape(3, 4),
+                    np.random.default_rng(0).random((5, 2)).astype(np.float32),
+                    np.zeros((0, 3)),
+                    np.array([[1 + 2j, 3 - 1j]])]
+        leidas = list(iterar_matrices(_flujo(*matrices)))
+
+        self.assertEqual(len(leidas), len(matrices))
+        for original, leida in zip(matrices, leidas):
+            self.assertEqual(original.dtype, leida.dtype)
+            np.testing.assert_array_equal(original, leida)
+
+    def test_compatible_con_np_load(self):
+        """Testa que cada matriz del flujo se lee con np.load y viceversa."""
+        a = np.arange(6.0).reshape(2, 3)
+        flujo = _flujo(a, a.T)
+        np.testing.assert_array_equal(np.load(flujo), a)
+        np.testing.assert_array_equal(np.load(flujo), a.T)
+
+        flujo = io.BytesIO()
+        np.save(flujo, a)
+        flujo.seek(0)
+        np.testing.assert_array_equal(leer_matriz(flujo), a)
+
+    def test_transpuesta_sin_copia(self):
+        """Testa que una transpuesta se escribe en orden Fortran con los mismos bytes."""
+        a = np.arange(6.0).reshape(2, 3)
+        flujo = _flujo(a.T)
+        self.assertIn(b"'fortran_order': True", flujo.getvalue())
+        self.assertTrue(flujo.getvalue().endswith(a.tobytes()))
+
+        leida = leer_matriz(flujo)
+        self.assertTrue(leida.flags.f_contiguous)
+        np.testing.assert_array_equal(leida, a.T)
+
+    def test_reutilizar_bufer(self):
+        """Testa que las matrices de igual forma se leen en el mismo array."""
+        a, b = np.ones((4, 4)), np.full((4, 4), 2.0)
+        leidas = [id(m) for m in iterar_matrices(_flujo(a, b), reutilizar=True)]
+        self.assertEqual(leidas[0], leidas[1])
+
+    def test_flujo_truncado_o_invalido(self):
+        """Testa los errores ante flujos incompletos, ajenos o con objetos."""
+        datos = _flujo(np.ones((3, 3))).getvalue()
+        with self.assertRaises(ValueError):
+            leer_matriz(io.BytesIO(datos[:-5]))
+        with self.assertRaises(ValueError):
+            leer_matriz(io.BytesIO(b"1,2,3\n4,5,6\n"))
+        with self.assertRaises(ValueError):
+            escribir_matriz(io.BytesIO(), np.array([[1, 'a']], dtype=object))
+        self.assertIsNone(leer_matriz(io.BytesIO()))
+
+    def test_matriz_demasiado_grande(self):
+        """Testa que una forma enorme en el encabezado no llega a reservarse."""
+        flujo = io.BytesIO()
+        np.lib.format.write_array_header_1_0(flujo, {'descr': '<f8', 'fortran_order': False,
+                                                     'shape': (10 ** 9, 10 ** 9)})
+        with self.assertRaisesRegex(ValueError, "supera el máximo"):
+            leer_matriz(io.BytesIO(flujo.getvalue()))
+        with self.assertRaises(ValueError):
+            leer_matriz(_flujo(np.ones((4, 4))), max_bytes=100)
+        self.assertEqual(leer_matriz(_flujo(np.ones((4, 4))), max_bytes=128).shape, (4, 4))
+
+        registro = io.StringIO()
+        codigo = ejecutar_tuberia('transponer', entrada=io.BytesIO(flujo.getvalue()), salida=io.BytesIO(),
+                                  registro=registro)
+        self.assertEqual(codigo, ERROR_EJECUCION)
+        self.assertIn("Matriz 1", registro.getvalue())
+
+
+class TestTuberia(unittest.TestCase):
+    """Pruebas unitarias para interfaces/tuberia_numpy.py."""
+
+    def _procesar(self, operacion, *matrices, matriz=None):
+        salida = io.BytesIO()
+        ProcesadorTuberia(operacion, matriz).procesar(_flujo(*matrices), salida)
+        salida.seek(0)
+        return list(iterar_matrices(salida))
+
+    def test_operaciones(self):
+        """Testa transponer, multiplicar, resolver y normalizar."""
+        rng = np.random.default_rng(1)
+        x = rng.random((4, 3))
+        m = rng.random((3, 3)) + 3 * np.eye(3)
+
+        np.testing.assert_array_equal(self._procesar('transponer', x)[0], x.T)
+        np.testing.assert_allclose(self._procesar('multiplicar', x, matriz=m)[0], x @ m)
+        y = self._procesar('resolver', x.T, matriz=m)[0]
+        np.testing.assert_allclose(m @ y, x.T)
+        normalizada = self._procesar('normalizar', x, np.zeros((2, 2)))
+        self.assertAlmostEqual(np.linalg.norm(normalizada[0]), 1.0)
+        np.testing.assert_array_equal(normalizada[1], np.zeros((2, 2)))
+
+    def test_formas_variables(self):
+        """Testa que los búferes reutilizados no mezclan resultados de formas distintas."""
+        m = np.arange(4).reshape(2, 2)
+        entradas = [np.ones((3, 2), dtype=np.int64), np.full((3, 2), 2, dtype=np.int64),
+                    np.ones((1, 2), dtype=np.int64)]
+        resultados = self._procesar('multiplicar', *entradas, matriz=m)
+        for entrada, resultado in zip(entradas, resultados):
+            np.testing.assert_array_equal(resultado, entrada @ m)
+
+    def test_errores(self):
+        """Testa los códigos de salida ante argumentos y matrices incompatibles."""
+        registro = io.StringIO()
+        self.assertEqual(ejecutar_tuberia('invertir', entrada=io.BytesIO(), salida=io.BytesIO(),
+                                          registro=registro), ERROR_ARGUMENTOS)
+        self.assertEqual(ejecutar_tuberia('multiplicar', entrada=io.BytesIO(), salida=io.BytesIO(),
+                                          registro=registro), ERROR_ARGUMENTOS)
+
+        with tempfile.TemporaryDirectory() as directorio:
+            ruta = os.path.join(directorio, "m.npy")
+            np.save(ruta, np.eye(3))
+            salida = io.BytesIO()
+            codigo = ejecutar_tuberia('multiplicar', ruta, _flujo(np.ones((2, 3)), np.ones((2, 2))),
+                                      salida, registro)
+        self.assertEqual(codigo, ERROR_EJECUCION)
+        self.assertIn("Matriz 2", registro.getvalue())
+        salida.seek(0)
+        self.assertEqual(len(list(iterar_matrices(salida))), 1)
+
+    def test_main_pipe(self):
+        """Testa main.py --pipe como proceso con stdin y stdout binarios."""
+        raiz = os.path.join(os.path.dirname(__file__), '..')
+        a = np.arange(20.0).reshape(4, 5)
+        resultado = subprocess.run([sys.executable, "main.py", "--pipe", "transponer"], cwd=raiz,
+                                   input=_flujo(a, 2 * a).getvalue(), capture_output=True, timeout=60)
+
+        self.assertEqual(resultado.returncode, EXITO, resultado.stderr)
+        salidas = list(iterar_matrices(io.BytesIO(resultado.stdout)))
+        np.testing.assert_array_equal(salidas[0], a.T)
+        np.testing.assert_array_equal(salidas[1], 2 * a.T)
+
+
+if __name__ == '__main__':
+    unittest.main()
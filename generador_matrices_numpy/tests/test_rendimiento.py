@@ -0,0 +1,82 @@
+"""
+Pruebas unitarias para la batería de benchmarks
+===============================================
+
+Tests para verificar los datos de entrada, la medición, los casos
+omitidos de cada motor y la comparación con una línea base de
+ejemplos/ejemplo_rendimiento.py.
+
+Autor: Nicolas
+"""
+
+import unittest
+import sys
+import os
+import json
+from fractions import Fraction
+
+# Agregar el directorio raíz y el de ejemplos al path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'ejemplos'))
+
+from ejemplo_rendimiento import generar_datos, medir, ejecutar, comparar, clave, HAS_PURO
+
+
+class TestRendimiento(unittest.TestCase):
+    """Pruebas unitarias para ejemplos/ejemplo_rendimiento.py."""
+
+    def test_generar_datos(self):
+        """Los datos dependen solo de la semilla y tienen la diagonal dominante."""
+        datos = generar_datos(6, 'fraction', semilla=3)
+        self.assertEqual(datos, generar_datos(6, 'fraction', semilla=3))
+        self.assertIsInstance(datos[0][1], Fraction)
+        for i, fila in enumerate(datos):
+            self.assertGreater(abs(fila[i]), sum(abs(v) for j, v in enumerate(fila) if j != i))
+
+    def test_medir(self):
+        """medir guarda una duración por repetición y sus estadísticas."""
+        llamadas = []
+        resultado = medir(lambda: llamadas.append(1), calentamiento=2, repeticiones=4, tiempo_minimo=0)
+        self.assertEqual(len(resultado['tiempos']), 4)
+        self.assertEqual(len(llamadas), 2 + 4 * resultado['llamadas'])
+        self.assertLessEqual(resultado['minimo'], resultado['mediana'])
+
+    @unittest.skipUnless(HAS_PURO, "Motor puro no disponible")
+    def test_ejecutar(self):
+        """Se miden los dos motores y se omite lo que uno no admite."""
+        informe = ejecutar(tamaños=[3], tipos=['int', 'fraction'], operaciones=['suma', 'inversa', 'csv_leer'],
+                           repeticiones=2, tiempo_minimo=0)
+        medidos = {clave(r) for r in informe['resultados']}
+        omitidos = {clave(o) for o in informe['omitidos']}
+
+        self.assertIn('puro/suma/fraction/3', medidos)
+        self.assertIn('numpy/inversa/int/3', medidos)
+        self.assertIn('puro/csv_leer/fraction/3', medidos)
+        self.assertIn('puro/inversa/int/3', omitidos)
+        self.assertIn('numpy/inversa/fraction/3', omitidos)
+        self.assertEqual(len(medidos) + len(omitidos), 2 * 2 * 3)
+        json.dumps(informe)
+
+        with self.assertRaises(ValueError):
+            ejecutar(tamaños=[3], operaciones=['magia'])
+
+    def test_comparar(self):
+        """Se detectan regresiones, mejoras y casos nuevos o desaparecidos."""
+        def resultado(operacion, mediana):
+            return {'motor': 'numpy', 'operacion': operacion, 'tipo': 'float', 'tamaño': 10, 'mediana': mediana}
+
+        base = {'resultados': [resultado('suma', 1e-3), resultado('resta', 1e-3), resultado('qr', 1e-3),
+                               resultado('svd', 1e-3)]}
+        actual = {'resultados': [resultado('suma', 2e-3), resultado('resta', 0.5e-3), resultado('qr', 1.1e-3),
+                                 resultado('lu', 1e-3)]}
+        informe = comparar(actual, base, umbral=0.25)
+
+        self.assertEqual([c['clave'] for c in informe['regresiones']], ['numpy/suma/float/10'])
+        self.assertAlmostEqual(informe['regresiones'][0]['cambio'], 1.0)
+        self.assertEqual([c['clave'] for c in informe['mejoras']], ['numpy/resta/float/10'])
+        self.assertEqual(informe['nuevos'], [{'clave': 'numpy/lu/float/10'}])
+        self.assertEqual(informe['desaparecidos'], [{'clave': 'numpy/svd/float/10'}])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,181 @@
+"""
+Pruebas unitarias para el servidor de cálculo
+=============================================
+
+Tests para verificar el espacio compartido, la caché de respuestas, la
+agrupación de MATVEC y el protocolo cliente-servidor.
+
+Autor: Nicolas
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+import threading
+import numpy as np
+
+# Agregar el directorio raíz al path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from interfaces.servidor_numpy import (ServidorMatrices, ClienteMatrices, EspacioCompartido, analizar_direccion,
+                                      OP_ORDEN, OP_OBTENER, OP_MATVEC)
+from src.protocolo import RESP_ERROR
+
+
+class TestServidorMatrices(unittest.TestCase):
+    """Pruebas unitarias para ServidorMatrices y ClienteMatrices."""
+
+    def setUp(self):
+        """Configuración inicial para cada test."""
+        self.directorio = tempfile.TemporaryDirectory()
+        self.direccion = os.path.join(self.directorio.name, "matrices.sock")
+        self.servidor = ServidorMatrices(self.direccion, trabajadores=2)
+        self.servidor.iniciar_en_segundo_plano()
+        self.cliente = ClienteMatrices(self.direccion)
+
+    def tearDown(self):
+        self.cliente.cerrar()
+        self.servidor.detener()
+        self.directorio.cleanup()
+
+    def test_crear_operar_obtener(self):
+        """Testa órdenes, PONER, EVALUAR con asignación y OBTENER."""
+        a = np.arange(6.0).reshape(2, 3)
+        self.cliente.poner('A', a)
+        self.cliente.orden('identidad I 3')
+        self.assertEqual(self.cliente.evaluar('C = A @ I + A'), None)
+
+        np.testing.assert_array_equal(self.cliente.obtener('C'), 2 * a)
+        np.testing.assert_array_equal(self.cliente.evaluar('A.T'), a.T)
+        self.assertIn('[[1. 0. 0.]', self.cliente.orden('mostrar I'))
+
+        self.cliente.eliminar('C')
+        self.assertEqual(set(self.cliente.estado()['matrices']), {'A', 'I'})
+
+    def test_cache_se_invalida(self):
+        """Testa que las respuestas se cachean y se descartan al cambiar el espacio."""
+        self.cliente.poner('A', np.ones((3, 3)))
+        self.cliente.evaluar('A + A')
+        np.testing.assert_array_equal(self.cliente.evaluar('A + A'), np.full((3, 3), 2.0))
+        self.assertEqual(self.cliente.estado()['aciertos_cache'], 1)
+
+        self.cliente.poner('A', np.zeros((3, 3)))
+        np.testing.assert_array_equal(self.cliente.evaluar('A + A'), np.zeros((3, 3)))
+
+    def test_errores(self):
+        """Testa que los errores llegan al cliente sin cerrar la conexión."""
+        with self.assertRaises(ValueError):
+            self.cliente.obtener('X')
+        with self.assertRaises(ValueError):
+            self.cliente.orden('orden_inexistente')
+        with self.assertRaises(ValueError):
+            self.cliente.poner('no valido', np.ones((2, 2)))
+        self.cliente.poner('A', np.ones((2, 2)))
+        with self.assertRaises(ValueError):
+            self.cliente.matvec('A', np.ones(3))
+        np.testing.assert_array_equal(self.cliente.matvec('A', np.ones(2)), [2.0, 2.0])
+
+    def test_errores_de_archivo(self):
+        """Testa que los errores de E/S de una orden llegan como error y la conexión sigue viva."""
+        with self.assertRaises(ValueError):
+            self.cliente.orden('cargar B /no/existe.csv')
+        self.cliente.poner('A', np.ones((2, 2)))
+        with self.assertRaises(ValueError):
+            self.cliente.orden('guardar A /no/existe/x.npy')
+        np.testing.assert_array_equal(self.cliente.obtener('A'), np.ones((2, 2)))
+
+    def test_matvec_concurrentes_agrupados(self):
+        """Testa que muchos MATVEC concurrentes dan el resultado exacto y se agrupan."""
+        rng = np.random.default_rng(0)
+        a = rng.random((50, 40))
+        self.cliente.poner('A', a)
+        vectores = [rng.random(40) if i % 2 else rng.random((40, 3)) for i in range(8)]
+        resultados = [None] * len(vectores)
+
+        def trabajar(i):
+            with ClienteMatrices(self.direccion) as cliente:
+                for _ in range(20):
+                    resultados[i] = cliente.matvec('A', vectores[i])
+
+        hilos = [threading.Thread(target=trabajar, args=(i,)) for i in range(len(vectores))]
+        for hilo in hilos:
+            hilo.start()
+        for hilo in hilos:
+            hilo.join()
+
+        for x, y in zip(vectores, resultados):
+            np.testing.assert_allclose(y, a @ x)
+        estado = self.cliente.estado()
+        self.assertEqual(estado['matvec'], 160)
+        self.assertLessEqual(estado['lotes_matvec'], 160)
+
+    def test_analizar_direccion(self):
+        """Testa la interpretación de direcciones Unix y TCP."""
+        self.assertEqual(analizar_direccion('localhost:8765'), ('localhost', 8765))
+        self.assertEqual(analizar_direccion(':0'), ('127.0.0.1', 0))
+        self.assertEqual(analizar_direccion('/tmp/m.sock'), '/tmp/m.sock')
+        self.assertEqual(analizar_direccion('unix:m.sock'), 'm.sock')
+
+    def test_tcp(self):
+        """Testa el servidor sobre TCP local con un puerto libre."""
+        servidor = ServidorMatrices('127.0.0.1:0', trabajadores=1)
+        servidor.iniciar_en_segundo_plano()
+        try:
+            host, puerto = servidor.direccion
+            with ClienteMatrices(f"{host}:{puerto}") as cliente:
+                cliente.poner('B', np.eye(2, dtype=np.int64))
+                resultado = cliente.evaluar('B @ B')
+            self.assertEqual(resultado.dtype, np.int64)
+            np.testing.assert_array_equal(resultado, np.eye(2))
+        finally:
+            servidor.detener()
+
+    def test_solo_direcciones_locales(self):
+        """Testa que el servidor rechaza escuchar fuera de loopback."""
+        for direccion in ('0.0.0.0:0', '192.0.2.1:0', 'host.invalid:0'):
+            with self.assertRaisesRegex(ValueError, "dirección local", msg=direccion):
+                ServidorMatrices(direccion, trabajadores=1)
+        servidor = ServidorMatrices('localhost:0', trabajadores=1)
+        servidor.detener()
+
+
+if __name__ == '__main__':
+    unittest.main()
+
+
+class TestEspacioCompartido(unittest.TestCase):
+    """Pruebas unitarias para EspacioCompartido sin sockets."""
+
+    def setUp(self):
+        """Configuración inicial para cada test."""
+        self.espacio = EspacioCompartido(trabajadores=2)
+
+    def tearDown(self):
+        self.espacio.cerrar()
+
+    def test_cache_lru(self):
+        """Testa que un acierto renueva la entrada y se descarta la menos usada."""
+        for nombre in 'ABC':
+            self.espacio.atender(OP_ORDEN, f'identidad {nombre} 4', None)
+        tamaño = len(self.espacio.atender(OP_OBTENER, 'A', None))
+        self.espacio.max_cache_bytes = 2 * tamaño
+
+        self.espacio.atender(OP_OBTENER, 'B', None)
+        self.espacio.atender(OP_OBTENER, 'A', None)
+        self.espacio.atender(OP_OBTENER, 'C', None)
+
+        self.assertEqual([clave[1] for clave in self.espacio._cache], ['A', 'C'])
+        self.assertEqual(self.espacio.estado()['aciertos_cache'], 1)
+
+    def test_orden_no_bloquea_matvec(self):
+        """Testa que un MATVEC se atiende mientras una orden está en curso."""
+        self.espacio.atender(OP_ORDEN, 'identidad I 3', None)
+        resultado = []
+        with self.espacio._cerrojo_ordenes:
+            hilo = threading.Thread(target=lambda: resultado.append(
+                self.espacio.atender(OP_MATVEC, 'I', np.ones(3))))
+            hilo.start()
+            hilo.join(timeout=5)
+            self.assertFalse(hilo.is_alive())
+        self.assertNotEqual(resultado[0][0], RESP_ERROR)
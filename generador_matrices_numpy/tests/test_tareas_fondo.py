@@ -0,0 +1,177 @@
+"""
+Pruebas unitarias para las tareas en segundo plano
+==================================================
+
+Tests para verificar el ejecutor de la interfaz gráfica: entrega de
+resultados al sondear, errores, progreso y cancelación, y los cálculos
+por bloques que usa InterfazGraficaNP.
+
+Autor: Nicolas
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+import threading
+from concurrent.futures import CancelledError
+import numpy as np
+
+# Agregar el directorio raíz al path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.matriz_numpy import MatrizNumPy
+from interfaces.tareas_fondo import EjecutorFondo
+import interfaces.grafica_numpy as grafica
+
+
+def esperar_y_sondear(ejecutor, tarea):
+    """Simula el bucle de after(): espera a la tarea y sondea."""
+    tarea._terminado.wait(5)
+    return ejecutor.sondear()
+
+
+class TestEjecutorFondo(unittest.TestCase):
+    """Pruebas unitarias para interfaces/tareas_fondo.py."""
+
+    def setUp(self):
+        """Configuración inicial para cada test."""
+        self.ejecutor = EjecutorFondo()
+
+    def tearDown(self):
+        self.ejecutor.cerrar()
+
+    def test_resultado_en_el_hilo_que_sondea(self):
+        """Testa que al_terminar se llama al sondear y desde el hilo que sondea."""
+        llamadas = []
+        tarea = self.ejecutor.enviar("suma", lambda t: 2 + 3,
+                                     al_terminar=lambda r: llamadas.append((r, threading.get_ident())))
+        self.assertEqual(llamadas, [])
+        self.assertEqual(esperar_y_sondear(self.ejecutor, tarea), [tarea])
+        self.assertEqual(llamadas, [(5, threading.get_ident())])
+        self.assertEqual(self.ejecutor.activas, [])
+
+    def test_error(self):
+        """Testa que los errores llegan a al_fallar."""
+        errores = []
+
+        def fallar(tarea):
+            raise ValueError("La matriz es singular (no invertible)")
+
+        tarea = self.ejecutor.enviar("inversa", fallar, al_fallar=errores.append)
+        esperar_y_sondear(self.ejecutor, tarea)
+        self.assertIsInstance(errores[0], ValueError)
+
+    def test_en_curso_omite_canceladas(self):
+        """Testa que una tarea cancelada que sigue ejecutándose deja de estar en curso."""
+        liberar = threading.Event()
+        primera = self.ejecutor.enviar("determinante", lambda t: liberar.wait(5))
+        segunda = self.ejecutor.enviar("inversa", lambda t: liberar.wait(5))
+        self.assertEqual(self.ejecutor.en_curso(), [primera, segunda])
+
+        primera.cancelar()
+        self.assertEqual(self.ejecutor.activas, [primera, segunda])
+        self.assertEqual(self.ejecutor.en_curso(), [segunda])
+        liberar.set()
+
+    def test_termina_durante_el_sondeo(self):
+        """Testa que una tarea que termina mientras se sondea no se pierde."""
+        llamadas = []
+        liberar = threading.Event()
+        tarea = self.ejecutor.enviar("espera", lambda t: liberar.wait(5), al_terminar=llamadas.append)
+        terminada = tarea.terminada
+
+        def terminar_al_consultar():
+            # Termina justo después de la primera consulta
+            estado = terminada()
+            liberar.set()
+            tarea._terminado.wait(5)
+            return estado
+
+        tarea.terminada = terminar_al_consultar
+        self.assertEqual(self.ejecutor.sondear(), [])
+        self.assertEqual(self.ejecutor.activas, [tarea])
+        self.assertEqual(self.ejecutor.sondear(), [tarea])
+        self.assertEqual(llamadas, [True])
+
+    def test_progreso_y_cancelacion(self):
+        """Testa el progreso, la cancelación cooperativa y el descarte del resultado."""
+        avance = threading.Event()
+        continuar = threading.Event()
+        detenidos = []
+        resultados = []
+
+        def trabajo(tarea):
+            tarea.al_cancelar(lambda: detenidos.append(True))
+            for i in range(10):
+                tarea.reportar(i + 1, 10)
+                avance.set()
+                continuar.wait(5)
+                tarea.comprobar()
+            return 'fin'
+
+        tarea = self.ejecutor.enviar("largo", trabajo, al_terminar=resultados.append)
+        avance.wait(5)
+        self.assertEqual(tarea.fraccion(), 0.1)
+        tarea.cancelar()
+        continuar.set()
+        esperar_y_sondear(self.ejecutor, tarea)
+
+        self.assertIsInstance(tarea.error, CancelledError)
+        self.assertEqual(detenidos, [True])
+        self.assertEqual(resultados, [])
+        self.assertGreater(tarea.transcurrido(), 0)
+
+
+class TestCalculosPorBloques(unittest.TestCase):
+    """Pruebas para los cálculos por bloques de InterfazGraficaNP."""
+
+    def setUp(self):
+        """Configuración inicial para cada test."""
+        self.ejecutor = EjecutorFondo()
+        self.rng = np.random.default_rng(0)
+
+    def tearDown(self):
+        self.ejecutor.cerrar()
+
+    def ejecutar(self, funcion):
+        tarea = self.ejecutor.enviar("prueba", funcion)
+        tarea._terminado.wait(10)
+        if tarea.error is not None:
+            raise tarea.error
+        return tarea
+
+    def test_multiplicar_por_paneles(self):
+        """Testa el producto por paneles de filas con progreso."""
+        a = MatrizNumPy(self.rng.random((grafica.FILAS_PANEL * 2 + 7, 30)))
+        b = MatrizNumPy(self.rng.random((30, 11)))
+        tarea = self.ejecutar(lambda t: grafica._multiplicar_por_paneles(a, b, t))
+        np.testing.assert_allclose(tarea.resultado.datos, a.datos @ b.datos)
+        self.assertEqual(tarea.fraccion(), 1.0)
+
+    def test_inversa_por_teselas(self):
+        """Testa la inversa grande con progreso por teselas."""
+        datos = self.rng.random((grafica.TAM_TESELA + 20,) * 2)
+        tarea = self.ejecutar(lambda t: grafica._invertir(MatrizNumPy(datos), t))
+        np.testing.assert_allclose(tarea.resultado.datos @ datos, np.eye(len(datos)), atol=1e-8)
+        self.assertEqual(tarea.fraccion(), 1.0)
+
+    def test_csv_por_bloques(self):
+        """Testa la escritura y lectura de CSV por bloques."""
+        datos = np.round(self.rng.random((25, 3)), 6)
+        linea = np.array([[1.0, 2.0, 3.0]])
+        with tempfile.TemporaryDirectory() as directorio:
+            ruta = os.path.join(directorio, "m.csv")
+            self.ejecutar(lambda t: grafica._escribir_csv(ruta, datos, t))
+            tarea = self.ejecutar(lambda t: grafica._leer_csv(ruta, t))
+            np.testing.assert_allclose(tarea.resultado, datos)
+            self.assertEqual(tarea.fraccion(), 1.0)
+
+            ruta_fila = os.path.join(directorio, "fila.csv")
+            np.savetxt(ruta_fila, linea, delimiter=',')
+            np.testing.assert_array_equal(self.ejecutar(lambda t: grafica._leer_csv(ruta_fila, t)).resultado,
+                                          linea)
+
+
+if __name__ == '__main__':
+    unittest.main()
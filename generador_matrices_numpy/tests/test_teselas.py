@@ -0,0 +1,163 @@
+"""
+Pruebas unitarias para las factorizaciones por teselas
+======================================================
+
+Tests para verificar Cholesky, LU, QR e inversa por teselas, el grafo de
+dependencias, las entradas mapeadas en memoria, el progreso y la cancelación.
+
+Autor: Nicolas
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+import threading
+from concurrent.futures import CancelledError
+import numpy as np
+
+# Agregar el directorio raíz al path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.matriz_numpy import MatrizNumPy
+from src.algebra_lineal import resolver_lu
+from src.teselas import (GrafoTareas, PlanificadorTeselas, cholesky_teselas, lu_teselas,
+                         inversa_teselas, qr_teselas)
+
+
+class TestFactorizacionesTeselas(unittest.TestCase):
+    """Pruebas unitarias para src/teselas.py."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Pool propio con varios hilos aunque la máquina tenga un núcleo."""
+        cls.pool = PlanificadorTeselas(hilos=4)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.pool.cerrar()
+
+    def setUp(self):
+        """Configuración inicial para cada test."""
+        rng = np.random.default_rng(0)
+        self.a = rng.random((45, 45))
+        self.spd = self.a @ self.a.T + 45 * np.eye(45)
+
+    def test_cholesky(self):
+        """Testa Cholesky con teselas irregulares contra NumPy."""
+        l = cholesky_teselas(self.spd, 8, planificador=self.pool).resultado()
+        np.testing.assert_allclose(l, np.linalg.cholesky(self.spd), atol=1e-12)
+
+        with self.assertRaises(np.linalg.LinAlgError):
+            cholesky_teselas(-self.spd, 8, planificador=self.pool).resultado()
+
+    def test_lu_e_inversa(self):
+        """Testa que la LU sirve para resolver_lu y la inversa."""
+        factorizacion = lu_teselas(self.a, 8, planificador=self.pool).resultado()
+        b = np.arange(90.0).reshape(45, 2)
+        np.testing.assert_allclose(self.a @ resolver_lu(factorizacion, b), b, atol=1e-9)
+
+        inversa = inversa_teselas(self.a, 8, planificador=self.pool).resultado()
+        np.testing.assert_allclose(inversa, np.linalg.inv(self.a), atol=1e-9)
+
+        with self.assertRaises(np.linalg.LinAlgError):
+            lu_teselas(np.ones((10, 10)), 4, planificador=self.pool).resultado()
+
+    def test_qr(self):
+        """Testa la QR reducida de una matriz alta."""
+        a = np.vstack([self.a, self.a[:7]])
+        q, r = qr_teselas(a, 8, planificador=self.pool).resultado()
+        self.assertEqual((q.shape, r.shape), ((52, 45), (45, 45)))
+        np.testing.assert_allclose(q @ r, a, atol=1e-12)
+        np.testing.assert_allclose(q.T @ q, np.eye(45), atol=1e-12)
+        np.testing.assert_array_equal(r, np.triu(r))
+
+        with self.assertRaises(ValueError):
+            qr_teselas(a.T)
+
+    def test_memmap(self):
+        """Testa una entrada de solo lectura y una salida mapeadas en memoria."""
+        with tempfile.TemporaryDirectory() as directorio:
+            ruta = os.path.join(directorio, "a.npy")
+            np.save(ruta, self.spd)
+            entrada = np.load(ruta, mmap_mode='r')
+            salida = np.lib.format.open_memmap(os.path.join(directorio, "l.npy"), mode='w+',
+                                               dtype=np.float64, shape=self.spd.shape)
+            cholesky_teselas(entrada, 16, salida=salida, planificador=self.pool).resultado()
+            salida.flush()
+            np.testing.assert_allclose(np.load(os.path.join(directorio, "l.npy")),
+                                       np.linalg.cholesky(self.spd), atol=1e-12)
+            del entrada, salida
+
+    def test_varias_factorizaciones_compartiendo_pool(self):
+        """Testa varias factorizaciones concurrentes sobre los mismos hilos."""
+        trabajos = [cholesky_teselas(self.spd * (k + 1), 8, planificador=self.pool) for k in range(4)]
+        for k, trabajo in enumerate(trabajos):
+            np.testing.assert_allclose(trabajo.resultado(), np.linalg.cholesky(self.spd * (k + 1)),
+                                       atol=1e-11)
+
+    def test_progreso_y_cancelacion(self):
+        """Testa el aviso de progreso y la cancelación de las tareas pendientes."""
+        avisos = []
+        trabajo = cholesky_teselas(self.spd, 8, planificador=self.pool,
+                                   al_progresar=lambda hechas, total: avisos.append((hechas, total)))
+        trabajo.resultado()
+        self.assertEqual(trabajo.progreso(), (trabajo.total, trabajo.total))
+        self.assertEqual(avisos[-1], (trabajo.total, trabajo.total))
+
+        bloqueo = threading.Event()
+        grafo = GrafoTareas()
+        ejecutadas = []
+        grafo.agregar("A", bloqueo.wait, escribe=['x'])
+        grafo.agregar("B", lambda: ejecutadas.append('B'), lee=['x'])
+        trabajo = grafo.ejecutar(self.pool)
+        trabajo.cancelar()
+        bloqueo.set()
+        with self.assertRaises(CancelledError):
+            trabajo.resultado(timeout=5)
+        self.assertEqual(ejecutadas, [])
+
+    def test_error_en_al_progresar(self):
+        """Testa que una callback de progreso que falla termina el trabajo sin bloquear el pool."""
+        def fallar(hechas, total):
+            raise RuntimeError("fallo en la interfaz")
+
+        for planificador in (self.pool, None):
+            trabajo = cholesky_teselas(np.eye(8), 2, planificador=planificador, al_progresar=fallar)
+            with self.assertRaisesRegex(RuntimeError, "fallo en la interfaz"):
+                trabajo.resultado(timeout=5)
+            self.assertEqual(trabajo.progreso(), (trabajo.total, trabajo.total))
+
+            l = cholesky_teselas(self.spd, 8, planificador=planificador).resultado(timeout=5)
+            np.testing.assert_allclose(l @ l.T, self.spd, rtol=1e-10)
+
+    def test_dependencias_deducidas(self):
+        """Testa las dependencias de lectura/escritura del grafo."""
+        grafo = GrafoTareas()
+        escribe = grafo.agregar("escribe", lambda: None, escribe=['x'])
+        lee_1 = grafo.agregar("lee_1", lambda: None, lee=['x'])
+        lee_2 = grafo.agregar("lee_2", lambda: None, lee=['x'])
+        reescribe = grafo.agregar("reescribe", lambda: None, escribe=['x'])
+        self.assertEqual(escribe.sucesores, [lee_1, lee_2, reescribe])
+        self.assertEqual(reescribe.pendientes, 3)
+
+    def test_metodos_de_matriz_numpy(self):
+        """Testa el parámetro tam_tesela de MatrizNumPy."""
+        m = MatrizNumPy(self.spd)
+        np.testing.assert_allclose(m.cholesky(tam_tesela=16).datos, m.cholesky().datos, atol=1e-12)
+        np.testing.assert_allclose(m.inversa(tam_tesela=16).datos, m.inversa().datos, atol=1e-12)
+        q, r = m.qr(tam_tesela=16)
+        np.testing.assert_allclose(q @ r, self.spd, atol=1e-10)
+        ancha = MatrizNumPy(self.a[:3, :5])
+        q, r = ancha.qr(tam_tesela=2)
+        self.assertEqual((q.shape, r.shape), ((3, 3), (3, 5)))
+        np.testing.assert_allclose(q @ r, self.a[:3, :5], atol=1e-12)
+
+        with self.assertRaises(ValueError):
+            MatrizNumPy(np.ones((4, 4))).inversa(tam_tesela=2)
+        with self.assertRaises(ValueError):
+            MatrizNumPy(-np.eye(4)).cholesky(tam_tesela=2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+"""
+Pruebas unitarias para el visor virtual de NumPy
+================================================
+
+Tests para verificar que el visor solo formatea el bloque visible y la
+traducción de los comandos de desplazamiento.
+
+Autor: Nicolas
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+from fractions import Fraction
+import numpy as np
+
+# Agregar el directorio raíz al path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from interfaces.visor_numpy import formatear_bloque, posicion_desde_scroll, limitar_inicio
+
+
+class TestVisorNumPy(unittest.TestCase):
+    """Pruebas unitarias para interfaces/visor_numpy.py."""
+
+    def test_formatear_bloque_por_dtype(self):
+        """Testa el formateo de flotantes, enteros, complejos y objetos."""
+        self.assertEqual(formatear_bloque(np.array([[1.0, 1 / 3], [1e-9, -2.5]])),
+                         [['1', '0.333333'], ['1e-09', '-2.5']])
+        self.assertEqual(formatear_bloque(np.array([[1, -20]])), [['1', '-20']])
+        self.assertEqual(formatear_bloque(np.array([[1 + 2j]])), [['1+2j']])
+        self.assertEqual(formatear_bloque(np.array([[Fraction(1, 3)]], dtype=object)), [['1/3']])
+
+    def test_bloque_de_memmap(self):
+        """Testa el formateo de un bloque de una matriz mapeada en memoria."""
+        with tempfile.TemporaryDirectory() as directorio:
+            ruta = os.path.join(directorio, "m.npy")
+            grande = np.lib.format.open_memmap(ruta, mode='w+', dtype=np.int32, shape=(20000, 5000))
+            grande[12345, 4000:4003] = [7, 8, 9]
+            grande.flush()
+            del grande
+            datos = np.load(ruta, mmap_mode='r')
+            self.assertEqual(formatear_bloque(datos[12345:12346, 4000:4003]), [['7', '8', '9']])
+            del datos
+
+    def test_desplazamiento(self):
+        """Testa moveto, unidades y páginas dentro de los límites."""
+        self.assertEqual(posicion_desde_scroll(('moveto', '0.25'), 0, 100000, 30), 25000)
+        self.assertEqual(posicion_desde_scroll(('moveto', '1'), 0, 100000, 30), 99970)
+        self.assertEqual(posicion_desde_scroll(('scroll', '-3', 'units'), 1, 100000, 30), 0)
+        self.assertEqual(posicion_desde_scroll(('scroll', '1', 'pages'), 0, 100000, 30), 29)
+        self.assertEqual(limitar_inicio(5, 3, 30), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()